@@ -8,6 +8,8 @@ Features:
 - Breaking point analysis
 - Approval workflow for accepted cycles
 - Historical tracking
+- SCC-first, bounded cycle enumeration (streaming)
+- Minimum feedback arc set heuristic for breaking candidates
 """
 
 import logging
@@ -15,9 +17,17 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
 import json
 
+import networkx as nx
+
+from acc.import_graph_builder import (
+    DEFAULT_MAX_CYCLES,
+    greedy_feedback_arc_set,
+    iter_bounded_cycles,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -212,10 +222,61 @@ class CycleAnalyzer:
         }
         return mapping.get(classification, CycleSeverity.WARNING)
 
+    @staticmethod
+    def _to_digraph(dependencies: Dict[str, List[str]]) -> nx.DiGraph:
+        """Build a directed graph from a module -> dependencies mapping."""
+        graph = nx.DiGraph()
+        graph.add_nodes_from(dependencies)
+        for source, targets in dependencies.items():
+            graph.add_edges_from((source, target) for target in targets)
+        return graph
+
+    def detect_cycles(
+        self,
+        dependencies: Dict[str, List[str]],
+        max_length: Optional[int] = None,
+        max_cycles: Optional[int] = DEFAULT_MAX_CYCLES
+    ) -> Iterator[List[str]]:
+        """
+        Stream cycles from a dependency mapping, one SCC at a time.
+
+        Args:
+            dependencies: Full dependency graph
+            max_length: Skip cycles longer than this (None = unbounded)
+            max_cycles: Stop after this many cycles (None = unbounded)
+
+        Yields:
+            Cycles as lists of module names
+        """
+        return iter_bounded_cycles(
+            self._to_digraph(dependencies),
+            max_length=max_length,
+            max_cycles=max_cycles
+        )
+
+    def find_feedback_arc_set(
+        self,
+        dependencies: Dict[str, List[str]]
+    ) -> List[Tuple[str, str]]:
+        """
+        Find a small set of edges whose removal breaks every cycle.
+
+        Uses the Eades-Lin-Smyth greedy heuristic per strongly connected
+        component, so it does not depend on enumerating cycles.
+
+        Args:
+            dependencies: Full dependency graph
+
+        Returns:
+            Sorted list of (source, target) edges
+        """
+        return sorted(greedy_feedback_arc_set(self._to_digraph(dependencies)))
+
     def find_breaking_candidates(
         self,
         cycle: List[str],
-        dependencies: Dict[str, List[str]]
+        dependencies: Dict[str, List[str]],
+        feedback_arcs: Optional[Set[Tuple[str, str]]] = None
     ) -> List[BreakingCandidate]:
         """
         Find optimal edges to break a cycle.
@@ -223,6 +284,8 @@ class CycleAnalyzer:
         Args:
             cycle: List of module names in the cycle
             dependencies: Full dependency graph
+            feedback_arcs: Optional feedback arc set for the whole graph; edges
+                in it are preferred since removing them breaks other cycles too
 
         Returns:
             List of BreakingCandidate sorted by impact score
@@ -247,6 +310,11 @@ class CycleAnalyzer:
             if total_deps > 0:
                 impact_score = 1 - (source_deps / total_deps) * 0.5
 
+            # Edges in the feedback arc set always rank first
+            in_feedback_set = bool(feedback_arcs) and (source, target) in feedback_arcs
+            if in_feedback_set:
+                impact_score *= 0.5
+
             # Generate suggestion
             source_component = self._get_component(source)
             target_component = self._get_component(target)
@@ -258,6 +326,9 @@ class CycleAnalyzer:
                 suggestion = f"Consider using event bus or dependency injection for {source} -> {target}"
                 refactoring_type = "EVENT_BUS"
 
+            if in_feedback_set:
+                suggestion += " (part of minimum breaking set)"
+
             candidates.append(BreakingCandidate(
                 source=source,
                 target=target,
@@ -271,26 +342,36 @@ class CycleAnalyzer:
 
     def analyze_cycles(
         self,
-        cycles: List[List[str]],
-        dependencies: Dict[str, List[str]]
+        cycles: Iterable[List[str]],
+        dependencies: Dict[str, List[str]],
+        max_cycles: Optional[int] = None
     ) -> List[CycleReport]:
         """
-        Analyze all cycles and generate reports.
+        Analyze cycles and generate reports.
 
         Args:
-            cycles: List of cycles (each cycle is list of module names)
+            cycles: Cycles (each a list of module names); may be a generator
+                such as detect_cycles(), which is consumed lazily
             dependencies: Full dependency graph
+            max_cycles: Stop after reporting this many cycles
 
         Returns:
             List of CycleReport objects
         """
         reports = []
+        feedback_arcs = set(self.find_feedback_arc_set(dependencies))
 
         for cycle in cycles:
+            if max_cycles is not None and len(reports) >= max_cycles:
+                logger.warning(f"Cycle analysis stopped at max_cycles={max_cycles}")
+                break
+
             cycle_id = self._get_cycle_id(cycle)
             classification = self.classify_cycle(cycle)
             severity = self.get_severity(classification)
-            breaking_candidates = self.find_breaking_candidates(cycle, dependencies)
+            breaking_candidates = self.find_breaking_candidates(
+                cycle, dependencies, feedback_arcs
+            )
 
             # Check if approved
             approved_info = self._approved_cycles.get(cycle_id, {})
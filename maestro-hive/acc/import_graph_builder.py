@@ -11,6 +11,12 @@ Enhanced Features (MD-2081):
 - Incremental graph building with file hash caching
 - Namespace package support
 - Performance target: <30 seconds for 1000+ files
+
+Parse Performance:
+- Process-pool parsing with chunked work distribution (ast.parse is GIL-bound)
+- mtime/size/inode fast path that skips reading and hashing unchanged files
+- Compact versioned JSON cache (one array per module); legacy JSON caches
+  are still readable
 """
 
 import ast
@@ -19,15 +25,36 @@ import hashlib
 import json
 import time
 import logging
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Set, Optional, Tuple, Any
 import networkx as nx
 
 logger = logging.getLogger(__name__)
 
+# Cache format version; bump when the cached record layout changes
+# (version "1.0" caches, with one object per module, are still read)
+CACHE_FORMAT_VERSION = 2
+
+# Parse modes accepted by ImportGraphBuilder
+PARSE_MODE_THREAD = "thread"
+PARSE_MODE_PROCESS = "process"
+PARSE_MODE_AUTO = "auto"
+
+# In "auto" mode, projects with at least this many files to parse use processes
+PROCESS_POOL_MIN_FILES = 200
+
+# (mtime_ns, size, inode) used to detect unchanged files without hashing
+StatSignature = Tuple[int, int, int]
+
+# Cycle enumeration bounds (the number of simple cycles is exponential in
+# densely coupled packages, so find_cycles never enumerates all of them)
+DEFAULT_MAX_CYCLES = 1000
+DEFAULT_MAX_CYCLES_PER_COMPONENT = 200
+
 
 @dataclass
 class ModuleInfo:
@@ -65,6 +92,189 @@ class BuildMetrics:
     star_imports_found: int = 0
 
 
+def cyclic_components(graph: nx.DiGraph) -> List[Set[str]]:
+    """
+    Find strongly connected components of a graph that contain a cycle.
+
+    Every cycle lies entirely inside one of these components, so cycle
+    enumeration can be restricted to them. Components are returned smallest
+    first so cheap components are always fully reported.
+
+    Returns:
+        List of node sets (size > 1, or a single node with a self-loop)
+    """
+    components = [
+        set(scc)
+        for scc in nx.strongly_connected_components(graph)
+        if len(scc) > 1 or graph.has_edge(next(iter(scc)), next(iter(scc)))
+    ]
+    return sorted(components, key=lambda scc: (len(scc), min(scc)))
+
+
+def iter_bounded_cycles(
+    graph: nx.DiGraph,
+    max_length: Optional[int] = None,
+    max_cycles: Optional[int] = DEFAULT_MAX_CYCLES,
+    max_cycles_per_component: Optional[int] = DEFAULT_MAX_CYCLES_PER_COMPONENT,
+    within: Optional[Set[str]] = None
+) -> Iterator[List[str]]:
+    """
+    Stream simple cycles, enumerating each cyclic SCC separately.
+
+    Args:
+        graph: Directed dependency graph
+        max_length: Skip cycles longer than this (None = unbounded)
+        max_cycles: Stop after this many cycles in total (None = unbounded)
+        max_cycles_per_component: Stop enumerating a component after this many
+            cycles so one dense component can't starve the others
+        within: Only enumerate components containing one of these nodes
+
+    Yields:
+        Cycles as lists of node names
+    """
+    emitted = 0
+    for scc in cyclic_components(graph):
+        if within is not None and not (scc & within):
+            continue
+
+        per_component = 0
+        for cycle in _simple_cycles(graph.subgraph(scc), max_length):
+            yield cycle
+            emitted += 1
+            per_component += 1
+            if max_cycles is not None and emitted >= max_cycles:
+                logger.warning(f"Cycle enumeration stopped at max_cycles={max_cycles}")
+                return
+            if max_cycles_per_component is not None and per_component >= max_cycles_per_component:
+                logger.warning(
+                    f"Cycle enumeration truncated for component of {len(scc)} modules "
+                    f"at {max_cycles_per_component} cycles"
+                )
+                break
+
+
+def _simple_cycles(graph: nx.DiGraph, max_length: Optional[int]) -> Iterator[List[str]]:
+    """nx.simple_cycles with a length bound on NetworkX versions that lack one."""
+    if max_length is None:
+        return nx.simple_cycles(graph)
+    try:
+        return nx.simple_cycles(graph, length_bound=max_length)
+    except TypeError:  # NetworkX < 3.1
+        return (c for c in nx.simple_cycles(graph) if len(c) <= max_length)
+
+
+def greedy_feedback_arc_set(graph: nx.DiGraph) -> Set[Tuple[str, str]]:
+    """
+    Approximate a minimum feedback arc set (Eades-Lin-Smyth heuristic).
+
+    Removing the returned edges makes the graph acyclic. Each cyclic SCC is
+    ordered greedily (sinks last, sources first, otherwise the node with the
+    largest out-degree minus in-degree next); edges pointing backwards in
+    that order form the arc set. Nodes sit in buckets keyed by out-degree
+    minus in-degree, so each pick and each degree update is amortised O(1)
+    and a component is ordered in O(V + E).
+
+    Returns:
+        Set of (source, target) edges
+    """
+    feedback_arcs: Set[Tuple[str, str]] = set()
+
+    for scc in cyclic_components(graph):
+        nodes = sorted(scc)
+        sub = graph.subgraph(nodes)
+        succ = {n: set(sub.successors(n)) - {n} for n in nodes}
+        pred = {n: set(sub.predecessors(n)) - {n} for n in nodes}
+        feedback_arcs.update((n, n) for n in nodes if sub.has_edge(n, n))
+
+        head: List[str] = []
+        tail: List[str] = []
+        remaining = set(nodes)
+        sinks = deque(n for n in nodes if not succ[n])
+        sources = deque(n for n in nodes if not pred[n])
+
+        # Bucket queue: delta -> nodes (insertion-ordered), plus an upper
+        # bound on the largest non-empty bucket. The bound only rises by one
+        # per removed edge, so lowering it costs O(V + E) in total.
+        delta = {n: len(succ[n]) - len(pred[n]) for n in nodes}
+        buckets: Dict[int, Dict[str, None]] = defaultdict(dict)
+        for n in nodes:
+            buckets[delta[n]][n] = None
+        top = max(delta.values())
+
+        def shift(node: str, change: int):
+            nonlocal top
+            del buckets[delta[node]][node]
+            delta[node] += change
+            buckets[delta[node]][node] = None
+            top = max(top, delta[node])
+
+        def remove(node: str):
+            remaining.discard(node)
+            del buckets[delta[node]][node]
+            for s in succ.pop(node):
+                pred[s].discard(node)
+                shift(s, 1)
+                if not pred[s]:
+                    sources.append(s)
+            for p in pred.pop(node):
+                succ[p].discard(node)
+                shift(p, -1)
+                if not succ[p]:
+                    sinks.append(p)
+
+        while remaining:
+            if sinks:
+                node = sinks.popleft()
+                if node in remaining:
+                    tail.append(node)
+                    remove(node)
+            elif sources:
+                node = sources.popleft()
+                if node in remaining:
+                    head.append(node)
+                    remove(node)
+            else:
+                while not buckets[top]:
+                    top -= 1
+                node = next(iter(buckets[top]))
+                head.append(node)
+                remove(node)
+
+        order = {node: i for i, node in enumerate(head + tail[::-1])}
+        feedback_arcs.update(
+            (u, v) for u, v in sub.edges() if u != v and order[u] > order[v]
+        )
+
+    return feedback_arcs
+
+
+@dataclass
+class GraphDelta:
+    """Changes applied to an ImportGraph by an incremental update."""
+    added_modules: Set[str] = field(default_factory=set)
+    changed_modules: Set[str] = field(default_factory=set)
+    removed_modules: Set[str] = field(default_factory=set)
+    edges_added: Set[Tuple[str, str]] = field(default_factory=set)
+    edges_removed: Set[Tuple[str, str]] = field(default_factory=set)
+
+    @property
+    def affected_modules(self) -> Set[str]:
+        """Modules whose dependencies or coupling may have changed."""
+        affected = self.added_modules | self.changed_modules | self.removed_modules
+        for source, target in self.edges_added | self.edges_removed:
+            affected.add(source)
+            affected.add(target)
+        return affected
+
+    @property
+    def is_empty(self) -> bool:
+        """True if the update did not change any module or edge."""
+        return not (
+            self.added_modules or self.changed_modules or self.removed_modules
+            or self.edges_added or self.edges_removed
+        )
+
+
 class ImportGraph:
     """
     Dependency graph of Python modules based on import statements.
@@ -143,19 +353,110 @@ class ImportGraph:
         except nx.NetworkXNoCycle:
             return False
 
-    def find_cycles(self) -> List[List[str]]:
+    def remove_module(self, module_name: str):
+        """
+        Remove a module and all of its edges from the graph.
+
+        Args:
+            module_name: Module name
+        """
+        self.modules.pop(module_name, None)
+        if module_name in self.graph:
+            self.graph.remove_node(module_name)
+
+    def cyclic_components(self) -> List[Set[str]]:
         """
-        Find all cycles in the graph.
+        Find strongly connected components that contain at least one cycle.
+
+        Every cycle lies entirely inside one of these components, so callers
+        can restrict cycle enumeration to the components they care about.
+
+        Returns:
+            List of module name sets (size > 1, or a single self-importing module)
+        """
+        return cyclic_components(self.graph)
+
+    def iter_cycles(
+        self,
+        max_length: Optional[int] = None,
+        max_cycles: Optional[int] = DEFAULT_MAX_CYCLES,
+        max_cycles_per_component: Optional[int] = DEFAULT_MAX_CYCLES_PER_COMPONENT,
+        within: Optional[Set[str]] = None
+    ) -> Iterator[List[str]]:
+        """
+        Stream cycles component by component with length and count caps.
+
+        See iter_bounded_cycles for the meaning of the bounds.
+        """
+        return iter_bounded_cycles(
+            self.graph,
+            max_length=max_length,
+            max_cycles=max_cycles,
+            max_cycles_per_component=max_cycles_per_component,
+            within=within
+        )
+
+    def find_cycles_touching(
+        self,
+        module_names: Set[str],
+        max_length: Optional[int] = None,
+        max_cycles: Optional[int] = DEFAULT_MAX_CYCLES
+    ) -> List[List[str]]:
+        """
+        Find cycles in the components that contain any of the given modules.
+
+        Args:
+            module_names: Modules of interest
+            max_length: Skip cycles longer than this
+            max_cycles: Maximum number of cycles to return
+
+        Returns:
+            List of cycles, where each cycle is a list of module names
+        """
+        return list(self.iter_cycles(
+            max_length=max_length, max_cycles=max_cycles, within=set(module_names)
+        ))
+
+    def find_cycles(
+        self,
+        max_length: Optional[int] = None,
+        max_cycles: Optional[int] = DEFAULT_MAX_CYCLES,
+        max_cycles_per_component: Optional[int] = DEFAULT_MAX_CYCLES_PER_COMPONENT
+    ) -> List[List[str]]:
+        """
+        Find cycles in the graph.
+
+        Enumeration runs per strongly connected component and is bounded, so
+        densely coupled packages can't stall the caller. Pass None for both
+        caps to enumerate every cycle.
+
+        Args:
+            max_length: Skip cycles longer than this (None = unbounded)
+            max_cycles: Maximum number of cycles to return
+            max_cycles_per_component: Maximum cycles reported per component
 
         Returns:
             List of cycles, where each cycle is a list of module names
         """
         try:
-            cycles = list(nx.simple_cycles(self.graph))
-            return cycles
-        except:
+            return list(self.iter_cycles(
+                max_length=max_length,
+                max_cycles=max_cycles,
+                max_cycles_per_component=max_cycles_per_component
+            ))
+        except Exception as e:
+            logger.warning(f"Cycle detection failed: {e}")
             return []
 
+    def feedback_arc_set(self) -> Set[Tuple[str, str]]:
+        """
+        Approximate minimum set of edges whose removal breaks every cycle.
+
+        Returns:
+            Set of (source, target) dependency edges
+        """
+        return greedy_feedback_arc_set(self.graph)
+
     def calculate_coupling(self, module_name: str) -> Tuple[int, int, float]:
         """
         Calculate coupling metrics for a module.
@@ -266,7 +567,10 @@ class ImportGraphBuilder:
         project_path: str,
         project_name: Optional[str] = None,
         max_workers: int = 4,  # MD-2081: Parallel workers
-        cache_path: Optional[str] = None  # MD-2081: Cache for incremental builds
+        cache_path: Optional[str] = None,  # MD-2081: Cache for incremental builds
+        parse_mode: str = PARSE_MODE_AUTO,
+        chunk_size: Optional[int] = None,
+        load_cache: bool = True
     ):
         """
         Initialize import graph builder.
@@ -276,13 +580,25 @@ class ImportGraphBuilder:
             project_name: Project name (used for module resolution)
             max_workers: Number of parallel workers for file scanning
             cache_path: Path to cache file for incremental builds
+                (default: <project>/.acc_cache.json)
+            parse_mode: "thread", "process" or "auto" (process pool when at
+                least PROCESS_POOL_MIN_FILES files need parsing)
+            chunk_size: Files per process-pool task (default: derived from
+                the number of files and workers)
+            load_cache: Whether to load the on-disk cache at construction
         """
+        if parse_mode not in (PARSE_MODE_THREAD, PARSE_MODE_PROCESS, PARSE_MODE_AUTO):
+            raise ValueError(f"Unknown parse_mode: {parse_mode}")
+
         self.project_path = Path(project_path)
         self.project_name = project_name or self.project_path.name
         self.max_workers = max_workers
+        self.parse_mode = parse_mode
+        self.chunk_size = chunk_size
         self.cache_path = Path(cache_path) if cache_path else self.project_path / ".acc_cache.json"
         self._module_cache: Dict[str, ModuleInfo] = {}
         self._file_hashes: Dict[str, str] = {}
+        self._file_stats: Dict[str, StatSignature] = {}
 
         self.exclusions: List[str] = [
             '__pycache__',
@@ -298,12 +614,16 @@ class ImportGraphBuilder:
         ]
 
         # Load existing cache
-        self._load_cache()
+        if load_cache:
+            self._load_cache()
 
     def build_graph(self, use_cache: bool = True, parallel: bool = True) -> ImportGraph:
         """
         Build import graph from Python files in the project.
 
+        Files whose stat signature (mtime, size, inode) matches the cache are
+        reused without being read; only the remaining files are parsed.
+
         Args:
             use_cache: Whether to use incremental caching (default: True)
             parallel: Whether to use parallel scanning (default: True)
@@ -318,17 +638,28 @@ class ImportGraphBuilder:
         python_files = self._find_python_files()
         graph.build_metrics.total_files = len(python_files)
 
-        # Parse files (parallel or sequential)
+        # Reuse unchanged files straight from the cache (stat fast path)
         parse_start = time.time()
-        if parallel and len(python_files) > 10:
-            parsed_modules = self._parse_files_parallel(python_files, use_cache)
+        if use_cache:
+            cached_modules, stale_files = self._partition_cached(python_files)
         else:
-            parsed_modules = self._parse_files_sequential(python_files, use_cache)
+            cached_modules, stale_files = [], python_files
+        graph.build_metrics.files_cached = len(cached_modules)
+
+        # Parse remaining files (process pool, thread pool or sequential)
+        if parallel and len(stale_files) > 10:
+            if self._use_process_pool(len(stale_files)):
+                parsed_modules = self._parse_files_process_pool(stale_files, use_cache)
+            else:
+                parsed_modules = self._parse_files_parallel(stale_files, use_cache)
+        else:
+            parsed_modules = self._parse_files_sequential(stale_files, use_cache)
 
         graph.build_metrics.parse_time_ms = (time.time() - parse_start) * 1000
+        graph.build_metrics.files_failed = sum(1 for m in parsed_modules if m is None)
 
         # Add modules to graph
-        for module_info in parsed_modules:
+        for module_info in cached_modules + parsed_modules:
             if module_info:
                 graph.add_module(module_info)
                 graph.build_metrics.files_parsed += 1
@@ -345,20 +676,179 @@ class ImportGraphBuilder:
                     graph.add_dependency(module_name, resolved_dep)
                     graph.build_metrics.total_dependencies += 1
 
-        # Save cache for incremental builds
+        # Save cache for incremental builds (skip the write on fully warm runs)
         if use_cache:
-            self._save_cache()
+            removed = self._prune_cache(python_files)
+            if stale_files or removed:
+                self._save_cache()
 
         graph.build_metrics.build_time_ms = (time.time() - start_time) * 1000
 
         logger.info(
-            f"Built import graph: {graph.build_metrics.files_parsed} files, "
+            f"Built import graph: {graph.build_metrics.files_parsed} files "
+            f"({graph.build_metrics.files_cached} cached), "
             f"{graph.build_metrics.total_dependencies} deps, "
             f"{graph.build_metrics.build_time_ms:.0f}ms"
         )
 
         return graph
 
+    def update_graph(self, graph: ImportGraph, changed_files: Iterable[Path]) -> GraphDelta:
+        """
+        Incrementally patch a graph built by build_graph.
+
+        Only the given files are re-parsed. Deleted files are removed from the
+        graph, outgoing edges of added/changed modules are re-resolved, and
+        existing modules that import a newly added module gain their edge.
+        A file that fails to parse keeps its previous graph entry until it
+        parses again.
+
+        Args:
+            graph: ImportGraph to update in place
+            changed_files: Added, modified or deleted Python files
+
+        Returns:
+            GraphDelta describing the modules and edges that changed
+        """
+        delta = GraphDelta()
+
+        for file_path in changed_files:
+            file_path = Path(file_path)
+            if file_path.suffix != '.py' or self._is_excluded(file_path):
+                continue
+
+            if not file_path.exists():
+                cache_key = str(file_path)
+                self._module_cache.pop(cache_key, None)
+                self._file_stats.pop(cache_key, None)
+
+                module_name = self._get_module_name(file_path)
+                module_info = graph.modules.get(module_name)
+                if module_info and Path(module_info.file_path) == file_path:
+                    delta.edges_removed.update(graph.graph.in_edges(module_name))
+                    delta.edges_removed.update(graph.graph.out_edges(module_name))
+                    graph.remove_module(module_name)
+                    delta.removed_modules.add(module_name)
+                continue
+
+            module_info = self._parse_file_cached(file_path, use_cache=True)
+            if module_info is None:
+                continue
+
+            module_name = module_info.module_name
+            previous = graph.modules.get(module_name)
+            if previous is module_info:
+                continue
+            if previous is None:
+                delta.added_modules.add(module_name)
+            else:
+                delta.changed_modules.add(module_name)
+            graph.add_module(module_info)
+
+        # Re-resolve outgoing edges of parsed modules
+        for module_name in delta.added_modules | delta.changed_modules:
+            old_targets = set(graph.graph.successors(module_name))
+            new_targets = {
+                resolved
+                for resolved in map(self._resolve_import, graph.modules[module_name].all_dependencies())
+                if resolved and resolved in graph.modules
+            }
+            for target in old_targets - new_targets:
+                graph.graph.remove_edge(module_name, target)
+                delta.edges_removed.add((module_name, target))
+            for target in new_targets - old_targets:
+                graph.add_dependency(module_name, target)
+                delta.edges_added.add((module_name, target))
+
+        # Existing modules may import a module that only now exists
+        if delta.added_modules:
+            parsed = delta.added_modules | delta.changed_modules
+            for module_name, module_info in graph.modules.items():
+                if module_name in parsed:
+                    continue
+                for dep in module_info.all_dependencies():
+                    resolved = self._resolve_import(dep)
+                    if resolved in delta.added_modules and not graph.graph.has_edge(module_name, resolved):
+                        graph.add_dependency(module_name, resolved)
+                        delta.edges_added.add((module_name, resolved))
+
+        graph.build_metrics.files_parsed = len(graph.modules)
+        graph.build_metrics.total_dependencies = graph.graph.number_of_edges()
+
+        return delta
+
+    def detect_changed_files(self) -> List[Path]:
+        """
+        Find files added, modified or deleted since they were last parsed.
+
+        Uses the same stat signatures as the build cache, so no file is read.
+
+        Returns:
+            List of changed file paths (deleted files no longer exist on disk)
+        """
+        python_files = self._find_python_files()
+        live: Set[str] = set()
+        changed: List[Path] = []
+
+        for py_file in python_files:
+            cache_key = str(py_file)
+            live.add(cache_key)
+            signature = self._stat_signature(py_file)
+            if signature is None or self._file_stats.get(cache_key) != signature:
+                changed.append(py_file)
+
+        changed.extend(Path(key) for key in self._module_cache if key not in live)
+        return changed
+
+    def flush_cache(self):
+        """Persist the in-memory parse cache (used by long-running watch mode)."""
+        self._save_cache()
+
+    def _prune_cache(self, python_files: List[Path]) -> int:
+        """Drop cache entries for files that no longer exist; returns count removed."""
+        live = {str(f) for f in python_files}
+        removed = [key for key in self._module_cache if key not in live]
+        for key in removed:
+            del self._module_cache[key]
+            self._file_stats.pop(key, None)
+        return len(removed)
+
+    def _use_process_pool(self, file_count: int) -> bool:
+        """Decide whether a parse batch should run on the process pool."""
+        if self.parse_mode == PARSE_MODE_PROCESS:
+            return True
+        if self.parse_mode == PARSE_MODE_AUTO:
+            return self.max_workers > 1 and file_count >= PROCESS_POOL_MIN_FILES
+        return False
+
+    def _partition_cached(
+        self,
+        python_files: List[Path]
+    ) -> Tuple[List[ModuleInfo], List[Path]]:
+        """
+        Split files into cache hits and files that need parsing.
+
+        A file is a cache hit when its current stat signature equals the one
+        recorded when it was last parsed, so no read or hash is needed.
+
+        Returns:
+            Tuple of (cached ModuleInfo objects, files to parse)
+        """
+        cached: List[ModuleInfo] = []
+        stale: List[Path] = []
+
+        for py_file in python_files:
+            cache_key = str(py_file)
+            module_info = self._module_cache.get(cache_key)
+            if module_info is not None:
+                signature = self._stat_signature(py_file)
+                if signature is not None and self._file_stats.get(cache_key) == signature:
+                    cached.append(module_info)
+                    continue
+            stale.append(py_file)
+
+        return cached, stale
+
     def _parse_files_parallel(
         self,
         python_files: List[Path],
@@ -384,6 +874,64 @@ class ImportGraphBuilder:
 
         return results
 
+    def _parse_files_process_pool(
+        self,
+        python_files: List[Path],
+        use_cache: bool
+    ) -> List[Optional[ModuleInfo]]:
+        """
+        Parse files on a process pool in chunks.
+
+        Each worker builds its own parser once (pool initializer) and handles
+        whole chunks, so pickling and scheduling overhead is paid per chunk
+        rather than per file. Falls back to the thread pool if worker
+        processes cannot be started.
+        """
+        chunk_size = self.chunk_size or max(
+            1, min(256, len(python_files) // (self.max_workers * 4) or 1)
+        )
+        chunks = [
+            python_files[i:i + chunk_size]
+            for i in range(0, len(python_files), chunk_size)
+        ]
+        results: List[Optional[ModuleInfo]] = []
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_parse_worker,
+                initargs=(str(self.project_path),)
+            ) as executor:
+                future_to_chunk = {
+                    executor.submit(_parse_chunk_worker, chunk): chunk
+                    for chunk in chunks
+                }
+
+                for future in as_completed(future_to_chunk):
+                    chunk = future_to_chunk[future]
+                    try:
+                        parsed = future.result()
+                    except BrokenProcessPool:
+                        # Every pending chunk is lost with the pool
+                        raise
+                    except Exception as e:
+                        logger.warning(f"Failed to parse chunk of {len(chunk)} files: {e}")
+                        results.extend([None] * len(chunk))
+                        continue
+
+                    for py_file, module_info, signature in parsed:
+                        if module_info:
+                            self._remember(py_file, module_info, signature)
+                        results.append(module_info)
+
+        except (OSError, RuntimeError) as e:
+            # BrokenProcessPool (a RuntimeError) or no semaphore support in
+            # the sandbox; files parsed so far are served from the cache
+            logger.warning(f"Process pool unavailable ({e}), falling back to threads")
+            return self._parse_files_parallel(python_files, use_cache)
+
+        return results
+
     def _parse_files_sequential(
         self,
         python_files: List[Path],
@@ -408,24 +956,64 @@ class ImportGraphBuilder:
         use_cache: bool
     ) -> Optional[ModuleInfo]:
         """Parse file with caching support (MD-2081)."""
-        # Calculate file hash
-        file_hash = self._calculate_file_hash(file_path)
         cache_key = str(file_path)
+        signature = self._stat_signature(file_path)
+
+        # Stat fast path: unchanged file, no read or hash needed
+        cached = self._module_cache.get(cache_key) if use_cache else None
+        if cached and signature is not None and self._file_stats.get(cache_key) == signature:
+            return cached
 
-        # Check cache
-        if use_cache and cache_key in self._module_cache:
-            cached = self._module_cache[cache_key]
-            if cached.file_hash == file_hash:
-                return cached
+        try:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+
+        # Content unchanged (e.g. touched file): refresh the stat signature only
+        file_hash = hashlib.md5(content).hexdigest()
+        if cached and cached.file_hash == file_hash:
+            if signature is not None:
+                self._file_stats[cache_key] = signature
+            return cached
 
         # Parse file
-        module_info = self._parse_file(file_path)
+        module_info = self._parse_file(file_path, source=content)
         if module_info:
             module_info.file_hash = file_hash
-            self._module_cache[cache_key] = module_info
+            self._remember(file_path, module_info, signature)
+        else:
+            # Don't serve a stale module for a file that no longer parses, but
+            # remember its signature so change detection doesn't retry it
+            self._module_cache.pop(cache_key, None)
+            if signature is not None:
+                self._file_stats[cache_key] = signature
 
         return module_info
 
+    def _remember(
+        self,
+        file_path: Path,
+        module_info: ModuleInfo,
+        signature: Optional[StatSignature]
+    ):
+        """Record a freshly parsed module in the in-memory cache."""
+        cache_key = str(file_path)
+        self._module_cache[cache_key] = module_info
+        if signature is not None:
+            self._file_stats[cache_key] = signature
+        else:
+            self._file_stats.pop(cache_key, None)
+
+    @staticmethod
+    def _stat_signature(file_path: Path) -> Optional[StatSignature]:
+        """Return (mtime_ns, size, inode) for a file, or None if it can't be stat'ed."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
     def _calculate_file_hash(self, file_path: Path) -> str:
         """Calculate MD5 hash of file content (MD-2081)."""
         try:
@@ -443,59 +1031,109 @@ class ImportGraphBuilder:
             with open(self.cache_path, 'r') as f:
                 cache_data = json.load(f)
 
-            for file_path, module_data in cache_data.get('modules', {}).items():
-                self._module_cache[file_path] = ModuleInfo(
-                    module_name=module_data['module_name'],
-                    file_path=Path(module_data['file_path']),
-                    imports=module_data.get('imports', []),
-                    from_imports=module_data.get('from_imports', []),
-                    dynamic_imports=module_data.get('dynamic_imports', []),
-                    star_imports=module_data.get('star_imports', []),
-                    exports=module_data.get('exports', []),
-                    size_lines=module_data.get('size_lines', 0),
-                    classes=module_data.get('classes', []),
-                    functions=module_data.get('functions', []),
-                    file_hash=module_data.get('file_hash', ''),
-                    is_namespace_package=module_data.get('is_namespace_package', False)
-                )
+            if cache_data.get('version') == '1.0':
+                self._load_legacy_cache(cache_data)
+            elif cache_data.get('version') != CACHE_FORMAT_VERSION:
+                logger.debug("Ignoring cache with unsupported format version")
+            elif cache_data.get('project_path') != str(self.project_path):
+                logger.debug("Ignoring cache built for a different project path")
+            else:
+                self._load_compact_cache(cache_data)
 
             logger.debug(f"Loaded {len(self._module_cache)} cached modules")
 
         except Exception as e:
             logger.warning(f"Failed to load cache: {e}")
+            self._module_cache.clear()
+            self._file_stats.clear()
+
+    def _load_compact_cache(self, cache_data: Dict[str, Any]):
+        """Load the per-module arrays written by _save_cache."""
+        for file_path, record in cache_data.get('modules', {}).items():
+            (module_name, module_path, imports, from_imports, dynamic_imports,
+             star_imports, exports, size_lines, classes, functions, file_hash,
+             is_namespace_package, signature) = record
+
+            self._module_cache[file_path] = ModuleInfo(
+                module_name=module_name,
+                file_path=Path(module_path),
+                imports=imports,
+                from_imports=from_imports,
+                dynamic_imports=dynamic_imports,
+                star_imports=star_imports,
+                exports=exports,
+                size_lines=size_lines,
+                classes=classes,
+                functions=functions,
+                file_hash=file_hash,
+                is_namespace_package=is_namespace_package
+            )
+            if signature:
+                self._file_stats[file_path] = tuple(signature)
+
+    def _load_legacy_cache(self, cache_data: Dict[str, Any]):
+        """Load the version "1.0" cache format (MD-2081)."""
+        for file_path, module_data in cache_data.get('modules', {}).items():
+            self._module_cache[file_path] = ModuleInfo(
+                module_name=module_data['module_name'],
+                file_path=Path(module_data['file_path']),
+                imports=module_data.get('imports', []),
+                from_imports=module_data.get('from_imports', []),
+                dynamic_imports=module_data.get('dynamic_imports', []),
+                star_imports=module_data.get('star_imports', []),
+                exports=module_data.get('exports', []),
+                size_lines=module_data.get('size_lines', 0),
+                classes=module_data.get('classes', []),
+                functions=module_data.get('functions', []),
+                file_hash=module_data.get('file_hash', ''),
+                is_namespace_package=module_data.get('is_namespace_package', False)
+            )
+            signature = module_data.get('file_stat')
+            if signature:
+                self._file_stats[file_path] = tuple(signature)
 
     def _save_cache(self):
-        """Save module cache to disk (MD-2081)."""
-        try:
-            cache_data = {
-                'version': '1.0',
-                'project_path': str(self.project_path),
-                'modules': {
-                    path: {
-                        'module_name': info.module_name,
-                        'file_path': str(info.file_path),
-                        'imports': info.imports,
-                        'from_imports': info.from_imports,
-                        'dynamic_imports': info.dynamic_imports,
-                        'star_imports': info.star_imports,
-                        'exports': info.exports,
-                        'size_lines': info.size_lines,
-                        'classes': info.classes,
-                        'functions': info.functions,
-                        'file_hash': info.file_hash,
-                        'is_namespace_package': info.is_namespace_package
-                    }
-                    for path, info in self._module_cache.items()
-                }
-            }
+        """
+        Save module cache to disk (MD-2081).
 
-            with open(self.cache_path, 'w') as f:
-                json.dump(cache_data, f)
+        Each module is one JSON array (see _load_compact_cache). The file is
+        written to a temporary path and renamed into place so a concurrent
+        reader never sees a partially written cache.
+        """
+        cache_data = {
+            'version': CACHE_FORMAT_VERSION,
+            'project_path': str(self.project_path),
+            'modules': {
+                path: [
+                    info.module_name,
+                    str(info.file_path),
+                    info.imports,
+                    info.from_imports,
+                    info.dynamic_imports,
+                    info.star_imports,
+                    info.exports,
+                    info.size_lines,
+                    info.classes,
+                    info.functions,
+                    info.file_hash,
+                    info.is_namespace_package,
+                    list(self._file_stats.get(path, ()))
+                ]
+                for path, info in self._module_cache.items()
+            }
+        }
 
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(cache_data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_path)
             logger.debug(f"Saved {len(self._module_cache)} modules to cache")
 
         except Exception as e:
             logger.warning(f"Failed to save cache: {e}")
+            tmp_path.unlink(missing_ok=True)
 
     def _find_python_files(self) -> List[Path]:
         """
@@ -508,14 +1146,18 @@ class ImportGraphBuilder:
 
         for py_file in self.project_path.rglob("*.py"):
             # Skip excluded directories
-            if any(excl in str(py_file) for excl in self.exclusions):
+            if self._is_excluded(py_file):
                 continue
 
             python_files.append(py_file)
 
         return sorted(python_files)
 
-    def _parse_file(self, file_path: Path) -> Optional[ModuleInfo]:
+    def _is_excluded(self, file_path: Path) -> bool:
+        """Check whether a path matches any exclusion pattern."""
+        return any(excl in str(file_path) for excl in self.exclusions)
+
+    def _parse_file(self, file_path: Path, source: Optional[bytes] = None) -> Optional[ModuleInfo]:
         """
         Parse a Python file and extract module information.
 
@@ -527,13 +1169,17 @@ class ImportGraphBuilder:
 
         Args:
             file_path: Path to Python file
+            source: File content if already read by the caller
 
         Returns:
             ModuleInfo object or None if parsing fails
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
+            if source is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    source = f.read()
+            else:
+                source = source.decode('utf-8')
 
             # Parse AST
             tree = ast.parse(source, filename=str(file_path))
@@ -541,21 +1187,25 @@ class ImportGraphBuilder:
             # Get module name
             module_name = self._get_module_name(file_path)
 
+            # Walk the AST once and share the node list between extractors
+            nodes = list(ast.walk(tree))
+
             # Extract imports (enhanced)
-            imports, from_imports, dynamic_imports, star_imports = self._extract_imports_enhanced(tree)
+            imports, from_imports, dynamic_imports, star_imports = \
+                self._extract_imports_enhanced(tree, nodes)
 
             # Extract __all__ exports
-            exports = self._extract_exports(tree)
+            exports = self._extract_exports(tree, nodes)
 
             # Extract classes and functions
-            classes = self._extract_classes(tree)
-            functions = self._extract_functions(tree)
+            classes = self._extract_classes(tree, nodes)
+            functions = self._extract_functions(tree, nodes)
 
             # Count lines
             size_lines = len(source.splitlines())
 
             # Check if namespace package (PEP 420)
-            is_namespace = self._is_namespace_package(file_path)
+            is_namespace = self._is_namespace_package(file_path, source)
 
             return ModuleInfo(
                 module_name=module_name,
@@ -575,7 +1225,7 @@ class ImportGraphBuilder:
             logger.debug(f"Error parsing {file_path}: {e}")
             return None
 
-    def _is_namespace_package(self, file_path: Path) -> bool:
+    def _is_namespace_package(self, file_path: Path, source: Optional[str] = None) -> bool:
         """Check if this is a PEP 420 namespace package (MD-2081)."""
         # A namespace package is a directory without __init__.py
         # but containing Python files or subdirectories with Python files
@@ -585,8 +1235,10 @@ class ImportGraphBuilder:
         parent_dir = file_path.parent
         # Check if __init__.py is empty or only has docstrings/comments
         try:
-            with open(file_path, 'r') as f:
-                content = f.read().strip()
+            if source is None:
+                with open(file_path, 'r') as f:
+                    source = f.read()
+            content = source.strip()
 
             # Empty or docstring-only __init__.py in directory with subpackages
             if not content:
@@ -642,7 +1294,8 @@ class ImportGraphBuilder:
 
     def _extract_imports_enhanced(
         self,
-        tree: ast.AST
+        tree: ast.AST,
+        nodes: Optional[List[ast.AST]] = None
     ) -> Tuple[List[str], List[str], List[str], List[str]]:
         """
         Extract import statements with enhanced detection (MD-2081).
@@ -655,6 +1308,7 @@ class ImportGraphBuilder:
 
         Args:
             tree: AST tree
+            nodes: Pre-walked AST nodes (avoids re-walking the tree)
 
         Returns:
             Tuple of (imports, from_imports, dynamic_imports, star_imports)
@@ -664,7 +1318,7 @@ class ImportGraphBuilder:
         dynamic_imports = []
         star_imports = []
 
-        for node in ast.walk(tree):
+        for node in (nodes if nodes is not None else ast.walk(tree)):
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     imports.append(alias.name)
@@ -725,7 +1379,11 @@ class ImportGraphBuilder:
 
         return None
 
-    def _extract_exports(self, tree: ast.AST) -> List[str]:
+    def _extract_exports(
+        self,
+        tree: ast.AST,
+        nodes: Optional[List[ast.AST]] = None
+    ) -> List[str]:
         """
         Extract __all__ exports from module (MD-2081).
 
@@ -735,13 +1393,14 @@ class ImportGraphBuilder:
 
         Args:
             tree: AST tree
+            nodes: Pre-walked AST nodes (avoids re-walking the tree)
 
         Returns:
             List of exported names
         """
         exports = []
 
-        for node in ast.walk(tree):
+        for node in (nodes if nodes is not None else ast.walk(tree)):
             if isinstance(node, ast.Assign):
                 for target in node.targets:
                     if isinstance(target, ast.Name) and target.id == '__all__':
@@ -755,37 +1414,47 @@ class ImportGraphBuilder:
 
         return exports
 
-    def _extract_classes(self, tree: ast.AST) -> List[str]:
+    def _extract_classes(
+        self,
+        tree: ast.AST,
+        nodes: Optional[List[ast.AST]] = None
+    ) -> List[str]:
         """
         Extract class names from AST.
 
         Args:
             tree: AST tree
+            nodes: Pre-walked AST nodes (avoids re-walking the tree)
 
         Returns:
             List of class names
         """
         classes = []
 
-        for node in ast.walk(tree):
+        for node in (nodes if nodes is not None else ast.walk(tree)):
             if isinstance(node, ast.ClassDef):
                 classes.append(node.name)
 
         return classes
 
-    def _extract_functions(self, tree: ast.AST) -> List[str]:
+    def _extract_functions(
+        self,
+        tree: ast.AST,
+        nodes: Optional[List[ast.AST]] = None
+    ) -> List[str]:
         """
         Extract function names from AST.
 
         Args:
             tree: AST tree
+            nodes: Pre-walked AST nodes (avoids re-walking the tree)
 
         Returns:
             List of function names
         """
         functions = []
 
-        for node in ast.walk(tree):
+        for node in (nodes if nodes is not None else ast.walk(tree)):
             if isinstance(node, ast.FunctionDef):
                 functions.append(node.name)
 
@@ -818,6 +1487,37 @@ class ImportGraphBuilder:
         return None
 
 
+# Process-pool workers (module level so they can be pickled by reference)
+_worker_builder: Optional[ImportGraphBuilder] = None
+
+
+def _init_parse_worker(project_path: str):
+    """Create the per-process parser once, without loading the on-disk cache."""
+    global _worker_builder
+    _worker_builder = ImportGraphBuilder(project_path, load_cache=False)
+
+
+def _parse_chunk_worker(
+    file_paths: List[Path]
+) -> List[Tuple[Path, Optional[ModuleInfo], Optional[StatSignature]]]:
+    """Read, hash and parse a chunk of files in a worker process."""
+    results = []
+    for file_path in file_paths:
+        signature = ImportGraphBuilder._stat_signature(file_path)
+        try:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+        except OSError:
+            results.append((file_path, None, signature))
+            continue
+
+        module_info = _worker_builder._parse_file(file_path, source=content)
+        if module_info:
+            module_info.file_hash = hashlib.md5(content).hexdigest()
+        results.append((file_path, module_info, signature))
+    return results
+
+
 # Example usage
 if __name__ == "__main__":
     import sys
@@ -832,7 +1532,8 @@ if __name__ == "__main__":
 
     builder = ImportGraphBuilder(
         project_path=project_path,
-        max_workers=4  # Parallel scanning
+        max_workers=4,  # Parallel scanning
+        parse_mode="auto"  # Process pool for large projects
     )
 
     # Build graph with parallel scanning and caching
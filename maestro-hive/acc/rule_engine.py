@@ -180,6 +180,10 @@ class EvaluationResult:
     execution_time_ms: float = 0.0
     cache_hits: int = 0
     cache_misses: int = 0
+    # Watch mode: violations holds newly introduced ones, resolved_violations
+    # the ones that disappeared since the previous evaluation
+    is_delta: bool = False
+    resolved_violations: List[Violation] = field(default_factory=list)
 
     @property
     def blocking_violations(self) -> List[Violation]:
@@ -203,7 +207,7 @@ class EvaluationResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary."""
-        return {
+        data = {
             'violations': [v.to_dict() for v in self.violations],
             'summary': {
                 'total_violations': len(self.violations),
@@ -218,6 +222,10 @@ class EvaluationResult:
                 'cache_misses': self.cache_misses
             }
         }
+        if self.is_delta:
+            data['resolved_violations'] = [v.to_dict() for v in self.resolved_violations]
+            data['summary']['resolved'] = len(self.resolved_violations)
+        return data
 
 
 # ============================================================================
@@ -612,6 +620,85 @@ class RuleEngine:
 
         return result
 
+    def evaluate_affected(
+        self,
+        dependencies: Dict[str, List[str]],
+        affected_files: Set[str],
+        coupling_metrics: Optional[Dict[str, Tuple[int, int, float]]] = None,
+        cycles: Optional[List[List[str]]] = None,
+        dry_run: bool = False
+    ) -> EvaluationResult:
+        """
+        Evaluate only the rules that can be affected by a set of changed files.
+
+        Dependency and coupling rules are run against the affected files only,
+        and only for rules whose component owns one of those files. NO_CYCLES
+        rules are run against the given cycles (which the caller restricts to
+        the cycles touching the change) for the components those cycles span.
+
+        Args:
+            dependencies: Dict of file -> list of dependency files (full graph)
+            affected_files: Files whose dependencies or coupling may have changed
+            coupling_metrics: Optional coupling metrics for the affected files
+            cycles: Optional list of cycles touching the affected files
+            dry_run: If True, only simulate evaluation
+
+        Returns:
+            EvaluationResult with the violations found in the affected scope
+        """
+        start_time = datetime.now()
+
+        scoped_dependencies = {
+            file_path: deps for file_path, deps in dependencies.items()
+            if file_path in affected_files
+        }
+        scoped_coupling = None
+        if coupling_metrics:
+            scoped_coupling = {
+                file_path: metrics for file_path, metrics in coupling_metrics.items()
+                if file_path in affected_files
+            }
+
+        affected_components = {
+            component for component in map(self.get_component_for_file, affected_files)
+            if component
+        }
+        cycle_components = {
+            component
+            for cycle in (cycles or [])
+            for component in map(self.get_component_for_file, cycle)
+            if component
+        }
+
+        result = EvaluationResult()
+        result.files_analyzed = len(scoped_dependencies)
+        result.components_checked = len(affected_components | cycle_components)
+
+        for rule in self.rules:
+            relevant = cycle_components if rule.rule_type == RuleType.NO_CYCLES else affected_components
+            if rule.component not in relevant:
+                continue
+
+            result.violations.extend(self.evaluate_rule(
+                rule=rule,
+                dependencies=scoped_dependencies,
+                coupling_metrics=scoped_coupling,
+                cycles=cycles,
+                dry_run=dry_run
+            ))
+            result.rules_evaluated += 1
+
+        result.execution_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+        result.cache_hits = self.metrics['cache_hits']
+        result.cache_misses = self.metrics['cache_misses']
+
+        logger.debug(
+            f"Evaluated {result.rules_evaluated} affected rules over "
+            f"{len(affected_files)} files, found {len(result.violations)} violations"
+        )
+
+        return result
+
     def clear_cache(self) -> None:
         """Clear all caches."""
         self._file_to_component_cache.clear()
@@ -0,0 +1,261 @@
+"""
+ACC Watch Mode
+
+Long-running incremental architecture checking for local development.
+
+Instead of rebuilding the whole import graph and re-running every rule on
+each save, the watcher keeps the graph and the current violation set in
+memory and, per change:
+
+- re-parses only the changed files (ImportGraphBuilder.update_graph)
+- re-evaluates only the rules touching the affected components
+  (RuleEngine.evaluate_affected)
+- re-enumerates cycles only inside the strongly connected components that
+  contain an affected module
+- emits a delta EvaluationResult (new violations + resolved violations)
+
+Change detection uses inotify via the optional `watchdog` package when it is
+installed, and falls back to polling file stat signatures otherwise.
+"""
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from acc.import_graph_builder import ImportGraph, ImportGraphBuilder
+from acc.rule_engine import EvaluationResult, RuleEngine, RuleType, Violation
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+ViolationKey = Tuple[str, Optional[str], Optional[str], str]
+
+
+def _violation_key(violation: Violation) -> ViolationKey:
+    """Identity of a violation across evaluations (timestamps differ)."""
+    return (violation.rule_id, violation.source_file, violation.target_file, violation.message)
+
+
+if WATCHDOG_AVAILABLE:
+    class _ChangeCollector(FileSystemEventHandler):
+        """Collects changed .py paths from watchdog events."""
+
+        def __init__(self, on_change: Callable[[Path], None]):
+            super().__init__()
+            self._on_change = on_change
+
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            for attr in ('src_path', 'dest_path'):
+                path = getattr(event, attr, None)
+                if path and str(path).endswith('.py'):
+                    self._on_change(Path(path))
+
+
+class ArchitectureWatcher:
+    """
+    Incremental architecture checker with optional file watching.
+
+    Usage:
+        watcher = ArchitectureWatcher(project_path, rule_engine)
+        full = watcher.start()                 # full build + evaluation
+        delta = watcher.apply_changes([path])  # after an edit
+        watcher.watch(on_delta=print)          # blocking loop until stop()
+    """
+
+    def __init__(
+        self,
+        project_path: str,
+        rule_engine: RuleEngine,
+        builder: Optional[ImportGraphBuilder] = None,
+        poll_interval: float = 0.5,
+        use_inotify: bool = True
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            project_path: Root path of the project
+            rule_engine: Rule engine holding the components and rules to check
+            builder: Optional pre-configured ImportGraphBuilder
+            poll_interval: Seconds between change checks in watch()
+            use_inotify: Use watchdog (inotify) when available instead of polling
+        """
+        self.project_path = Path(project_path)
+        self.rule_engine = rule_engine
+        self.builder = builder or ImportGraphBuilder(str(self.project_path))
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify and WATCHDOG_AVAILABLE
+
+        self.graph: Optional[ImportGraph] = None
+        self._violations: Dict[ViolationKey, Violation] = {}
+        self._cyclic_components: List[Set[str]] = []
+        self._pending: Set[Path] = set()
+        self._pending_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._observer = None
+
+    @property
+    def violations(self) -> List[Violation]:
+        """Current (full) set of violations."""
+        return list(self._violations.values())
+
+    def start(self) -> EvaluationResult:
+        """
+        Build the full graph and evaluate all rules once.
+
+        Returns:
+            Full EvaluationResult for the project
+        """
+        self.graph = self.builder.build_graph()
+        dependencies = self.graph.to_dependencies_dict()
+        coupling = {name: self.graph.calculate_coupling(name) for name in dependencies}
+        cycles = self.graph.find_cycles()
+
+        result = self.rule_engine.evaluate_all(
+            dependencies=dependencies,
+            coupling_metrics=coupling,
+            cycles=cycles
+        )
+
+        self._violations = {_violation_key(v): v for v in result.violations}
+        self._cyclic_components = self.graph.cyclic_components()
+        return result
+
+    def apply_changes(self, changed_files: Optional[Iterable[Path]] = None) -> EvaluationResult:
+        """
+        Apply file changes and re-evaluate the affected scope.
+
+        Args:
+            changed_files: Changed files; detected from stat signatures if omitted
+
+        Returns:
+            Delta EvaluationResult (new violations and resolved_violations)
+        """
+        if self.graph is None:
+            self.start()
+
+        start_time = time.time()
+        if changed_files is None:
+            changed_files = self.builder.detect_changed_files()
+
+        delta = self.builder.update_graph(self.graph, changed_files)
+        result = EvaluationResult(is_delta=True)
+        if delta.is_empty:
+            return result
+
+        affected = delta.affected_modules
+        live_affected = {name for name in affected if name in self.graph.modules}
+
+        # Cycles can only change inside components containing an affected
+        # module, before or after the update
+        new_components = self.graph.cyclic_components()
+        cycle_scope: Set[str] = set()
+        for component in self._cyclic_components + new_components:
+            if component & affected:
+                cycle_scope |= component
+        self._cyclic_components = new_components
+
+        dependencies = {
+            name: self.graph.get_dependencies(name) for name in live_affected
+        }
+        coupling = {name: self.graph.calculate_coupling(name) for name in live_affected}
+        cycles = self.graph.find_cycles_touching(affected)
+
+        scoped = self.rule_engine.evaluate_affected(
+            dependencies=dependencies,
+            affected_files=live_affected,
+            coupling_metrics=coupling,
+            cycles=cycles
+        )
+
+        # Replace every previous violation owned by the re-evaluated scope
+        stale_keys = {
+            key for key, violation in self._violations.items()
+            if (violation.source_file in cycle_scope if violation.rule_type == RuleType.NO_CYCLES
+                else violation.source_file in affected)
+        }
+        fresh = {_violation_key(v): v for v in scoped.violations}
+
+        result.violations = [v for key, v in fresh.items() if key not in self._violations]
+        result.resolved_violations = [
+            self._violations[key] for key in stale_keys if key not in fresh
+        ]
+        for key in stale_keys:
+            del self._violations[key]
+        self._violations.update(fresh)
+
+        result.rules_evaluated = scoped.rules_evaluated
+        result.components_checked = scoped.components_checked
+        result.files_analyzed = len(live_affected)
+        result.cache_hits = scoped.cache_hits
+        result.cache_misses = scoped.cache_misses
+        result.execution_time_ms = (time.time() - start_time) * 1000
+
+        logger.info(
+            f"ACC delta: {len(affected)} affected modules, "
+            f"+{len(result.violations)} / -{len(result.resolved_violations)} violations, "
+            f"{result.execution_time_ms:.0f}ms"
+        )
+        return result
+
+    def watch(self, on_delta: Callable[[EvaluationResult], None]):
+        """
+        Block and report deltas until stop() is called.
+
+        Args:
+            on_delta: Called with each non-empty delta EvaluationResult
+        """
+        if self.graph is None:
+            self.start()
+
+        self._stop_event.clear()
+        if self.use_inotify:
+            self._observer = Observer()
+            self._observer.schedule(
+                _ChangeCollector(self._queue_change), str(self.project_path), recursive=True
+            )
+            self._observer.start()
+            logger.info(f"Watching {self.project_path} (inotify)")
+        else:
+            logger.info(f"Watching {self.project_path} (polling every {self.poll_interval}s)")
+
+        try:
+            while not self._stop_event.wait(self.poll_interval):
+                if self.use_inotify:
+                    with self._pending_lock:
+                        changed, self._pending = self._pending, set()
+                    if not changed:
+                        continue
+                else:
+                    changed = self.builder.detect_changed_files()
+                    if not changed:
+                        continue
+
+                result = self.apply_changes(changed)
+                if result.violations or result.resolved_violations:
+                    on_delta(result)
+        finally:
+            if self._observer is not None:
+                self._observer.stop()
+                self._observer.join()
+                self._observer = None
+            self.builder.flush_cache()
+
+    def stop(self):
+        """Stop a running watch() loop."""
+        self._stop_event.set()
+
+    def _queue_change(self, path: Path):
+        """Record a changed path reported by the file watcher."""
+        with self._pending_lock:
+            self._pending.add(path)
@@ -8,19 +8,27 @@ MD-2094: Added BDVOrchestrator class with full orchestration support including:
 - Programmatic pytest hook integration
 - Retry logic with exponential backoff
 - Result aggregation across parallel workers
+- Optional warm worker processes that run pytest in-process and are
+  reused across runs; modules loaded from the features directory are
+  dropped after every run, so edited step definitions are always re-read
 """
 
+import importlib
 import json
 import subprocess
+import sys
 import time
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, TYPE_CHECKING
 import re
 
+if TYPE_CHECKING:
+    from bdv.worker_pool import WarmWorkerPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -68,6 +76,25 @@ class BDVResult:
     scenarios: List[ScenarioResult]
     summary: Dict[str, Any]
 
+    @classmethod
+    def empty(
+        cls,
+        iteration_id: Optional[str],
+        message: str = 'No feature files found'
+    ) -> 'BDVResult':
+        """Result of a run with no scenarios to execute"""
+        return cls(
+            iteration_id=iteration_id,
+            total_scenarios=0,
+            passed=0,
+            failed=0,
+            skipped=0,
+            duration=0.0,
+            timestamp=datetime.utcnow().isoformat() + "Z",
+            scenarios=[],
+            summary={'message': message}
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -90,6 +117,10 @@ class BDVRunner:
     Uses pytest-bdd to run Gherkin feature files and collects results.
     """
 
+    # pytest option (registered by features/conftest.py) restricting the
+    # generated test module to the given feature files
+    FEATURE_OPTION = "--bdv-feature"
+
     def __init__(self, base_url: str, features_path: str = "features/"):
         """
         Initialize BDV runner.
@@ -146,7 +177,8 @@ class BDVRunner:
         Run BDV tests and collect results.
 
         Args:
-            feature_files: Specific feature files to run (optional, runs all if None)
+            feature_files: Specific feature files to run (optional, runs all
+                generated features if None)
             iteration_id: Iteration identifier for tracking (optional)
             tags: pytest-bdd tags to filter scenarios (optional, e.g., "@happy_path")
 
@@ -155,16 +187,12 @@ class BDVRunner:
         """
         start_time = datetime.now()
 
-        # Discover feature files if not specified
-        if not feature_files:
-            discovered = self.discover_features()
-            feature_files = [str(f) for f in discovered]
-
-        if not feature_files:
+        # Nothing to run if no features exist at all
+        if not feature_files and not self.discover_features():
             return self._create_empty_result(iteration_id, start_time)
 
         # Build pytest command
-        pytest_args = self._build_pytest_args(feature_files, tags)
+        pytest_args = self._build_pytest_args(feature_files or [], tags)
 
         # Execute pytest
         try:
@@ -197,16 +225,22 @@ class BDVRunner:
     def run_with_pytest_bdd(
         self,
         feature_files: List[str],
-        iteration_id: Optional[str] = None
+        iteration_id: Optional[str] = None,
+        tags: Optional[str] = None
     ) -> BDVResult:
         """
         Run tests using pytest-bdd directly (alternative implementation).
 
-        This method uses pytest-bdd's programmatic API instead of subprocess.
+        This method calls pytest.main() in the current process instead of
+        spawning a subprocess, and builds one ScenarioResult per test from
+        pytest's reports. Modules it imports stay in sys.modules; callers
+        that run it repeatedly in one process use reset_feature_modules()
+        in between (as BDVOrchestrator's process mode does).
 
         Args:
             feature_files: List of feature files to run
             iteration_id: Iteration identifier (optional)
+            tags: pytest-bdd tags to filter scenarios (optional)
 
         Returns:
             BDVResult with execution results
@@ -214,39 +248,28 @@ class BDVRunner:
         import pytest
 
         start_time = datetime.now()
+        collector = _ScenarioCollector()
 
-        # Build pytest args
-        pytest_args = [
-            "--tb=short",
-            "--json-report",
-            f"--json-report-file=bdv_report_{iteration_id or 'default'}.json",
-            "--base-url", self.base_url,
-            "-v"
-        ]
-        pytest_args.extend(feature_files)
-
-        # Run pytest
-        exit_code = pytest.main(pytest_args)
-
-        # Parse JSON report
-        report_file = f"bdv_report_{iteration_id or 'default'}.json"
-        if Path(report_file).exists():
-            with open(report_file) as f:
-                report_data = json.load(f)
-
-            bdv_result = self._parse_json_report(
-                report_data,
-                iteration_id,
-                start_time
-            )
-        else:
-            bdv_result = self._create_error_result(
-                iteration_id,
-                start_time,
-                "JSON report not generated"
+        try:
+            exit_code = pytest.main(
+                self._build_pytest_args(feature_files, tags)[1:],
+                plugins=[collector]
             )
+        except Exception as e:
+            return self._create_error_result(iteration_id, start_time, str(e))
 
-        return bdv_result
+        scenarios = collector.scenarios
+        return BDVResult(
+            iteration_id=iteration_id,
+            total_scenarios=len(scenarios),
+            passed=sum(1 for s in scenarios if s.status == 'passed'),
+            failed=sum(1 for s in scenarios if s.status == 'failed'),
+            skipped=sum(1 for s in scenarios if s.status == 'skipped'),
+            duration=(datetime.now() - start_time).total_seconds(),
+            timestamp=datetime.utcnow().isoformat() + "Z",
+            scenarios=scenarios,
+            summary={'exit_code': int(exit_code), 'in_process': True}
+        )
 
     def _build_pytest_args(
         self,
@@ -256,6 +279,9 @@ class BDVRunner:
         """
         Build pytest command line arguments.
 
+        Each feature file is passed as a FEATURE_OPTION so only its
+        scenarios are collected; with none, every generated feature runs.
+
         Args:
             feature_files: List of feature files
             tags: Optional tags filter
@@ -263,8 +289,10 @@ class BDVRunner:
         Returns:
             List of command line arguments
         """
-        # Get the features directory path for conftest.py discovery
-        features_dir = str(self.features_path.resolve())
+        # Get the features directory path for conftest.py discovery; the
+        # BDV config and generated test module live there too, so none of
+        # the paths depend on the working directory
+        features_dir = self.features_path.resolve()
 
         args = [
             "pytest",
@@ -273,14 +301,17 @@ class BDVRunner:
             "--override-ini=addopts=",  # Disable strict-markers from pytest.ini
             "-W", "ignore::pytest.PytestUnknownMarkWarning",  # Ignore marker warnings
             f"--confcutdir={features_dir}",  # Set conftest.py search boundary
-            "-c", "features/pytest_bdv.ini",  # Use BDV-specific pytest config
+            "-c", str(features_dir / "pytest_bdv.ini"),  # Use BDV-specific pytest config
         ]
 
         if tags:
             args.extend(["-m", tags])
 
+        for feature_file in feature_files:
+            args.extend([self.FEATURE_OPTION, str(Path(feature_file).resolve())])
+
         # Run the test module which imports the feature files
-        args.append("features/test_generated_features.py")
+        args.append(str(features_dir / "test_generated_features.py"))
 
         return args
 
@@ -389,17 +420,7 @@ class BDVRunner:
         start_time: datetime
     ) -> BDVResult:
         """Create empty result (no features found)"""
-        return BDVResult(
-            iteration_id=iteration_id,
-            total_scenarios=0,
-            passed=0,
-            failed=0,
-            skipped=0,
-            duration=0.0,
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            scenarios=[],
-            summary={'message': 'No feature files found'}
-        )
+        return BDVResult.empty(iteration_id)
 
     def _create_timeout_result(
         self,
@@ -456,6 +477,91 @@ class BDVRunner:
             json.dump(result.to_dict(), f, indent=2)
 
 
+class _ScenarioCollector:
+    """pytest plugin turning per-test reports into one ScenarioResult per nodeid."""
+
+    def __init__(self):
+        self._results: Dict[str, ScenarioResult] = {}
+
+    @property
+    def scenarios(self) -> List[ScenarioResult]:
+        return list(self._results.values())
+
+    def pytest_runtest_logreport(self, report):
+        existing = self._results.get(report.nodeid)
+        if existing is not None:
+            # A later phase can only turn the result into a failure
+            # (e.g. a teardown error after a passing call)
+            if report.outcome == 'failed' and existing.status != 'failed':
+                existing.status = 'failed'
+                existing.error_message = report.longreprtext
+            existing.duration += report.duration
+            return
+        # Passing setup/teardown phases are not results of their own
+        if report.when != 'call' and report.outcome == 'passed':
+            return
+        feature_file, _, scenario_name = report.nodeid.partition("::")
+        self._results[report.nodeid] = ScenarioResult(
+            feature_file=feature_file,
+            scenario_name=scenario_name or report.nodeid,
+            status=report.outcome,
+            duration=report.duration,
+            error_message=report.longreprtext if report.outcome == 'failed' else None
+        )
+
+
+def reset_feature_modules(features_path: str) -> int:
+    """
+    Forget modules loaded from a features directory after an in-process run.
+
+    Test modules, conftest.py and step definitions under features_path are
+    removed from sys.modules (and pytest-bdd's parsed-feature cache is
+    cleared), so the next pytest.main() in the same process imports the
+    current code. Everything else imported by the run stays warm.
+
+    Returns:
+        Number of modules removed
+    """
+    root = Path(features_path).resolve()
+    removed = 0
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if not module_file:
+            continue
+        try:
+            Path(module_file).resolve().relative_to(root)
+        except ValueError:
+            continue
+        del sys.modules[name]
+        removed += 1
+
+    feature_cache = getattr(sys.modules.get("pytest_bdd.feature"), "features", None)
+    if isinstance(feature_cache, dict):
+        feature_cache.clear()
+    importlib.invalidate_caches()
+    return removed
+
+
+def run_feature_in_worker(
+    base_url: str,
+    features_path: str,
+    feature: str,
+    iteration_id: Optional[str],
+    tags: Optional[str]
+) -> BDVResult:
+    """
+    Run one feature inside a warm worker process.
+
+    Module-level so it can be sent to WarmWorkerPool workers. The worker is
+    reused for later runs, so feature-directory modules are reset afterwards.
+    """
+    runner = BDVRunner(base_url, features_path)
+    try:
+        return runner.run_with_pytest_bdd([feature], iteration_id=iteration_id, tags=tags)
+    finally:
+        reset_feature_modules(features_path)
+
+
 class BDVOrchestrator:
     """
     BDV Orchestrator for full test execution orchestration (MD-2094).
@@ -465,14 +571,19 @@ class BDVOrchestrator:
     - Retry logic with exponential backoff
     - Result aggregation across parallel workers
     - Suite-level coordination
+    - Pre-started worker processes (execution_mode="process")
     """
 
+    EXECUTION_MODES = ("thread", "process")
+
     def __init__(
         self,
         base_url: str = "http://localhost:8000",
         features_path: str = "features/",
         retry_config: Optional[RetryConfig] = None,
-        max_workers: int = 4
+        max_workers: int = 4,
+        execution_mode: str = "thread",
+        warm_modules: Optional[List[str]] = None
     ):
         """
         Initialize BDV orchestrator.
@@ -482,10 +593,24 @@ class BDVOrchestrator:
             features_path: Path to feature files directory
             retry_config: Configuration for retry logic
             max_workers: Maximum parallel workers
+            execution_mode: "thread" spawns a pytest subprocess per feature run;
+                "process" runs pytest in-process inside warm workers that are
+                reused across runs (feature-directory modules are re-imported
+                each run, so code changes are always seen)
+            warm_modules: Modules (shared helpers, fixtures) each worker
+                imports once and keeps; modules under the features directory
+                are re-imported every run regardless
         """
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(
+                f"execution_mode must be one of {self.EXECUTION_MODES}, got {execution_mode!r}"
+            )
         self.runner = BDVRunner(base_url, features_path)
         self.retry_config = retry_config or RetryConfig()
         self.max_workers = max_workers
+        self.execution_mode = execution_mode
+        self.warm_modules = list(warm_modules or [])
+        self._worker_pool: Optional["WarmWorkerPool"] = None
         self._scenario_results: Dict[str, List[ScenarioResult]] = {}
         self._hooks: Dict[str, List[Callable]] = {
             'before_suite': [],
@@ -495,7 +620,53 @@ class BDVOrchestrator:
             'on_retry': [],
             'on_failure': []
         }
-        logger.info(f"BDVOrchestrator initialized with {max_workers} workers")
+        logger.info(
+            f"BDVOrchestrator initialized with {max_workers} workers ({execution_mode} mode)"
+        )
+
+    def _get_worker_pool(self) -> "WarmWorkerPool":
+        """Start the worker pool on first use and keep it for later suites."""
+        if self._worker_pool is None:
+            from bdv.worker_pool import WarmWorkerPool, WorkerSetup
+
+            # Workers live for the pool's lifetime; run_feature_in_worker()
+            # drops feature-directory modules after each run instead
+            self._worker_pool = WarmWorkerPool(
+                max_workers=self.max_workers,
+                setup=WorkerSetup(step_modules=["pytest"] + self.warm_modules)
+            )
+            self._worker_pool.start()
+        return self._worker_pool
+
+    def close(self):
+        """Shut down warm worker processes, if any were started."""
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
+
+    def _execute_feature(
+        self,
+        feature: str,
+        iteration_id: str,
+        tags: Optional[str]
+    ) -> BDVResult:
+        """Run one feature attempt in the configured execution mode."""
+        if self.execution_mode == "process":
+            future = self._get_worker_pool().submit(
+                run_feature_in_worker,
+                self.runner.base_url,
+                str(self.runner.features_path),
+                feature,
+                iteration_id,
+                tags
+            )
+            return future.result()
+
+        return self.runner.run(
+            feature_files=[feature],
+            iteration_id=iteration_id,
+            tags=tags
+        )
 
     def register_hook(self, hook_type: str, callback: Callable):
         """
@@ -549,7 +720,7 @@ class BDVOrchestrator:
 
         if not features:
             logger.warning("No feature files found")
-            return self.runner._create_empty_result(iteration_id, start_time)
+            return BDVResult.empty(iteration_id)
 
         # Run tests (parallel or sequential)
         if parallel and len(features) > 1:
@@ -562,6 +733,56 @@ class BDVOrchestrator:
 
         return result
 
+    def run_impacted(
+        self,
+        changed_files: Optional[List[str]] = None,
+        base_ref: str = "HEAD",
+        head_ref: Optional[str] = None,
+        project_path: str = ".",
+        selector: Optional[Any] = None,
+        iteration_id: Optional[str] = None,
+        parallel: bool = False,
+        tags: Optional[str] = None,
+        cache_dir: Optional[str] = None
+    ) -> BDVResult:
+        """
+        Run only the features impacted by a change (plus a safety sample).
+
+        Args:
+            changed_files: Changed files; taken from git (base_ref..head_ref) if omitted
+            base_ref: Base revision for the git diff
+            head_ref: Head revision (None = working tree)
+            project_path: Source root for the import graph (default selector only)
+            selector: Optional pre-configured bdv.impact_selector.TestImpactSelector
+            iteration_id: Iteration identifier
+            parallel: Whether to run features in parallel
+            tags: Tags filter for scenarios
+            cache_dir: Import graph cache directory (default selector only)
+
+        Returns:
+            BDVResult with the selection report under summary['impact_selection']
+        """
+        from bdv.impact_selector import TestImpactSelector
+
+        selector = selector or TestImpactSelector(
+            project_path, str(self.runner.features_path), cache_dir=cache_dir
+        )
+        if changed_files is None:
+            selection = selector.select_from_git(base_ref, head_ref)
+        else:
+            selection = selector.select(changed_files)
+
+        features = [str(p) for p in selection.features_to_run]
+        if features:
+            result = self.run_suite(
+                features=features, iteration_id=iteration_id, parallel=parallel, tags=tags
+            )
+        else:
+            result = BDVResult.empty(iteration_id, 'No impacted features')
+
+        result.summary['impact_selection'] = selection.to_dict()
+        return result
+
     def _run_sequential(
         self,
         features: List[str],
@@ -655,6 +876,7 @@ class BDVOrchestrator:
             scenarios=all_scenarios,
             summary={
                 'execution_mode': 'parallel',
+                'worker_mode': self.execution_mode,
                 'workers': self.max_workers,
                 'features_count': len(features)
             }
@@ -686,10 +908,10 @@ class BDVOrchestrator:
             try:
                 self._execute_hooks('before_scenario', feature=feature, attempt=attempt)
 
-                result = self.runner.run(
-                    feature_files=[feature],
-                    iteration_id=f"{iteration_id}-attempt-{attempt}",
-                    tags=tags
+                result = self._execute_feature(
+                    feature,
+                    f"{iteration_id}-attempt-{attempt}",
+                    tags
                 )
 
                 # Mark scenarios with worker_id and retry count
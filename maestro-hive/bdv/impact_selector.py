@@ -0,0 +1,379 @@
+"""
+Test Impact Selector for BDV
+
+Selects the BDV feature files impacted by a change instead of running the
+full suite on every commit.
+
+Features:
+- Changed files from a git diff or an explicit list
+- Reverse walk of the ACC import graph from changed modules to every module
+  that (transitively) imports them
+- Affected modules mapped to contracts (explicit contract map patterns, with
+  a name-based fallback) and contracts mapped to features via @contract tags
+- Changed feature files always selected
+- Full-run fallback for changes the graph cannot see (conftest, step
+  definitions, pytest/packaging config)
+- Deterministic safety sample of unselected features
+- Selection report listing what was skipped and why
+"""
+
+import fnmatch
+import hashlib
+import json
+import logging
+import math
+import random
+import re
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from acc.import_graph_builder import ImportGraph, ImportGraphBuilder
+from bdv.bdv_runner import BDVRunner
+
+# Import graph caches live here, one file per project, instead of inside the
+# analysed tree
+DEFAULT_CACHE_DIR = Path.home() / '.maestro' / 'bdv_cache'
+
+logger = logging.getLogger(__name__)
+
+# Changes to these paths can affect any scenario, so they force a full run
+DEFAULT_FULL_RUN_PATTERNS = [
+    "conftest.py",
+    "*/conftest.py",
+    "pytest*.ini",
+    "*/pytest*.ini",
+    "pyproject.toml",
+    "setup.py",
+    "setup.cfg",
+    "requirements*.txt",
+    "bdv/*",
+]
+
+
+@dataclass
+class ImpactSelection:
+    """
+    Result of test-impact selection.
+
+    Attributes:
+        selected: Features impacted by the change
+        safety_sample: Unimpacted features added as a safety net
+        skipped: Features not run
+        changed_files: Files considered changed
+        affected_modules: Changed modules plus everything importing them
+        affected_contracts: Contracts implemented by affected modules
+        reasons: Why each run feature was selected
+        full_run: Whether selection fell back to the full suite
+        full_run_reason: Why it fell back
+    """
+    selected: List[Path] = field(default_factory=list)
+    safety_sample: List[Path] = field(default_factory=list)
+    skipped: List[Path] = field(default_factory=list)
+    changed_files: List[Path] = field(default_factory=list)
+    affected_modules: Set[str] = field(default_factory=set)
+    affected_contracts: Set[str] = field(default_factory=set)
+    reasons: Dict[str, str] = field(default_factory=dict)
+    full_run: bool = False
+    full_run_reason: Optional[str] = None
+
+    @property
+    def features_to_run(self) -> List[Path]:
+        """Selected features followed by the safety sample"""
+        return self.selected + self.safety_sample
+
+    @property
+    def total_features(self) -> int:
+        return len(self.selected) + len(self.safety_sample) + len(self.skipped)
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of features skipped"""
+        total = self.total_features
+        return len(self.skipped) / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'selected': [str(p) for p in self.selected],
+            'safety_sample': [str(p) for p in self.safety_sample],
+            'skipped': [str(p) for p in self.skipped],
+            'changed_files': [str(p) for p in self.changed_files],
+            'affected_modules': sorted(self.affected_modules),
+            'affected_contracts': sorted(self.affected_contracts),
+            'reasons': self.reasons,
+            'full_run': self.full_run,
+            'full_run_reason': self.full_run_reason,
+            'total_features': self.total_features,
+            'reduction': self.reduction
+        }
+
+
+def _snake_case(name: str) -> str:
+    """AuthAPI -> auth_api, UserProfileService -> user_profile_service"""
+    name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
+    name = re.sub(r'([a-z\d])([A-Z])', r'\1_\2', name)
+    return name.replace('-', '_').lower()
+
+
+class TestImpactSelector:
+    """
+    Selects impacted BDV features for a set of changed files.
+
+    Usage:
+        selector = TestImpactSelector(".", "features/",
+                                      contract_map={"AuthAPI": ["services.auth.*"]})
+        selection = selector.select_from_git("origin/main")
+        runner.run(feature_files=[str(p) for p in selection.features_to_run])
+    """
+
+    __test__ = False  # Not a pytest test class
+
+    def __init__(
+        self,
+        project_path: str,
+        features_path: str = "features/",
+        contract_map: Optional[Dict[str, List[str]]] = None,
+        contract_map_path: Optional[str] = None,
+        safety_sample_rate: float = 0.05,
+        safety_sample_min: int = 1,
+        full_run_patterns: Optional[List[str]] = None,
+        builder: Optional[ImportGraphBuilder] = None,
+        seed: Optional[int] = None,
+        cache_dir: Optional[str] = None
+    ):
+        """
+        Initialize the selector.
+
+        Args:
+            project_path: Root of the source tree analysed by the import graph
+            features_path: Directory containing .feature files
+            contract_map: {contract name: [module glob patterns]} implementing it
+            contract_map_path: JSON file with the same structure (merged in)
+            safety_sample_rate: Fraction of unimpacted features to run anyway
+            safety_sample_min: Minimum safety sample size (when any are skipped)
+            full_run_patterns: Path globs (relative to project) forcing a full run
+            builder: Optional pre-configured ImportGraphBuilder
+            seed: Seed for the safety sample (default: derived from the change set)
+            cache_dir: Directory for the import graph cache of the default
+                builder (default: ~/.maestro/bdv_cache)
+        """
+        self.project_path = Path(project_path).resolve()
+        self.features_path = Path(features_path)
+        if not self.features_path.is_absolute():
+            self.features_path = (self.project_path / self.features_path).resolve()
+        self.contract_map: Dict[str, List[str]] = dict(contract_map or {})
+        if contract_map_path:
+            with open(contract_map_path) as f:
+                for name, patterns in json.load(f).items():
+                    self.contract_map.setdefault(name, []).extend(patterns)
+        self.safety_sample_rate = safety_sample_rate
+        self.safety_sample_min = safety_sample_min
+        self.full_run_patterns = full_run_patterns or list(DEFAULT_FULL_RUN_PATTERNS)
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        if builder is None:
+            project_key = hashlib.sha256(str(self.project_path).encode()).hexdigest()[:16]
+            builder = ImportGraphBuilder(
+                str(self.project_path),
+                cache_path=str(self.cache_dir / f"import_graph_{project_key}.json")
+            )
+        self.builder = builder
+        self.seed = seed
+        self._runner = BDVRunner("", str(self.features_path))
+        self._graph: Optional[ImportGraph] = None
+
+    def changed_files_from_git(
+        self,
+        base_ref: str = "HEAD",
+        head_ref: Optional[str] = None
+    ) -> List[Path]:
+        """
+        List files changed between two refs (or base_ref and the working tree).
+
+        Args:
+            base_ref: Base revision
+            head_ref: Head revision; None compares against the working tree and
+                includes untracked files
+
+        Returns:
+            Absolute paths of changed files
+        """
+        def git(*args: str) -> List[str]:
+            output = subprocess.run(
+                ["git", *args], cwd=self.project_path,
+                capture_output=True, text=True, check=True
+            ).stdout
+            return [line for line in output.splitlines() if line.strip()]
+
+        root = Path(git("rev-parse", "--show-toplevel")[0])
+        if head_ref:
+            names = git("diff", "--name-only", f"{base_ref}...{head_ref}")
+        else:
+            names = git("diff", "--name-only", base_ref)
+            names += git("ls-files", "--others", "--exclude-standard", "--full-name")
+        return sorted({(root / name).resolve() for name in names})
+
+    def select_from_git(
+        self,
+        base_ref: str = "HEAD",
+        head_ref: Optional[str] = None
+    ) -> ImpactSelection:
+        """Select impacted features for a git diff."""
+        return self.select(self.changed_files_from_git(base_ref, head_ref))
+
+    def select(self, changed_files: Iterable) -> ImpactSelection:
+        """
+        Select impacted features for a set of changed files.
+
+        Args:
+            changed_files: Changed file paths (absolute or project-relative)
+
+        Returns:
+            ImpactSelection with selected, sampled and skipped features
+        """
+        changed = sorted({self._absolute(p) for p in changed_files})
+        features = sorted(p.resolve() for p in self._runner.discover_features())
+        selection = ImpactSelection(changed_files=changed)
+
+        full_run_reason = self._full_run_reason(changed)
+        if full_run_reason:
+            selection.full_run = True
+            selection.full_run_reason = full_run_reason
+            selection.selected = features
+            selection.reasons = {str(p): 'full run' for p in features}
+            logger.info(f"BDV impact selection: full run ({full_run_reason})")
+            return selection
+
+        # Changed feature files are always impacted
+        feature_set = set(features)
+        for path in changed:
+            if path in feature_set:
+                selection.reasons[str(path)] = 'feature changed'
+
+        changed_modules = self._changed_modules(changed)
+        if changed_modules:
+            # Each feature file is read once; its tags serve both lookups
+            feature_contracts = {feature: self._feature_contracts(feature) for feature in features}
+            selection.affected_modules = self._reverse_closure(changed_modules)
+            selection.affected_contracts = self._contracts_for(
+                selection.affected_modules, feature_contracts
+            )
+
+        if selection.affected_contracts:
+            for feature in features:
+                if str(feature) in selection.reasons:
+                    continue
+                hit = feature_contracts[feature] & selection.affected_contracts
+                if hit:
+                    selection.reasons[str(feature)] = f"contract {', '.join(sorted(hit))}"
+
+        selection.selected = [p for p in features if str(p) in selection.reasons]
+        remaining = [p for p in features if str(p) not in selection.reasons]
+        selection.safety_sample = self._safety_sample(remaining, changed)
+        for path in selection.safety_sample:
+            selection.reasons[str(path)] = 'safety sample'
+        sampled = set(selection.safety_sample)
+        selection.skipped = [p for p in remaining if p not in sampled]
+
+        logger.info(
+            f"BDV impact selection: {len(selection.selected)} impacted, "
+            f"{len(selection.safety_sample)} sampled, {len(selection.skipped)} skipped "
+            f"({len(selection.affected_contracts)} contracts affected)"
+        )
+        return selection
+
+    def _absolute(self, path) -> Path:
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.project_path / path
+        return path.resolve()
+
+    def _relative(self, path: Path) -> Optional[str]:
+        try:
+            return path.relative_to(self.project_path).as_posix()
+        except ValueError:
+            return None
+
+    def _full_run_reason(self, changed: List[Path]) -> Optional[str]:
+        """Changes the import graph cannot attribute to specific features."""
+        for path in changed:
+            rel = self._relative(path)
+            if rel is None:
+                continue
+            for pattern in self.full_run_patterns:
+                if fnmatch.fnmatch(rel, pattern):
+                    return f"{rel} matches {pattern}"
+            # Step definitions and helpers under features/ are shared by scenarios
+            if path.suffix == '.py' and self.features_path in path.parents:
+                return f"{rel} is BDV support code"
+        return None
+
+    def _changed_modules(self, changed: List[Path]) -> Set[str]:
+        modules = set()
+        for path in changed:
+            if path.suffix == '.py' and self._relative(path) is not None:
+                modules.add(self.builder._get_module_name(path))
+        return modules
+
+    def _get_graph(self) -> ImportGraph:
+        if self._graph is None:
+            self._graph = self.builder.build_graph()
+        return self._graph
+
+    def _reverse_closure(self, modules: Set[str]) -> Set[str]:
+        """Modules plus every module that transitively imports one of them."""
+        graph = self._get_graph()
+        affected = set(modules)
+        frontier = [m for m in modules if m in graph.graph]
+        while frontier:
+            module = frontier.pop()
+            for dependent in graph.get_dependents(module):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    frontier.append(dependent)
+        return affected
+
+    def _contracts_for(
+        self,
+        modules: Set[str],
+        feature_contracts: Dict[Path, Set[str]]
+    ) -> Set[str]:
+        """Contracts whose implementation modules intersect the affected set."""
+        contracts = set()
+        known = set(self.contract_map).union(*feature_contracts.values())
+
+        for contract in known:
+            patterns = self.contract_map.get(contract)
+            if patterns:
+                if any(fnmatch.fnmatch(m, p) for m in modules for p in patterns):
+                    contracts.add(contract)
+                continue
+            # Fallback: contract name appears as a module path component
+            token = _snake_case(contract)
+            for module in modules:
+                parts = module.split('.')
+                if token in parts or any(part.startswith(token + '_') for part in parts):
+                    contracts.add(contract)
+                    break
+        return contracts
+
+    def _feature_contracts(self, feature: Path) -> Set[str]:
+        """Contract names tagged on a feature (version ignored)."""
+        return {
+            tag.split(':')[1]
+            for tag in self._runner.extract_contract_tags(feature)
+        }
+
+    def _safety_sample(self, remaining: List[Path], changed: List[Path]) -> List[Path]:
+        if not remaining or self.safety_sample_rate <= 0 and self.safety_sample_min <= 0:
+            return []
+        size = max(self.safety_sample_min, math.ceil(self.safety_sample_rate * len(remaining)))
+        size = min(size, len(remaining))
+
+        seed = self.seed
+        if seed is None:
+            # Same change set -> same sample, so reruns are reproducible
+            digest = hashlib.sha256('\n'.join(str(p) for p in changed).encode()).hexdigest()
+            seed = int(digest[:16], 16)
+        return sorted(random.Random(seed).sample(remaining, size))
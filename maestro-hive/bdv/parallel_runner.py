@@ -6,13 +6,18 @@ Provides parallelization for BDV test execution with:
 - Worker-aware result collection
 - Dependency-aware scheduling
 - Resource pooling
+- Duration-aware (longest critical path first) scheduling from run history
+- Makespan simulation for comparing scheduling policies
 """
 
+import heapq
+import json
 import logging
 import os
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed, wait, FIRST_COMPLETED
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -187,6 +192,7 @@ class ParallelResult:
     workers: List[WorkerInfo]
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    predicted_makespan: Optional[float] = None
 
     @property
     def pass_rate(self) -> float:
@@ -217,7 +223,8 @@ class ParallelResult:
             'results': [r.to_dict() for r in self.results],
             'workers': [w.to_dict() for w in self.workers],
             'started_at': self.started_at.isoformat() if self.started_at else None,
-            'completed_at': self.completed_at.isoformat() if self.completed_at else None
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'predicted_makespan': self.predicted_makespan
         }
 
 
@@ -326,21 +333,50 @@ class ResourcePool:
         return self._pool.qsize()
 
 
+class SchedulingPolicy(Enum):
+    """Ordering of ready tests within the same priority"""
+    PRIORITY = "priority"  # Static priority only (insertion order breaks ties)
+    LPT = "lpt"  # Longest remaining critical path first
+
+
 class DependencyScheduler:
     """
     Schedules tests based on dependencies and priorities.
 
     Ensures tests with dependencies run after their dependencies
     complete, while maximizing parallelism.
+
+    Ready tests are kept in a heap and each test tracks its number of
+    unmet dependencies, so dispatching k tests costs O(k log n) and
+    completing a test only touches its direct dependents.
+
+    With the LPT policy, ties in static priority are broken by the
+    longest critical path from the test to the end of its dependency
+    chain (its own estimated_duration plus the longest chain of
+    dependents), which keeps long tests from starting last and leaving
+    workers idle at the tail.
     """
 
-    def __init__(self):
-        """Initialize the scheduler"""
+    def __init__(self, policy: SchedulingPolicy = SchedulingPolicy.PRIORITY):
+        """
+        Initialize the scheduler
+
+        Args:
+            policy: Ordering policy for ready tests
+        """
+        self.policy = policy
         self._tests: Dict[str, TestItem] = {}
         self._completed: Set[str] = set()
         self._running: Set[str] = set()
         self._lock = Lock()
 
+        # Indexes maintained by _rebuild_index / mark_completed
+        self._order: Dict[str, int] = {}
+        self._unmet: Dict[str, int] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        self._critical_path: Dict[str, float] = {}
+        self._ready: List[Tuple[int, float, int, str]] = []
+
     def add_tests(self, tests: List[TestItem]) -> None:
         """
         Add tests to the scheduler.
@@ -351,8 +387,69 @@ class DependencyScheduler:
         with self._lock:
             for test in tests:
                 self._tests[test.id] = test
+                self._order.setdefault(test.id, len(self._order))
+            self._rebuild_index()
             logger.debug(f"Added {len(tests)} tests to scheduler")
 
+    def _rebuild_index(self) -> None:
+        """Recompute dependency counters, critical paths and the ready heap."""
+        self._unmet = {}
+        self._dependents = {}
+        for test_id, test in self._tests.items():
+            deps = set(test.dependencies)
+            self._unmet[test_id] = len(deps - self._completed)
+            for dep in deps:
+                self._dependents.setdefault(dep, []).append(test_id)
+
+        self._critical_path = {}
+        if self.policy == SchedulingPolicy.LPT:
+            for test_id in self._tests:
+                self._compute_critical_path(test_id)
+
+        self._ready = []
+        for test_id in self._tests:
+            if self._unmet[test_id] == 0 and test_id not in self._completed \
+                    and test_id not in self._running:
+                self._push_ready(test_id)
+
+    def _compute_critical_path(self, test_id: str) -> float:
+        """Length of the longest duration chain starting at a test (iterative DFS)."""
+        stack = [(test_id, False)]
+        visiting: Set[str] = set()
+        while stack:
+            node, expanded = stack.pop()
+            if node in self._critical_path:
+                continue
+            children = [d for d in self._dependents.get(node, []) if d in self._tests]
+            if expanded:
+                visiting.discard(node)
+                longest = max(
+                    (self._critical_path.get(c, 0.0) for c in children), default=0.0
+                )
+                self._critical_path[node] = self._tests[node].estimated_duration + longest
+                continue
+            if node in visiting:
+                # Dependency cycle: these tests can never become ready anyway
+                self._critical_path[node] = self._tests[node].estimated_duration
+                continue
+            visiting.add(node)
+            stack.append((node, True))
+            stack.extend(
+                (c, False) for c in children
+                if c not in self._critical_path and c not in visiting
+            )
+        return self._critical_path[test_id]
+
+    def _push_ready(self, test_id: str) -> None:
+        """Push a test whose dependencies are all met onto the ready heap."""
+        test = self._tests[test_id]
+        heapq.heappush(self._ready, (
+            -test.priority,
+            -self._critical_path.get(test_id, 0.0),
+            self._order[test_id],
+            test_id
+        ))
+
     def get_ready_tests(self, max_count: int = 10) -> List[TestItem]:
         """
         Get tests that are ready to run.
@@ -363,32 +460,16 @@ class DependencyScheduler:
             max_count: Maximum number of tests to return
 
         Returns:
-            List of ready test items, sorted by priority
+            List of ready test items, sorted by priority (then by policy)
         """
         with self._lock:
-            ready = []
-
-            for test_id, test in self._tests.items():
-                # Skip if already completed or running
+            result = []
+            while self._ready and len(result) < max_count:
+                *_, test_id = heapq.heappop(self._ready)
                 if test_id in self._completed or test_id in self._running:
                     continue
-
-                # Check if all dependencies are completed
-                deps_met = all(
-                    dep in self._completed
-                    for dep in test.dependencies
-                )
-
-                if deps_met:
-                    ready.append(test)
-
-            # Sort by priority (higher first)
-            ready.sort(key=lambda t: t.priority, reverse=True)
-
-            # Mark as running
-            result = ready[:max_count]
-            for test in result:
-                self._running.add(test.id)
+                self._running.add(test_id)
+                result.append(self._tests[test_id])
 
             return result
 
@@ -401,8 +482,16 @@ class DependencyScheduler:
         """
         with self._lock:
             self._running.discard(test_id)
+            if test_id in self._completed:
+                return
             self._completed.add(test_id)
 
+            for dependent in self._dependents.get(test_id, []):
+                self._unmet[dependent] -= 1
+                if self._unmet[dependent] == 0 and dependent not in self._completed \
+                        and dependent not in self._running:
+                    self._push_ready(dependent)
+
     def mark_failed(self, test_id: str) -> None:
         """
         Mark a test as failed.
@@ -420,6 +509,7 @@ class DependencyScheduler:
         with self._lock:
             self._completed.clear()
             self._running.clear()
+            self._rebuild_index()
 
     @property
     def pending_count(self) -> int:
@@ -432,6 +522,139 @@ class DependencyScheduler:
         """Number of completed tests"""
         return len(self._completed)
 
+    @property
+    def running_count(self) -> int:
+        """Number of tests handed out and not yet completed"""
+        return len(self._running)
+
+
+class DurationHistory:
+    """
+    Historical per-test durations used for duration-aware scheduling.
+
+    Keeps an exponentially weighted moving average per test id, fed from
+    previous ParallelResults and persisted as JSON between runs.
+    """
+
+    def __init__(self, path: Optional[Path] = None, alpha: float = 0.3):
+        """
+        Initialize the history.
+
+        Args:
+            path: Optional JSON file to load from / save to
+            alpha: Weight of the newest observation in the moving average
+        """
+        self.path = Path(path) if path else None
+        self.alpha = alpha
+        self._durations: Dict[str, float] = {}
+        self._samples: Dict[str, int] = {}
+
+        if self.path and self.path.exists():
+            self.load()
+
+    def load(self) -> None:
+        """Load durations from the JSON file."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            for test_id, entry in data.get('tests', {}).items():
+                self._durations[test_id] = float(entry['duration'])
+                self._samples[test_id] = int(entry.get('samples', 1))
+        except Exception as e:
+            logger.warning(f"Failed to load duration history from {self.path}: {e}")
+
+    def save(self) -> None:
+        """Persist durations to the JSON file (atomic replace)."""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            'updated_at': datetime.utcnow().isoformat(),
+            'tests': {
+                test_id: {'duration': duration, 'samples': self._samples.get(test_id, 1)}
+                for test_id, duration in self._durations.items()
+            }
+        }
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def record(self, result: ParallelResult) -> None:
+        """
+        Fold a run's measured durations into the history.
+
+        Args:
+            result: Result of a previous parallel run
+        """
+        for test_result in result.results:
+            if test_result.status == 'skipped' or test_result.duration <= 0:
+                continue
+            previous = self._durations.get(test_result.test_id)
+            if previous is None:
+                self._durations[test_result.test_id] = test_result.duration
+            else:
+                self._durations[test_result.test_id] = (
+                    self.alpha * test_result.duration + (1 - self.alpha) * previous
+                )
+            self._samples[test_result.test_id] = self._samples.get(test_result.test_id, 0) + 1
+
+    def estimate(self, test_id: str, default: float = 1.0) -> float:
+        """Estimated duration for a test, or default if never seen."""
+        return self._durations.get(test_id, default)
+
+    def apply(self, tests: List[TestItem]) -> None:
+        """Set estimated_duration on tests that have history."""
+        for test in tests:
+            test.estimated_duration = self.estimate(test.id, test.estimated_duration)
+
+    def __len__(self) -> int:
+        return len(self._durations)
+
+
+@dataclass
+class ScheduleSimulation:
+    """
+    Predicted execution of a test set on a fixed number of workers.
+
+    Attributes:
+        policy: Scheduling policy simulated
+        worker_count: Number of workers
+        predicted_makespan: Predicted wall-clock duration in seconds
+        total_work: Sum of estimated test durations
+        worker_busy: Predicted busy time per worker
+        order: Test ids in dispatch order
+    """
+    policy: SchedulingPolicy
+    worker_count: int
+    predicted_makespan: float
+    total_work: float
+    worker_busy: List[float]
+    order: List[str]
+
+    @property
+    def idle_time(self) -> float:
+        """Predicted total worker idle time before the last test finishes"""
+        return self.predicted_makespan * self.worker_count - self.total_work
+
+    @property
+    def efficiency(self) -> float:
+        """Fraction of worker time spent running tests"""
+        capacity = self.predicted_makespan * self.worker_count
+        return self.total_work / capacity if capacity else 1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'policy': self.policy.value,
+            'worker_count': self.worker_count,
+            'predicted_makespan': self.predicted_makespan,
+            'total_work': self.total_work,
+            'idle_time': self.idle_time,
+            'efficiency': self.efficiency,
+            'worker_busy': self.worker_busy
+        }
+
 
 class WorkerResultCollector:
     """
@@ -496,6 +719,8 @@ class ParallelTestRunner:
     Features:
     - Configurable worker count
     - Dependency-aware scheduling
+    - Duration-aware (LPT / critical path) scheduling from run history
+    - Optional warm worker processes (bdv.worker_pool)
     - Resource pooling
     - Worker-aware result collection
     - pytest-xdist compatibility
@@ -505,7 +730,10 @@ class ParallelTestRunner:
         self,
         max_workers: int = 4,
         use_xdist: bool = False,
-        resource_pools: Optional[Dict[ResourceType, int]] = None
+        resource_pools: Optional[Dict[ResourceType, int]] = None,
+        scheduling_policy: SchedulingPolicy = SchedulingPolicy.PRIORITY,
+        duration_history: Optional[DurationHistory] = None,
+        worker_pool: Optional[Any] = None
     ):
         """
         Initialize the parallel runner.
@@ -514,10 +742,19 @@ class ParallelTestRunner:
             max_workers: Maximum number of parallel workers
             use_xdist: Whether to use pytest-xdist (requires installation)
             resource_pools: Resource pool configuration {type: pool_size}
+            scheduling_policy: Ordering of ready tests within a priority
+            duration_history: Historical durations used for estimates;
+                updated (and saved, if it has a path) after each run
+            worker_pool: Optional bdv.worker_pool.WarmWorkerPool; when set, tests
+                run in its pre-warmed processes instead of threads (test_runner
+                must then be a picklable module-level function)
         """
         self.max_workers = max_workers
         self.use_xdist = use_xdist
-        self._scheduler = DependencyScheduler()
+        self.scheduling_policy = scheduling_policy
+        self.duration_history = duration_history
+        self.worker_pool = worker_pool
+        self._scheduler = DependencyScheduler(policy=scheduling_policy)
         self._collector = WorkerResultCollector()
         self._pools: Dict[ResourceType, ResourcePool] = {}
         self._workers: Dict[str, WorkerInfo] = {}
@@ -602,18 +839,43 @@ class ParallelTestRunner:
         Returns:
             ParallelResult with all test results
         """
+        if self.duration_history is not None:
+            self.duration_history.apply(tests)
+
         if self.use_xdist:
             return self._run_with_xdist(tests, iteration_id)
 
-        return self._run_with_threadpool(tests, test_runner)
+        result = self._run_with_threadpool(tests, test_runner)
+
+        if self.duration_history is not None:
+            self.duration_history.record(result)
+            self.duration_history.save()
+
+        return result
+
+    def simulate(self, tests: List[TestItem]) -> 'ScheduleSimulation':
+        """
+        Predict the makespan of running tests with this runner's settings.
+
+        Args:
+            tests: List of test items (estimated_duration is used)
+
+        Returns:
+            ScheduleSimulation for the configured workers and policy
+        """
+        if self.duration_history is not None:
+            self.duration_history.apply(tests)
+        return simulate_schedule(tests, self.max_workers, self.scheduling_policy)
 
     def _run_with_threadpool(
         self,
         tests: List[TestItem],
         test_runner: Callable[[TestItem, str], TestResult]
     ) -> ParallelResult:
-        """Run tests using ThreadPoolExecutor"""
+        """Run tests using ThreadPoolExecutor, or the warm worker pool if configured"""
         started_at = datetime.utcnow()
+        predicted = simulate_schedule(tests, self.max_workers, self.scheduling_policy)
+        self._scheduler = DependencyScheduler(policy=self.scheduling_policy)
         self._scheduler.add_tests(tests)
         self._collector.clear()
         self._workers.clear()
@@ -624,16 +886,22 @@ class ParallelTestRunner:
             worker_id = f"worker-{i}"
             self._workers[worker_id] = WorkerInfo(id=worker_id)
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        if self.worker_pool is not None:
+            # The pool outlives this run so workers stay warm between runs
+            executor_context = nullcontext(self.worker_pool)
+        else:
+            executor_context = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        with executor_context as executor:
             futures: Dict[Future, Tuple[TestItem, str]] = {}
-            worker_queue = list(self._workers.keys())
-            worker_idx = 0
+            # Only idle workers receive tests, so a long test never has
+            # another test queued behind it on the same worker
+            free_workers = list(self._workers.keys())
 
             while self._scheduler.pending_count > 0 and not self._stop_event.is_set():
-                # Get ready tests
                 ready_tests = self._scheduler.get_ready_tests(
-                    max_count=len(worker_queue)
-                )
+                    max_count=len(free_workers)
+                ) if free_workers else []
 
                 if not ready_tests and not futures:
                     # No ready tests and no running tests - might have circular deps
@@ -642,8 +910,7 @@ class ParallelTestRunner:
 
                 # Submit ready tests
                 for test in ready_tests:
-                    worker_id = worker_queue[worker_idx % len(worker_queue)]
-                    worker_idx += 1
+                    worker_id = free_workers.pop(0)
 
                     worker = self._workers[worker_id]
                     worker.assigned_tests.append(test.id)
@@ -657,30 +924,30 @@ class ParallelTestRunner:
 
                 # Wait for at least one completion if we have running tests
                 if futures:
-                    done, _ = as_completed(futures.keys()).__iter__().__next__(), None
-                    for future in list(futures.keys()):
-                        if future.done():
-                            test, worker_id = futures.pop(future)
-                            try:
-                                result = future.result()
-                                self._collector.add_result(result)
-                                self._workers[worker_id].completed_tests.append(test.id)
-
-                                if result.status == 'failed':
-                                    self._scheduler.mark_failed(test.id)
-                                else:
-                                    self._scheduler.mark_completed(test.id)
-
-                            except Exception as e:
-                                logger.error(f"Test {test.id} raised exception: {e}")
-                                error_result = TestResult(
-                                    test_id=test.id,
-                                    worker_id=worker_id,
-                                    status='failed',
-                                    error_message=str(e)
-                                )
-                                self._collector.add_result(error_result)
+                    done, _ = wait(futures.keys(), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        test, worker_id = futures.pop(future)
+                        free_workers.append(worker_id)
+                        try:
+                            result = future.result()
+                            self._collector.add_result(result)
+                            self._workers[worker_id].completed_tests.append(test.id)
+
+                            if result.status == 'failed':
                                 self._scheduler.mark_failed(test.id)
+                            else:
+                                self._scheduler.mark_completed(test.id)
+
+                        except Exception as e:
+                            logger.error(f"Test {test.id} raised exception: {e}")
+                            error_result = TestResult(
+                                test_id=test.id,
+                                worker_id=worker_id,
+                                status='failed',
+                                error_message=str(e)
+                            )
+                            self._collector.add_result(error_result)
+                            self._scheduler.mark_failed(test.id)
 
             # Wait for remaining futures
             for future in as_completed(futures.keys()):
@@ -720,7 +987,8 @@ class ParallelTestRunner:
             results=results,
             workers=list(self._workers.values()),
             started_at=started_at,
-            completed_at=completed_at
+            completed_at=completed_at,
+            predicted_makespan=predicted.predicted_makespan
         )
 
     def _run_with_xdist(
@@ -883,6 +1151,85 @@ def estimate_test_duration(
     return sum(durations) / len(durations)
 
 
+def simulate_schedule(
+    tests: List[TestItem],
+    max_workers: int,
+    policy: SchedulingPolicy = SchedulingPolicy.PRIORITY
+) -> ScheduleSimulation:
+    """
+    Simulate dispatching tests to workers using their estimated durations.
+
+    Runs the same DependencyScheduler the runner uses against a virtual
+    clock, so the predicted makespan reflects dependencies and policy.
+
+    Args:
+        tests: List of test items (estimated_duration is used)
+        max_workers: Number of workers
+        policy: Scheduling policy to simulate
+
+    Returns:
+        ScheduleSimulation with predicted makespan and per-worker load
+    """
+    worker_count = max(1, min(max_workers, len(tests))) if tests else max(1, max_workers)
+    scheduler = DependencyScheduler(policy=policy)
+    scheduler.add_tests(tests)
+
+    clock = 0.0
+    free_workers = list(range(worker_count))
+    busy = [0.0] * worker_count
+    running: List[Tuple[float, int, str]] = []
+    order: List[str] = []
+
+    while scheduler.pending_count > 0:
+        for test in scheduler.get_ready_tests(max_count=len(free_workers)):
+            worker = free_workers.pop(0)
+            duration = max(test.estimated_duration, 0.0)
+            busy[worker] += duration
+            heapq.heappush(running, (clock + duration, worker, test.id))
+            order.append(test.id)
+
+        if not running:
+            break  # Remaining tests have unsatisfiable dependencies
+
+        clock, worker, test_id = heapq.heappop(running)
+        free_workers.append(worker)
+        scheduler.mark_completed(test_id)
+        # Release every test finishing at the same instant together
+        while running and running[0][0] <= clock:
+            _, worker, test_id = heapq.heappop(running)
+            free_workers.append(worker)
+            scheduler.mark_completed(test_id)
+
+    return ScheduleSimulation(
+        policy=policy,
+        worker_count=worker_count,
+        predicted_makespan=clock,
+        total_work=sum(busy),
+        worker_busy=busy,
+        order=order
+    )
+
+
+def compare_schedules(
+    tests: List[TestItem],
+    max_workers: int
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare predicted makespan of every scheduling policy.
+
+    Args:
+        tests: List of test items (estimated_duration is used)
+        max_workers: Number of workers
+
+    Returns:
+        Mapping of policy name to ScheduleSimulation.to_dict()
+    """
+    return {
+        policy.value: simulate_schedule(tests, max_workers, policy).to_dict()
+        for policy in SchedulingPolicy
+    }
+
+
 # Example usage
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -926,6 +1273,18 @@ if __name__ == "__main__":
     print(f"  Failed: {result.failed}")
     print(f"  Duration: {result.duration:.2f}s")
     print(f"  Speedup: {result.speedup:.2f}x")
+    print(f"  Predicted makespan: {result.predicted_makespan:.2f}s")
+
+    # Compare scheduling policies on a skewed duration mix
+    skewed = [
+        TestItem(id=f"short-{i}", feature_file="a.feature", scenario_name=f"Short {i}",
+                 estimated_duration=1.0)
+        for i in range(8)
+    ] + [TestItem(id="long", feature_file="b.feature", scenario_name="Long",
+                  estimated_duration=8.0)]
+    for name, sim in compare_schedules(skewed, max_workers=4).items():
+        print(f"  {name}: makespan={sim['predicted_makespan']:.1f}s "
+              f"efficiency={sim['efficiency']:.0%}")
 
     # Cleanup
     runner.cleanup()
@@ -0,0 +1,463 @@
+"""
+Warm Worker Pool for BDV execution
+
+Persistent worker processes for running BDV scenarios without paying
+interpreter start-up and fixture construction on every run:
+
+- Each worker imports step-definition modules once at start-up
+- Each worker builds its ResourcePool fixtures once and reuses them
+- Scenarios are handed to whichever worker is idle, one at a time, so the
+  parent always knows what each worker is running
+- Results are streamed back as they complete and resolve Futures, so the
+  pool can be used anywhere a concurrent.futures executor is expected
+- Crashed workers are detected, their in-flight task is failed and the
+  worker is replaced
+- Workers can be recycled after a fixed number of tasks
+  (max_tasks_per_worker); the replacement warms up while the others run, so
+  code reloaded by a task is always fresh without paying start-up per task
+
+Callables and arguments sent to workers must be picklable (module-level
+functions, dataclasses such as TestItem).
+"""
+
+import importlib
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bdv.parallel_runner import ResourcePool, ResourceType
+
+logger = logging.getLogger(__name__)
+
+# Messages sent from workers to the parent
+_MSG_READY = "ready"
+_MSG_DONE = "done"
+
+
+class WorkerCrashedError(RuntimeError):
+    """Raised for a task whose worker process died while running it."""
+
+
+@dataclass
+class WorkerSetup:
+    """
+    One-time set-up performed in every worker process.
+
+    Attributes:
+        step_modules: Modules to import up front (step definitions, conftest helpers)
+        resource_factories: {resource type: (pool size, factory)} fixtures to build
+        initializer: Optional callable run once after imports and fixtures
+        env: Environment variables to set before importing anything
+    """
+    step_modules: List[str] = field(default_factory=list)
+    resource_factories: Dict[ResourceType, Tuple[int, Callable[[], Any]]] = field(default_factory=dict)
+    initializer: Optional[Callable[[], None]] = None
+    env: Dict[str, str] = field(default_factory=dict)
+
+
+class WorkerContext:
+    """
+    Per-process state available to tasks running inside a warm worker.
+
+    Tasks call get_worker_context() to reach the fixtures that were built
+    when the worker started.
+    """
+
+    def __init__(self, worker_id: str):
+        self.worker_id = worker_id
+        self.pools: Dict[ResourceType, ResourcePool] = {}
+        self.modules: Dict[str, Any] = {}
+        self.tasks_run = 0
+
+    def acquire(self, resource_type: ResourceType, timeout: float = 30.0) -> Any:
+        """Acquire a warm fixture from this worker's pool."""
+        if resource_type not in self.pools:
+            raise ValueError(f"No pool for {resource_type.value} in {self.worker_id}")
+        return self.pools[resource_type].acquire(timeout)
+
+    def release(self, resource_type: ResourceType, resource: Any) -> None:
+        """Return a fixture to this worker's pool."""
+        if resource_type in self.pools:
+            self.pools[resource_type].release(resource)
+
+
+_worker_context: Optional[WorkerContext] = None
+
+
+def get_worker_context() -> Optional[WorkerContext]:
+    """Context of the current warm worker, or None outside a worker process."""
+    return _worker_context
+
+
+def _picklable_error(error: BaseException) -> BaseException:
+    """Return the exception itself if it survives pickling, else a RuntimeError."""
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+def _worker_main(worker_id: str, setup: WorkerSetup, task_queue, result_queue) -> None:
+    """Worker process entry point: warm up once, then serve tasks until a sentinel."""
+    global _worker_context
+
+    os.environ.update(setup.env)
+    context = WorkerContext(worker_id)
+    for module_name in setup.step_modules:
+        context.modules[module_name] = importlib.import_module(module_name)
+    for resource_type, (pool_size, factory) in setup.resource_factories.items():
+        pool = ResourcePool(resource_type, pool_size)
+        pool.initialize(factory)
+        context.pools[resource_type] = pool
+    if setup.initializer is not None:
+        setup.initializer()
+    _worker_context = context
+    result_queue.put((_MSG_READY, worker_id, None, None))
+
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            task_id, fn, args, kwargs = task
+            try:
+                outcome = (True, fn(*args, **kwargs))
+            except BaseException as e:
+                error = _picklable_error(e)
+                try:
+                    error.worker_traceback = traceback.format_exc()
+                except AttributeError:
+                    pass
+                outcome = (False, error)
+            context.tasks_run += 1
+            try:
+                result_queue.put((_MSG_DONE, worker_id, task_id, outcome))
+            except Exception as e:
+                result_queue.put((_MSG_DONE, worker_id, task_id, (False, _picklable_error(e))))
+    finally:
+        for pool in context.pools.values():
+            pool.cleanup()
+
+
+class WarmWorkerPool:
+    """
+    Pool of persistent, pre-warmed worker processes.
+
+    Usage:
+        setup = WorkerSetup(step_modules=["features.steps.api_steps"])
+        with WarmWorkerPool(max_workers=4, setup=setup) as pool:
+            future = pool.submit(run_scenario, test_item, "worker-0")
+            result = future.result()
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        setup: Optional[WorkerSetup] = None,
+        mp_context: Optional[str] = None,
+        startup_timeout: float = 60.0,
+        max_tasks_per_worker: Optional[int] = None
+    ):
+        """
+        Initialize the pool (workers start on start() or first submit()).
+
+        Args:
+            max_workers: Number of worker processes
+            setup: One-time worker set-up (imports, fixtures, initializer)
+            mp_context: multiprocessing start method (default: platform default)
+            startup_timeout: Seconds to wait for workers to finish warming up
+            max_tasks_per_worker: Retire a worker and start a fresh one after
+                this many tasks (None: keep workers for the pool's lifetime)
+        """
+        self.max_workers = max(1, max_workers)
+        self.setup = setup or WorkerSetup()
+        self.startup_timeout = startup_timeout
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._ctx = multiprocessing.get_context(mp_context)
+
+        self._result_queue = None
+        self._processes: Dict[str, Any] = {}
+        self._task_queues: Dict[str, Any] = {}
+        self._ready: set = set()
+        self._idle: deque = deque()
+        self._pending: deque = deque()
+        self._inflight: Dict[str, int] = {}
+        self._tasks_run: Dict[str, int] = {}
+        self._retired: List[Any] = []
+        self._futures: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._next_task_id = 0
+        self._next_worker_index = 0
+        self._collector: Optional[threading.Thread] = None
+        self._shutdown = threading.Event()
+        self._stopping = False
+        self._started = False
+
+        self.tasks_completed = 0
+        self.workers_restarted = 0
+        self.workers_recycled = 0
+        self.startup_seconds = 0.0
+
+    def __enter__(self) -> 'WarmWorkerPool':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    @property
+    def worker_ids(self) -> List[str]:
+        """IDs of the current worker processes"""
+        return list(self._processes.keys())
+
+    def start(self, wait_ready: bool = True) -> None:
+        """
+        Start the worker processes.
+
+        Args:
+            wait_ready: Block until every worker has finished warming up
+        """
+        if self._started:
+            return
+        started = time.time()
+        self._result_queue = self._ctx.Queue()
+        self._shutdown.clear()
+        for _ in range(self.max_workers):
+            self._spawn_worker()
+
+        self._collector = threading.Thread(
+            target=self._collect_results, name="warm-pool-collector", daemon=True
+        )
+        self._collector.start()
+        self._started = True
+
+        if wait_ready:
+            deadline = time.time() + self.startup_timeout
+            while len(self._ready) < self.max_workers and time.time() < deadline:
+                if not any(p.is_alive() for p in self._processes.values()):
+                    break
+                time.sleep(0.01)
+            if len(self._ready) < self.max_workers:
+                logger.warning(
+                    f"Only {len(self._ready)}/{self.max_workers} warm workers ready "
+                    f"after {self.startup_timeout}s"
+                )
+        self.startup_seconds = time.time() - started
+        logger.info(
+            f"WarmWorkerPool started {self.max_workers} workers in {self.startup_seconds:.2f}s"
+        )
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a call for execution in a warm worker.
+
+        Args:
+            fn: Picklable callable
+            *args: Picklable positional arguments
+            **kwargs: Picklable keyword arguments
+
+        Returns:
+            Future resolved when the worker streams back the result
+        """
+        if self._shutdown.is_set():
+            raise RuntimeError("cannot submit to a pool that has been shut down")
+        if not self._started:
+            self.start()
+
+        future: Future = Future()
+        with self._lock:
+            task_id = self._next_task_id
+            self._next_task_id += 1
+            self._futures[task_id] = future
+            self._pending.append((task_id, fn, args, kwargs))
+            self._dispatch()
+        return future
+
+    def map(self, fn: Callable, *iterables) -> List[Any]:
+        """Run fn over the zipped iterables and return results in order."""
+        futures = [self.submit(fn, *args) for args in zip(*iterables)]
+        return [f.result() for f in futures]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop all workers.
+
+        Args:
+            wait: Wait for queued tasks to drain before stopping
+        """
+        if not self._started or self._shutdown.is_set():
+            return
+        if wait:
+            with self._lock:
+                pending = bool(self._pending or self._inflight)
+            while pending and self._processes:
+                time.sleep(0.01)
+                with self._lock:
+                    pending = bool(self._pending or self._inflight)
+        self._stopping = True
+        for task_queue in self._task_queues.values():
+            task_queue.put(None)
+        processes = list(self._processes.values()) + self._retired
+        if wait:
+            for process in processes:
+                process.join()
+        self._shutdown.set()
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        if self._collector is not None:
+            self._collector.join()
+
+        with self._lock:
+            pending = list(self._futures.values())
+            self._futures.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("worker pool shut down"))
+
+        for task_queue in self._task_queues.values():
+            task_queue.close()
+        self._result_queue.close()
+        self._processes.clear()
+        self._task_queues.clear()
+        self._ready.clear()
+        self._idle.clear()
+        self._pending.clear()
+        self._inflight.clear()
+        self._tasks_run.clear()
+        self._retired.clear()
+        self._started = False
+        self._stopping = False
+        logger.info(f"WarmWorkerPool shut down after {self.tasks_completed} tasks")
+
+    def _spawn_worker(self) -> str:
+        """Start one worker process."""
+        worker_id = f"warm-{self._next_worker_index}"
+        self._next_worker_index += 1
+        task_queue = self._ctx.Queue()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker_id, self.setup, task_queue, self._result_queue),
+            name=worker_id,
+            daemon=True
+        )
+        process.start()
+        self._processes[worker_id] = process
+        self._task_queues[worker_id] = task_queue
+        return worker_id
+
+    def _dispatch(self) -> None:
+        """Hand pending tasks to idle workers (caller holds the lock)."""
+        while self._pending and self._idle:
+            worker_id = self._idle.popleft()
+            if worker_id not in self._processes:
+                continue
+            task = self._pending.popleft()
+            self._inflight[worker_id] = task[0]
+            self._task_queues[worker_id].put(task)
+
+    def _collect_results(self) -> None:
+        """Parent-side loop resolving futures and replacing dead workers."""
+        last_reap = time.time()
+        while not self._shutdown.is_set():
+            if time.time() - last_reap >= 0.1:
+                self._reap_dead_workers()
+                last_reap = time.time()
+            try:
+                kind, worker_id, task_id, payload = self._result_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+
+            if kind == _MSG_READY:
+                with self._lock:
+                    self._ready.add(worker_id)
+                    self._idle.append(worker_id)
+                    self._dispatch()
+            elif kind == _MSG_DONE:
+                with self._lock:
+                    self._inflight.pop(worker_id, None)
+                    future = self._futures.pop(task_id, None)
+                    self.tasks_completed += 1
+                    self._tasks_run[worker_id] = self._tasks_run.get(worker_id, 0) + 1
+                    if (
+                        self.max_tasks_per_worker is not None
+                        and self._tasks_run[worker_id] >= self.max_tasks_per_worker
+                        and not self._stopping
+                    ):
+                        self._retire_worker(worker_id)
+                    else:
+                        self._idle.append(worker_id)
+                    self._dispatch()
+                if future is not None and not future.done():
+                    ok, value = payload
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+
+    def _retire_worker(self, worker_id: str) -> None:
+        """Stop an idle worker and start its replacement (caller holds the lock)."""
+        process = self._processes.pop(worker_id)
+        task_queue = self._task_queues.pop(worker_id)
+        task_queue.put(None)
+        task_queue.close()
+        self._ready.discard(worker_id)
+        self._tasks_run.pop(worker_id, None)
+        self._retired.append(process)
+        self.workers_recycled += 1
+        self._spawn_worker()
+
+    def _reap_dead_workers(self) -> None:
+        """Fail the in-flight task of any crashed worker and start a replacement."""
+        if self._stopping:
+            return
+        with self._lock:
+            for process in [p for p in self._retired if not p.is_alive()]:
+                process.join()
+                self._retired.remove(process)
+        for worker_id, process in list(self._processes.items()):
+            if process.is_alive():
+                continue
+            exitcode = process.exitcode
+            was_ready = worker_id in self._ready
+            with self._lock:
+                del self._processes[worker_id]
+                self._task_queues.pop(worker_id).close()
+                self._ready.discard(worker_id)
+                task_id = self._inflight.pop(worker_id, None)
+                future = self._futures.pop(task_id, None) if task_id is not None else None
+            if future is not None and not future.done():
+                future.set_exception(WorkerCrashedError(
+                    f"{worker_id} exited with code {exitcode} while running task {task_id}"
+                ))
+
+            if not was_ready:
+                # Warm-up itself failed (bad import or fixture); restarting would loop
+                logger.error(f"Warm worker {worker_id} failed during set-up (exit code {exitcode})")
+                continue
+            logger.warning(f"Warm worker {worker_id} died (exit code {exitcode}), restarting")
+            self.workers_restarted += 1
+            with self._lock:
+                self._spawn_worker()
+
+        if not self._processes:
+            with self._lock:
+                pending = list(self._futures.values())
+                self._futures.clear()
+                self._pending.clear()
+            for future in pending:
+                if not future.done():
+                    future.set_exception(WorkerCrashedError("no warm workers left"))
@@ -8,7 +8,7 @@ These are the single source of truth - DO NOT duplicate these definitions elsewh
 Import from: from contracts.models import ...
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -16,6 +16,11 @@ import hashlib
 import json
 
 
+def _fields_dict(obj: Any) -> Dict[str, Any]:
+    """Shallow field -> value mapping of a dataclass instance"""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
 # ============================================================================
 # Contract Lifecycle States
 # ============================================================================
@@ -91,6 +96,17 @@ class AcceptanceCriterion:
     created_by: str = "system"
     tags: List[str] = field(default_factory=list)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary"""
+        data = _fields_dict(self)
+        data["created_at"] = self.created_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AcceptanceCriterion':
+        """Deserialize from dictionary"""
+        return cls(**{**data, "created_at": datetime.fromisoformat(data["created_at"])})
+
 
 @dataclass
 class CriterionResult:
@@ -115,6 +131,17 @@ class CriterionResult:
     evaluator: str = "system"  # Validator that evaluated this
     duration_ms: int = 0  # Time taken to evaluate
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary"""
+        data = _fields_dict(self)
+        data["evaluated_at"] = self.evaluated_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CriterionResult':
+        """Deserialize from dictionary"""
+        return cls(**{**data, "evaluated_at": datetime.fromisoformat(data["evaluated_at"])})
+
 
 @dataclass
 class VerificationResult:
@@ -154,6 +181,22 @@ class VerificationResult:
         ]
         return hashlib.sha256("|".join(key_components).encode()).hexdigest()
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary"""
+        data = _fields_dict(self)
+        data["criteria_results"] = [r.to_dict() for r in self.criteria_results]
+        data["verified_at"] = self.verified_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'VerificationResult':
+        """Deserialize from dictionary"""
+        return cls(**{
+            **data,
+            "criteria_results": [CriterionResult.from_dict(r) for r in data["criteria_results"]],
+            "verified_at": datetime.fromisoformat(data["verified_at"]),
+        })
+
 
 # ============================================================================
 # Contract Events
@@ -171,6 +214,26 @@ class ContractEvent:
     timestamp: datetime = field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary, recording the event subclass"""
+        data = _fields_dict(self)
+        data["event_class"] = type(self).__name__
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ContractEvent':
+        """Deserialize from dictionary as the recorded event subclass"""
+        data = dict(data)
+        event_class = _EVENT_CLASSES.get(data.pop("event_class", None), ContractEvent)
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        return event_class(**event_class._decode_fields(data))
+
+    @staticmethod
+    def _decode_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert subclass-specific fields from their serialized form"""
+        return data
+
 
 @dataclass
 class ContractProposedEvent(ContractEvent):
@@ -178,6 +241,25 @@ class ContractProposedEvent(ContractEvent):
     proposer: str = ""  # Agent who proposed the contract
     contract: Optional['UniversalContract'] = None  # The proposed contract
 
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        if self.contract is not None:
+            # The proposed contract is normally the one holding this event;
+            # store just its ID and let UniversalContract.from_dict relink it
+            if self.contract.contract_id == self.contract_id:
+                data["contract"] = self.contract_id
+            else:
+                data["contract"] = self.contract.to_dict()
+        return data
+
+    @staticmethod
+    def _decode_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+        if isinstance(data.get("contract"), dict):
+            data["contract"] = UniversalContract.from_dict(data["contract"])
+        elif data.get("contract") is not None:
+            data["contract"] = None
+        return data
+
 
 @dataclass
 class ContractAcceptedEvent(ContractEvent):
@@ -185,6 +267,16 @@ class ContractAcceptedEvent(ContractEvent):
     acceptor: str = ""  # Agent who accepted the contract
     acceptance_timestamp: datetime = field(default_factory=datetime.utcnow)
 
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data["acceptance_timestamp"] = self.acceptance_timestamp.isoformat()
+        return data
+
+    @staticmethod
+    def _decode_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+        data["acceptance_timestamp"] = datetime.fromisoformat(data["acceptance_timestamp"])
+        return data
+
 
 @dataclass
 class ContractFulfilledEvent(ContractEvent):
@@ -199,6 +291,18 @@ class ContractVerifiedEvent(ContractEvent):
     verifier: str = ""  # Validator or agent who verified
     verification_result: Optional[VerificationResult] = None  # Verification result
 
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        if self.verification_result is not None:
+            data["verification_result"] = self.verification_result.to_dict()
+        return data
+
+    @staticmethod
+    def _decode_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+        if data.get("verification_result") is not None:
+            data["verification_result"] = VerificationResult.from_dict(data["verification_result"])
+        return data
+
 
 @dataclass
 class ContractBreachedEvent(ContractEvent):
@@ -206,6 +310,31 @@ class ContractBreachedEvent(ContractEvent):
     breach: Optional['ContractBreach'] = None  # Details of the breach
     severity: str = "major"  # "critical", "major", "minor"
 
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        if self.breach is not None:
+            data["breach"] = self.breach.to_dict()
+        return data
+
+    @staticmethod
+    def _decode_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+        if data.get("breach") is not None:
+            data["breach"] = ContractBreach.from_dict(data["breach"])
+        return data
+
+
+_EVENT_CLASSES = {
+    event_class.__name__: event_class
+    for event_class in (
+        ContractEvent,
+        ContractProposedEvent,
+        ContractAcceptedEvent,
+        ContractFulfilledEvent,
+        ContractVerifiedEvent,
+        ContractBreachedEvent,
+    )
+}
+
 
 # ============================================================================
 # Validation Policy
@@ -292,6 +421,17 @@ class ContractBreach:
     remediation_steps: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary"""
+        data = _fields_dict(self)
+        data["timestamp"] = self.timestamp.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ContractBreach':
+        """Deserialize from dictionary"""
+        return cls(**{**data, "timestamp": datetime.fromisoformat(data["timestamp"])})
+
 
 # ============================================================================
 # Universal Contract
@@ -394,6 +534,43 @@ class UniversalContract:
         """Check if work can begin on this contract"""
         return self.lifecycle_state == ContractLifecycle.ACCEPTED
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary (events included)"""
+        data = _fields_dict(self)
+        data.update(
+            acceptance_criteria=[c.to_dict() for c in self.acceptance_criteria],
+            lifecycle_state=self.lifecycle_state.value,
+            events=[e.to_dict() for e in self.events],
+            created_at=self.created_at.isoformat(),
+            updated_at=self.updated_at.isoformat(),
+            verification_result=(
+                self.verification_result.to_dict() if self.verification_result else None
+            ),
+        )
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UniversalContract':
+        """Deserialize from dictionary"""
+        result = data.get("verification_result")
+        contract = cls(**{
+            **data,
+            "acceptance_criteria": [
+                AcceptanceCriterion.from_dict(c) for c in data["acceptance_criteria"]
+            ],
+            "lifecycle_state": ContractLifecycle(data["lifecycle_state"]),
+            "events": [],
+            "created_at": datetime.fromisoformat(data["created_at"]),
+            "updated_at": datetime.fromisoformat(data["updated_at"]),
+            "verification_result": VerificationResult.from_dict(result) if result else None,
+        })
+        for event_data in data.get("events", []):
+            event = ContractEvent.from_dict(event_data)
+            if event_data.get("contract") == contract.contract_id:
+                event.contract = contract
+            contract.events.append(event)
+        return contract
+
 
 # ============================================================================
 # Execution Plan (for dependency resolution)
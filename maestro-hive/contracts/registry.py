@@ -7,14 +7,21 @@ The ContractRegistry manages all contracts in the system, including:
 - Dependency graph management
 - Execution plan generation
 - Contract verification
+- Secondary indexes (type, state, provider, consumer, priority, blocking, tags)
+  and a trigram index for substring search
+- Execution plans cached until the dependency subgraph they cover changes
+- Optional SQLite backing store (see contracts.store); stored contracts are
+  indexed from their summaries at start-up and loaded by ID on first access
 
 Version: 1.0.0
 """
 
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from datetime import datetime
+import dataclasses
 import uuid
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import MutableMapping
 
 from contracts.models import (
     UniversalContract,
@@ -29,6 +36,19 @@ from contracts.models import (
     ContractBreach,
     ExecutionPlan,
 )
+from contracts.store import ContractStore, ContractSummary
+
+
+# Fields searched by search_contracts() that have a trigram index
+_SEARCH_FIELDS = ("name", "description", "tags", "contract_id", "contract_type")
+
+# Execution plans kept per contract-ID selection
+_PLAN_CACHE_SIZE = 64
+
+
+def _trigrams(text: str) -> Set[str]:
+    """All 3-character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
 
 
 class ContractRegistryError(Exception):
@@ -51,6 +71,53 @@ class DependencyCycleError(ContractRegistryError):
     pass
 
 
+class _ContractMap(MutableMapping):
+    """
+    contract_id -> contract mapping in registration order.
+
+    Stored contracts start out as their ContractSummary and are read from
+    the store by ID the first time they are looked up.
+    """
+
+    def __init__(self, store: Optional[ContractStore] = None):
+        self._store = store
+        self._entries: Dict[str, Union[UniversalContract, ContractSummary]] = {}
+
+    def __getitem__(self, contract_id: str) -> UniversalContract:
+        entry = self._entries[contract_id]
+        if isinstance(entry, ContractSummary):
+            entry = self._store.get(contract_id)
+            if entry is None:
+                raise KeyError(contract_id)
+            self._entries[contract_id] = entry
+        return entry
+
+    def __setitem__(self, contract_id: str, contract: UniversalContract) -> None:
+        self._entries[contract_id] = contract
+
+    def __delitem__(self, contract_id: str) -> None:
+        del self._entries[contract_id]
+
+    def __contains__(self, contract_id: object) -> bool:
+        return contract_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add_summary(self, summary: ContractSummary) -> None:
+        self._entries[summary.contract_id] = summary
+
+    def peek(self, contract_id: str) -> Union[UniversalContract, ContractSummary]:
+        """The loaded contract, or its summary if not loaded yet"""
+        return self._entries[contract_id]
+
+    def peek_all(self) -> List[Union[UniversalContract, ContractSummary]]:
+        return list(self._entries.values())
+
+
 class ContractRegistry:
     """
     Central registry for managing all contracts in the system.
@@ -71,14 +138,48 @@ class ContractRegistry:
     13. create_execution_plan() - Generate execution plan with topological sort
     14. get_contract_history() - Get event history for a contract
     15. search_contracts() - Search contracts by various criteria
+
+    Lookups go through secondary indexes kept up to date by the methods above.
+    Changes made to a contract object outside the registry must be saved with
+    update_contract() to be reflected in the indexes and the backing store.
     """
 
-    def __init__(self):
-        """Initialize the contract registry"""
-        self._contracts: Dict[str, UniversalContract] = {}
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the contract registry
+
+        Args:
+            db_path: Optional SQLite file backing the registry. Stored
+                contracts are loaded on start-up and every change made through
+                the registry is written back.
+        """
+        self._store = ContractStore(db_path) if db_path else None
+        self._contracts = _ContractMap(self._store)
         self._dependency_graph: Dict[str, Set[str]] = defaultdict(set)  # contract_id -> dependencies
         self._dependents_graph: Dict[str, Set[str]] = defaultdict(set)  # contract_id -> dependents
 
+        # Registration order (search and list results keep it)
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
+
+        # Secondary indexes: field -> value -> contract IDs
+        self._field_index: Dict[str, Dict[Any, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        # Text search: field -> trigram -> contract IDs (built on first search)
+        self._ngram_index: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._ngram_ready = False
+        # Keys each contract is currently indexed under
+        self._indexed: Dict[str, Tuple[Dict[str, Set[Any]], Dict[str, Set[str]]]] = {}
+
+        # Execution plan cache: a plan stays valid while the dependency
+        # versions of the contracts it covers are unchanged
+        self._graph_version = 0
+        self._membership_version = 0
+        self._dep_versions: Dict[str, int] = {}
+        self._plan_cache: Dict[Optional[Tuple[str, ...]], Tuple[int, int, Dict[str, int], ExecutionPlan]] = {}
+
+        if self._store:
+            self._load_from_store()
+
     # ========================================================================
     # 1. Register Contract
     # ========================================================================
@@ -97,6 +198,37 @@ class ContractRegistry:
             ContractRegistryError: If contract_id already exists
             DependencyCycleError: If dependencies create a cycle
         """
+        self._register(contract)
+        self._persist(contract)
+        return contract
+
+    def register_contracts(self, contracts: Iterable[UniversalContract]) -> List[UniversalContract]:
+        """
+        Register many contracts, writing them to the backing store in one
+        transaction.
+
+        Args:
+            contracts: Contracts to register (dependencies first)
+
+        Returns:
+            The registered contracts
+
+        Raises:
+            ContractRegistryError: If a contract_id already exists
+            DependencyCycleError: If dependencies create a cycle
+
+        Contracts registered before a failure stay registered and stored.
+        """
+        registered = []
+        try:
+            for contract in contracts:
+                self._register(contract)
+                registered.append(contract)
+        finally:
+            self._persist(*registered)
+        return registered
+
+    def _register(self, contract: UniversalContract) -> None:
         if contract.contract_id in self._contracts:
             raise ContractRegistryError(f"Contract {contract.contract_id} already exists")
 
@@ -105,13 +237,18 @@ class ContractRegistry:
 
         # Register the contract
         self._contracts[contract.contract_id] = contract
+        self._seq[contract.contract_id] = self._next_seq
+        self._next_seq += 1
 
         # Update dependency graphs
         for dep_id in contract.depends_on:
             self._dependency_graph[contract.contract_id].add(dep_id)
             self._dependents_graph[dep_id].add(contract.contract_id)
 
-        return contract
+        self._dep_versions[contract.contract_id] = 0
+        self._membership_version += 1
+        self._graph_version += 1
+        self._index_contract(contract)
 
     # ========================================================================
     # 2. Get Contract
@@ -161,11 +298,40 @@ class ContractRegistry:
             tags: Filter by tags (contract must have all specified tags)
 
         Returns:
-            List of contracts matching the filters
+            List of contracts matching the filters (in registration order)
         """
-        contracts = list(self._contracts.values())
+        criteria = []
+        if contract_type:
+            criteria.append(('contract_type', [contract_type]))
+        if lifecycle_state:
+            criteria.append(('lifecycle_state', [lifecycle_state]))
+        if provider_agent:
+            criteria.append(('provider_agent', [provider_agent]))
+        if consumer_agent:
+            criteria.append(('consumer_agent', [consumer_agent]))
+        if priority:
+            criteria.append(('priority', [priority]))
+        if is_blocking is not None:
+            criteria.append(('is_blocking', [is_blocking]))
+        if tags:
+            criteria.append(('tag', tags))
+
+        if not criteria:
+            return list(self._contracts.values())
 
-        # Apply filters
+        # Intersect posting sets, smallest first
+        postings = sorted(
+            (self._field_index[field].get(value, set()) for field, values in criteria for value in values),
+            key=len,
+        )
+        candidate_ids = set(postings[0])
+        for posting in postings[1:]:
+            if not candidate_ids:
+                break
+            candidate_ids &= posting
+        contracts = self._in_registration_order(candidate_ids)
+
+        # Re-check the candidates against the objects themselves
         if contract_type:
             contracts = [c for c in contracts if c.contract_type == contract_type]
 
@@ -210,14 +376,18 @@ class ContractRegistry:
         if contract.contract_id not in self._contracts:
             raise ContractNotFoundError(f"Contract {contract.contract_id} not found")
 
-        # Check for dependency cycles with updated dependencies
+        # Check for dependency cycles with updated dependencies. Compare with
+        # the graph rather than the stored object, which callers may have
+        # modified in place before calling update.
         old_contract = self._contracts[contract.contract_id]
-        if contract.depends_on != old_contract.depends_on:
+        old_deps = set(self._dependency_graph.get(contract.contract_id, ()))
+        dependencies_changed = set(contract.depends_on) != old_deps
+        if dependencies_changed:
             self._check_dependency_cycle(contract.contract_id, contract.depends_on)
 
             # Update dependency graphs
             # Remove old dependencies
-            for dep_id in old_contract.depends_on:
+            for dep_id in old_deps:
                 self._dependency_graph[contract.contract_id].discard(dep_id)
                 self._dependents_graph[dep_id].discard(contract.contract_id)
 
@@ -226,11 +396,17 @@ class ContractRegistry:
                 self._dependency_graph[contract.contract_id].add(dep_id)
                 self._dependents_graph[dep_id].add(contract.contract_id)
 
+        # Cached plans hold the old dependencies or the old object
+        if dependencies_changed or contract is not old_contract:
+            self._dep_versions[contract.contract_id] += 1
+            self._graph_version += 1
+
         # Update timestamp
         contract.updated_at = datetime.utcnow()
 
         # Store updated contract
         self._contracts[contract.contract_id] = contract
+        self._commit(contract)
 
         return contract
 
@@ -269,6 +445,8 @@ class ContractRegistry:
             self._dependents_graph[dep_id].discard(contract_id)
         self._dependency_graph[contract_id].clear()
 
+        self._commit(contract)
+
     # ========================================================================
     # 6. Propose Contract
     # ========================================================================
@@ -308,6 +486,7 @@ class ContractRegistry:
             contract=contract,
         )
         contract.add_event(event)
+        self._commit(contract)
 
         return contract
 
@@ -352,6 +531,7 @@ class ContractRegistry:
 
         # Transition to IN_PROGRESS
         contract.transition_to(ContractLifecycle.IN_PROGRESS)
+        self._commit(contract)
 
         return contract
 
@@ -396,6 +576,7 @@ class ContractRegistry:
             deliverables=deliverables,
         )
         contract.add_event(event)
+        self._commit(contract)
 
         return contract
 
@@ -467,6 +648,7 @@ class ContractRegistry:
             verification_result=verification_result,
         )
         contract.add_event(event)
+        self._commit(contract)
 
         return contract
 
@@ -507,6 +689,7 @@ class ContractRegistry:
             severity=breach.severity,
         )
         contract.add_event(event)
+        self._commit(contract)
 
         return contract
 
@@ -583,7 +766,16 @@ class ContractRegistry:
 
         Raises:
             DependencyCycleError: If there's a cycle in the dependency graph
+
+        Plans are cached per contract selection and reused (as a copy with a
+        new plan_id) until the dependencies of a covered contract change or,
+        for the all-contracts plan, a contract is registered.
         """
+        cache_key = None if contract_ids is None else tuple(contract_ids)
+        cached = self._plan_cache.get(cache_key)
+        if cached is not None and self._plan_is_current(cache_key, cached):
+            return self._copy_plan(cached[3])
+
         # Get contracts to include
         if contract_ids is None:
             contracts = list(self._contracts.values())
@@ -614,7 +806,16 @@ class ContractRegistry:
             parallel_groups=parallel_groups,
         )
 
-        return plan
+        if len(self._plan_cache) >= _PLAN_CACHE_SIZE and cache_key not in self._plan_cache:
+            self._plan_cache.pop(next(iter(self._plan_cache)))
+        self._plan_cache[cache_key] = (
+            self._graph_version,
+            self._membership_version,
+            {cid: self._dep_versions.get(cid, 0) for cid in contract_id_set},
+            plan,
+        )
+
+        return self._copy_plan(plan)
 
     # ========================================================================
     # 14. Get Contract History
@@ -656,12 +857,43 @@ class ContractRegistry:
             search_fields: Fields to search (default: name, description, tags)
 
         Returns:
-            List of matching contracts
+            List of matching contracts (case-insensitive substring match, in
+            registration order)
         """
         if search_fields is None:
             search_fields = ["name", "description", "tags"]
 
         query_lower = query.lower()
+
+        # Queries of 3+ characters are answered from the trigram index: every
+        # substring match contains all of the query's trigrams, so the
+        # intersection is a superset of the matches and is then verified.
+        if len(query_lower) >= 3:
+            if not self._ngram_ready:
+                self._ngram_ready = True
+                for contract in self._contracts.peek_all():
+                    self._index_contract(contract)
+            query_grams = sorted(
+                _trigrams(query_lower),
+                key=lambda g: min((len(self._ngram_index[f].get(g, ())) for f in search_fields
+                                   if f in _SEARCH_FIELDS), default=0),
+            )
+            matched_ids: Set[str] = set()
+            for field in search_fields:
+                if field not in _SEARCH_FIELDS:
+                    continue
+                index = self._ngram_index[field]
+                candidates = set(index.get(query_grams[0], ()))
+                for gram in query_grams[1:]:
+                    if not candidates:
+                        break
+                    candidates &= index.get(gram, set())
+                for cid in candidates - matched_ids:
+                    texts = self._field_texts(self._contracts.peek(cid), field)
+                    if any(query_lower in text for text in texts):
+                        matched_ids.add(cid)
+            return self._in_registration_order(matched_ids)
+
         matches = []
 
         for contract in self._contracts.values():
@@ -703,29 +935,23 @@ class ContractRegistry:
         Raises:
             DependencyCycleError: If a cycle is detected
         """
-        # Build temporary graph with new dependencies
-        temp_graph = dict(self._dependency_graph)
-        temp_graph[contract_id] = set(dependencies)
-
-        # Check for cycles using DFS
+        # The existing graph is acyclic, so a cycle exists exactly when
+        # contract_id is reachable from one of the new dependencies
         visited = set()
-        rec_stack = set()
-
-        def has_cycle(node: str) -> bool:
+        stack = list(dependencies)
+        has_cycle = False
+
+        while stack:
+            node = stack.pop()
+            if node == contract_id:
+                has_cycle = True
+                break
+            if node in visited:
+                continue
             visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in temp_graph.get(node, []):
-                if neighbor not in visited:
-                    if has_cycle(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
+            stack.extend(self._dependency_graph.get(node, ()))
 
-            rec_stack.remove(node)
-            return False
-
-        if has_cycle(contract_id):
+        if has_cycle:
             raise DependencyCycleError(
                 f"Adding dependencies {dependencies} to contract {contract_id} would create a cycle"
             )
@@ -744,23 +970,28 @@ class ContractRegistry:
             DependencyCycleError: If there's a cycle
         """
         # Calculate in-degrees (number of dependencies for each node)
-        in_degree = {node: len(graph[node]) for node in graph}
+        in_degree = {node: len(set(graph[node])) for node in graph}
+
+        # Reverse edges, with dependents in graph order
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for node in graph:
+            for dep in set(graph[node]):
+                dependents[dep].append(node)
 
         # Find nodes with no dependencies (in-degree = 0)
-        queue = [node for node in graph if in_degree[node] == 0]
+        queue = deque(node for node in graph if in_degree[node] == 0)
         result = []
 
         while queue:
             # Process node with no dependencies
-            node = queue.pop(0)
+            node = queue.popleft()
             result.append(node)
 
-            # Find all nodes that depend on this node and reduce their in-degree
-            for dependent in graph:
-                if node in graph[dependent]:
-                    in_degree[dependent] -= 1
-                    if in_degree[dependent] == 0:
-                        queue.append(dependent)
+            # Reduce the in-degree of all nodes that depend on this node
+            for dependent in dependents.get(node, ()):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
 
         # Check if all nodes were processed
         if len(result) != len(graph):
@@ -791,15 +1022,116 @@ class ContractRegistry:
             level[node] = max(dep_levels) + 1 if dep_levels else 0
 
         # Group by level
-        parallel_groups = []
-        max_level = max(level.values()) if level else 0
+        groups: Dict[int, List[str]] = defaultdict(list)
+        for node in execution_order:
+            groups[level[node]].append(node)
 
-        for i in range(max_level + 1):
-            group = [node for node in execution_order if level[node] == i]
-            if group:
-                parallel_groups.append(group)
+        return [groups[i] for i in sorted(groups)]
 
-        return parallel_groups
+    # ========================================================================
+    # Indexing, Persistence and Plan Cache Helpers
+    # ========================================================================
+
+    def _load_from_store(self) -> None:
+        """Rebuild dependency graphs and indexes from the stored summaries"""
+        for summary in self._store.load_summaries():
+            cid = summary.contract_id
+            self._contracts.add_summary(summary)
+            self._seq[cid] = summary.seq
+            self._next_seq = max(self._next_seq, summary.seq + 1)
+            self._dep_versions[cid] = 0
+
+            # Deleted (REJECTED) contracts were unlinked from the graph
+            if summary.lifecycle_state != ContractLifecycle.REJECTED:
+                for dep_id in summary.depends_on:
+                    self._dependency_graph[cid].add(dep_id)
+                    self._dependents_graph[dep_id].add(cid)
+
+            self._index_contract(summary)
+
+    def _persist(self, *contracts: UniversalContract) -> None:
+        if self._store and contracts:
+            self._store.save((self._seq[c.contract_id], c) for c in contracts)
+
+    def _commit(self, contract: UniversalContract) -> None:
+        """Refresh a changed contract's indexes and write it to the store"""
+        self._index_contract(contract)
+        self._persist(contract)
+
+    @staticmethod
+    def _field_texts(contract: Union[UniversalContract, ContractSummary], field: str) -> List[str]:
+        if field == "tags":
+            return [tag.lower() for tag in contract.tags]
+        return [getattr(contract, field).lower()]
+
+    def _index_contract(self, contract: Union[UniversalContract, ContractSummary]) -> None:
+        """(Re)index a contract, touching only the keys that changed"""
+        cid = contract.contract_id
+        keys = {
+            'contract_type': {contract.contract_type},
+            'lifecycle_state': {contract.lifecycle_state},
+            'provider_agent': {contract.provider_agent},
+            'consumer_agent': set(contract.consumer_agents),
+            'priority': {contract.priority},
+            'is_blocking': {contract.is_blocking},
+            'tag': set(contract.tags),
+        }
+        grams = {
+            field: set().union(*map(_trigrams, self._field_texts(contract, field)))
+            for field in _SEARCH_FIELDS
+        } if self._ngram_ready else {}
+        old_keys, old_grams = self._indexed.get(cid, ({}, {}))
+
+        for field, values in keys.items():
+            index = self._field_index[field]
+            old_values = old_keys.get(field, set())
+            for value in old_values - values:
+                index[value].discard(cid)
+                if not index[value]:
+                    del index[value]
+            for value in values - old_values:
+                index[value].add(cid)
+
+        for field, field_grams in grams.items():
+            index = self._ngram_index[field]
+            old_field_grams = old_grams.get(field, set())
+            for gram in old_field_grams - field_grams:
+                index[gram].discard(cid)
+                if not index[gram]:
+                    del index[gram]
+            for gram in field_grams - old_field_grams:
+                index[gram].add(cid)
+
+        self._indexed[cid] = (keys, grams)
+
+    def _in_registration_order(self, contract_ids: Set[str]) -> List[UniversalContract]:
+        return [self._contracts[cid] for cid in sorted(contract_ids, key=self._seq.__getitem__)]
+
+    def _plan_is_current(
+        self,
+        cache_key: Optional[Tuple[str, ...]],
+        cached: Tuple[int, int, Dict[str, int], ExecutionPlan],
+    ) -> bool:
+        graph_version, membership_version, versions, _ = cached
+        if graph_version == self._graph_version:
+            return True
+        if cache_key is None and membership_version != self._membership_version:
+            return False
+        return all(self._dep_versions.get(cid, 0) == v for cid, v in versions.items())
+
+    @staticmethod
+    def _copy_plan(plan: ExecutionPlan) -> ExecutionPlan:
+        """Copy of a cached plan that callers may modify freely"""
+        return dataclasses.replace(
+            plan,
+            plan_id=str(uuid.uuid4()),
+            contracts=list(plan.contracts),
+            execution_order=list(plan.execution_order),
+            dependency_graph={cid: list(deps) for cid, deps in plan.dependency_graph.items()},
+            parallel_groups=[list(group) for group in plan.parallel_groups],
+            created_at=datetime.utcnow(),
+            metadata=dict(plan.metadata),
+        )
 
 
 # ============================================================================
@@ -0,0 +1,234 @@
+"""
+Contract Store
+Version: 1.0.0
+
+SQLite backing store for the ContractRegistry.
+
+Each contract is stored as the JSON form of UniversalContract.to_dict()
+(events, criteria and verification results included) alongside indexed
+columns, so the database can also be queried directly:
+
+    contracts(contract_id, seq, contract_type, lifecycle_state, provider_agent,
+              priority, is_blocking, name, description, updated_at, data)
+    contract_tags(contract_id, tag)
+    contract_consumers(contract_id, agent)
+    contract_dependencies(contract_id, depends_on)
+
+with secondary indexes on state, type, provider, tag, consumer and reverse
+dependency. ContractRegistry opens a store by reading only the indexed
+columns (load_summaries) and fetches full contracts by ID (get) on demand.
+"""
+
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from contracts.models import ContractLifecycle, UniversalContract
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS contracts (
+        contract_id TEXT PRIMARY KEY,
+        seq INTEGER NOT NULL,
+        contract_type TEXT NOT NULL,
+        lifecycle_state TEXT NOT NULL,
+        provider_agent TEXT NOT NULL,
+        priority TEXT NOT NULL,
+        is_blocking INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        description TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        data TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_contracts_seq ON contracts(seq)",
+    "CREATE INDEX IF NOT EXISTS idx_contracts_state ON contracts(lifecycle_state)",
+    "CREATE INDEX IF NOT EXISTS idx_contracts_type ON contracts(contract_type)",
+    "CREATE INDEX IF NOT EXISTS idx_contracts_provider ON contracts(provider_agent)",
+    """
+    CREATE TABLE IF NOT EXISTS contract_tags (
+        contract_id TEXT NOT NULL,
+        tag TEXT NOT NULL,
+        PRIMARY KEY (contract_id, tag)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_contract_tags_tag ON contract_tags(tag)",
+    """
+    CREATE TABLE IF NOT EXISTS contract_consumers (
+        contract_id TEXT NOT NULL,
+        agent TEXT NOT NULL,
+        PRIMARY KEY (contract_id, agent)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_contract_consumers_agent ON contract_consumers(agent)",
+    """
+    CREATE TABLE IF NOT EXISTS contract_dependencies (
+        contract_id TEXT NOT NULL,
+        depends_on TEXT NOT NULL,
+        PRIMARY KEY (contract_id, depends_on)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_contract_dependencies_target "
+    "ON contract_dependencies(depends_on)",
+]
+
+
+@dataclass
+class ContractSummary:
+    """
+    The indexed columns of a stored contract.
+
+    Carries the attributes ContractRegistry indexes and searches, so a
+    registry can be rebuilt without deserializing contract bodies.
+    """
+    contract_id: str
+    seq: int
+    contract_type: str
+    lifecycle_state: ContractLifecycle
+    provider_agent: str
+    priority: str
+    is_blocking: bool
+    name: str
+    description: str
+    tags: List[str] = field(default_factory=list)
+    consumer_agents: List[str] = field(default_factory=list)
+    depends_on: List[str] = field(default_factory=list)
+
+
+class ContractStore:
+    """
+    SQLite persistence for contracts.
+
+    Writes are batched per call in a single transaction; the database runs in
+    WAL mode so readers are not blocked by the registry's writes.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the contract database.
+
+        Args:
+            db_path: Path to the SQLite file (":memory:" for a private in-memory DB)
+        """
+        self.db_path = db_path
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def save(self, items: Iterable[Tuple[int, UniversalContract]]) -> None:
+        """
+        Insert or replace contracts in one transaction.
+
+        Args:
+            items: (registration sequence, contract) pairs
+        """
+        with self._conn:
+            for seq, contract in items:
+                cid = contract.contract_id
+                self._conn.execute(
+                    """
+                    INSERT OR REPLACE INTO contracts (
+                        contract_id, seq, contract_type, lifecycle_state,
+                        provider_agent, priority, is_blocking, name,
+                        description, updated_at, data
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        cid, seq, contract.contract_type,
+                        contract.lifecycle_state.value, contract.provider_agent,
+                        contract.priority, int(contract.is_blocking), contract.name,
+                        contract.description, contract.updated_at.isoformat(),
+                        json.dumps(contract.to_dict(), default=str),
+                    ),
+                )
+                for table in ("contract_tags", "contract_consumers", "contract_dependencies"):
+                    self._conn.execute(f"DELETE FROM {table} WHERE contract_id = ?", (cid,))
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO contract_tags VALUES (?, ?)",
+                    [(cid, tag) for tag in contract.tags],
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO contract_consumers VALUES (?, ?)",
+                    [(cid, agent) for agent in contract.consumer_agents],
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO contract_dependencies VALUES (?, ?)",
+                    [(cid, dep) for dep in contract.depends_on],
+                )
+
+    def get(self, contract_id: str) -> Optional[UniversalContract]:
+        """
+        Load one contract by ID.
+
+        Returns:
+            The contract, or None if it is not stored
+        """
+        row = self._conn.execute(
+            "SELECT data FROM contracts WHERE contract_id = ?", (contract_id,)
+        ).fetchone()
+        return UniversalContract.from_dict(json.loads(row[0])) if row else None
+
+    def load_summaries(self) -> List[ContractSummary]:
+        """
+        Load the indexed columns of every stored contract.
+
+        Returns:
+            Summaries in registration order
+        """
+        summaries: Dict[str, ContractSummary] = {}
+        for row in self._conn.execute(
+            """
+            SELECT contract_id, seq, contract_type, lifecycle_state, provider_agent,
+                   priority, is_blocking, name, description
+            FROM contracts ORDER BY seq
+            """
+        ):
+            summaries[row[0]] = ContractSummary(
+                contract_id=row[0], seq=row[1], contract_type=row[2],
+                lifecycle_state=ContractLifecycle(row[3]), provider_agent=row[4],
+                priority=row[5], is_blocking=bool(row[6]), name=row[7], description=row[8],
+            )
+        for table, column, attr in (
+            ("contract_tags", "tag", "tags"),
+            ("contract_consumers", "agent", "consumer_agents"),
+            ("contract_dependencies", "depends_on", "depends_on"),
+        ):
+            for cid, value in self._conn.execute(
+                f"SELECT contract_id, {column} FROM {table} ORDER BY rowid"
+            ):
+                if cid in summaries:
+                    getattr(summaries[cid], attr).append(value)
+        return list(summaries.values())
+
+    def load_all(self) -> List[Tuple[int, UniversalContract]]:
+        """
+        Load every stored contract.
+
+        Returns:
+            (registration sequence, contract) pairs in registration order
+        """
+        rows = self._conn.execute("SELECT seq, data FROM contracts ORDER BY seq").fetchall()
+        return [(seq, UniversalContract.from_dict(json.loads(data))) for seq, data in rows]
+
+    def count(self) -> int:
+        """Number of stored contracts"""
+        return self._conn.execute("SELECT COUNT(*) FROM contracts").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self._conn.close()
+
+
+__all__ = ["ContractStore", "ContractSummary"]
@@ -58,7 +58,8 @@ from dde.routing_engine import (
     RoutingEngine,
     get_routing_engine,
     RoutingDecision,
-    RoutingStrategy
+    RoutingStrategy,
+    BatchAssignment
 )
 
 # MD-2023: DDE-BDV Correlation Service
@@ -124,6 +125,7 @@ __all__ = [
     'get_routing_engine',
     'RoutingDecision',
     'RoutingStrategy',
+    'BatchAssignment',
 
     # MD-2023: Correlation Service
     'DDEBDVCorrelationService',
@@ -7,6 +7,7 @@ Description: Central registry for dynamic agent capability management with:
 - Capability CRUD operations
 - In-memory caching for performance (<100ms lookups)
 - Integration with capability taxonomy
+- Skill -> agents inverted index with availability bitsets for routing
 
 Author: AI Agent
 Date: 2024-12
@@ -14,8 +15,9 @@ Date: 2024-12
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
 from uuid import uuid4
+import bisect
 import logging
 import threading
 from functools import lru_cache
@@ -226,6 +228,160 @@ class CapabilityVersion:
         return self.major == other.major and self.minor >= other.minor
 
 
+# ============================================================================
+# Skill Index
+# ============================================================================
+
+class SkillIndex:
+    """
+    Inverted index from skills to agents.
+
+    Each agent gets a stable slot number; per-skill and per-status sets of
+    agents are kept as integer bitsets over those slots, so candidate sets
+    for a query are a handful of OR/AND operations instead of a scan over
+    every agent. Posting lists are kept sorted by proficiency (descending)
+    so minimum-proficiency filters read only a prefix.
+
+    Slots are never reused, which keeps slot order equal to registration
+    order (the order list_agents() returns in memory mode).
+    """
+
+    def __init__(self):
+        self._slots: Dict[str, int] = {}
+        self._slot_agents: Dict[int, str] = {}
+        self._next_slot = 0
+        self._agent_skills: Dict[str, Dict[str, int]] = {}
+        self._agent_status: Dict[str, str] = {}
+        self._postings: Dict[str, List[Tuple[int, int, str]]] = {}
+        self._skill_bits: Dict[str, int] = {}
+        self._status_bits: Dict[str, int] = {}
+        self._all_bits = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._slots
+
+    def upsert(self, agent: AgentProfile) -> None:
+        """Index an agent, updating only what changed since the last call."""
+        skills: Dict[str, int] = {}
+        for cap in agent.capabilities:
+            # First occurrence wins, matching AgentProfile.get_proficiency
+            skills.setdefault(cap.skill_id, cap.proficiency)
+
+        slot = self._slots.get(agent.agent_id)
+        if slot is None:
+            slot = self._next_slot
+            self._next_slot += 1
+            self._slots[agent.agent_id] = slot
+            self._slot_agents[slot] = agent.agent_id
+            self._agent_skills[agent.agent_id] = {}
+            self._all_bits |= 1 << slot
+
+        old_skills = self._agent_skills[agent.agent_id]
+        if skills != old_skills:
+            for skill_id, proficiency in old_skills.items():
+                if skills.get(skill_id) != proficiency:
+                    self._remove_posting(skill_id, proficiency, slot, agent.agent_id)
+            for skill_id, proficiency in skills.items():
+                if old_skills.get(skill_id) != proficiency:
+                    self._add_posting(skill_id, proficiency, slot, agent.agent_id)
+            self._agent_skills[agent.agent_id] = skills
+
+        self.set_status(agent.agent_id, agent.availability_status)
+
+    def set_status(self, agent_id: str, status: str) -> None:
+        """Move an agent between availability bitsets."""
+        slot = self._slots.get(agent_id)
+        if slot is None:
+            return
+        bit = 1 << slot
+        old_status = self._agent_status.get(agent_id)
+        if old_status == status:
+            return
+        if old_status is not None:
+            self._status_bits[old_status] &= ~bit
+        self._status_bits[status] = self._status_bits.get(status, 0) | bit
+        self._agent_status[agent_id] = status
+
+    def remove(self, agent_id: str) -> None:
+        """Drop an agent from the index."""
+        slot = self._slots.pop(agent_id, None)
+        if slot is None:
+            return
+        for skill_id, proficiency in self._agent_skills.pop(agent_id).items():
+            self._remove_posting(skill_id, proficiency, slot, agent_id)
+        status = self._agent_status.pop(agent_id, None)
+        if status is not None:
+            self._status_bits[status] &= ~(1 << slot)
+        del self._slot_agents[slot]
+        self._all_bits &= ~(1 << slot)
+
+    def clear(self) -> None:
+        """Drop everything."""
+        self.__init__()
+
+    def skill_mask(self, skills: Iterable[str], min_proficiency: int = 1) -> int:
+        """Bitset of agents holding any of the skills at min_proficiency or above."""
+        mask = 0
+        for skill_id in skills:
+            if min_proficiency <= 1:
+                mask |= self._skill_bits.get(skill_id, 0)
+                continue
+            for neg_prof, slot, _ in self._postings.get(skill_id, ()):
+                if -neg_prof < min_proficiency:
+                    break
+                mask |= 1 << slot
+        return mask
+
+    def status_mask(self, status: str) -> int:
+        """Bitset of agents with the given availability status."""
+        return self._status_bits.get(status, 0)
+
+    @property
+    def all_mask(self) -> int:
+        """Bitset of every indexed agent."""
+        return self._all_bits
+
+    def agent_ids(self, mask: int) -> List[str]:
+        """Agent IDs in a bitset, in slot (registration) order."""
+        agent_ids = []
+        while mask:
+            low = mask & -mask
+            agent_ids.append(self._slot_agents[low.bit_length() - 1])
+            mask ^= low
+        return agent_ids
+
+    def agent_skills(self, agent_id: str) -> Dict[str, int]:
+        """Indexed skill -> proficiency map for an agent."""
+        return self._agent_skills.get(agent_id, {})
+
+    def postings(self, skill_id: str) -> List[Tuple[str, int]]:
+        """(agent_id, proficiency) for a skill, highest proficiency first."""
+        return [(agent_id, -neg_prof) for neg_prof, _, agent_id in self._postings.get(skill_id, ())]
+
+    def coverage(self) -> Dict[str, int]:
+        """Number of agents per skill."""
+        return {skill_id: len(entries) for skill_id, entries in self._postings.items()}
+
+    def _add_posting(self, skill_id: str, proficiency: int, slot: int, agent_id: str) -> None:
+        bisect.insort(self._postings.setdefault(skill_id, []), (-proficiency, slot, agent_id))
+        self._skill_bits[skill_id] = self._skill_bits.get(skill_id, 0) | (1 << slot)
+
+    def _remove_posting(self, skill_id: str, proficiency: int, slot: int, agent_id: str) -> None:
+        entries = self._postings.get(skill_id, [])
+        entry = (-proficiency, slot, agent_id)
+        i = bisect.bisect_left(entries, entry)
+        if i < len(entries) and entries[i] == entry:
+            entries.pop(i)
+        if entries:
+            self._skill_bits[skill_id] &= ~(1 << slot)
+        else:
+            self._postings.pop(skill_id, None)
+            self._skill_bits.pop(skill_id, None)
+
+
 # ============================================================================
 # Capability Registry Class
 # ============================================================================
@@ -240,6 +396,7 @@ class CapabilityRegistry:
     - In-memory caching for <100ms lookups
     - Hierarchical skill matching via taxonomy
     - Quality history tracking
+    - Skill inverted index for routing in memory-only mode
     """
 
     def __init__(
@@ -265,6 +422,12 @@ class CapabilityRegistry:
         self._capability_cache: Dict[str, Tuple[Any, datetime]] = {}
         self._cache_lock = threading.RLock()
 
+        # Skill -> agents index over cached agents. In memory-only mode the
+        # cache is the registry, so queries are answered from the index; with
+        # a database the cache holds a subset and queries go to the database.
+        self._index = SkillIndex()
+        self._expansion_cache: Dict[str, Tuple[str, ...]] = {}
+
         logger.info("CapabilityRegistry initialized with taxonomy: %s", taxonomy_path)
 
     # =========================================================================
@@ -384,6 +547,7 @@ class CapabilityRegistry:
         with self._cache_lock:
             if agent_id in self._agent_cache:
                 del self._agent_cache[agent_id]
+                self._index.remove(agent_id)
                 return True
         return False
 
@@ -797,9 +961,14 @@ class CapabilityRegistry:
         if include_parent_matches:
             for skill in required_skills:
                 # Add parent skills
-                parents = self.taxonomy.expand_capability(skill)
+                parents = self._expand_skill(skill)
                 search_skills.update(parents)
 
+        if not self.db:
+            return self._find_capable_indexed(
+                search_skills, min_proficiency, availability_required, limit
+            )
+
         # Find matching agents
         agents = self.list_agents()
         matches = []
@@ -847,12 +1016,8 @@ class CapabilityRegistry:
                 return {}
 
         # Memory-only mode
-        coverage = {}
-        agents = self.list_agents()
-        for agent in agents:
-            for cap in agent.capabilities:
-                coverage[cap.skill_id] = coverage.get(cap.skill_id, 0) + 1
-        return coverage
+        with self._cache_lock:
+            return self._index.coverage()
 
     # =========================================================================
     # Enhanced Routing Algorithm (MD-2067)
@@ -893,7 +1058,7 @@ class CapabilityRegistry:
         expanded_skills = set()
         for skill in required_skills:
             expanded_skills.add(skill)
-            parents = self.taxonomy.expand_capability(skill)
+            parents = self._expand_skill(skill)
             expanded_skills.update(parents)
 
         matched_skills = []
@@ -903,7 +1068,7 @@ class CapabilityRegistry:
             # Check direct match or parent match
             if skill in agent_skill_ids:
                 matched_skills.append(skill)
-            elif any(parent in agent_skill_ids for parent in self.taxonomy.expand_capability(skill)):
+            elif any(parent in agent_skill_ids for parent in self._expand_skill(skill)):
                 matched_skills.append(skill)
             else:
                 missing_skills.append(skill)
@@ -1005,7 +1170,12 @@ class CapabilityRegistry:
             List of (agent, score) tuples sorted by match score descending
         """
         candidates = []
-        agents = self.list_agents()
+        if self.db:
+            agents = self.list_agents()
+        else:
+            agents = self._indexed_route_candidates(
+                required_skills, min_proficiency, availability_required
+            )
 
         for agent in agents:
             # Quick availability filter
@@ -1348,9 +1518,10 @@ class CapabilityRegistry:
     # =========================================================================
 
     def _cache_agent(self, agent: AgentProfile) -> None:
-        """Cache an agent profile."""
+        """Cache an agent profile and update the skill index incrementally."""
         with self._cache_lock:
             self._agent_cache[agent.agent_id] = (agent, datetime.now())
+            self._index.upsert(agent)
 
     def _get_cached_agent(self, agent_id: str) -> Optional[AgentProfile]:
         """Get agent from cache if valid."""
@@ -1361,6 +1532,7 @@ class CapabilityRegistry:
                     return agent
                 else:
                     del self._agent_cache[agent_id]
+                    self._index.remove(agent_id)
         return None
 
     def invalidate_agent_cache(self, agent_id: str) -> None:
@@ -1368,12 +1540,75 @@ class CapabilityRegistry:
         with self._cache_lock:
             if agent_id in self._agent_cache:
                 del self._agent_cache[agent_id]
+            self._index.remove(agent_id)
 
     def refresh_cache(self) -> None:
         """Clear all cached data."""
         with self._cache_lock:
             self._agent_cache.clear()
             self._capability_cache.clear()
+            self._index.clear()
+
+    # =========================================================================
+    # Indexed Queries (memory-only mode)
+    # =========================================================================
+
+    def _expand_skill(self, skill_id: str) -> Tuple[str, ...]:
+        """Taxonomy expansion of a skill (self first, then parents), memoized."""
+        expanded = self._expansion_cache.get(skill_id)
+        if expanded is None:
+            expanded = tuple(self.taxonomy.expand_capability(skill_id))
+            self._expansion_cache[skill_id] = expanded
+        return expanded
+
+    def _find_capable_indexed(
+        self,
+        search_skills: Set[str],
+        min_proficiency: int,
+        availability_required: bool,
+        limit: int
+    ) -> List[AgentProfile]:
+        """find_capable_agents() answered from the skill index."""
+        with self._cache_lock:
+            mask = self._index.skill_mask(search_skills, min_proficiency)
+            if availability_required:
+                mask &= self._index.status_mask("available")
+
+            matches = []
+            for agent_id in self._index.agent_ids(mask):
+                skills = self._index.agent_skills(agent_id)
+                overlap = [skill for skill in search_skills if skill in skills]
+                max_prof = max(skills[skill] for skill in overlap)
+                matches.append((agent_id, max_prof, len(overlap)))
+
+            # Sort by proficiency (desc) then skill coverage (desc); stable on slot order
+            matches.sort(key=lambda x: (x[1], x[2]), reverse=True)
+            return [self._agent_cache[agent_id][0] for agent_id, _, _ in matches[:limit]]
+
+    def _indexed_route_candidates(
+        self,
+        required_skills: List[str],
+        min_proficiency: int,
+        availability_required: bool
+    ) -> List[AgentProfile]:
+        """
+        Agents worth scoring for route_task().
+
+        An agent with none of the required skills (or their taxonomy parents)
+        scores zero proficiency, which route_task() rejects whenever
+        min_proficiency > 0, so only agents in the skill bitsets are scored.
+        """
+        with self._cache_lock:
+            if min_proficiency > 0:
+                search_skills = {
+                    parent for skill in required_skills for parent in self._expand_skill(skill)
+                }
+                mask = self._index.skill_mask(search_skills)
+            else:
+                mask = self._index.all_mask
+            if availability_required:
+                mask &= self._index.status_mask("available")
+            return [self._agent_cache[agent_id][0] for agent_id in self._index.agent_ids(mask)]
 
     # =========================================================================
     # Internal Helpers
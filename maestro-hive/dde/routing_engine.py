@@ -9,6 +9,9 @@ Features:
 - Load balancing
 - Real-time status updates
 - Fallback strategies
+- Batch routing as a global assignment problem (task x agent-slot score
+  matrix under WIP capacity, solved with SciPy's linear_sum_assignment or a
+  pure-Python Hungarian fallback)
 
 ML Integration Points:
 - Reinforcement learning for routing
@@ -16,18 +19,31 @@ ML Integration Points:
 """
 
 import logging
+import random
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from enum import Enum
 
-from dde.agent_registry import get_agent_registry, AgentProfile
+try:
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from dde.agent_registry import get_agent_registry, AgentProfile, AgentCapability
 from dde.task_matcher import get_task_matcher, TaskRequirements, MatchResult
 from dde.agent_evaluator import get_agent_evaluator
 from dde.performance_tracker import get_performance_tracker
 
 logger = logging.getLogger(__name__)
 
+# Cost of a task/slot pair the agent cannot take; dominates any real score so
+# the solver maximises the number of feasible assignments first
+_INFEASIBLE_COST = 1e6
+
 
 class RoutingStrategy(Enum):
     """Routing strategies"""
@@ -36,6 +52,7 @@ class RoutingStrategy(Enum):
     LEAST_LOADED = "least_loaded"  # Agent with least WIP
     SPECIALIZED = "specialized"  # Best for task type
     FALLBACK = "fallback"  # Use fallback when primary unavailable
+    OPTIMAL_ASSIGNMENT = "optimal_assignment"  # Batch: maximise total match score
 
 
 @dataclass
@@ -65,6 +82,111 @@ class RoutingDecision:
         }
 
 
+@dataclass
+class BatchAssignment:
+    """Planned assignment of a task batch (nothing is routed until committed)"""
+    method: str  # optimal, greedy
+    assignments: Dict[str, str] = field(default_factory=dict)  # task_id -> agent_id
+    scores: Dict[str, float] = field(default_factory=dict)  # task_id -> match score
+    slots: Dict[str, int] = field(default_factory=dict)  # task_id -> batch slot on agent
+    alternatives: Dict[str, List[str]] = field(default_factory=dict)
+    unassigned: List[str] = field(default_factory=list)
+    agent_load_hours: Dict[str, float] = field(default_factory=dict)
+    solver: str = ""
+    elapsed_ms: float = 0.0
+
+    @property
+    def total_score(self) -> float:
+        return sum(self.scores.values())
+
+    @property
+    def mean_score(self) -> float:
+        return self.total_score / len(self.scores) if self.scores else 0.0
+
+    @property
+    def makespan_hours(self) -> float:
+        """Largest estimated effort assigned to a single agent in this batch"""
+        return max(self.agent_load_hours.values(), default=0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'method': self.method,
+            'solver': self.solver,
+            'assigned': len(self.assignments),
+            'unassigned': len(self.unassigned),
+            'total_score': round(self.total_score, 4),
+            'mean_score': round(self.mean_score, 4),
+            'makespan_hours': round(self.makespan_hours, 2),
+            'agents_used': len(self.agent_load_hours),
+            'elapsed_ms': round(self.elapsed_ms, 2)
+        }
+
+
+def _hungarian(cost: List[List[float]]) -> List[Tuple[int, int]]:
+    """
+    Minimum-cost assignment for a rectangular cost matrix.
+
+    Pure-Python Kuhn-Munkres with potentials, O(n^2 m) for n <= m. Used when
+    SciPy is not installed.
+
+    Returns:
+        Sorted (row, column) pairs; every row of the smaller side is assigned
+    """
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    if n == 0 or m == 0:
+        return []
+    if n > m:
+        transposed = [list(column) for column in zip(*cost)]
+        return sorted((row, col) for col, row in _hungarian(transposed))
+
+    inf = float('inf')
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    p = [0] * (m + 1)  # p[j]: row matched to column j (1-based, 0 = free)
+    way = [0] * (m + 1)
+
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            row = cost[i0 - 1]
+            ui0 = u[i0]
+            delta = inf
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j - 1] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j] = cur
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        # Augment along the alternating path
+        while True:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+            if j0 == 0:
+                break
+
+    return sorted((p[j] - 1, j - 1) for j in range(1, m + 1) if p[j])
+
+
 class RoutingEngine:
     """
     Dynamic Routing Engine
@@ -129,21 +251,21 @@ class RoutingEngine:
             decision = self._route_best_match(requirements, matches)
 
         if decision:
-            # Update routing stats
-            self._routing_stats[decision.agent_id] = \
-                self._routing_stats.get(decision.agent_id, 0) + 1
-
-            # Update agent WIP
-            self.registry.update_agent_status(
-                decision.agent_id,
-                current_wip=self.registry.get_agent(decision.agent_id).current_wip + 1
-            )
+            self._record_assignment(decision.agent_id)
 
             logger.info(f"🔀 Routed {requirements.task_id} to {decision.agent_name} "
                        f"(strategy: {strategy.value}, score: {decision.match_score:.3f})")
 
         return decision
 
+    def _record_assignment(self, agent_id: str):
+        """Update routing stats and agent WIP for a routed task"""
+        self._routing_stats[agent_id] = self._routing_stats.get(agent_id, 0) + 1
+        self.registry.update_agent_status(
+            agent_id,
+            current_wip=self.registry.get_agent(agent_id).current_wip + 1
+        )
+
     def _route_best_match(
         self,
         requirements: TaskRequirements,
@@ -320,7 +442,10 @@ class RoutingEngine:
         strategy: RoutingStrategy = RoutingStrategy.LEAST_LOADED
     ) -> List[RoutingDecision]:
         """
-        Route multiple tasks optimally.
+        Route multiple tasks.
+
+        OPTIMAL_ASSIGNMENT solves the whole batch at once (see plan_batch);
+        any other strategy routes tasks one at a time in order.
 
         Args:
             tasks: List of task requirements
@@ -329,24 +454,185 @@ class RoutingEngine:
         Returns:
             List of routing decisions
         """
+        if strategy == RoutingStrategy.OPTIMAL_ASSIGNMENT:
+            return self._route_batch_optimal(tasks)
+
         decisions = []
 
         for task in tasks:
-            # Get already assigned agents for this batch
-            assigned = [d.agent_id for d in decisions]
-
-            # Try to route with load balancing
-            decision = self.route_task(
-                task,
-                strategy=strategy,
-                exclude_agents=[]  # Don't exclude, but prefer less loaded
-            )
+            # Route with load balancing (WIP updates feed later matches)
+            decision = self.route_task(task, strategy=strategy)
 
             if decision:
                 decisions.append(decision)
 
         return decisions
 
+    def _route_batch_optimal(
+        self,
+        tasks: List[TaskRequirements]
+    ) -> List[RoutingDecision]:
+        """Commit an optimal batch plan: WIP, stats and routing decisions"""
+        plan = self.plan_batch(tasks, method="optimal")
+        by_id = {task.task_id: task for task in tasks}
+        decisions = []
+
+        for task_id, agent_id in plan.assignments.items():
+            agent = self.registry.get_agent(agent_id)
+            match = self.matcher.score(agent, by_id[task_id])
+            decision = RoutingDecision(
+                task_id=task_id,
+                agent_id=agent_id,
+                agent_name=agent.name,
+                strategy_used=RoutingStrategy.OPTIMAL_ASSIGNMENT.value,
+                confidence=plan.scores[task_id],
+                match_score=plan.scores[task_id],
+                reasons=match.reasons + [
+                    f"Batch-optimal assignment (slot {plan.slots[task_id] + 1} "
+                    f"of {agent.wip_limit - agent.current_wip} free)"
+                ],
+                alternatives=plan.alternatives.get(task_id, [])
+            )
+            decisions.append(decision)
+
+        for decision in decisions:
+            self._record_assignment(decision.agent_id)
+
+        for task_id in plan.unassigned:
+            logger.warning(f"No capacity for task {task_id} in batch")
+
+        logger.info(f"🔀 Routed batch of {len(tasks)} tasks: {len(decisions)} assigned, "
+                   f"total score {plan.total_score:.3f} ({plan.solver})")
+
+        return decisions
+
+    def plan_batch(
+        self,
+        tasks: List[TaskRequirements],
+        method: str = "optimal",
+        agents: Optional[List[AgentProfile]] = None
+    ) -> BatchAssignment:
+        """
+        Plan a batch assignment without routing anything.
+
+        Each agent contributes one column per free WIP slot. Slot k of an agent
+        is scored with the TaskMatcher score the agent would have after k more
+        tasks (the load component drops as WIP rises), so the task x slot
+        matrix carries both match quality and capacity.
+
+        - optimal: maximise the total match score over the whole batch
+          (assignment problem; as many tasks as capacity allows are placed)
+        - greedy: tasks in order, each taking its best agent with a free slot
+
+        Args:
+            tasks: Task requirements
+            method: "optimal" or "greedy"
+            agents: Candidate agents (default: available agents in the registry)
+
+        Returns:
+            BatchAssignment
+        """
+        if method not in ("optimal", "greedy"):
+            raise ValueError(f"Unknown batch method: {method}")
+
+        start = time.perf_counter()
+        if agents is None:
+            agents = self.registry.list_agents(availability_status="available")
+
+        base_rows = self.matcher.score_batch(tasks, agents)
+        load_weight = self.matcher.weights['load']
+        capacity = [max(0, agent.wip_limit - agent.current_wip) for agent in agents]
+
+        def slot_bonus(a: int, k: int) -> float:
+            agent = agents[a]
+            if agent.wip_limit <= 0:
+                return 0.0
+            return load_weight * max(0.0, 1.0 - (agent.current_wip + k) / agent.wip_limit)
+
+        if method == "optimal":
+            columns = [(a, k) for a, cap in enumerate(capacity) for k in range(cap)]
+            bonus = [slot_bonus(a, k) for a, k in columns]
+            pairs, solver = self._solve_assignment(base_rows, columns, bonus)
+        else:
+            pairs, solver = self._greedy_assignment(base_rows, capacity, slot_bonus), "greedy"
+
+        plan = BatchAssignment(method=method, solver=solver)
+        for t, a, k, score in pairs:
+            task, agent = tasks[t], agents[a]
+            plan.assignments[task.task_id] = agent.agent_id
+            plan.scores[task.task_id] = score
+            plan.slots[task.task_id] = k
+            plan.agent_load_hours[agent.agent_id] = \
+                plan.agent_load_hours.get(agent.agent_id, 0.0) + task.estimated_effort_hours
+            ranked = sorted(
+                (b for b, s in enumerate(base_rows[t]) if s is not None and b != a),
+                key=lambda b: -base_rows[t][b]
+            )
+            plan.alternatives[task.task_id] = [agents[b].agent_id for b in ranked[:2]]
+
+        plan.unassigned = [task.task_id for task in tasks if task.task_id not in plan.assignments]
+        plan.elapsed_ms = (time.perf_counter() - start) * 1000
+        return plan
+
+    def _solve_assignment(
+        self,
+        base_rows: List[List[Optional[float]]],
+        columns: List[Tuple[int, int]],
+        bonus: List[float]
+    ) -> Tuple[List[Tuple[int, int, int, float]], str]:
+        """Solve the task x slot assignment; returns (task, agent, slot, score) tuples"""
+        if not base_rows or not columns:
+            return [], "none"
+
+        if SCIPY_AVAILABLE:
+            agent_index = np.array([a for a, _ in columns])
+            base = np.array(
+                [[np.nan if s is None else s for s in row] for row in base_rows],
+                dtype=float
+            ).reshape(len(base_rows), -1)
+            score = base[:, agent_index] + np.array(bonus)
+            cost = np.where(np.isnan(score), _INFEASIBLE_COST, -score)
+            rows, cols = linear_sum_assignment(cost)
+            pairs = zip(rows.tolist(), cols.tolist())
+            solver = "scipy"
+        else:
+            cost = [
+                [_INFEASIBLE_COST if row[a] is None else -(row[a] + bonus[c])
+                 for c, (a, _) in enumerate(columns)]
+                for row in base_rows
+            ]
+            pairs = _hungarian(cost)
+            solver = "hungarian"
+
+        result = []
+        for t, c in pairs:
+            a, k = columns[c]
+            if base_rows[t][a] is not None:
+                result.append((t, a, k, base_rows[t][a] + bonus[c]))
+        return result, solver
+
+    @staticmethod
+    def _greedy_assignment(
+        base_rows: List[List[Optional[float]]],
+        capacity: List[int],
+        slot_bonus
+    ) -> List[Tuple[int, int, int, float]]:
+        """Tasks in order, each taking its best agent with a free slot"""
+        used = [0] * len(capacity)
+        result = []
+        for t, row in enumerate(base_rows):
+            best, best_score = None, None
+            for a, base in enumerate(row):
+                if base is None or used[a] >= capacity[a]:
+                    continue
+                score = base + slot_bonus(a, used[a])
+                if best_score is None or score > best_score:
+                    best, best_score = a, score
+            if best is not None:
+                result.append((t, best, used[best], best_score))
+                used[best] += 1
+        return result
+
     def suggest_optimal_strategy(
         self,
         requirements: TaskRequirements
@@ -376,6 +662,87 @@ class RoutingEngine:
         return RoutingStrategy.LEAST_LOADED
 
 
+_BENCHMARK_SKILLS = [
+    'Backend:Python', 'Backend:Java', 'Frontend:React', 'Frontend:TypeScript',
+    'DevOps:Docker', 'DevOps:Kubernetes', 'Testing:Unit', 'Testing:E2E',
+    'Data:SQL:PostgreSQL', 'Cloud:AWS', 'Analysis:Requirements', 'Quality:CodeReview'
+]
+
+
+def _synthetic_batch(
+    task_count: int,
+    agent_count: int,
+    rng: random.Random
+) -> Tuple[List[TaskRequirements], List[AgentProfile]]:
+    """Random agents (2-4 skills, WIP limit 2-5) and 1-2 skill tasks"""
+    agents = []
+    for i in range(agent_count):
+        skills = rng.sample(_BENCHMARK_SKILLS, rng.randint(2, 4))
+        agents.append(AgentProfile(
+            agent_id=f"bench-agent-{i:04d}",
+            name=f"Bench Agent {i}",
+            persona_type="benchmark",
+            wip_limit=rng.randint(2, 5),
+            capabilities=[AgentCapability(skill_id=s, proficiency=rng.randint(3, 5)) for s in skills],
+            quality_score_history=[round(rng.uniform(0.6, 1.0), 2) for _ in range(5)]
+        ))
+
+    tasks = []
+    for i in range(task_count):
+        skills = rng.sample(_BENCHMARK_SKILLS, rng.choice([1, 1, 2]))
+        tasks.append(TaskRequirements(
+            task_id=f"bench-task-{i:04d}",
+            task_type=skills[0].split(':')[0].lower(),
+            required_skills=skills,
+            min_proficiency=3,
+            estimated_effort_hours=round(rng.uniform(0.5, 8.0), 1)
+        ))
+    return tasks, agents
+
+
+def benchmark_batch_routing(
+    batch_sizes: Sequence[int] = (100, 250, 500, 1000),
+    agents_per_task: float = 0.4,
+    seed: int = 42,
+    engine: Optional[RoutingEngine] = None
+) -> List[Dict[str, Any]]:
+    """
+    Compare greedy and optimal batch assignment on synthetic batches.
+
+    Agents are generated in memory (the registry is not touched) and both
+    methods plan the same batch, so total match score, assigned count and
+    makespan are directly comparable.
+
+    Args:
+        batch_sizes: Task counts to benchmark
+        agents_per_task: Agents generated per task
+        seed: Random seed
+        engine: RoutingEngine to use (default: global engine)
+
+    Returns:
+        One result dict per batch size
+    """
+    engine = engine or get_routing_engine()
+    rng = random.Random(seed)
+    results = []
+
+    for size in batch_sizes:
+        tasks, agents = _synthetic_batch(size, max(1, int(size * agents_per_task)), rng)
+        greedy = engine.plan_batch(tasks, method="greedy", agents=agents)
+        optimal = engine.plan_batch(tasks, method="optimal", agents=agents)
+        results.append({
+            'tasks': size,
+            'agents': len(agents),
+            'capacity': sum(a.wip_limit - a.current_wip for a in agents),
+            'greedy': greedy.to_dict(),
+            'optimal': optimal.to_dict(),
+            'score_gain': round(optimal.total_score - greedy.total_score, 4),
+            'makespan_delta_hours': round(optimal.makespan_hours - greedy.makespan_hours, 2)
+        })
+
+    return results
+
+
 # Global instance
 _engine: Optional[RoutingEngine] = None
 
@@ -451,3 +818,14 @@ if __name__ == "__main__":
     print("\n=== Releasing Agents ===")
     for agent_id in stats['by_agent'].keys():
         engine.release_agent(agent_id)
+
+    # Batch assignment benchmark (synthetic agents, registry untouched)
+    print("\n=== Batch Routing: Greedy vs Optimal ===")
+    for result in benchmark_batch_routing():
+        greedy, optimal = result['greedy'], result['optimal']
+        print(f"{result['tasks']:>5} tasks / {result['agents']:>4} agents: "
+              f"score {greedy['total_score']:.2f} -> {optimal['total_score']:.2f} "
+              f"(+{result['score_gain']:.2f}), "
+              f"assigned {greedy['assigned']} -> {optimal['assigned']}, "
+              f"makespan {greedy['makespan_hours']:.1f}h -> {optimal['makespan_hours']:.1f}h, "
+              f"solve {optimal['elapsed_ms']:.0f}ms ({optimal['solver']})")
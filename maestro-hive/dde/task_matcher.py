@@ -188,6 +188,70 @@ class TaskMatcher:
 
         return self._calculate_match_score(agent, requirements)
 
+    def score(
+        self,
+        agent: AgentProfile,
+        requirements: TaskRequirements
+    ) -> MatchResult:
+        """
+        Score one agent for a task, whether or not it is available.
+
+        Args:
+            agent: Agent to score
+            requirements: Task requirements
+
+        Returns:
+            MatchResult with detailed scores
+        """
+        return self._calculate_match_score(agent, requirements)
+
+    def score_batch(
+        self,
+        tasks: List[TaskRequirements],
+        agents: List[AgentProfile]
+    ) -> List[List[Optional[float]]]:
+        """
+        Match score of every task/agent pair without the load component.
+
+        Batch planners add the load component per WIP slot themselves. Tasks
+        with the same skills, proficiency and type share one row, and each
+        agent's quality score is looked up once per task type.
+
+        Args:
+            tasks: Task requirements (one row each)
+            agents: Candidate agents (one column each)
+
+        Returns:
+            Rows of scores; None marks agents lacking the required capabilities
+        """
+        rows: Dict[Tuple, List[Optional[float]]] = {}
+        quality: Dict[Tuple[str, str], float] = {}
+        result = []
+
+        for task in tasks:
+            key = (tuple(task.required_skills), task.min_proficiency, task.task_type)
+            row = rows.get(key)
+            if row is None:
+                row = []
+                for agent in agents:
+                    if not self._has_required_capabilities(agent, task):
+                        row.append(None)
+                        continue
+                    quality_key = (agent.agent_id, task.task_type)
+                    if quality_key not in quality:
+                        quality[quality_key] = self._calculate_quality_score(
+                            agent, task.task_type
+                        )
+                    row.append(
+                        self._calculate_capability_score(agent, task) * self.weights['capability'] +
+                        self._calculate_availability_score(agent) * self.weights['availability'] +
+                        quality[quality_key] * self.weights['quality']
+                    )
+                rows[key] = row
+            result.append(row)
+
+        return result
+
     def _has_required_capabilities(
         self,
         agent: AgentProfile,
@@ -14,16 +14,39 @@ from pytest_bdd import given, when, then, parsers
 from pathlib import Path
 import json
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
+# Feature files selected with --bdv-feature, read by test_generated_features.py
+# when it is imported (os.pathsep separated)
+FEATURE_FILES_ENV = "BDV_FEATURE_FILES"
+
 
 # ============================================================================
 # PYTEST HOOKS - Allow dynamic markers from feature files
 # ============================================================================
 
+def pytest_addoption(parser):
+    """Register the feature selection option used by BDVRunner."""
+    parser.addoption(
+        "--bdv-feature",
+        action="append",
+        default=[],
+        dest="bdv_features",
+        help="Run only the scenarios of this feature file (repeatable)",
+    )
+
+
 def pytest_configure(config):
     """Register dynamic markers for BDV feature files."""
+    # Publish the feature selection before the test module is imported
+    selected = config.getoption("bdv_features")
+    if selected:
+        os.environ[FEATURE_FILES_ENV] = os.pathsep.join(selected)
+    else:
+        os.environ.pop(FEATURE_FILES_ENV, None)
+
     # Register wildcard patterns for dynamic markers
     config.addinivalue_line("markers", "contract: BDV contract tag (dynamic)")
 
@@ -12,6 +12,7 @@ import pytest
 from pytest_bdd import scenarios
 from pathlib import Path
 import glob
+import os
 
 # Get the directory containing this file
 FEATURES_DIR = Path(__file__).parent
@@ -35,8 +36,10 @@ def get_latest_feature_files():
 # Dynamically load scenarios from generated feature files
 # Note: pytest-bdd scenarios() must be called at module level
 try:
-    # Load all scenarios from the generated directory
-    scenarios(str(GENERATED_DIR))
+    # Load the features selected with --bdv-feature (see conftest.py), or
+    # all scenarios from the generated directory
+    selected = [f for f in os.environ.get("BDV_FEATURE_FILES", "").split(os.pathsep) if f]
+    scenarios(*(selected or [str(GENERATED_DIR)]))
 except Exception as e:
     # If no features found or other error, create a placeholder test
     @pytest.mark.skip(reason=f"No generated features available: {e}")
@@ -0,0 +1,82 @@
+"""indexed artifact search and running impact score totals
+
+Revision ID: 003_artifact_search
+Revises: 002_add_users
+Create Date: 2026-10-18 10:00:00.000000
+
+Artifact search is on the hot path of every persona recommendation.
+
+Changes:
+1. artifacts.tags TEXT (JSON-encoded) -> JSONB, with a GIN index for
+   containment/any-of tag filters
+2. pg_trgm extension and a trigram GIN index on artifacts.name for ILIKE
+3. Running impact_score_sum / impact_score_count columns, backfilled from
+   artifact_usage, so log_usage() updates the average without rescanning
+4. Index on artifact_usage.artifact_id for analytics and reconciliation
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003_artifact_search'
+down_revision = '002_add_users'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """
+    Add search indexes and running impact score totals
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Tags: JSON text -> JSONB
+    op.execute(
+        "ALTER TABLE artifacts ALTER COLUMN tags TYPE jsonb "
+        "USING COALESCE(NULLIF(tags, ''), '[]')::jsonb"
+    )
+    op.create_index('ix_artifacts_tags_gin', 'artifacts', ['tags'], postgresql_using='gin')
+    op.create_index(
+        'ix_artifacts_name_trgm', 'artifacts', ['name'],
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index('ix_artifacts_active_impact', 'artifacts', ['is_active', 'avg_impact_score'])
+
+    # Running totals
+    op.add_column('artifacts', sa.Column('impact_score_sum', sa.Float(), nullable=False, server_default='0'))
+    op.add_column('artifacts', sa.Column('impact_score_count', sa.Integer(), nullable=False, server_default='0'))
+    op.execute("""
+        UPDATE artifacts a
+        SET impact_score_sum = s.total,
+            impact_score_count = s.n,
+            avg_impact_score = s.total / s.n
+        FROM (
+            SELECT artifact_id, SUM(impact_score) AS total, COUNT(impact_score) AS n
+            FROM artifact_usage
+            WHERE impact_score IS NOT NULL
+            GROUP BY artifact_id
+        ) s
+        WHERE a.id = s.artifact_id
+    """)
+
+    op.create_index('ix_artifact_usage_artifact', 'artifact_usage', ['artifact_id'])
+
+    print("✅ Added artifact search indexes and impact score totals")
+
+
+def downgrade():
+    """
+    Drop search indexes and running totals, restore JSON text tags
+    """
+    op.drop_index('ix_artifact_usage_artifact', 'artifact_usage')
+
+    op.drop_column('artifacts', 'impact_score_count')
+    op.drop_column('artifacts', 'impact_score_sum')
+
+    op.drop_index('ix_artifacts_active_impact', 'artifacts')
+    op.drop_index('ix_artifacts_name_trgm', 'artifacts')
+    op.drop_index('ix_artifacts_tags_gin', 'artifacts')
+    op.execute("ALTER TABLE artifacts ALTER COLUMN tags TYPE text USING tags::text")
+
+    print("✅ Dropped artifact search indexes and impact score totals")
@@ -14,11 +14,11 @@ Changes from original database.py:
 """
 
 from sqlalchemy import (
-    Column, String, Integer, Float, DateTime, Text, JSON, ForeignKey, Boolean, Index
+    Column, String, Integer, Float, DateTime, Text, JSON, ForeignKey, Boolean, Index, DDL, event
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB
 from sqlalchemy.types import TypeDecorator
 import json
 from datetime import datetime
@@ -186,7 +186,11 @@ class Artifact(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     usage_count = Column(Integer, default=0)
     avg_impact_score = Column(Float, default=0.0)  # Average contribution to project success
-    tags = Column(JSONEncodedList)  # Works in both PostgreSQL and SQLite
+    # Running totals over usages with an impact score; avg = sum / count
+    impact_score_sum = Column(Float, default=0.0, server_default="0", nullable=False)
+    impact_score_count = Column(Integer, default=0, server_default="0", nullable=False)
+    # JSONB on PostgreSQL (GIN-indexed containment), JSON text on SQLite
+    tags = Column(JSONEncodedList().with_variant(JSONB(), "postgresql"))
     content_hash = Column(String(64))  # SHA-256 of content
     storage_path = Column(Text)  # S3/MinIO path
     meta = Column(JSON)
@@ -201,12 +205,27 @@ class Artifact(Base):
         Index('ix_artifacts_tenant_created', 'tenant_id', 'created_at'),
         Index('ix_artifacts_tenant_type', 'tenant_id', 'type'),
         Index('ix_artifacts_tenant_active', 'tenant_id', 'is_active'),
+        # ADDED: Search indexes (GIN/trigram on PostgreSQL, plain on SQLite)
+        Index('ix_artifacts_tags_gin', 'tags', postgresql_using='gin'),
+        Index(
+            'ix_artifacts_name_trgm', 'name',
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+        ),
+        Index('ix_artifacts_active_impact', 'is_active', 'avg_impact_score'),
     )
 
     def __repr__(self):
         return f"<Artifact(name='{self.name}', tenant_id={self.tenant_id}, type='{self.type}')>"
 
 
+# gin_trgm_ops needs pg_trgm before the artifacts indexes are created
+event.listen(
+    Artifact.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+
 class ArtifactUsage(Base):
     """
     Track when artifacts are used in projects
@@ -233,6 +252,7 @@ class ArtifactUsage(Base):
     # ADDED: Indexes
     __table_args__ = (
         Index('ix_artifact_usage_tenant_used', 'tenant_id', 'used_at'),
+        Index('ix_artifact_usage_artifact', 'artifact_id'),
     )
 
     def __repr__(self):
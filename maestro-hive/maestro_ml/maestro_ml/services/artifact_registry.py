@@ -4,13 +4,21 @@ Artifact Registry Service - The "Music Library"
 
 Manages reusable ML artifacts (feature pipelines, model templates, schemas, notebooks).
 Tracks usage and calculates impact scores to identify valuable components.
+
+Search uses JSONB containment (GIN) for tags and trigram-indexed ILIKE for
+names on PostgreSQL, with a LIKE-based fallback on other dialects (SQLite in
+tests). Impact scores are running averages maintained by log_usage().
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, Text
+from sqlalchemy import select, update, and_, or_, func, type_coerce, Text
+from sqlalchemy.dialects.postgresql import JSONB, array
+from sqlalchemy.exc import NoResultFound
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import hashlib
+import json
+import uuid as uuid_lib
 
 from maestro_ml.models.database import Artifact, ArtifactUsage, ArtifactCreate, ArtifactResponse
 
@@ -59,35 +67,66 @@ class ArtifactRegistry:
 
         Returns top matching artifacts sorted by impact score
         """
+        stmt = self._build_search_query(
+            self._dialect_name(session),
+            query=query,
+            artifact_type=artifact_type,
+            tags=tags,
+            min_impact_score=min_impact_score,
+            limit=limit
+        )
+
+        result = await session.execute(stmt)
+        return result.scalars().all()
+
+    def _build_search_query(
+        self,
+        dialect_name: str,
+        query: Optional[str] = None,
+        artifact_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        min_impact_score: Optional[float] = None,
+        limit: int = 20
+    ):
+        """Search statement for the given dialect (indexed operators on PostgreSQL)"""
         stmt = select(Artifact).where(Artifact.is_active == True)
 
         # Filter by type
         if artifact_type:
             stmt = stmt.where(Artifact.type == artifact_type)
 
-        # Filter by tags (any match) - works for both PostgreSQL ARRAY and SQLite JSON
+        is_postgres = dialect_name == "postgresql"
+
+        # Filter by tags (any match)
         if tags:
-            # For SQLite with JSONEncodedList, we need to use LIKE for pattern matching
-            tag_conditions = []
-            for tag in tags:
-                # Use LIKE to search for the tag in the JSON string
-                tag_conditions.append(Artifact.tags.cast(Text).like(f'%"{tag}"%'))
-            if tag_conditions:
-                stmt = stmt.where(or_(*tag_conditions))
+            if is_postgres:
+                # tags ?| array[...] - served by the GIN index on tags
+                stmt = stmt.where(
+                    type_coerce(Artifact.tags, JSONB).has_any(array(tags, type_=Text))
+                )
+            else:
+                # JSON text column: match the encoded element
+                stmt = stmt.where(or_(*[
+                    Artifact.tags.cast(Text).like(
+                        f"%{self._escape_like(json.dumps(tag))}%", escape="\\"
+                    )
+                    for tag in tags
+                ]))
 
         # Filter by minimum impact score
         if min_impact_score:
             stmt = stmt.where(Artifact.avg_impact_score >= min_impact_score)
 
-        # Text search in name (metadata search requires jsonb support)
+        # Text search in name - trigram GIN index on PostgreSQL
         if query:
-            stmt = stmt.where(Artifact.name.ilike(f"%{query}%"))
+            stmt = stmt.where(
+                Artifact.name.ilike(f"%{self._escape_like(query)}%", escape="\\")
+            )
 
         # Order by impact score (most valuable first)
         stmt = stmt.order_by(Artifact.avg_impact_score.desc()).limit(limit)
 
-        result = await session.execute(stmt)
-        return result.scalars().all()
+        return stmt
 
     async def log_usage(
         self,
@@ -102,12 +141,14 @@ class ArtifactRegistry:
 
         This is called whenever an artifact is used. Impact score can be provided
         now or calculated later after project completion.
-        """
-        import uuid as uuid_lib
 
+        Usage count and the running impact totals are incremented in a single
+        UPDATE, so concurrent calls never lose an increment and the average
+        is maintained without rescanning usages.
+        """
         # Convert string IDs to UUIDs
-        artifact_uuid = uuid_lib.UUID(artifact_id) if isinstance(artifact_id, str) else artifact_id
-        project_uuid = uuid_lib.UUID(project_id) if isinstance(project_id, str) else project_id
+        artifact_uuid = self._as_uuid(artifact_id)
+        project_uuid = self._as_uuid(project_id)
 
         usage = ArtifactUsage(
             artifact_id=artifact_uuid,
@@ -118,11 +159,27 @@ class ArtifactRegistry:
 
         session.add(usage)
 
-        # Increment usage count
-        stmt = select(Artifact).where(Artifact.id == artifact_uuid)
+        # Increment counters atomically (SET expressions see the old row)
+        values = {"usage_count": func.coalesce(Artifact.usage_count, 0) + 1}
+        if impact_score is not None:
+            new_sum = Artifact.impact_score_sum + impact_score
+            new_count = Artifact.impact_score_count + 1
+            values.update(
+                impact_score_sum=new_sum,
+                impact_score_count=new_count,
+                avg_impact_score=new_sum / new_count,
+            )
+
+        stmt = (
+            update(Artifact)
+            .where(Artifact.id == artifact_uuid)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
         result = await session.execute(stmt)
-        artifact = result.scalar_one()
-        artifact.usage_count += 1
+        if result.rowcount == 0:
+            await session.rollback()
+            raise NoResultFound(f"Artifact {artifact_id} not found")
 
         await session.commit()
         await session.refresh(usage)
@@ -135,26 +192,43 @@ class ArtifactRegistry:
         artifact_id: str
     ) -> float:
         """
-        Calculate and update average impact score for an artifact
+        Recalculate the running impact totals for an artifact from its usages
 
-        Impact score = average of all usage impact scores
-        Called after projects complete to update artifact value
+        Impact score = average of all usage impact scores. log_usage() keeps
+        it current; this reconciles it after usages are scored or edited
+        outside the registry (e.g. post-project scoring).
         """
-        stmt = select(func.avg(ArtifactUsage.impact_score)).where(
+        artifact_uuid = self._as_uuid(artifact_id)
+
+        stmt = select(
+            func.count(ArtifactUsage.impact_score),
+            func.coalesce(func.sum(ArtifactUsage.impact_score), 0.0)
+        ).where(
             and_(
-                ArtifactUsage.artifact_id == artifact_id,
+                ArtifactUsage.artifact_id == artifact_uuid,
                 ArtifactUsage.impact_score.isnot(None)
             )
         )
 
         result = await session.execute(stmt)
-        avg_score = result.scalar() or 0.0
+        count, total = result.one()
+        avg_score = total / count if count else 0.0
 
         # Update artifact
-        stmt = select(Artifact).where(Artifact.id == artifact_id)
+        stmt = (
+            update(Artifact)
+            .where(Artifact.id == artifact_uuid)
+            .values(
+                impact_score_sum=total,
+                impact_score_count=count,
+                avg_impact_score=avg_score,
+            )
+            .execution_options(synchronize_session=False)
+        )
         result = await session.execute(stmt)
-        artifact = result.scalar_one()
-        artifact.avg_impact_score = avg_score
+        if result.rowcount == 0:
+            await session.rollback()
+            raise NoResultFound(f"Artifact {artifact_id} not found")
 
         await session.commit()
 
@@ -212,6 +286,20 @@ class ArtifactRegistry:
             "created_by": artifact.created_by
         }
 
+    @staticmethod
+    def _dialect_name(session: AsyncSession) -> str:
+        """Dialect of the session's bind ("postgresql", "sqlite", ...)"""
+        return session.bind.dialect.name if session.bind is not None else ""
+
+    @staticmethod
+    def _escape_like(text: str) -> str:
+        """Escape LIKE wildcards so user input matches literally"""
+        return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @staticmethod
+    def _as_uuid(value: Any) -> Any:
+        return uuid_lib.UUID(value) if isinstance(value, str) else value
+
     @staticmethod
     def _calculate_hash(content: str) -> str:
         """Calculate SHA-256 hash of content"""
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Overlap Engine - batch set-similarity primitives for reuse analysis
+
+Shared by SpecSimilarityService and PersonaArtifactMatcher:
+- Token sets computed once per text and cached
+- Vectorised Jaccard scoring of every (new, existing) item pair
+- MinHash signatures and LSH banding to skip obviously dissimilar pairs
+  when item lists or the project history get large
+"""
+
+import re
+import zlib
+from collections import OrderedDict
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def word_tokens(text: str) -> FrozenSet[str]:
+    """Lower-cased \\w+ tokens (the tokenisation SpecSimilarityService uses)"""
+    return frozenset(TOKEN_PATTERN.findall(text.lower()))
+
+
+class TokenSetCache:
+    """
+    Bounded LRU cache of text -> token set.
+
+    The same story or requirement is compared against many candidates;
+    tokenising it once per process instead of once per pair is most of the
+    win for small lists.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Callable[[str], FrozenSet[str]] = word_tokens,
+        maxsize: int = 50000
+    ):
+        self.tokenizer = tokenizer
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str) -> FrozenSet[str]:
+        tokens = self._cache.get(text)
+        if tokens is not None:
+            self._cache.move_to_end(text)
+            self.hits += 1
+            return tokens
+
+        self.misses += 1
+        tokens = self.tokenizer(text)
+        self._cache[text] = tokens
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return tokens
+
+    def get_many(self, texts: Iterable[str]) -> List[FrozenSet[str]]:
+        return [self.get(text) for text in texts]
+
+
+def jaccard_matrix(left: Sequence[FrozenSet], right: Sequence[FrozenSet]) -> np.ndarray:
+    """
+    Jaccard similarity of every (left, right) pair as a (len(left), len(right)) matrix.
+
+    Sets are mapped to rows of a shared 0/1 incidence matrix, so all
+    intersections come from one matrix product. Pairs where either set is
+    empty score 0.
+    """
+    scores = np.zeros((len(left), len(right)), dtype=np.float64)
+    if not left or not right:
+        return scores
+
+    vocabulary: Dict[Hashable, int] = {}
+    for items in (left, right):
+        for item_set in items:
+            for item in item_set:
+                if item not in vocabulary:
+                    vocabulary[item] = len(vocabulary)
+    if not vocabulary:
+        return scores
+
+    def incidence(sets: Sequence[FrozenSet]) -> np.ndarray:
+        matrix = np.zeros((len(sets), len(vocabulary)), dtype=np.float32)
+        for row, item_set in enumerate(sets):
+            if item_set:
+                matrix[row, [vocabulary[item] for item in item_set]] = 1.0
+        return matrix
+
+    a, b = incidence(left), incidence(right)
+    intersection = (a @ b.T).astype(np.float64)
+    union = a.sum(axis=1)[:, None] + b.sum(axis=1)[None, :] - intersection
+    np.divide(intersection, union, out=scores, where=union > 0)
+    return scores
+
+
+def greedy_match(scores: np.ndarray, consume_at: float) -> List[Tuple[Optional[int], float]]:
+    """
+    One-to-one greedy matching over a score matrix, row by row in order.
+
+    Each row takes its best still-available column (first column on ties);
+    the column is used up only when the score reaches consume_at. Rows with
+    no positive score get (None, 0.0).
+    """
+    available = np.ones(scores.shape[1], dtype=bool)
+    results: List[Tuple[Optional[int], float]] = []
+    for row in scores:
+        masked = np.where(available, row, -1.0)
+        if masked.size == 0:
+            results.append((None, 0.0))
+            continue
+        col = int(np.argmax(masked))
+        score = float(masked[col])
+        if score <= 0:
+            results.append((None, 0.0))
+            continue
+        if score >= consume_at:
+            available[col] = False
+        results.append((col, score))
+    return results
+
+
+class MinHasher:
+    """
+    MinHash signatures over token sets.
+
+    Uses universal hashing (a*x + b) mod (2^31 - 1) with seeded parameters,
+    so signatures are stable across processes and comparable between calls.
+    """
+
+    PRIME = (1 << 31) - 1
+
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self._a = rng.randint(1, self.PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, self.PRIME, size=num_perm).astype(np.uint64)
+
+    def signature(self, tokens: Iterable[str]) -> np.ndarray:
+        hashes = np.fromiter(
+            (zlib.crc32(token.encode("utf-8")) for token in tokens),
+            dtype=np.uint64,
+        ) % np.uint64(self.PRIME)
+        if hashes.size == 0:
+            return np.full(self.num_perm, self.PRIME, dtype=np.uint64)
+        return ((np.outer(hashes, self._a) + self._b) % np.uint64(self.PRIME)).min(axis=0)
+
+    @staticmethod
+    def estimate(signature: np.ndarray, others: np.ndarray) -> np.ndarray:
+        """Estimated Jaccard of one signature against a stack of signatures"""
+        return (others == signature).mean(axis=-1)
+
+
+class LSHIndex:
+    """
+    Locality-sensitive hashing over MinHash signatures.
+
+    Signatures are cut into bands; keys sharing any identical band are
+    candidates. The band layout is the one whose similarity threshold
+    (1/bands)^(1/rows) is the largest not above the requested threshold,
+    favouring recall: pairs at the threshold are found with high probability,
+    and false positives are filtered by exact scoring.
+    """
+
+    def __init__(self, threshold: float = 0.5, num_perm: int = 128):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = self._choose_bands(threshold, num_perm)
+        self._buckets: List[Dict[bytes, Set[Hashable]]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    @staticmethod
+    def _choose_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+        best = (num_perm, 1)
+        for rows in range(1, num_perm + 1):
+            if num_perm % rows:
+                continue
+            bands = num_perm // rows
+            if (1.0 / bands) ** (1.0 / rows) <= threshold:
+                best = (bands, rows)
+        return best
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def add(self, key: Hashable, signature: np.ndarray) -> None:
+        if key in self._signatures:
+            self.remove(key)
+        self._signatures[key] = signature
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(band_key, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            members = buckets.get(band_key)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del buckets[band_key]
+
+    def query(self, signature: np.ndarray) -> Set[Hashable]:
+        candidates: Set[Hashable] = set()
+        for buckets, band_key in zip(self._buckets, self._band_keys(signature)):
+            members = buckets.get(band_key)
+            if members:
+                candidates.update(members)
+        return candidates
+
+    def ranked(self, signature: np.ndarray, limit: int) -> List[Tuple[Hashable, float]]:
+        """Candidates ordered by estimated Jaccard, best first, at most limit"""
+        keys = list(self.query(signature))
+        if not keys:
+            return []
+        estimates = MinHasher.estimate(signature, np.stack([self._signatures[k] for k in keys]))
+        order = np.argsort(-estimates, kind="stable")[:limit]
+        return [(keys[i], float(estimates[i])) for i in order]
+
+
+class OverlapEngine:
+    """
+    Item-level matcher used by overlap analysis.
+
+    Scores every pair exactly with jaccard_matrix() while the pair count is
+    at most dense_pair_limit; above that, MinHash/LSH proposes candidate
+    pairs and only those are scored, bounding time and memory for very long
+    item lists.
+    """
+
+    def __init__(
+        self,
+        token_cache: Optional[TokenSetCache] = None,
+        dense_pair_limit: int = 250_000,
+        lsh_threshold: float = 0.5,
+        num_perm: int = 128,
+    ):
+        self.tokens = token_cache or TokenSetCache()
+        self.dense_pair_limit = dense_pair_limit
+        self.lsh_threshold = lsh_threshold
+        self.hasher = MinHasher(num_perm=num_perm)
+
+    def match_texts(
+        self,
+        new_texts: Sequence[str],
+        existing_texts: Sequence[str],
+        consume_at: float,
+    ) -> List[Tuple[Optional[int], float]]:
+        """greedy_match() over the token-set Jaccard of two text lists"""
+        return self.match_sets(
+            self.tokens.get_many(new_texts),
+            self.tokens.get_many(existing_texts),
+            consume_at,
+        )
+
+    def match_sets(
+        self,
+        new_sets: Sequence[FrozenSet],
+        existing_sets: Sequence[FrozenSet],
+        consume_at: float,
+    ) -> List[Tuple[Optional[int], float]]:
+        if len(new_sets) * len(existing_sets) <= self.dense_pair_limit:
+            return greedy_match(jaccard_matrix(new_sets, existing_sets), consume_at)
+        return self._match_sparse(new_sets, existing_sets, consume_at)
+
+    def _match_sparse(
+        self,
+        new_sets: Sequence[FrozenSet],
+        existing_sets: Sequence[FrozenSet],
+        consume_at: float,
+    ) -> List[Tuple[Optional[int], float]]:
+        index = LSHIndex(threshold=self.lsh_threshold, num_perm=self.hasher.num_perm)
+        for col, item_set in enumerate(existing_sets):
+            if item_set:
+                index.add(col, self.hasher.signature(sorted(map(str, item_set))))
+
+        used: Set[int] = set()
+        results: List[Tuple[Optional[int], float]] = []
+        for item_set in new_sets:
+            best_col, best_score = None, 0.0
+            if item_set:
+                signature = self.hasher.signature(sorted(map(str, item_set)))
+                for col in sorted(index.query(signature)):
+                    if col in used:
+                        continue
+                    other = existing_sets[col]
+                    score = len(item_set & other) / len(item_set | other)
+                    if score > best_score:
+                        best_col, best_score = col, score
+            if best_col is not None and best_score >= consume_at:
+                used.add(best_col)
+            results.append((best_col, best_score))
+        return results
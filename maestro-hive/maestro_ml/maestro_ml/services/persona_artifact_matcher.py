@@ -19,11 +19,16 @@ Example:
     - Result: Fast-track 2 personas, run 8 = 20% time savings
 """
 
+import copy
+import hashlib
 import re
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 
+from maestro_ml.services.overlap_engine import LSHIndex, MinHasher, TokenSetCache
+
 
 @dataclass
 class PersonaDomainSpec:
@@ -72,6 +77,18 @@ class PersonaArtifactMatcher:
         # Configurable: Reuse thresholds per persona
         self.reuse_thresholds = self._initialize_reuse_thresholds()
 
+        # Aspects extracted per document digest; several personas share
+        # aspects (tech_stack, data_models, ...) and documents are re-read
+        # for every comparison
+        self._aspect_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._aspect_cache_size = 1024
+        self._text_tokens = TokenSetCache(tokenizer=lambda text: frozenset(text.lower().split()))
+
+        # Indexed project history: per-persona specs and LSH over their tokens
+        self._hasher = MinHasher()
+        self._history_specs: Dict[str, Dict[str, PersonaDomainSpec]] = {}
+        self._history_index: Dict[str, LSHIndex] = {}
+
     def _initialize_persona_domains(self) -> Dict[str, Dict[str, Any]]:
         """
         Define what each persona's domain includes.
@@ -300,11 +317,13 @@ class PersonaArtifactMatcher:
         domain_config = self.persona_domains[persona_id]
 
         # Extract specs based on key aspects
+        digest = hashlib.sha1(requirements_md.encode("utf-8")).hexdigest()
         extracted_specs = {}
         for aspect in domain_config["key_aspects"]:
-            extracted_specs[aspect] = self._extract_aspect(
+            extracted_specs[aspect] = self._extract_aspect_cached(
                 aspect,
                 requirements_md,
+                digest,
                 additional_artifacts or {}
             )
 
@@ -319,6 +338,28 @@ class PersonaArtifactMatcher:
             confidence=confidence
         )
 
+    def _extract_aspect_cached(
+        self,
+        aspect: str,
+        requirements_md: str,
+        digest: str,
+        additional_artifacts: Dict[str, str]
+    ) -> Any:
+        """_extract_aspect() memoised per (aspect, document digest)"""
+        if additional_artifacts:
+            return self._extract_aspect(aspect, requirements_md, additional_artifacts)
+
+        key = (aspect, digest)
+        if key in self._aspect_cache:
+            self._aspect_cache.move_to_end(key)
+        else:
+            self._aspect_cache[key] = self._extract_aspect(aspect, requirements_md, {})
+            if len(self._aspect_cache) > self._aspect_cache_size:
+                self._aspect_cache.popitem(last=False)
+
+        # Callers own the returned value
+        return copy.deepcopy(self._aspect_cache[key])
+
     def _extract_aspect(
         self,
         aspect: str,
@@ -703,8 +744,8 @@ class PersonaArtifactMatcher:
 
     def _text_similarity(self, text1: str, text2: str) -> float:
         """Calculate text similarity using simple token overlap"""
-        tokens1 = set(text1.lower().split())
-        tokens2 = set(text2.lower().split())
+        tokens1 = self._text_tokens.get(text1)
+        tokens2 = self._text_tokens.get(text2)
 
         intersection = len(tokens1 & tokens2)
         union = len(tokens1 | tokens2)
@@ -823,3 +864,130 @@ class PersonaArtifactMatcher:
             personas_to_execute=personas_to_execute,
             estimated_time_savings_percent=time_savings_percent
         )
+
+    def index_project(
+        self,
+        project_id: str,
+        requirements_md: str,
+        persona_ids: Optional[List[str]] = None
+    ) -> None:
+        """
+        Add a past project to the history searched by
+        build_persona_reuse_map_from_history().
+
+        Specs are extracted once per persona and summarised as MinHash
+        signatures in a per-persona LSH index. Re-indexing a project_id
+        replaces it.
+        """
+        for persona_id in persona_ids or list(self.persona_domains):
+            if persona_id == "requirement_analyst":
+                continue
+            spec = self.extract_persona_specs(persona_id, requirements_md)
+            self._history_specs.setdefault(persona_id, {})[project_id] = spec
+            index = self._history_index.setdefault(persona_id, LSHIndex(threshold=0.3))
+            index.add(project_id, self._hasher.signature(sorted(self._spec_tokens(spec))))
+
+    def _spec_tokens(self, spec: PersonaDomainSpec) -> set:
+        """Tokens of every aspect value, prefixed by aspect so aspects stay distinct"""
+        tokens = set()
+
+        def collect(aspect: str, value: Any) -> None:
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    tokens.add(f"{aspect}:{str(key).lower()}")
+                    collect(aspect, item)
+            elif isinstance(value, (list, tuple, set)):
+                for item in value:
+                    collect(aspect, item)
+            elif value is not None:
+                for token in self._text_tokens.get(str(value)):
+                    tokens.add(f"{aspect}:{token}")
+
+        for aspect, value in spec.specs.items():
+            collect(aspect, value)
+        return tokens
+
+    def build_persona_reuse_map_from_history(
+        self,
+        new_project_requirements: str,
+        persona_ids: List[str],
+        max_candidates: int = 10
+    ) -> PersonaReuseMap:
+        """
+        Build a reuse map choosing, per persona, the best indexed project.
+
+        LSH proposes the indexed projects whose persona specs share the most
+        tokens with the new project; only the top max_candidates per persona
+        are scored with match_persona_artifacts(), so the cost does not grow
+        with history size beyond the LSH lookup.
+
+        Args:
+            new_project_requirements: New project REQUIREMENTS.md
+            persona_ids: List of personas to analyze
+            max_candidates: Exact comparisons per persona
+
+        Returns:
+            PersonaReuseMap whose matches carry source_project_id
+        """
+        persona_matches = {}
+        personas_to_reuse = []
+        personas_to_execute = []
+
+        for persona_id in persona_ids:
+            if persona_id == "requirement_analyst":
+                personas_to_execute.append(persona_id)
+                continue
+
+            new_specs = self.extract_persona_specs(persona_id, new_project_requirements)
+            index = self._history_index.get(persona_id)
+
+            best = None
+            if index is not None:
+                signature = self._hasher.signature(sorted(self._spec_tokens(new_specs)))
+                for project_id, _ in index.ranked(signature, max_candidates):
+                    existing = self._history_specs[persona_id][project_id]
+                    result = self.match_persona_artifacts(new_specs, existing)
+                    if best is None or result.similarity_score > best[1].similarity_score:
+                        best = (project_id, result)
+
+            if best is None:
+                persona_matches[persona_id] = PersonaMatchResult(
+                    persona_id=persona_id,
+                    similarity_score=0.0,
+                    should_reuse=False,
+                    source_project_id=None,
+                    source_artifacts=[],
+                    match_details={},
+                    rationale=f"{persona_id} has no comparable project in history. "
+                              f"Recommendation: Execute fresh."
+                )
+                personas_to_execute.append(persona_id)
+                continue
+
+            project_id, match_result = best
+            if match_result.should_reuse:
+                match_result.source_project_id = project_id
+                personas_to_reuse.append(persona_id)
+            else:
+                personas_to_execute.append(persona_id)
+            persona_matches[persona_id] = match_result
+
+        if persona_matches:
+            overall_similarity = sum(
+                m.similarity_score for m in persona_matches.values()
+            ) / len(persona_matches)
+        else:
+            overall_similarity = 0.0
+
+        total_personas = len(persona_ids)
+        time_savings_percent = (
+            len(personas_to_reuse) / total_personas * 100 if total_personas > 0 else 0
+        )
+
+        return PersonaReuseMap(
+            overall_similarity=overall_similarity,
+            persona_matches=persona_matches,
+            personas_to_reuse=personas_to_reuse,
+            personas_to_execute=personas_to_execute,
+            estimated_time_savings_percent=time_savings_percent
+        )
@@ -3,27 +3,34 @@
 Spec Similarity Service - ML Phase 3
 
 Provides intelligent requirement specification similarity detection using:
-- Semantic embeddings for specs
-- Vector similarity search
-- Feature-level overlap analysis
+- Hashed TF-IDF (or pluggable) embeddings for specs
+- Matrix-based vector similarity search
+- Feature-level overlap analysis (batch scored, LSH candidates over history)
 - Effort estimation
 
 This enables V4 to detect similar projects and recommend clone-and-customize strategies.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import numpy as np
 from datetime import datetime
 import hashlib
 import re
 
+from maestro_ml.services.overlap_engine import (
+    LSHIndex,
+    OverlapEngine,
+    greedy_match,
+    jaccard_matrix,
+)
+
 
 @dataclass
 class SpecEmbedding:
     """Embedded representation of requirement specs"""
     project_id: str
-    embedding: np.ndarray  # 768-dim vector
+    embedding: np.ndarray  # 768-dim raw vector (term frequencies, no IDF)
     specs: Dict[str, Any]
     metadata: Dict[str, Any]
     created_at: datetime
@@ -95,65 +102,136 @@ class ReuseRecommendation:
     reasoning: str
 
 
+def _hash_token(token: str, dims: int) -> Tuple[int, float]:
+    """Stable (bucket, sign) for a token, independent of PYTHONHASHSEED."""
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dims, (1.0 if value >> 63 else -1.0)
+
+
+class HashingTfidfVectorizer:
+    """
+    Feature-hashing TF-IDF vectoriser with a global IDF table.
+
+    Every token maps to a fixed bucket (and sign) by a stable hash, so
+    dimension i means the same thing for every project and vectors from
+    different calls are directly comparable. Document frequencies are kept
+    per bucket and updated as projects are added or replaced; IDF weights
+    are applied at query time, so stored vectors never go stale.
+    """
+
+    TOKEN_PATTERN = re.compile(r'\w+')
+
+    def __init__(self, dims: int = 768, token_cache_size: int = 65536):
+        self.dims = dims
+        self.doc_freq = np.zeros(dims, dtype=np.float64)
+        self.doc_count = 0
+        self._token_cache: Dict[str, Tuple[int, float]] = {}
+        self._token_cache_size = token_cache_size
+
+    def _bucket(self, token: str) -> Tuple[int, float]:
+        cached = self._token_cache.get(token)
+        if cached is None:
+            cached = _hash_token(token, self.dims)
+            if len(self._token_cache) < self._token_cache_size:
+                self._token_cache[token] = cached
+        return cached
+
+    def term_frequencies(self, text_features: List[str]) -> np.ndarray:
+        """Signed, sublinear term-frequency vector (no IDF applied)."""
+        counts: Dict[str, int] = {}
+        for text in text_features:
+            for token in self.TOKEN_PATTERN.findall(text.lower()):
+                counts[token] = counts.get(token, 0) + 1
+
+        vector = np.zeros(self.dims, dtype=np.float64)
+        for token, count in counts.items():
+            index, sign = self._bucket(token)
+            vector[index] += sign * (1.0 + np.log(count))
+        return vector
+
+    def add_document(self, tf: np.ndarray) -> None:
+        """Count a stored document's buckets towards document frequency."""
+        self.doc_freq += tf != 0
+        self.doc_count += 1
+
+    def remove_document(self, tf: np.ndarray) -> None:
+        """Undo add_document() for a replaced document."""
+        self.doc_freq -= tf != 0
+        self.doc_count -= 1
+
+    def idf(self) -> np.ndarray:
+        """Smoothed inverse document frequency per bucket."""
+        return np.log((1.0 + self.doc_count) / (1.0 + self.doc_freq)) + 1.0
+
+    def transform(self, tf: np.ndarray, idf: Optional[np.ndarray] = None) -> np.ndarray:
+        """L2-normalised TF-IDF vector(s); accepts one vector or a matrix of rows."""
+        weighted = tf * (self.idf() if idf is None else idf)
+        norms = np.linalg.norm(weighted, axis=-1, keepdims=True)
+        return np.divide(weighted, norms, out=np.zeros_like(weighted), where=norms > 0)
+
+
 class SpecSimilarityService:
     """
     Service for detecting similar requirement specifications.
 
     Uses simple but effective similarity algorithms:
-    - TF-IDF for text similarity
+    - Hashed TF-IDF (or a pluggable embedding model) for text similarity
     - Jaccard similarity for structured data
     - Weighted combination for overall score
+
+    Stored projects are kept as rows of one matrix, so a similarity search
+    is a single matrix-vector product plus a partial sort for the top k.
     """
 
-    def __init__(self):
+    EMBEDDING_DIMS = 768
+
+    def __init__(self, embedder: Optional[Callable[[List[str]], np.ndarray]] = None):
+        """
+        Args:
+            embedder: Optional model mapping text features to a fixed-size
+                vector (e.g. a sentence-transformers wrapper). Replaces the
+                hashed TF-IDF vectoriser when given.
+        """
         # In-memory storage for embeddings (would be vector DB in production)
         self.embeddings_store: Dict[str, SpecEmbedding] = {}
 
+        self.embedder = embedder
+        self.vectorizer = HashingTfidfVectorizer(dims=self.EMBEDDING_DIMS)
+
+        # Row-per-project matrix of raw vectors (term frequencies, or model
+        # embeddings when an embedder is set) with spare capacity
+        self._row_ids: List[str] = []
+        self._row_index: Dict[str, int] = {}
+        self._raw_matrix = np.zeros((0, self.EMBEDDING_DIMS), dtype=np.float64)
+        # Normalised search matrix, rebuilt lazily after changes
+        self._search_matrix: Optional[np.ndarray] = None
+
+        # Item-level overlap scoring and MinHash/LSH over stored projects'
+        # token sets, used to pick candidates for history-wide analysis
+        self.overlap_engine = OverlapEngine()
+        self._overlap_index = LSHIndex(threshold=0.3, num_perm=self.overlap_engine.hasher.num_perm)
+
         # Effort estimation constants (learned from historical data)
         self.FULL_SDLC_HOURS = 120  # Average hours for full SDLC
         self.INTEGRATION_OVERHEAD = 0.15  # 15% overhead for integration
 
     def embed_specs(self, specs: Dict[str, Any], project_id: str) -> SpecEmbedding:
         """
-        Create semantic embedding for requirement specs.
+        Create semantic embedding for requirement specs and index it.
 
-        For now, uses simple TF-IDF-like approach.
-        In production, would use trained transformer model.
+        Re-embedding an existing project_id replaces its previous vector.
+        The stored embedding is the raw vector; IDF changes as projects are
+        added, so use get_embedding() for the weighted, normalised form.
         """
-
-        # Extract all text from specs
-        text_features = []
-
-        # User stories
-        for story in specs.get("user_stories", []):
-            text_features.append(story.lower())
-
-        # Functional requirements
-        for req in specs.get("functional_requirements", []):
-            text_features.append(req.lower())
-
-        # Non-functional requirements
-        for nfr in specs.get("non_functional_requirements", []):
-            text_features.append(nfr.lower())
-
-        # Extract keywords from structured data
-        for model in specs.get("data_models", []):
-            if isinstance(model, dict):
-                text_features.append(model.get("entity", "").lower())
-                text_features.extend([f.lower() for f in model.get("fields", [])])
-
-        for endpoint in specs.get("api_endpoints", []):
-            if isinstance(endpoint, dict):
-                text_features.append(endpoint.get("path", "").lower())
-                text_features.append(endpoint.get("purpose", "").lower())
-
-        # Create simple embedding (bag of words + TF-IDF weights)
-        # In production: Use sentence-transformers or similar
-        embedding = self._create_simple_embedding(text_features)
+        features = self._extract_text_features(specs)
+        raw = self._raw_vector(features)
+        self._store_row(project_id, raw)
+        self._overlap_index.add(project_id, self._spec_signature(features))
 
         spec_embedding = SpecEmbedding(
             project_id=project_id,
-            embedding=embedding,
+            embedding=raw,
             specs=specs,
             metadata={
                 "user_story_count": len(specs.get("user_stories", [])),
@@ -171,33 +249,66 @@ class SpecSimilarityService:
 
     def _create_simple_embedding(self, text_features: List[str]) -> np.ndarray:
         """
-        Create simple embedding from text features.
+        Create embedding from text features.
 
-        Uses vocabulary + TF weighting.
-        Fixed 768 dimensions for compatibility with real embeddings.
+        Hashed TF-IDF against the current corpus IDF, or the configured
+        embedder. Fixed 768 dimensions for compatibility with real embeddings.
         """
-
-        # Build vocabulary from common software terms
-        vocabulary = set()
-        for text in text_features:
-            words = re.findall(r'\w+', text.lower())
-            vocabulary.update(words)
-
-        # Create term frequency vector
-        vocab_list = sorted(list(vocabulary))[:768]  # Limit to 768 dims
-
-        embedding = np.zeros(768)
-        for i, term in enumerate(vocab_list):
-            # Count occurrences across all features
-            count = sum(1 for text in text_features if term in text.lower())
-            embedding[i] = count / (1 + len(text_features))  # TF weighting
-
-        # Normalize
-        norm = np.linalg.norm(embedding)
-        if norm > 0:
-            embedding = embedding / norm
-
-        return embedding
+        return self._normalize(self._raw_vector(text_features))
+
+    def get_embedding(self, project_id: str) -> np.ndarray:
+        """Stored project's normalised vector under the current IDF."""
+        return self._get_search_matrix()[self._row_index[project_id]]
+
+    def _raw_vector(self, text_features: List[str]) -> np.ndarray:
+        if self.embedder is not None:
+            vector = np.asarray(self.embedder(text_features), dtype=np.float64).ravel()
+            if vector.shape[0] != self._raw_matrix.shape[1]:
+                if self._row_ids:
+                    raise ValueError(
+                        f"Embedder returned {vector.shape[0]} dims, "
+                        f"index has {self._raw_matrix.shape[1]}"
+                    )
+                self._raw_matrix = np.zeros((0, vector.shape[0]), dtype=np.float64)
+            return vector
+        return self.vectorizer.term_frequencies(text_features)
+
+    def _normalize(self, raw: np.ndarray) -> np.ndarray:
+        if self.embedder is not None:
+            norm = np.linalg.norm(raw)
+            return raw / norm if norm > 0 else raw
+        return self.vectorizer.transform(raw)
+
+    def _store_row(self, project_id: str, raw: np.ndarray) -> None:
+        """Insert or replace a project's row, growing capacity geometrically."""
+        row = self._row_index.get(project_id)
+        if row is None:
+            row = len(self._row_ids)
+            if row == self._raw_matrix.shape[0]:
+                grown = np.zeros((max(16, row * 2), raw.shape[0]), dtype=np.float64)
+                grown[:row] = self._raw_matrix[:row]
+                self._raw_matrix = grown
+            self._row_ids.append(project_id)
+            self._row_index[project_id] = row
+        elif self.embedder is None:
+            self.vectorizer.remove_document(self._raw_matrix[row])
+
+        self._raw_matrix[row] = raw
+        if self.embedder is None:
+            self.vectorizer.add_document(raw)
+        self._search_matrix = None
+
+    def _get_search_matrix(self) -> np.ndarray:
+        """Normalised (n_projects, dims) matrix under the current IDF."""
+        if self._search_matrix is None:
+            self._search_matrix = self._normalize_rows(self._raw_matrix[:len(self._row_ids)])
+        return self._search_matrix
+
+    def _normalize_rows(self, raw: np.ndarray) -> np.ndarray:
+        if self.embedder is not None:
+            norms = np.linalg.norm(raw, axis=1, keepdims=True)
+            return np.divide(raw, norms, out=np.zeros_like(raw), where=norms > 0)
+        return self.vectorizer.transform(raw)
 
     def find_similar_projects(
         self,
@@ -217,37 +328,31 @@ class SpecSimilarityService:
             List of similar projects, sorted by similarity (highest first)
         """
 
-        if not self.embeddings_store:
+        if not self._row_ids:
             return []
 
-        # Create embedding for new specs
-        new_embedding = self._create_simple_embedding(
-            self._extract_text_features(specs)
-        )
-
-        # Calculate similarity with all stored projects
-        similarities = []
-        for project_id, stored_embedding in self.embeddings_store.items():
-            similarity = self._cosine_similarity(
-                new_embedding,
-                stored_embedding.embedding
-            )
-
-            if similarity >= min_similarity:
-                similarities.append(SimilarProject(
-                    project_id=project_id,
-                    similarity_score=similarity,
-                    specs=stored_embedding.specs,
-                    metadata=stored_embedding.metadata
-                ))
-
-        # Sort by similarity (highest first)
-        similarities.sort(key=lambda x: x.similarity_score, reverse=True)
-
-        return similarities[:limit]
+        query = self._create_simple_embedding(self._extract_text_features(specs))
+
+        # One matrix-vector product scores every stored project
+        scores = self._get_search_matrix() @ query
+        candidates = np.flatnonzero(scores >= min_similarity)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        results = []
+        for row in candidates:
+            stored = self.embeddings_store[self._row_ids[row]]
+            results.append(SimilarProject(
+                project_id=stored.project_id,
+                similarity_score=float(scores[row]),
+                specs=stored.specs,
+                metadata=stored.metadata
+            ))
+        return results
 
     def _extract_text_features(self, specs: Dict[str, Any]) -> List[str]:
-        """Extract text features from specs"""
+        """Extract text features from specs (shared by indexing and search)"""
         features = []
 
         for story in specs.get("user_stories", []):
@@ -259,6 +364,17 @@ class SpecSimilarityService:
         for nfr in specs.get("non_functional_requirements", []):
             features.append(nfr.lower())
 
+        # Extract keywords from structured data
+        for model in specs.get("data_models", []):
+            if isinstance(model, dict):
+                features.append(model.get("entity", "").lower())
+                features.extend([f.lower() for f in model.get("fields", [])])
+
+        for endpoint in specs.get("api_endpoints", []):
+            if isinstance(endpoint, dict):
+                features.append(endpoint.get("path", "").lower())
+                features.append(endpoint.get("purpose", "").lower())
+
         return features
 
     def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
@@ -272,6 +388,43 @@ class SpecSimilarityService:
 
         return float(dot_product / (norm1 * norm2))
 
+    def _spec_signature(self, features: List[str]) -> np.ndarray:
+        """MinHash signature of all tokens in a spec"""
+        tokens = set()
+        for tokens_of_feature in self.overlap_engine.tokens.get_many(features):
+            tokens.update(tokens_of_feature)
+        return self.overlap_engine.hasher.signature(sorted(tokens))
+
+    def find_overlapping_projects(
+        self,
+        new_specs: Dict[str, Any],
+        min_overlap: float = 0.5,
+        limit: int = 5,
+        max_candidates: int = 50
+    ) -> List[Tuple[str, OverlapAnalysis]]:
+        """
+        Run overlap analysis against the stored project history.
+
+        MinHash/LSH proposes stored projects whose vocabulary is close to
+        the new spec; at most max_candidates of them (best estimated
+        similarity first) get the full analyze_overlap(), so the cost is
+        bounded regardless of history size.
+
+        Returns:
+            (project_id, analysis) pairs with overall_overlap >= min_overlap,
+            highest overlap first
+        """
+        signature = self._spec_signature(self._extract_text_features(new_specs))
+
+        results = []
+        for project_id, _ in self._overlap_index.ranked(signature, max_candidates):
+            analysis = self.analyze_overlap(new_specs, self.embeddings_store[project_id].specs)
+            if analysis.overall_overlap >= min_overlap:
+                results.append((project_id, analysis))
+
+        results.sort(key=lambda item: item[1].overall_overlap, reverse=True)
+        return results[:limit]
+
     def analyze_overlap(
         self,
         new_specs: Dict[str, Any],
@@ -374,31 +527,14 @@ class SpecSimilarityService:
         new = []
         modified = []
 
-        used_existing = set()
-
-        for new_story in new_stories:
-            best_match = None
-            best_score = 0
-
-            for i, existing_story in enumerate(existing_stories):
-                if i in used_existing:
-                    continue
-
-                # Simple word overlap similarity
-                score = self._text_similarity(new_story, existing_story)
-
-                if score > best_score:
-                    best_score = score
-                    best_match = (i, existing_story)
-
-            if best_score >= 0.85:
+        matches = self.overlap_engine.match_texts(new_stories, existing_stories, consume_at=0.60)
+        for new_story, (index, score) in zip(new_stories, matches):
+            if score >= 0.85:
                 # Strong match
-                matched.append((new_story, best_match[1]))
-                used_existing.add(best_match[0])
-            elif best_score >= 0.60:
+                matched.append((new_story, existing_stories[index]))
+            elif score >= 0.60:
                 # Partial match (modified)
-                modified.append((new_story, best_match[1]))
-                used_existing.add(best_match[0])
+                modified.append((new_story, existing_stories[index]))
             else:
                 # New story
                 new.append(new_story)
@@ -414,25 +550,10 @@ class SpecSimilarityService:
         matched = []
         new = []
 
-        used_existing = set()
-
-        for new_req in new_reqs:
-            best_match = None
-            best_score = 0
-
-            for i, existing_req in enumerate(existing_reqs):
-                if i in used_existing:
-                    continue
-
-                score = self._text_similarity(new_req, existing_req)
-
-                if score > best_score:
-                    best_score = score
-                    best_match = (i, existing_req)
-
-            if best_score >= 0.75:
-                matched.append((new_req, best_match[1]))
-                used_existing.add(best_match[0])
+        matches = self.overlap_engine.match_texts(new_reqs, existing_reqs, consume_at=0.75)
+        for new_req, (index, score) in zip(new_reqs, matches):
+            if score >= 0.75:
+                matched.append((new_req, existing_reqs[index]))
             else:
                 new.append(new_req)
 
@@ -453,47 +574,30 @@ class SpecSimilarityService:
         new = []
         modified = []
 
-        used_existing = set()
-
-        for new_model in new_models:
-            if not isinstance(new_model, dict):
-                continue
-
-            new_entity = new_model.get("entity", "")
-            new_fields = set(new_model.get("fields", []))
-
-            best_match = None
-            best_score = 0
-
-            for i, existing_model in enumerate(existing_models):
-                if i in used_existing or not isinstance(existing_model, dict):
-                    continue
-
-                existing_entity = existing_model.get("entity", "")
-                existing_fields = set(existing_model.get("fields", []))
-
-                # Entity name similarity
-                name_sim = self._text_similarity(new_entity, existing_entity)
-
-                # Field overlap (Jaccard)
-                if new_fields or existing_fields:
-                    field_sim = len(new_fields & existing_fields) / len(new_fields | existing_fields)
-                else:
-                    field_sim = 0
-
-                # Combined score
-                score = 0.5 * name_sim + 0.5 * field_sim
-
-                if score > best_score:
-                    best_score = score
-                    best_match = (i, existing_model)
-
-            if best_score >= 0.85:
-                matched.append((new_model, best_match[1]))
-                used_existing.add(best_match[0])
-            elif best_score >= 0.50:
-                modified.append((new_model, best_match[1]))
-                used_existing.add(best_match[0])
+        new_models = [m for m in new_models if isinstance(m, dict)]
+        tokens = self.overlap_engine.tokens
+
+        def entity_tokens(models: List[Any]) -> List[frozenset]:
+            return [
+                tokens.get(m.get("entity", "")) if isinstance(m, dict) else frozenset()
+                for m in models
+            ]
+
+        def field_sets(models: List[Any]) -> List[frozenset]:
+            return [
+                frozenset(m.get("fields", [])) if isinstance(m, dict) else frozenset()
+                for m in models
+            ]
+
+        # Entity name similarity and field overlap (Jaccard), combined
+        scores = 0.5 * jaccard_matrix(entity_tokens(new_models), entity_tokens(existing_models))
+        scores += 0.5 * jaccard_matrix(field_sets(new_models), field_sets(existing_models))
+
+        for new_model, (index, score) in zip(new_models, greedy_match(scores, consume_at=0.50)):
+            if score >= 0.85:
+                matched.append((new_model, existing_models[index]))
+            elif score >= 0.50:
+                modified.append((new_model, existing_models[index]))
             else:
                 new.append(new_model)
 
@@ -513,37 +617,27 @@ class SpecSimilarityService:
         matched = []
         new = []
 
-        used_existing = set()
-
-        for new_ep in new_endpoints:
-            if not isinstance(new_ep, dict):
-                continue
+        new_endpoints = [ep for ep in new_endpoints if isinstance(ep, dict)]
+        tokens = self.overlap_engine.tokens
 
-            new_method = new_ep.get("method", "")
-            new_path = new_ep.get("path", "")
+        def paths(endpoints: List[Any]) -> List[frozenset]:
+            return [
+                tokens.get(ep.get("path", "")) if isinstance(ep, dict) else frozenset()
+                for ep in endpoints
+            ]
 
-            best_match = None
-            best_score = 0
-
-            for i, existing_ep in enumerate(existing_endpoints):
-                if i in used_existing or not isinstance(existing_ep, dict):
-                    continue
-
-                existing_method = existing_ep.get("method", "")
-                existing_path = existing_ep.get("path", "")
-
-                # Exact method match required
-                if new_method == existing_method:
-                    # Path similarity
-                    path_sim = self._text_similarity(new_path, existing_path)
-
-                    if path_sim > best_score:
-                        best_score = path_sim
-                        best_match = (i, existing_ep)
+        # Path similarity, only where methods match exactly
+        new_methods = np.array([ep.get("method", "") for ep in new_endpoints], dtype=object)
+        existing_methods = np.array(
+            [ep.get("method", "") if isinstance(ep, dict) else None for ep in existing_endpoints],
+            dtype=object
+        )
+        same_method = new_methods[:, None] == existing_methods[None, :]
+        scores = jaccard_matrix(paths(new_endpoints), paths(existing_endpoints)) * same_method
 
-            if best_score >= 0.80:
-                matched.append((new_ep, best_match[1]))
-                used_existing.add(best_match[0])
+        for new_ep, (index, score) in zip(new_endpoints, greedy_match(scores, consume_at=0.80)):
+            if score >= 0.80:
+                matched.append((new_ep, existing_endpoints[index]))
             else:
                 new.append(new_ep)
 
@@ -555,8 +649,8 @@ class SpecSimilarityService:
 
         In production, use semantic similarity.
         """
-        words1 = set(re.findall(r'\w+', text1.lower()))
-        words2 = set(re.findall(r'\w+', text2.lower()))
+        words1 = self.overlap_engine.tokens.get(text1)
+        words2 = self.overlap_engine.tokens.get(text2)
 
         if not words1 or not words2:
             return 0.0
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark for CacheManager ModelCache hit paths
+
+Times ModelCache.get_model() for L1 hits, L2 hits (L1 disabled) and misses
+with each available serialiser, plus encode/decode cost and stored size of
+a typical model metadata record.
+
+Usage:
+    python performance/benchmark_cache_manager.py --redis-url redis://localhost:6379/15
+    python performance/benchmark_cache_manager.py --fake   # in-process fakeredis
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Dict, List
+
+import redis
+
+from performance.cache_manager import (
+    MSGPACK_AVAILABLE,
+    ORJSON_AVAILABLE,
+    CacheManager,
+    ModelCache,
+    ValueSerializer,
+)
+
+
+def model_record(i: int) -> Dict[str, Any]:
+    """Model registry entry shaped like the /models API response."""
+    return {
+        "id": f"model-{i}",
+        "tenant_id": f"tenant-{i % 10}",
+        "name": f"churn-classifier-{i}",
+        "version": i % 7 + 1,
+        "framework": "sklearn",
+        "metrics": {"accuracy": 0.91, "f1": 0.88, "auc": 0.93, "loss": [0.5 - j * 0.01 for j in range(50)]},
+        "hyperparameters": {"n_estimators": 200, "max_depth": 12, "learning_rate": 0.05},
+        "features": [f"feature_{j}" for j in range(40)],
+        "tags": ["production", "churn", "v2"],
+        "created_at": "2026-10-18T10:00:00Z",
+    }
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "mean_us": round(statistics.mean(samples) * 1e6, 2),
+        "p50_us": round(percentile(samples, 0.50) * 1e6, 2),
+        "p95_us": round(percentile(samples, 0.95) * 1e6, 2),
+    }
+
+
+def timed(fn, keys: List[str]) -> Dict[str, float]:
+    samples = []
+    for key in keys:
+        start = time.perf_counter()
+        fn(key)
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def make_client(args):
+    if args.fake:
+        import fakeredis
+        return fakeredis.FakeRedis()
+    return redis.from_url(args.redis_url, decode_responses=False)
+
+
+def bench_codec(codec: str, args) -> Dict[str, Any]:
+    record = model_record(0)
+    serializer = ValueSerializer(codec)
+    encoded = serializer.dumps(record)
+    start = time.perf_counter()
+    for _ in range(args.iterations):
+        serializer.loads(serializer.dumps(record))
+    codec_us = (time.perf_counter() - start) / args.iterations * 1e6
+
+    client = make_client(args)
+    results: Dict[str, Any] = {"bytes": len(encoded), "encode_decode_us": round(codec_us, 2)}
+    for label, l1 in (("l1_hit", True), ("l2_hit", False)):
+        cache = CacheManager(
+            redis_client=client,
+            serializer=codec,
+            enable_memory_cache=l1,
+            invalidation_channel=None,
+        )
+        models = ModelCache(cache)
+        ids = [f"bench-{codec}-{i}" for i in range(args.models)]
+        for i, model_id in enumerate(ids):
+            models.set_model(model_id, model_record(i))
+        results[label] = timed(models.get_model, ids * (args.iterations // args.models or 1))
+        if not l1:
+            results["miss"] = timed(models.get_model, [f"absent-{i}" for i in range(args.iterations)])
+        cache.delete_pattern(f"model:bench-{codec}-*")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--fake", action="store_true", help="Use fakeredis instead of a Redis server")
+    parser.add_argument("--models", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    codecs = ["pickle", "json"]
+    if ORJSON_AVAILABLE:
+        codecs.append("orjson")
+    if MSGPACK_AVAILABLE:
+        codecs.append("msgpack")
+
+    print(json.dumps({codec: bench_codec(codec, args) for codec in codecs}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
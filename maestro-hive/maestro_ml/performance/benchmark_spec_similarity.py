@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark for SpecSimilarityService similarity search
+
+Indexes a few thousand synthetic specs and times find_similar_projects()
+(the /api/v1/ml/find-similar-projects path) against the previous
+project-at-a-time cosine loop over embeddings_store.
+
+Usage:
+    python performance/benchmark_spec_similarity.py --projects 5000 --queries 200
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from typing import Any, Dict, List
+
+from maestro_ml.services.spec_similarity import SpecSimilarityService
+
+DOMAINS = {
+    "shop": ["cart", "checkout", "payment", "order", "product", "inventory", "coupon"],
+    "health": ["patient", "appointment", "doctor", "prescription", "record", "insurance"],
+    "iot": ["sensor", "telemetry", "device", "firmware", "alert", "dashboard"],
+    "finance": ["account", "ledger", "transfer", "invoice", "budget", "audit"],
+    "social": ["post", "comment", "follow", "feed", "message", "profile"],
+}
+ACTIONS = ["create", "view", "update", "delete", "search", "export", "share", "approve"]
+ACTORS = ["user", "admin", "manager", "guest", "operator"]
+
+
+def make_specs(rng: random.Random) -> Dict[str, Any]:
+    """Random spec drawn mostly from one domain's vocabulary."""
+    domain = rng.choice(list(DOMAINS))
+    nouns = DOMAINS[domain] + rng.sample(sum(DOMAINS.values(), []), 3)
+
+    def sentence() -> str:
+        return f"as a {rng.choice(ACTORS)} I can {rng.choice(ACTIONS)} {rng.choice(nouns)} {rng.choice(nouns)}"
+
+    return {
+        "user_stories": [sentence() for _ in range(rng.randint(5, 15))],
+        "functional_requirements": [sentence() for _ in range(rng.randint(5, 15))],
+        "data_models": [
+            {"entity": noun, "fields": [f"{noun}_id", "created_at", "status"]}
+            for noun in rng.sample(nouns, 3)
+        ],
+        "api_endpoints": [
+            {"path": f"/api/{noun}", "purpose": f"{rng.choice(ACTIONS)} {noun}"}
+            for noun in rng.sample(nouns, 3)
+        ],
+    }
+
+
+def legacy_search(service: SpecSimilarityService, specs: Dict[str, Any], min_similarity: float, limit: int) -> List[str]:
+    """Previous behaviour: one cosine per stored project, then a full sort."""
+    query = service._create_simple_embedding(service._extract_text_features(specs))
+    scored = []
+    for project_id in service.embeddings_store:
+        score = service._cosine_similarity(query, service.get_embedding(project_id))
+        if score >= min_similarity:
+            scored.append((score, project_id))
+    scored.sort(reverse=True)
+    return [project_id for _, project_id in scored[:limit]]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "mean_ms": round(statistics.mean(samples) * 1000, 3),
+        "p50_ms": round(percentile(samples, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 3),
+    }
+
+
+def run(projects: int, queries: int, min_similarity: float, limit: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    service = SpecSimilarityService()
+
+    start = time.perf_counter()
+    for i in range(projects):
+        service.embed_specs(make_specs(rng), f"project-{i}")
+    index_seconds = time.perf_counter() - start
+
+    query_specs = [make_specs(rng) for _ in range(queries)]
+
+    # First search after indexing pays for building the search matrix
+    start = time.perf_counter()
+    service.find_similar_projects(query_specs[0], min_similarity, limit)
+    first_query_seconds = time.perf_counter() - start
+
+    matrix, legacy = [], []
+    for specs in query_specs:
+        start = time.perf_counter()
+        service.find_similar_projects(specs, min_similarity, limit)
+        matrix.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        legacy_search(service, specs, min_similarity, limit)
+        legacy.append(time.perf_counter() - start)
+
+    return {
+        "projects": projects,
+        "queries": queries,
+        "index_ms_per_project": round(index_seconds / projects * 1000, 3),
+        "first_query_ms": round(first_query_seconds * 1000, 3),
+        "matrix_search": summarize(matrix),
+        "legacy_loop": summarize(legacy),
+        "speedup_p50": round(percentile(legacy, 0.5) / percentile(matrix, 0.5), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--projects", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--min-similarity", type=float, default=0.5)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(json.dumps(
+        run(args.projects, args.queries, args.min_similarity, args.limit, args.seed),
+        indent=2,
+    ))
+
+
+if __name__ == "__main__":
+    main()
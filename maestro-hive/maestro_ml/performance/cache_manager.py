@@ -3,7 +3,9 @@ Redis Cache Manager for Maestro ML Platform
 
 Provides multi-level caching with:
 - Redis-based distributed cache
-- In-memory LRU cache
+- In-memory LRU cache bounded by item count and byte budget
+- Cross-replica L1 invalidation over Redis pub/sub
+- Tagged serialisation (msgpack/orjson/json, pickle only when allowed)
 - Cache warming strategies
 - Automatic invalidation
 - Hit rate tracking
@@ -13,14 +15,32 @@ import redis
 import json
 import pickle
 import hashlib
+import math
+import threading
 import time
-from typing import Any, Optional, Callable, Dict, List
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional, Callable, Dict, List, Tuple
 from functools import wraps, lru_cache
 from datetime import timedelta
 import logging
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +59,9 @@ class CacheStats:
     sets: int = 0
     deletes: int = 0
     errors: int = 0
+    l1_hits: int = 0
+    l1_evictions: int = 0
+    invalidations_received: int = 0
 
     @property
     def hit_rate(self) -> float:
@@ -52,6 +75,193 @@ class CacheStats:
         return self.hits + self.misses
 
 
+# ============================================================================
+# Serialisation
+# ============================================================================
+
+class SerializationError(ValueError):
+    """Value cannot be encoded or decoded by the configured codecs"""
+
+
+class ValueSerializer:
+    """
+    Tagged value codec for L2 entries.
+
+    Every stored value starts with a one-byte codec tag, so values written
+    with different codecs (or by older replicas, which wrote raw pickles)
+    can be read back during a rollout. Pickle is used only when
+    allow_pickle is set: unpickling data from a shared Redis lets anyone
+    with write access to it run code in this process.
+
+    Codecs:
+        msgpack - fastest and most compact (requires msgpack)
+        orjson  - JSON via orjson (requires orjson)
+        json    - standard library JSON
+        pickle  - arbitrary Python objects (default)
+        auto    - msgpack, else orjson, else json
+    Values the chosen codec cannot return unchanged (tuples, sets, non-str
+    JSON keys, custom classes, non-finite floats, ...) are pickled when
+    allowed and rejected otherwise, so a cache hit always has the type that
+    was stored.
+    """
+
+    TAG_MSGPACK = b"\x01"
+    TAG_JSON = b"\x02"
+    TAG_PICKLE = b"\x03"
+    # Untagged pickles written before tagging start with the protocol opcode
+    LEGACY_PICKLE_PREFIX = 0x80
+
+    # Integer range every codec (and orjson on the reading side) handles
+    INT_MIN, INT_MAX = -(1 << 63), (1 << 63) - 1
+
+    def __init__(self, codec: str = "pickle", allow_pickle: bool = True):
+        if codec == "auto":
+            codec = "msgpack" if MSGPACK_AVAILABLE else ("orjson" if ORJSON_AVAILABLE else "json")
+        if codec == "msgpack" and not MSGPACK_AVAILABLE:
+            raise ValueError("msgpack codec requested but msgpack is not installed")
+        if codec == "orjson" and not ORJSON_AVAILABLE:
+            raise ValueError("orjson codec requested but orjson is not installed")
+        if codec not in ("msgpack", "orjson", "json", "pickle"):
+            raise ValueError(f"Unknown cache codec: {codec}")
+        if codec == "pickle" and not allow_pickle:
+            raise ValueError("pickle codec requires allow_pickle=True")
+
+        self.codec = codec
+        self.allow_pickle = allow_pickle
+
+    def _lossless(self, value: Any) -> bool:
+        """True if the codec round-trips value to an equal object of the same types"""
+        kind = type(value)
+        if value is None or kind is bool or kind is str:
+            return True
+        if kind is int:
+            return self.INT_MIN <= value <= self.INT_MAX
+        if kind is float:
+            return self.codec == "msgpack" or math.isfinite(value)
+        if kind is bytes:
+            return self.codec == "msgpack"
+        if kind is list:
+            return all(self._lossless(item) for item in value)
+        if kind is dict:
+            key_types = (str, int) if self.codec == "msgpack" else (str,)
+            return all(
+                type(key) in key_types and (type(key) is str or self._lossless(key))
+                and self._lossless(item)
+                for key, item in value.items()
+            )
+        return False
+
+    def dumps(self, value: Any) -> bytes:
+        if self.codec != "pickle" and not self._lossless(value):
+            if not self.allow_pickle:
+                raise SerializationError(
+                    f"{self.codec} cannot store {type(value).__name__} without changing it"
+                )
+            return self.TAG_PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            if self.codec == "msgpack":
+                return self.TAG_MSGPACK + msgpack.packb(value, use_bin_type=True)
+            if self.codec == "orjson":
+                return self.TAG_JSON + orjson.dumps(value)
+            if self.codec == "json":
+                return self.TAG_JSON + json.dumps(value, separators=(",", ":")).encode()
+        except (TypeError, ValueError, OverflowError) as e:
+            if not self.allow_pickle:
+                raise SerializationError(f"{self.codec} cannot encode {type(value).__name__}: {e}")
+        return self.TAG_PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data: bytes) -> Any:
+        tag = data[:1]
+        if tag == self.TAG_MSGPACK:
+            if not MSGPACK_AVAILABLE:
+                raise SerializationError("msgpack value but msgpack is not installed")
+            return msgpack.unpackb(data[1:], raw=False, strict_map_key=False)
+        if tag == self.TAG_JSON:
+            return orjson.loads(data[1:]) if ORJSON_AVAILABLE else json.loads(data[1:])
+        if tag == self.TAG_PICKLE or (data and data[0] == self.LEGACY_PICKLE_PREFIX):
+            if not self.allow_pickle:
+                raise SerializationError("refusing to unpickle cache value (allow_pickle=False)")
+            return pickle.loads(data[1:] if tag == self.TAG_PICKLE else data)
+        raise SerializationError(f"Unknown cache value tag: {tag!r}")
+
+
+# ============================================================================
+# L1 memory cache
+# ============================================================================
+
+class MemoryLRU:
+    """
+    Thread-safe in-process LRU with an item limit and a byte budget.
+
+    Entry size is the length of the value's serialised form, which the
+    manager already has on every set and L2 read, so sizing costs nothing
+    extra and tracks what the value would cost to fetch again.
+    """
+
+    def __init__(self, max_items: int = 1000, max_bytes: int = 64 * 1024 * 1024):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            value, expiry, _ = entry
+            if expiry is not None and time.time() >= expiry:
+                self._pop(key)
+                return False, None
+            self._entries.move_to_end(key)
+            return True, value
+
+    def contains(self, key: str) -> bool:
+        return self.get(key)[0]
+
+    def set(self, key: str, value: Any, expiry: Optional[float], size: int) -> None:
+        if size > self.max_bytes:
+            # Never worth evicting everything else for one value
+            self.discard(key)
+            return
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (value, expiry, size)
+            self.bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_items or self.bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._pop(oldest)
+                self.evictions += 1
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def discard_matching(self, predicate: Callable[[str], bool]) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._pop(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[2]
+
+
 class CacheManager:
     """
     Multi-level cache manager with Redis backend
@@ -69,6 +279,12 @@ class CacheManager:
         @cache.cached(ttl=60, key_prefix="models")
         def get_model(model_id: str):
             return db.query(Model).filter(Model.id == model_id).first()
+
+    Coherence:
+        Writes, deletes and flushes publish the affected keys (or pattern) on
+        the invalidation channel; every replica drops them from its L1. A
+        replica that misses messages while disconnected clears its L1 on
+        reconnect, and l1_max_ttl bounds staleness if pub/sub is unavailable.
     """
 
     def __init__(
@@ -76,7 +292,13 @@ class CacheManager:
         redis_url: str = "redis://localhost:6379/0",
         default_ttl: int = 300,  # 5 minutes
         max_memory_items: int = 1000,
-        enable_memory_cache: bool = True
+        enable_memory_cache: bool = True,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        l1_max_ttl: Optional[int] = 60,
+        serializer: str = "pickle",
+        allow_pickle: bool = True,
+        invalidation_channel: Optional[str] = "maestro:cache:invalidate",
+        redis_client: Optional[Any] = None
     ):
         """
         Initialize cache manager
@@ -86,15 +308,27 @@ class CacheManager:
             default_ttl: Default TTL in seconds
             max_memory_items: Maximum items in memory cache
             enable_memory_cache: Enable L1 in-memory cache
+            max_memory_bytes: Byte budget for the memory cache
+            l1_max_ttl: Cap on how long an L1 entry lives (None = L2 TTL)
+            serializer: L2 codec - pickle (default), msgpack, orjson, json or
+                auto (msgpack > orjson > json); non-pickle codecs store only
+                values they return unchanged and pickle the rest
+            allow_pickle: Allow pickling values other codecs cannot encode
+                (and reading pickled values)
+            invalidation_channel: Pub/sub channel for L1 invalidation
+                (None disables cross-replica invalidation)
+            redis_client: Existing Redis client to use instead of redis_url
         """
         # Redis connection
-        self.redis = redis.from_url(redis_url, decode_responses=False)
+        self.redis = redis_client or redis.from_url(redis_url, decode_responses=False)
         self.default_ttl = default_ttl
         self.enable_memory_cache = enable_memory_cache
+        self.l1_max_ttl = l1_max_ttl
+        self.serializer = ValueSerializer(serializer, allow_pickle=allow_pickle)
 
         # In-memory L1 cache
         if enable_memory_cache:
-            self._memory_cache: Dict[str, tuple] = {}
+            self._memory_cache = MemoryLRU(max_memory_items, max_memory_bytes)
             self._max_memory_items = max_memory_items
 
         # Statistics
@@ -108,6 +342,17 @@ class CacheManager:
             logger.error(f"Failed to connect to Redis: {e}")
             raise
 
+        # Cross-replica invalidation
+        self.instance_id = uuid.uuid4().hex
+        self.invalidation_channel = invalidation_channel if enable_memory_cache else None
+        # Bumped on every invalidation; an L2 read only fills L1 if no
+        # invalidation arrived while it was in flight
+        self._invalidation_epoch = 0
+        self._pubsub = None
+        self._pubsub_thread = None
+        if self.invalidation_channel:
+            self._start_invalidation_listener()
+
     def get(self, key: str, default: Any = None) -> Optional[Any]:
         """
         Get value from cache (checks memory → Redis)
@@ -121,28 +366,31 @@ class CacheManager:
         """
         # Try memory cache first (L1)
         if self.enable_memory_cache:
-            if key in self._memory_cache:
-                value, expiry = self._memory_cache[key]
-                if expiry is None or time.time() < expiry:
-                    self.stats.hits += 1
-                    logger.debug(f"L1 cache hit: {key}")
-                    return value
-                else:
-                    # Expired
-                    del self._memory_cache[key]
+            found, value = self._memory_cache.get(key)
+            if found:
+                self.stats.hits += 1
+                self.stats.l1_hits += 1
+                return value
 
-        # Try Redis (L2)
+        # Try Redis (L2) - value and TTL in one round trip
         try:
-            value = self.redis.get(key)
-            if value is not None:
+            epoch = self._invalidation_epoch
+            if self.enable_memory_cache:
+                pipeline = self.redis.pipeline(transaction=False)
+                pipeline.get(key)
+                pipeline.pttl(key)
+                data, pttl = pipeline.execute()
+            else:
+                data, pttl = self.redis.get(key), None
+
+            if data is not None:
                 self.stats.hits += 1
-                deserialized = pickle.loads(value)
+                deserialized = self.serializer.loads(data)
 
                 # Populate memory cache
-                if self.enable_memory_cache:
-                    ttl = self.redis.ttl(key)
-                    expiry = time.time() + ttl if ttl > 0 else None
-                    self._set_memory(key, deserialized, expiry)
+                if self.enable_memory_cache and epoch == self._invalidation_epoch:
+                    ttl = pttl / 1000.0 if pttl and pttl > 0 else None
+                    self._set_memory(key, deserialized, self._l1_expiry(ttl), len(data))
 
                 logger.debug(f"L2 cache hit: {key}")
                 return deserialized
@@ -179,7 +427,7 @@ class CacheManager:
 
         try:
             # Serialize value
-            serialized = pickle.dumps(value)
+            serialized = self.serializer.dumps(value)
 
             # Set in Redis
             if nx:
@@ -189,11 +437,13 @@ class CacheManager:
 
             if result:
                 self.stats.sets += 1
+                self._publish_invalidation(keys=[key])
 
                 # Set in memory cache
                 if self.enable_memory_cache:
-                    expiry = time.time() + ttl if ttl > 0 else None
-                    self._set_memory(key, value, expiry)
+                    self._set_memory(
+                        key, value, self._l1_expiry(ttl if ttl > 0 else None), len(serialized)
+                    )
 
                 logger.debug(f"Cache set: {key} (TTL: {ttl}s)")
                 return True
@@ -211,9 +461,10 @@ class CacheManager:
             # Delete from Redis
             result = self.redis.delete(key)
 
-            # Delete from memory
-            if self.enable_memory_cache and key in self._memory_cache:
-                del self._memory_cache[key]
+            # Delete from memory, here and on other replicas
+            if self.enable_memory_cache:
+                self._memory_cache.discard(key)
+            self._publish_invalidation(keys=[key])
 
             if result:
                 self.stats.deletes += 1
@@ -231,6 +482,8 @@ class CacheManager:
         """
         Delete all keys matching pattern
 
+        Uses SCAN rather than KEYS so Redis is not blocked on large keyspaces.
+
         Args:
             pattern: Key pattern (e.g., "user:*")
 
@@ -238,21 +491,28 @@ class CacheManager:
             Number of keys deleted
         """
         try:
-            keys = self.redis.keys(pattern)
-            if keys:
-                deleted = self.redis.delete(*keys)
+            deleted = 0
+            batch = []
+            for key in self.redis.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= 1000:
+                    deleted += self.redis.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis.delete(*batch)
+
+            # Clear memory caches for matching keys, including other replicas'
+            # (their L1 may hold keys this replica never saw)
+            if self.enable_memory_cache:
+                self._memory_cache.discard_matching(
+                    lambda key: self._matches_pattern(key, pattern)
+                )
+            self._publish_invalidation(pattern=pattern)
+
+            if deleted:
                 self.stats.deletes += deleted
-
-                # Clear memory cache for matching keys
-                if self.enable_memory_cache:
-                    for key in list(self._memory_cache.keys()):
-                        if self._matches_pattern(key, pattern):
-                            del self._memory_cache[key]
-
                 logger.info(f"Deleted {deleted} keys matching pattern: {pattern}")
-                return deleted
-
-            return 0
+            return deleted
 
         except Exception as e:
             self.stats.errors += 1
@@ -262,10 +522,8 @@ class CacheManager:
     def exists(self, key: str) -> bool:
         """Check if key exists in cache"""
         # Check memory first
-        if self.enable_memory_cache and key in self._memory_cache:
-            _, expiry = self._memory_cache[key]
-            if expiry is None or time.time() < expiry:
-                return True
+        if self.enable_memory_cache and self._memory_cache.contains(key):
+            return True
 
         # Check Redis
         return bool(self.redis.exists(key))
@@ -287,21 +545,113 @@ class CacheManager:
         """
         return self.redis.incrby(key, amount)
 
-    def _set_memory(self, key: str, value: Any, expiry: Optional[float]):
+    def _set_memory(self, key: str, value: Any, expiry: Optional[float], size: int = 0):
         """Set value in memory cache with LRU eviction"""
-        # Check if we need to evict
-        if len(self._memory_cache) >= self._max_memory_items:
-            # Simple LRU: remove oldest item
-            oldest_key = next(iter(self._memory_cache))
-            del self._memory_cache[oldest_key]
+        before = self._memory_cache.evictions
+        self._memory_cache.set(key, value, expiry, size)
+        self.stats.l1_evictions += self._memory_cache.evictions - before
 
-        self._memory_cache[key] = (value, expiry)
+    def _l1_expiry(self, ttl: Optional[float]) -> Optional[float]:
+        """Absolute L1 expiry: the L2 TTL capped by l1_max_ttl"""
+        if self.l1_max_ttl is not None:
+            ttl = self.l1_max_ttl if ttl is None else min(ttl, self.l1_max_ttl)
+        return time.time() + ttl if ttl is not None else None
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _pattern_regex(pattern: str):
+        import re
+        return re.compile("^" + ".*".join(re.escape(part) for part in pattern.split("*")) + "$")
 
     def _matches_pattern(self, key: str, pattern: str) -> bool:
         """Simple pattern matching (supports * wildcard)"""
-        import re
-        regex_pattern = pattern.replace("*", ".*")
-        return bool(re.match(f"^{regex_pattern}$", key))
+        return bool(self._pattern_regex(pattern).match(key))
+
+    # ------------------------------------------------------------------
+    # Cross-replica invalidation
+    # ------------------------------------------------------------------
+
+    def _publish_invalidation(
+        self,
+        keys: Optional[List[str]] = None,
+        pattern: Optional[str] = None,
+        flush: bool = False
+    ) -> None:
+        """Tell other replicas to drop keys, a pattern, or everything from L1"""
+        if not self.invalidation_channel:
+            return
+        message = {"origin": self.instance_id}
+        if keys:
+            message["keys"] = keys
+        if pattern:
+            message["pattern"] = pattern
+        if flush:
+            message["flush"] = True
+        try:
+            self.redis.publish(self.invalidation_channel, json.dumps(message))
+        except Exception as e:
+            # Other replicas fall back to l1_max_ttl expiry
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+    def _handle_invalidation(self, message: Dict[str, Any]) -> None:
+        """Apply an invalidation message from the pub/sub channel"""
+        if message.get("type") == "subscribe":
+            # (Re)subscribed: anything published while disconnected was lost
+            self._invalidation_epoch += 1
+            self._memory_cache.clear()
+            return
+        if message.get("type") != "message":
+            return
+
+        try:
+            payload = json.loads(message["data"])
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed cache invalidation message")
+            return
+        if payload.get("origin") == self.instance_id:
+            return
+
+        self._invalidation_epoch += 1
+        self.stats.invalidations_received += 1
+        if payload.get("flush"):
+            self._memory_cache.clear()
+        if payload.get("pattern"):
+            pattern = payload["pattern"]
+            self._memory_cache.discard_matching(lambda key: self._matches_pattern(key, pattern))
+        for key in payload.get("keys", ()):
+            self._memory_cache.discard(key)
+
+    def _start_invalidation_listener(self) -> None:
+        """Subscribe to the invalidation channel on a background thread"""
+        try:
+            self._pubsub = self.redis.pubsub()
+            self._pubsub.subscribe(**{self.invalidation_channel: self._handle_invalidation})
+            self._pubsub_thread = self._pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=self._on_listener_error,
+            )
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener unavailable, relying on L1 TTL: {e}")
+            self._pubsub = None
+
+    def _on_listener_error(self, error: Exception, pubsub: Any, thread: Any) -> None:
+        # The connection is re-established (and re-subscribed) on the next
+        # poll; until the subscribe confirmation arrives, L1 may be stale
+        logger.warning(f"Cache invalidation listener error: {error}")
+        self._invalidation_epoch += 1
+        if self.enable_memory_cache:
+            self._memory_cache.clear()
+        time.sleep(1.0)
+
+    def close(self) -> None:
+        """Stop the invalidation listener"""
+        if self._pubsub_thread is not None:
+            self._pubsub_thread.stop()
+            self._pubsub_thread = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
 
     def cached(
         self,
@@ -387,13 +737,14 @@ class CacheManager:
         pipeline = self.redis.pipeline()
 
         for key, value in keys_and_values:
-            serialized = pickle.dumps(value)
+            serialized = self.serializer.dumps(value)
             if ttl:
                 pipeline.set(key, serialized, ex=ttl)
             else:
                 pipeline.set(key, serialized)
 
         pipeline.execute()
+        self._publish_invalidation(keys=[key for key, _ in keys_and_values])
         logger.info(f"Warmed cache with {len(keys_and_values)} items")
 
     def get_stats(self) -> Dict:
@@ -406,7 +757,12 @@ class CacheManager:
             "sets": self.stats.sets,
             "deletes": self.stats.deletes,
             "errors": self.stats.errors,
-            "memory_cache_size": len(self._memory_cache) if self.enable_memory_cache else 0
+            "memory_cache_size": len(self._memory_cache) if self.enable_memory_cache else 0,
+            "memory_cache_bytes": self._memory_cache.bytes if self.enable_memory_cache else 0,
+            "l1_hits": self.stats.l1_hits,
+            "l1_evictions": self.stats.l1_evictions,
+            "invalidations_received": self.stats.invalidations_received,
+            "serializer": self.serializer.codec,
         }
 
     def clear_stats(self):
@@ -418,6 +774,7 @@ class CacheManager:
         self.redis.flushdb()
         if self.enable_memory_cache:
             self._memory_cache.clear()
+        self._publish_invalidation(flush=True)
         logger.warning("Cache flushed!")
 
 
@@ -0,0 +1,43 @@
+"""
+Tests for ArtifactRegistry indexed search queries and schema
+"""
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.schema import CreateIndex
+
+from maestro_ml.models.database import Artifact
+from maestro_ml.services.artifact_registry import ArtifactRegistry
+
+
+def compile_search(dialect, **filters):
+    stmt = ArtifactRegistry()._build_search_query(dialect.name, **filters)
+    return stmt.compile(dialect=dialect)
+
+
+def test_postgres_search_uses_indexable_operators():
+    compiled = compile_search(postgresql.dialect(), tags=["churn", "fraud"], query="churn")
+    sql = str(compiled)
+
+    assert "?|" in sql
+    assert "ILIKE" in sql
+    assert "CAST(artifacts.tags AS TEXT)" not in sql
+    assert {"churn", "fraud", "%churn%"} <= set(compiled.params.values())
+
+
+def test_sqlite_search_falls_back_to_escaped_like():
+    compiled = compile_search(sqlite.dialect(), tags=["a_b"], query="50%")
+    sql = str(compiled)
+
+    assert "LIKE" in sql and "ESCAPE" in sql
+    assert set(compiled.params.values()) >= {'%"a\\_b"%', "%50\\%%"}
+
+
+def test_search_indexes_defined_for_postgres():
+    dialect = postgresql.dialect()
+    ddl = {
+        index.name: str(CreateIndex(index).compile(dialect=dialect))
+        for index in Artifact.__table__.indexes
+    }
+
+    assert "USING gin (tags)" in ddl["ix_artifacts_tags_gin"]
+    assert "USING gin (name gin_trgm_ops)" in ddl["ix_artifacts_name_trgm"]
+    assert str(Artifact.__table__.c.tags.type.compile(dialect=dialect)) == "JSONB"
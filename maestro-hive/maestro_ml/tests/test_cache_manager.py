@@ -0,0 +1,132 @@
+"""
+Tests for the multi-level CacheManager: bounded L1, serialisers and
+cross-replica invalidation (fakeredis stands in for a shared Redis)
+"""
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from performance.cache_manager import (
+    CacheManager,
+    MemoryLRU,
+    ModelCache,
+    SerializationError,
+    ValueSerializer,
+)
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def make_cache(server, **kwargs):
+    return CacheManager(redis_client=fakeredis.FakeRedis(server=server), **kwargs)
+
+
+def wait_for(condition, timeout=3.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_memory_lru_enforces_item_and_byte_limits():
+    lru = MemoryLRU(max_items=3, max_bytes=100)
+    for key in "abc":
+        lru.set(key, key, None, 10)
+    lru.get("a")
+    lru.set("d", "d", None, 10)
+    assert not lru.contains("b") and lru.contains("a")
+
+    lru.set("big", "x", None, 85)
+    assert lru.bytes <= 100 and lru.contains("big")
+    lru.set("huge", "x", None, 101)
+    assert not lru.contains("huge")
+
+
+def test_serializer_round_trips_and_refuses_pickle_when_disallowed():
+    safe = ValueSerializer("json", allow_pickle=False)
+    value = {"model": "m1", "metrics": [0.9, 0.8], "active": True}
+    assert safe.loads(safe.dumps(value)) == value
+
+    with pytest.raises(SerializationError):
+        safe.dumps({1, 2})
+    legacy = ValueSerializer("pickle").dumps({1, 2})
+    with pytest.raises(SerializationError):
+        safe.loads(legacy)
+    with pytest.raises(SerializationError):
+        safe.loads(legacy[1:])  # untagged pickle written before tagging
+
+    assert ValueSerializer("json").loads(legacy[1:]) == {1, 2}
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson", "msgpack"])
+def test_lossy_values_fall_back_to_pickle(codec):
+    if codec != "json":
+        pytest.importorskip(codec)
+    serializer = ValueSerializer(codec)
+    for value in ({1: "a", "t": (1, 2)}, {"s": {1, 2}}, [float("nan")], b"raw", 1 << 70):
+        data = serializer.dumps(value)
+        decoded = serializer.loads(data)
+        assert type(decoded) is type(value)
+        if value == value:
+            assert repr(decoded) == repr(value)
+    plain = {"model": "m1", "metrics": [0.9, 1], "nested": {"ok": None}}
+    assert serializer.dumps(plain)[:1] != ValueSerializer.TAG_PICKLE
+    assert serializer.loads(serializer.dumps(plain)) == plain
+
+
+def test_msgpack_int_keys_round_trip_across_instances(server):
+    pytest.importorskip("msgpack")
+    writer = make_cache(server, serializer="msgpack", invalidation_channel=None)
+    reader = make_cache(server, serializer="msgpack", invalidation_channel=None)
+    assert writer.set("k", {1: "a", "n": [1, 2]})
+    assert writer.redis.get("k")[:1] == ValueSerializer.TAG_MSGPACK
+    assert reader.get("k") == {1: "a", "n": [1, 2]}
+    assert reader.stats.errors == 0
+
+
+def test_pickle_is_the_default_codec(server):
+    cache = make_cache(server, invalidation_channel=None)
+    assert cache.get_stats()["serializer"] == "pickle"
+
+
+def test_l1_serves_hits_and_is_bounded(server):
+    cache = make_cache(server, invalidation_channel=None, max_memory_items=2)
+    models = ModelCache(cache)
+    for model_id in ("a", "b", "c"):
+        models.set_model(model_id, {"id": model_id})
+
+    assert models.get_model("c") == {"id": "c"}
+    stats = cache.get_stats()
+    assert stats["l1_hits"] == 1 and stats["memory_cache_size"] == 2
+    assert stats["l1_evictions"] == 1
+    assert models.get_model("a") == {"id": "a"}  # evicted from L1, served from L2
+
+
+def test_delete_invalidates_other_replicas(server):
+    writer = make_cache(server)
+    reader = make_cache(server)
+    try:
+        writer.set("model:m1", {"version": 1})
+        assert reader.get("model:m1") == {"version": 1}  # now in reader's L1
+
+        writer.set("model:m1", {"version": 2})
+        assert wait_for(lambda: reader.get("model:m1") == {"version": 2})
+
+        writer.set("model:m2:t1:x", {"version": 1})
+        assert reader.get("model:m2:t1:x") == {"version": 1}
+        writer.delete_pattern("model:*:t1:*")
+        assert wait_for(lambda: reader.get("model:m2:t1:x") is None)
+
+        writer.delete("model:m1")
+        assert wait_for(lambda: reader.get("model:m1") is None)
+        assert reader.get_stats()["invalidations_received"] >= 3
+    finally:
+        writer.close()
+        reader.close()
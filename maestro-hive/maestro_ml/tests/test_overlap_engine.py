@@ -0,0 +1,92 @@
+"""
+Tests for the batch overlap engine and its use in reuse analysis
+"""
+import numpy as np
+
+from maestro_ml.services.overlap_engine import (
+    LSHIndex,
+    MinHasher,
+    OverlapEngine,
+    TokenSetCache,
+    greedy_match,
+    jaccard_matrix,
+)
+from maestro_ml.services.persona_artifact_matcher import PersonaArtifactMatcher
+from maestro_ml.services.spec_similarity import SpecSimilarityService
+
+
+def test_jaccard_matrix_matches_pairwise_sets():
+    left = [frozenset("abc"), frozenset(), frozenset("xy")]
+    right = [frozenset("abd"), frozenset("xyz")]
+    scores = jaccard_matrix(left, right)
+    expected = [[len(l & r) / len(l | r) if l and r else 0.0 for r in right] for l in left]
+    assert np.allclose(scores, expected)
+
+
+def test_greedy_match_consumes_columns_in_row_order():
+    scores = np.array([[0.9, 0.9], [0.9, 0.4], [0.5, 0.3], [0.5, 0.0]])
+    assert greedy_match(scores, consume_at=0.8) == [(0, 0.9), (1, 0.4), (1, 0.3), (None, 0.0)]
+
+
+def test_token_cache_tokenises_once():
+    cache = TokenSetCache()
+    assert cache.get("User can Pay") == frozenset({"user", "can", "pay"})
+    cache.get("User can Pay")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lsh_finds_similar_and_skips_dissimilar():
+    hasher = MinHasher()
+    index = LSHIndex(threshold=0.5)
+    base = [f"t{i}" for i in range(40)]
+    index.add("near", hasher.signature(base[:36] + ["u1", "u2", "u3", "u4"]))
+    index.add("far", hasher.signature([f"z{i}" for i in range(40)]))
+
+    assert index.query(hasher.signature(base)) == {"near"}
+    index.remove("near")
+    assert index.query(hasher.signature(base)) == set()
+
+
+def test_sparse_matching_agrees_with_dense():
+    stories = [f"as user {i} I can view report {i} and export page {i}" for i in range(30)]
+    edited = [s.replace("export", "print") for s in stories]
+    dense = OverlapEngine().match_texts(edited, stories, consume_at=0.6)
+    sparse = OverlapEngine(dense_pair_limit=0).match_texts(edited, stories, consume_at=0.6)
+    assert sparse == dense
+    assert [index for index, _ in dense] == list(range(30))
+
+
+def test_find_overlapping_projects_uses_history():
+    service = SpecSimilarityService()
+    shop = {
+        "user_stories": ["user can add product to cart", "user can checkout cart"],
+        "functional_requirements": ["support card payment"],
+    }
+    service.embed_specs(shop, "shop")
+    service.embed_specs({
+        "user_stories": ["sensor streams telemetry", "operator sees alerts"],
+        "functional_requirements": ["store readings for a year"],
+    }, "iot")
+
+    results = service.find_overlapping_projects(shop, min_overlap=0.5)
+    assert [project_id for project_id, _ in results] == ["shop"]
+    assert results[0][1].user_stories_overlap == 1.0
+
+
+def test_persona_reuse_from_history_matches_pairwise():
+    requirements = (
+        "Microservices architecture using React, FastAPI and PostgreSQL. "
+        "Login form and dashboard. Checkout flow. Deployed on Kubernetes with Docker."
+    )
+    personas = ["requirement_analyst", "system_architect", "frontend_engineer"]
+    matcher = PersonaArtifactMatcher()
+    matcher.index_project("shop", requirements)
+    matcher.index_project("iot", "Monolith using Django. Sensor telemetry on VMs.")
+
+    from_history = matcher.build_persona_reuse_map_from_history(requirements, personas)
+    pairwise = matcher.build_persona_reuse_map(requirements, requirements, personas)
+
+    for persona_id in personas[1:]:
+        assert from_history.persona_matches[persona_id].similarity_score == \
+            pairwise.persona_matches[persona_id].similarity_score
+    assert from_history.personas_to_execute[0] == "requirement_analyst"
@@ -0,0 +1,90 @@
+"""
+Tests for SpecSimilarityService hashed TF-IDF vectors and matrix search
+"""
+import numpy as np
+
+from maestro_ml.services.spec_similarity import (
+    HashingTfidfVectorizer,
+    SpecSimilarityService,
+)
+
+
+def make_specs(*stories):
+    return {
+        "user_stories": list(stories),
+        "data_models": [{"entity": "User", "fields": ["email", "password"]}],
+    }
+
+
+def test_dimensions_are_stable_across_documents():
+    """The same token lands in the same bucket whatever else is in the document"""
+    vectorizer = HashingTfidfVectorizer()
+    alone = vectorizer.term_frequencies(["checkout"])
+    mixed = vectorizer.term_frequencies(["checkout", "aardvark zebra"])
+    index = int(np.flatnonzero(alone)[0])
+    assert mixed[index] == alone[index]
+
+
+def test_find_similar_ranks_and_filters():
+    service = SpecSimilarityService()
+    service.embed_specs(make_specs("user can checkout a cart", "user can pay by card"), "shop")
+    service.embed_specs(make_specs("user can checkout a cart", "admin manages stock"), "store")
+    service.embed_specs({"user_stories": ["sensor streams telemetry to dashboard"]}, "iot")
+
+    query = make_specs("user can checkout a cart", "user can pay by card")
+    results = service.find_similar_projects(query, min_similarity=0.0, limit=2)
+
+    assert [r.project_id for r in results] == ["shop", "store"]
+    assert results[0].similarity_score > 0.99
+    assert results[0].similarity_score > results[1].similarity_score
+    assert service.find_similar_projects(query, min_similarity=0.999) == results[:1]
+
+
+def test_reembedding_replaces_project():
+    service = SpecSimilarityService()
+    service.embed_specs(make_specs("user can checkout a cart"), "p1")
+    service.embed_specs({"user_stories": ["sensor streams telemetry"]}, "p1")
+
+    assert service.vectorizer.doc_count == 1
+    results = service.find_similar_projects(
+        {"user_stories": ["sensor streams telemetry"]}, min_similarity=0.0
+    )
+    assert [r.project_id for r in results] == ["p1"]
+    assert results[0].similarity_score > 0.99
+
+
+def test_stored_embedding_follows_corpus_idf():
+    """Stored vectors are raw term frequencies; IDF is applied on read"""
+    service = SpecSimilarityService()
+    specs = make_specs("user can checkout a cart")
+    first = service.embed_specs(specs, "shop")
+    before = service.get_embedding("shop").copy()
+    np.testing.assert_array_equal(
+        first.embedding,
+        service.vectorizer.term_frequencies(service._extract_text_features(specs)),
+    )
+
+    service.embed_specs(make_specs("admin manages stock"), "store")
+    after = service.get_embedding("shop")
+    assert not np.allclose(before, after)
+    np.testing.assert_allclose(after, service.vectorizer.transform(first.embedding))
+    results = service.find_similar_projects(specs, min_similarity=0.0, limit=1)
+    assert np.isclose(
+        results[0].similarity_score,
+        service._cosine_similarity(service._create_simple_embedding(
+            service._extract_text_features(specs)), after),
+    )
+
+
+def test_pluggable_embedder():
+    def embedder(features):
+        text = " ".join(features)
+        return np.array([text.count("cart"), text.count("sensor"), 1.0])
+
+    service = SpecSimilarityService(embedder=embedder)
+    service.embed_specs({"user_stories": ["cart cart"]}, "shop")
+    service.embed_specs({"user_stories": ["sensor"]}, "iot")
+
+    results = service.find_similar_projects({"user_stories": ["cart"]}, min_similarity=0.0)
+    assert [r.project_id for r in results] == ["shop", "iot"]
+    assert len(service.embeddings_store["shop"].embedding) == 3
@@ -10,6 +10,11 @@ from .checkpoint_manager import (
     CheckpointInfo,
     run_checkpoint_cleanup
 )
+from .checkpoint_store import (
+    CheckpointStore,
+    ManifestEntry,
+    CheckpointIntegrityError
+)
 
 __all__ = [
     "SyntheticCheckpointBuilder",
@@ -18,5 +23,8 @@ __all__ = [
     "create_synthetic_checkpoint",
     "CheckpointManager",
     "CheckpointInfo",
-    "run_checkpoint_cleanup"
+    "run_checkpoint_cleanup",
+    "CheckpointStore",
+    "ManifestEntry",
+    "CheckpointIntegrityError"
 ]
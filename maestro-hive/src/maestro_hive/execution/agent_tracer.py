@@ -7,22 +7,62 @@ Provides deep observability into agent operations with:
 - LLM call instrumentation
 - Performance metrics collection
 - OpenTelemetry-compatible format
+- Tail-based sampling (slow and failed traces are always kept)
+- Ring-buffered store of recent traces
+- Batched OTLP/JSON export to a file or local collector
 """
 
 import asyncio
+import random
+import threading
 import uuid
 import time
+from collections import OrderedDict
 from contextvars import ContextVar
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, List, Any, Generator
 from enum import Enum
 from contextlib import contextmanager
 import logging
 import json
 
+from .trace_export import BatchSpanExporter, JsonLinesSpanSink, OTLPHttpSpanSink
+
 logger = logging.getLogger(__name__)
 
+# OTLP enum values (opentelemetry/proto/trace/v1/trace.proto)
+_OTLP_SPAN_KIND = {
+    "internal": 1,
+    "server": 2,
+    "client": 3,
+    "producer": 4,
+    "consumer": 5,
+}
+_OTLP_STATUS_CODE = {"unset": 0, "ok": 1, "error": 2}
+
+
+def _unix_nano(dt: datetime) -> str:
+    """Naive UTC datetime to OTLP/JSON unix nanos (int64 encoded as string)."""
+    return str(int(dt.replace(tzinfo=timezone.utc).timestamp() * 1_000_000) * 1000)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Encode a Python value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": value if isinstance(value, str) else str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()]
+
 
 class SpanStatus(Enum):
     """Span completion status."""
@@ -133,6 +173,32 @@ class Span:
             ],
         }
 
+    def to_otlp(self) -> Dict[str, Any]:
+        """Convert to an OTLP/JSON Span."""
+        otlp: Dict[str, Any] = {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "name": self.name,
+            "kind": _OTLP_SPAN_KIND[self.kind.value],
+            "startTimeUnixNano": _unix_nano(self.start_time),
+            "endTimeUnixNano": _unix_nano(self.end_time or self.start_time),
+            "attributes": _otlp_attributes(self.attributes),
+            "events": [
+                {
+                    "timeUnixNano": _unix_nano(e.timestamp),
+                    "name": e.name,
+                    "attributes": _otlp_attributes(e.attributes),
+                }
+                for e in self.events
+            ],
+            "status": {"code": _OTLP_STATUS_CODE[self.status.value]},
+        }
+        if self.context.parent_span_id:
+            otlp["parentSpanId"] = self.context.parent_span_id
+        if self.status_message:
+            otlp["status"]["message"] = self.status_message
+        return otlp
+
 
 @dataclass
 class TraceData:
@@ -170,15 +236,46 @@ class TraceData:
             "metadata": self.metadata,
         }
 
+    @property
+    def has_error(self) -> bool:
+        """True if any span in the trace ended with an error."""
+        return self.root_span.status == SpanStatus.ERROR or any(
+            s.status == SpanStatus.ERROR for s in self.spans
+        )
+
+    def to_otlp(self, service_name: str) -> Dict[str, Any]:
+        """Convert to an OTLP/JSON ExportTraceServiceRequest."""
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": service_name, **{
+                        k: v for k, v in self.metadata.items()
+                        if isinstance(v, (str, int, float, bool))
+                    }}),
+                },
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [self.root_span.to_otlp()] + [s.to_otlp() for s in self.spans],
+                }],
+            }],
+        }
+
 
 @dataclass
 class TracerConfig:
     """Configuration for agent tracer."""
     service_name: str = "maestro-hive"
-    sample_rate: float = 1.0  # 0.0 to 1.0
+    sample_rate: float = 1.0  # 0.0 to 1.0, applied to fast, successful traces
+    slow_trace_threshold_ms: float = 5000.0  # Traces at least this slow are always kept
+    keep_error_traces: bool = True  # Traces with an ERROR span are always kept
     max_spans_per_trace: int = 1000
     max_attributes_per_span: int = 128
     max_events_per_span: int = 128
+    max_active_traces: int = 10000  # Oldest unfinished traces are abandoned beyond this
+    max_recent_traces: int = 1000  # Ring buffer of finished, sampled traces
+    export_path: Optional[str] = None  # OTLP/JSON lines file
+    export_endpoint: Optional[str] = None  # OTLP/HTTP collector, e.g. http://localhost:4318
+    export_queue_size: int = 2048
     export_batch_size: int = 100
     export_interval_ms: int = 5000
 
@@ -204,11 +301,27 @@ class AgentTracer:
             config: Tracer configuration
         """
         self.config = config or TracerConfig()
-        self._traces: Dict[str, TraceData] = {}
+        # Active (unfinished) traces, oldest first
+        self._traces: "OrderedDict[str, TraceData]" = OrderedDict()
+        # Finished traces that survived tail sampling, oldest first
+        self._recent: "OrderedDict[str, TraceData]" = OrderedDict()
         self._current_context: ContextVar[Optional[SpanContext]] = \
             ContextVar("current_span", default=None)
         self._lock = asyncio.Lock()
-        self._exporters: List[Any] = []
+        self._store_lock = threading.Lock()
+        self._exporters: List[BatchSpanExporter] = []
+        self._sampling_stats: Dict[str, int] = {
+            "kept_error": 0,
+            "kept_slow": 0,
+            "kept_sampled": 0,
+            "dropped": 0,
+            "abandoned": 0,
+        }
+
+        if self.config.export_path:
+            self.add_exporter(JsonLinesSpanSink(self.config.export_path))
+        if self.config.export_endpoint:
+            self.add_exporter(OTLPHttpSpanSink(self.config.export_endpoint))
 
     @classmethod
     def get_instance(cls, config: Optional[TracerConfig] = None) -> "AgentTracer":
@@ -225,11 +338,44 @@ class AgentTracer:
         """Generate unique span ID."""
         return uuid.uuid4().hex[:16]
 
+    def add_exporter(self, sink: Any) -> BatchSpanExporter:
+        """
+        Export sampled traces to a sink in the background.
+
+        Args:
+            sink: Object with write(payloads) accepting OTLP/JSON requests
+
+        Returns:
+            The BatchSpanExporter feeding the sink
+        """
+        exporter = BatchSpanExporter(
+            sink,
+            max_queue_size=self.config.export_queue_size,
+            batch_size=self.config.export_batch_size,
+            interval_ms=self.config.export_interval_ms,
+        )
+        self._exporters.append(exporter)
+        return exporter
+
     def _should_sample(self) -> bool:
-        """Determine if trace should be sampled."""
-        import random
+        """Probabilistic sampling for traces that are neither slow nor failed."""
         return random.random() < self.config.sample_rate
 
+    def _sampling_decision(self, trace: TraceData) -> Optional[str]:
+        """
+        Tail-based sampling decision for a finished trace.
+
+        Returns:
+            Reason the trace is kept ("error", "slow", "sampled") or None to drop it
+        """
+        if self.config.keep_error_traces and trace.has_error:
+            return "error"
+        if (trace.duration_ms or 0.0) >= self.config.slow_trace_threshold_ms:
+            return "slow"
+        if self._should_sample():
+            return "sampled"
+        return None
+
     def start_trace(
         self,
         name: str,
@@ -263,7 +409,12 @@ class AgentTracer:
             metadata=metadata or {},
         )
 
-        self._traces[trace_id] = trace
+        with self._store_lock:
+            self._traces[trace_id] = trace
+            while len(self._traces) > self.config.max_active_traces:
+                abandoned_id, _ = self._traces.popitem(last=False)
+                self._sampling_stats["abandoned"] += 1
+                logger.warning(f"Abandoned unfinished trace {abandoned_id} (max_active_traces reached)")
         self._current_context.set(context)
 
         logger.debug(f"Started trace {trace_id}: {name}")
@@ -310,7 +461,10 @@ class AgentTracer:
         # Add to trace
         trace = self._traces.get(parent.trace_id)
         if trace:
-            trace.spans.append(span)
+            if len(trace.spans) < self.config.max_spans_per_trace:
+                trace.spans.append(span)
+            else:
+                trace.metadata["dropped_spans"] = trace.metadata.get("dropped_spans", 0) + 1
 
         # Set as current context
         self._current_context.set(context)
@@ -350,7 +504,8 @@ class AgentTracer:
         Returns:
             Complete TraceData or None
         """
-        trace = self._traces.get(trace_id)
+        with self._store_lock:
+            trace = self._traces.pop(trace_id, None)
         if not trace:
             return None
 
@@ -363,12 +518,66 @@ class AgentTracer:
         # Clear current context
         self._current_context.set(None)
 
-        logger.debug(f"Ended trace {trace_id} ({trace.duration_ms:.2f}ms, {trace.span_count} spans)")
+        reason = self._sampling_decision(trace)
+        if reason is None:
+            with self._store_lock:
+                self._sampling_stats["dropped"] += 1
+        else:
+            trace.metadata["sampling.reason"] = reason
+            with self._store_lock:
+                self._sampling_stats[f"kept_{reason}"] += 1
+                self._recent[trace_id] = trace
+                while len(self._recent) > self.config.max_recent_traces:
+                    self._recent.popitem(last=False)
+            if self._exporters:
+                payload = trace.to_otlp(self.config.service_name)
+                for exporter in self._exporters:
+                    exporter.enqueue(payload)
+
+        logger.debug(
+            f"Ended trace {trace_id} ({trace.duration_ms:.2f}ms, {trace.span_count} spans, "
+            f"{reason or 'dropped'})"
+        )
         return trace
 
     def get_trace(self, trace_id: str) -> Optional[TraceData]:
-        """Get trace data by ID."""
-        return self._traces.get(trace_id)
+        """Get an active or recently finished (sampled) trace by ID."""
+        return self._traces.get(trace_id) or self._recent.get(trace_id)
+
+    def get_recent_traces(self, limit: Optional[int] = None) -> List[TraceData]:
+        """
+        Get recently finished, sampled traces.
+
+        Args:
+            limit: Maximum traces to return
+
+        Returns:
+            Traces, newest first
+        """
+        with self._store_lock:
+            traces = list(reversed(self._recent.values()))
+        return traces[:limit] if limit is not None else traces
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Sampling, store and export statistics."""
+        with self._store_lock:
+            stats: Dict[str, Any] = {
+                "active_traces": len(self._traces),
+                "recent_traces": len(self._recent),
+                "sampling": dict(self._sampling_stats),
+            }
+        stats["exporters"] = [e.get_stats() for e in self._exporters]
+        return stats
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Block until queued traces are exported."""
+        return all(exporter.flush(timeout) for exporter in self._exporters)
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Flush and stop all exporters."""
+        for exporter in self._exporters:
+            exporter.shutdown(timeout)
+        self._exporters.clear()
 
     def get_current_span(self) -> Optional[Span]:
         """Get currently active span."""
@@ -512,10 +721,13 @@ class AgentTracer:
         Returns:
             Serialized trace data
         """
-        trace = self._traces.get(trace_id)
+        trace = self.get_trace(trace_id)
         if not trace:
             return None
 
+        if format == "otlp":
+            return json.dumps(trace.to_otlp(self.config.service_name), default=str)
+
         if format == "json":
             return json.dumps(trace.to_dict(), indent=2)
 
@@ -535,13 +747,13 @@ class AgentTracer:
         cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
         cleared = 0
 
-        for trace_id, trace in list(self._traces.items()):
-            if trace.end_time and trace.end_time < cutoff:
-                del self._traces[trace_id]
+        with self._store_lock:
+            # Oldest first, so stop at the first trace inside the window
+            while self._recent:
+                trace_id, trace = next(iter(self._recent.items()))
+                if trace.end_time >= cutoff:
+                    break
+                del self._recent[trace_id]
                 cleared += 1
 
         return cleared
-
-
-# Import timedelta for clear_completed_traces
-from datetime import timedelta
@@ -6,6 +6,8 @@ Handles checkpoint lifecycle including:
 - Storage and retrieval
 - Rotation and cleanup (configurable retention)
 - Validation and recovery
+- Content-addressed, compressed storage for new checkpoints (see checkpoint_store)
+- Stat-keyed index so listing does not re-parse unchanged checkpoint files
 - S3/Redis abstraction (future)
 
 Addresses Gap G-006 from DESIGN_REVIEW_PHASED_EXECUTION.md:
@@ -15,12 +17,15 @@ Addresses Gap G-006 from DESIGN_REVIEW_PHASED_EXECUTION.md:
 import json
 import os
 import shutil
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
+from .checkpoint_store import CheckpointStore, ManifestEntry
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +39,12 @@ class CheckpointInfo:
     size_bytes: int
     is_synthetic: bool = False
     version: int = 1
+    checkpoint_id: Optional[str] = None  # Set for content-addressed checkpoints
+
+    @property
+    def is_content_addressed(self) -> bool:
+        """True if stored in the chunk store rather than as a JSON file"""
+        return self.checkpoint_id is not None
 
     @property
     def age_hours(self) -> float:
@@ -49,8 +60,14 @@ class CheckpointManager:
         MAESTRO_CHECKPOINT_DIR: Base directory for checkpoints
         MAESTRO_CHECKPOINT_RETENTION: Max checkpoints per workflow (default: 10)
         MAESTRO_CHECKPOINT_MAX_AGE_DAYS: Max age before cleanup (default: 30)
+
+    Checkpoints written with save_checkpoint() go to a content-addressed
+    CheckpointStore; checkpoint_*.json files written by other components are
+    still listed, rotated and cleaned up alongside them.
     """
 
+    INDEX_FILE = ".checkpoint_index.json"
+
     def __init__(
         self,
         checkpoint_dir: Optional[Path] = None,
@@ -81,6 +98,7 @@ class CheckpointManager:
             # File exists with same name, use alternative path
             self.checkpoint_dir = Path(str(self.checkpoint_dir) + "_checkpoints")
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self.store = CheckpointStore(self.checkpoint_dir)
         logger.info(f"CheckpointManager initialized: {self.checkpoint_dir}")
 
     def list_workflows(self) -> List[str]:
@@ -107,16 +125,137 @@ class CheckpointManager:
         if not workflow_dir.exists():
             return []
 
-        checkpoints = []
+        checkpoints = self._list_file_checkpoints(workflow_dir, workflow_id)
+        checkpoints.extend(
+            self._info_from_entry(workflow_id, entry)
+            for entry in self.store.entries(workflow_id)
+        )
+
+        return sorted(checkpoints, key=lambda c: c.created_at, reverse=True)
+
+    def _list_file_checkpoints(self, workflow_dir: Path, workflow_id: str) -> List[CheckpointInfo]:
+        """
+        List checkpoint_*.json files, parsing only files changed since the last listing.
+
+        Parsed metadata is cached in INDEX_FILE keyed by file name, mtime and size.
+        """
+        index_path = workflow_dir / self.INDEX_FILE
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+
+        fresh: Dict[str, Dict[str, Any]] = {}
         for f in workflow_dir.glob("checkpoint_*.json"):
             try:
+                stat = f.stat()
+                cached = index.get(f.name)
+                if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                    fresh[f.name] = cached
+                    continue
                 info = self._parse_checkpoint(f, workflow_id)
                 if info:
-                    checkpoints.append(info)
+                    fresh[f.name] = {
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "phase": info.phase,
+                        "created_at": info.created_at.isoformat(),
+                        "is_synthetic": info.is_synthetic,
+                        "version": info.version,
+                    }
             except Exception as e:
                 logger.warning(f"Failed to parse checkpoint {f}: {e}")
 
-        return sorted(checkpoints, key=lambda c: c.created_at, reverse=True)
+        if fresh != index:
+            try:
+                CheckpointStore._atomic_write(index_path, json.dumps(fresh).encode("utf-8"))
+            except OSError as e:
+                logger.debug(f"Could not write checkpoint index {index_path}: {e}")
+
+        return [
+            CheckpointInfo(
+                path=workflow_dir / name,
+                workflow_id=workflow_id,
+                phase=meta["phase"],
+                created_at=datetime.fromisoformat(meta["created_at"]),
+                size_bytes=meta["size"],
+                is_synthetic=meta["is_synthetic"],
+                version=meta["version"],
+            )
+            for name, meta in fresh.items()
+        ]
+
+    def _info_from_entry(self, workflow_id: str, entry: ManifestEntry) -> CheckpointInfo:
+        """CheckpointInfo for a content-addressed checkpoint"""
+        return CheckpointInfo(
+            path=self.store._manifest_path(workflow_id),
+            workflow_id=workflow_id,
+            phase=entry.phase,
+            created_at=entry.created_datetime,
+            size_bytes=entry.size_bytes,
+            is_synthetic=entry.synthetic,
+            version=entry.version,
+            checkpoint_id=entry.checkpoint_id,
+        )
+
+    def save_checkpoint(
+        self,
+        workflow_id: str,
+        phase: str,
+        data: Dict[str, Any],
+        synthetic: bool = False
+    ) -> CheckpointInfo:
+        """
+        Save a checkpoint to the content-addressed store.
+
+        Unchanged state (e.g. phase_results of earlier phases) is shared with
+        previous checkpoints instead of being written again.
+
+        Args:
+            workflow_id: Workflow ID
+            phase: Phase the checkpoint was taken after
+            data: Checkpoint payload
+            synthetic: Whether the checkpoint is synthetic
+
+        Returns:
+            Info for the saved checkpoint
+        """
+        entry = self.store.save(
+            workflow_id,
+            data,
+            phase=phase,
+            version=data.get("checkpoint_metadata", {}).get("version", 1),
+            synthetic=synthetic or bool(data.get("synthetic", False)),
+        )
+        self.rotate_checkpoints(workflow_id)
+        return self._info_from_entry(workflow_id, entry)
+
+    def load_checkpoint(self, checkpoint: CheckpointInfo) -> Dict[str, Any]:
+        """
+        Load a checkpoint payload.
+
+        Args:
+            checkpoint: Info from list_checkpoints() or save_checkpoint()
+
+        Returns:
+            Checkpoint data
+        """
+        if checkpoint.is_content_addressed:
+            data = self.store.load(checkpoint.workflow_id, checkpoint.checkpoint_id)
+            if data is None:
+                raise FileNotFoundError(f"Checkpoint {checkpoint.checkpoint_id} not in manifest")
+            return data
+
+        with open(checkpoint.path) as f:
+            return json.load(f)
+
+    def _delete_checkpoint(self, checkpoint: CheckpointInfo) -> bool:
+        """Delete one checkpoint; chunks are reclaimed by store.gc()"""
+        if checkpoint.is_content_addressed:
+            return self.store.delete(checkpoint.workflow_id, [checkpoint.checkpoint_id]) > 0
+        checkpoint.path.unlink()
+        return True
 
     def _parse_checkpoint(self, path: Path, workflow_id: str) -> Optional[CheckpointInfo]:
         """Parse checkpoint file to extract metadata"""
@@ -206,11 +345,14 @@ class CheckpointManager:
 
         for cp in to_delete:
             try:
-                cp.path.unlink()
-                logger.info(f"Rotated checkpoint: {cp.path}")
-                deleted += 1
+                if self._delete_checkpoint(cp):
+                    logger.info(f"Rotated checkpoint: {cp.checkpoint_id or cp.path}")
+                    deleted += 1
             except Exception as e:
-                logger.warning(f"Failed to delete checkpoint {cp.path}: {e}")
+                logger.warning(f"Failed to delete checkpoint {cp.checkpoint_id or cp.path}: {e}")
+
+        if any(cp.is_content_addressed for cp in to_delete):
+            self.store.maybe_gc()
 
         return deleted
 
@@ -232,11 +374,11 @@ class CheckpointManager:
             for cp in checkpoints:
                 if cp.created_at < cutoff:
                     try:
-                        cp.path.unlink()
-                        deleted += 1
-                        logger.info(f"Cleaned old checkpoint: {cp.path}")
+                        if self._delete_checkpoint(cp):
+                            deleted += 1
+                            logger.info(f"Cleaned old checkpoint: {cp.checkpoint_id or cp.path}")
                     except Exception as e:
-                        logger.warning(f"Failed to clean checkpoint {cp.path}: {e}")
+                        logger.warning(f"Failed to clean checkpoint {cp.checkpoint_id or cp.path}: {e}")
 
             if deleted > 0:
                 workflows_cleaned += 1
@@ -245,6 +387,7 @@ class CheckpointManager:
             # Also apply rotation
             total_deleted += self.rotate_checkpoints(workflow_id)
 
+        self.store.gc()
         return workflows_cleaned, total_deleted
 
     def archive_workflow(
@@ -273,7 +416,19 @@ class CheckpointManager:
         archive_path = archive_dir / archive_name
 
         try:
-            shutil.make_archive(str(archive_path), "zip", workflow_dir)
+            with tempfile.TemporaryDirectory() as staging:
+                # Content-addressed checkpoints live outside the workflow
+                # directory, so write them out as plain JSON for the archive
+                staged = Path(staging) / workflow_id
+                shutil.copytree(
+                    workflow_dir, staged,
+                    ignore=shutil.ignore_patterns(self.INDEX_FILE, CheckpointStore.MANIFEST_FILE),
+                )
+                for cp in self.list_checkpoints(workflow_id):
+                    if cp.is_content_addressed:
+                        with open(staged / f"checkpoint_{cp.phase}_{cp.checkpoint_id}.json", "w") as f:
+                            json.dump(self.load_checkpoint(cp), f)
+                shutil.make_archive(str(archive_path), "zip", staged)
             logger.info(f"Archived workflow {workflow_id} to {archive_path}.zip")
             return Path(f"{archive_path}.zip")
         except Exception as e:
@@ -296,6 +451,7 @@ class CheckpointManager:
 
         try:
             shutil.rmtree(workflow_dir)
+            self.store.gc()
             logger.info(f"Deleted all checkpoints for {workflow_id}")
             return True
         except Exception as e:
@@ -326,7 +482,8 @@ class CheckpointManager:
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "checkpoint_dir": str(self.checkpoint_dir),
             "max_checkpoints_per_workflow": self.max_checkpoints,
-            "max_age_days": self.max_age_days
+            "max_age_days": self.max_age_days,
+            "object_store": self.store.get_stats()
         }
 
     def validate_checkpoint(self, path: Path) -> Tuple[bool, Optional[str]]:
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Checkpoint Storage
+
+Stores checkpoints as compressed, content-addressed chunks plus a small
+per-workflow manifest:
+- Each top-level state field is one chunk; large mappings such as
+  persona_states are split into one chunk per entry
+- Chunks are keyed by the SHA-256 of their canonical JSON, so state that does
+  not change between checkpoints is stored once
+- zstd compression when the zstandard package is installed, gzip otherwise
+- manifest.jsonl lists checkpoints (id, phase, time, sizes, tree hash) so
+  listing and latest lookup never read checkpoint payloads
+- Mark-and-sweep garbage collection of chunks no manifest references,
+  amortised over deletions by maybe_gc()
+
+Layout:
+    <root>/.objects/ab/cdef...      compressed chunk or tree
+    <root>/<workflow_id>/manifest.jsonl
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class CheckpointIntegrityError(Exception):
+    """Raised when a stored chunk does not match its content hash."""
+    pass
+
+
+@dataclass
+class ManifestEntry:
+    """One checkpoint in a workflow manifest"""
+    checkpoint_id: str
+    tree: str
+    created_at: str
+    phase: str = ""
+    version: int = 1
+    size_bytes: int = 0  # Uncompressed JSON size of the checkpoint
+    stored_bytes: int = 0  # Compressed bytes newly written by this checkpoint
+    synthetic: bool = False
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def created_datetime(self) -> datetime:
+        return datetime.fromisoformat(self.created_at)
+
+
+def canonical_json(value: Any) -> bytes:
+    """Stable JSON encoding used for hashing chunks"""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class CheckpointStore:
+    """
+    Content-addressed, compressed checkpoint store with manifest index.
+
+    Args:
+        root: Base directory (shared by all workflows)
+        split_keys: Top-level mapping fields stored as one chunk per entry
+        compression: "zstd", "gzip" or "auto" (zstd when available)
+        level: Compression level
+        gc_grace_seconds: Unreferenced chunks younger than this survive gc()
+        gc_interval: maybe_gc() collects after this many deleted checkpoints
+        gc_garbage_bytes: ...or once deleted checkpoints account for this
+            many stored bytes
+    """
+
+    OBJECTS_DIR = ".objects"
+    MANIFEST_FILE = "manifest.jsonl"
+
+    def __init__(
+        self,
+        root: Path,
+        split_keys: Iterable[str] = ("persona_states", "phase_results"),
+        compression: str = "auto",
+        level: int = 3,
+        gc_grace_seconds: float = 300.0,
+        gc_interval: int = 64,
+        gc_garbage_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.root = Path(root)
+        self.objects_dir = self.root / self.OBJECTS_DIR
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.split_keys = frozenset(split_keys)
+        if compression == "auto":
+            compression = "zstd" if ZSTD_AVAILABLE else "gzip"
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the zstandard package")
+        self.compression = compression
+        self.level = level
+        self.gc_grace_seconds = gc_grace_seconds
+        self.gc_interval = gc_interval
+        self.gc_garbage_bytes = gc_garbage_bytes
+        # Deletions since the last gc() in this process (an upper bound on
+        # the garbage they left; chunks may still be shared)
+        self._deleted_since_gc = 0
+        self._deleted_bytes_since_gc = 0
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Objects
+    # ------------------------------------------------------------------
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _compress(self, raw: bytes) -> bytes:
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=self.level).compress(raw)
+        return gzip.compress(raw, compresslevel=min(max(self.level, 1), 9), mtime=0)
+
+    @staticmethod
+    def _decompress(blob: bytes) -> bytes:
+        if blob.startswith(_ZSTD_MAGIC):
+            if not ZSTD_AVAILABLE:
+                raise CheckpointIntegrityError("Chunk is zstd-compressed but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(blob)
+        if blob.startswith(_GZIP_MAGIC):
+            return gzip.decompress(blob)
+        return blob
+
+    def put_object(self, value: Any) -> Tuple[str, int, int]:
+        """
+        Store a JSON-serialisable value.
+
+        Returns:
+            Tuple of (digest, uncompressed size, compressed bytes written)
+        """
+        raw = canonical_json(value)
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            # Refresh mtime so a concurrent gc() treats the chunk as live
+            try:
+                os.utime(path)
+                return digest, len(raw), 0
+            except FileNotFoundError:
+                pass
+        blob = self._compress(raw)
+        path.parent.mkdir(exist_ok=True)
+        self._atomic_write(path, blob)
+        return digest, len(raw), len(blob)
+
+    def get_object(self, digest: str, verify: bool = True) -> Any:
+        """Load a stored value, optionally verifying its content hash"""
+        try:
+            blob = self._object_path(digest).read_bytes()
+        except FileNotFoundError:
+            raise CheckpointIntegrityError(f"Missing chunk {digest}")
+        raw = self._decompress(blob)
+        if verify and hashlib.sha256(raw).hexdigest() != digest:
+            raise CheckpointIntegrityError(f"Chunk {digest} does not match its hash")
+        return json.loads(raw)
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        temp_fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(temp_fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+
+    def _manifest_path(self, workflow_id: str) -> Path:
+        return self.root / workflow_id / self.MANIFEST_FILE
+
+    def save(
+        self,
+        workflow_id: str,
+        data: Dict[str, Any],
+        checkpoint_id: Optional[str] = None,
+        phase: str = "",
+        version: Optional[int] = None,
+        synthetic: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> ManifestEntry:
+        """
+        Store a checkpoint and append it to the workflow manifest.
+
+        Args:
+            workflow_id: Workflow ID
+            data: Checkpoint payload (top-level mapping)
+            checkpoint_id: Optional ID (generated if None)
+            phase: Phase name recorded in the manifest
+            version: Checkpoint version (previous + 1 if None)
+            synthetic: Whether the checkpoint is synthetic
+            metadata: Small extra fields recorded in the manifest
+
+        Returns:
+            The new ManifestEntry; its tree hash identifies the content
+        """
+        with self._lock:
+            fields: Dict[str, str] = {}
+            split: Dict[str, Dict[str, str]] = {}
+            size = stored = 0
+            for key, value in data.items():
+                if key in self.split_keys and isinstance(value, dict):
+                    split[key] = {}
+                    for sub_key, sub_value in value.items():
+                        digest, raw_size, written = self.put_object(sub_value)
+                        split[key][str(sub_key)] = digest
+                        size += raw_size
+                        stored += written
+                else:
+                    digest, raw_size, written = self.put_object(value)
+                    fields[key] = digest
+                    size += raw_size
+                    stored += written
+            tree, _, written = self.put_object({"fields": fields, "split": split})
+            stored += written
+
+            entries = self.entries(workflow_id)
+            if checkpoint_id and any(e.checkpoint_id == checkpoint_id for e in entries):
+                # Re-saving an ID replaces the earlier checkpoint
+                entries = [e for e in entries if e.checkpoint_id != checkpoint_id]
+                self._write_manifest(workflow_id, entries)
+            entry = ManifestEntry(
+                checkpoint_id=checkpoint_id or uuid.uuid4().hex[:12],
+                tree=tree,
+                created_at=datetime.utcnow().isoformat(),
+                phase=phase,
+                version=version if version is not None else (entries[-1].version + 1 if entries else 1),
+                size_bytes=size,
+                stored_bytes=stored,
+                synthetic=synthetic,
+                metadata=metadata or {},
+            )
+            manifest = self._manifest_path(workflow_id)
+            manifest.parent.mkdir(parents=True, exist_ok=True)
+            with open(manifest, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(entry), separators=(",", ":"), default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+        logger.debug(
+            f"Checkpoint {entry.checkpoint_id} for {workflow_id}: "
+            f"{size} bytes, {stored} bytes written"
+        )
+        return entry
+
+    def load_tree(self, tree: str, verify: bool = True) -> Dict[str, Any]:
+        """Reassemble a checkpoint payload from its tree hash"""
+        node = self.get_object(tree, verify)
+        data: Dict[str, Any] = {
+            key: self.get_object(digest, verify) for key, digest in node["fields"].items()
+        }
+        for key, entries in node["split"].items():
+            data[key] = {sub_key: self.get_object(digest, verify) for sub_key, digest in entries.items()}
+        return data
+
+    def load(self, workflow_id: str, checkpoint_id: str, verify: bool = True) -> Optional[Dict[str, Any]]:
+        """Load a checkpoint payload, or None if it is not in the manifest"""
+        entry = self.get_entry(workflow_id, checkpoint_id)
+        return self.load_tree(entry.tree, verify) if entry else None
+
+    def entries(self, workflow_id: str) -> List[ManifestEntry]:
+        """Manifest entries for a workflow, oldest first (no payloads read)"""
+        manifest = self._manifest_path(workflow_id)
+        try:
+            lines = manifest.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+        entries = []
+        for line in lines:
+            try:
+                entries.append(ManifestEntry(**json.loads(line)))
+            except (ValueError, TypeError) as e:
+                # A torn final line after a crash is skipped, not fatal
+                logger.warning(f"Skipping bad manifest line in {manifest}: {e}")
+        return entries
+
+    def get_entry(self, workflow_id: str, checkpoint_id: str) -> Optional[ManifestEntry]:
+        """Latest manifest entry with the given checkpoint ID"""
+        for entry in reversed(self.entries(workflow_id)):
+            if entry.checkpoint_id == checkpoint_id:
+                return entry
+        return None
+
+    def latest(self, workflow_id: str) -> Optional[ManifestEntry]:
+        """Most recent manifest entry for a workflow"""
+        entries = self.entries(workflow_id)
+        return entries[-1] if entries else None
+
+    def workflows(self) -> List[str]:
+        """Workflow IDs that have a manifest"""
+        return [
+            d.name for d in self.root.iterdir()
+            if d.is_dir() and (d / self.MANIFEST_FILE).exists()
+        ]
+
+    def delete(self, workflow_id: str, checkpoint_ids: Iterable[str]) -> int:
+        """
+        Remove checkpoints from a workflow manifest.
+
+        Chunks are reclaimed by the next gc() (see maybe_gc()).
+
+        Returns:
+            Number of manifest entries removed
+        """
+        doomed = set(checkpoint_ids)
+        with self._lock:
+            entries = self.entries(workflow_id)
+            kept = [e for e in entries if e.checkpoint_id not in doomed]
+            removed = len(entries) - len(kept)
+            if removed:
+                self._write_manifest(workflow_id, kept)
+                self._deleted_since_gc += removed
+                self._deleted_bytes_since_gc += sum(
+                    e.stored_bytes for e in entries if e.checkpoint_id in doomed
+                )
+        return removed
+
+    def prune(self, workflow_id: str, keep: int) -> int:
+        """Keep only the newest `keep` checkpoints of a workflow"""
+        entries = self.entries(workflow_id)
+        if len(entries) <= keep:
+            return 0
+        return self.delete(workflow_id, [e.checkpoint_id for e in entries[:len(entries) - keep]])
+
+    def _write_manifest(self, workflow_id: str, entries: List[ManifestEntry]) -> None:
+        body = "".join(
+            json.dumps(asdict(e), separators=(",", ":"), default=str) + "\n" for e in entries
+        )
+        self._atomic_write(self._manifest_path(workflow_id), body.encode("utf-8"))
+
+    def maybe_gc(self) -> int:
+        """
+        Run gc() once enough checkpoints have been deleted.
+
+        gc() reads every manifest and stats every object, so callers that
+        prune on each checkpoint use this instead; anything left over is
+        collected by a later call or by an explicit gc().
+
+        Returns:
+            Number of chunks deleted (0 if no collection was due)
+        """
+        with self._lock:
+            due = (
+                self._deleted_since_gc >= self.gc_interval
+                or self._deleted_bytes_since_gc >= self.gc_garbage_bytes
+            )
+        return self.gc() if due else 0
+
+    def gc(self) -> int:
+        """
+        Delete chunks not referenced by any manifest.
+
+        Returns:
+            Number of chunks deleted
+        """
+        with self._lock:
+            self._deleted_since_gc = 0
+            self._deleted_bytes_since_gc = 0
+            live: Set[str] = set()
+            for workflow_id in self.workflows():
+                for entry in self.entries(workflow_id):
+                    if entry.tree in live:
+                        continue
+                    live.add(entry.tree)
+                    try:
+                        node = self.get_object(entry.tree, verify=False)
+                    except (CheckpointIntegrityError, ValueError) as e:
+                        logger.warning(f"Unreadable tree {entry.tree} in {workflow_id}: {e}")
+                        continue
+                    live.update(node["fields"].values())
+                    for digests in node["split"].values():
+                        live.update(digests.values())
+
+            cutoff = time.time() - self.gc_grace_seconds
+            deleted = 0
+            for path in self.objects_dir.glob("??/*"):
+                if path.suffix == ".tmp" or path.parent.name + path.name in live:
+                    continue
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        deleted += 1
+                except FileNotFoundError:
+                    pass
+
+        if deleted:
+            logger.info(f"Checkpoint gc removed {deleted} unreferenced chunks")
+        return deleted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Object store size and logical checkpoint size"""
+        object_count = 0
+        stored_bytes = 0
+        for path in self.objects_dir.glob("??/*"):
+            try:
+                stored_bytes += path.stat().st_size
+                object_count += 1
+            except FileNotFoundError:
+                pass
+        logical_bytes = sum(
+            e.size_bytes for workflow_id in self.workflows() for e in self.entries(workflow_id)
+        )
+        return {
+            "objects": object_count,
+            "stored_bytes": stored_bytes,
+            "logical_bytes": logical_bytes,
+            "compression": self.compression,
+        }
+
+
+__all__ = [
+    "CheckpointStore",
+    "ManifestEntry",
+    "CheckpointIntegrityError",
+    "canonical_json",
+]
@@ -0,0 +1,173 @@
+"""
+Batched OTLP Trace Export.
+
+Ships finished traces from AgentTracer to a local collector or file without
+blocking the traced code:
+- Bounded in-memory queue (oldest traces dropped when full)
+- Background thread flushing every export_interval_ms or export_batch_size traces
+- OTLP/JSON encoding, written as JSON lines or POSTed to an OTLP/HTTP endpoint
+"""
+
+import json
+import logging
+import threading
+import urllib.request
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class SpanSink(Protocol):
+    """Destination for batches of OTLP ResourceSpans payloads."""
+
+    def write(self, payloads: List[Dict[str, Any]]) -> None:
+        ...
+
+
+class JsonLinesSpanSink:
+    """Appends one OTLP/JSON ExportTraceServiceRequest per line to a file."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def write(self, payloads: List[Dict[str, Any]]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            for payload in payloads:
+                f.write(json.dumps(payload, separators=(",", ":"), default=str))
+                f.write("\n")
+
+
+class OTLPHttpSpanSink:
+    """POSTs batches to an OTLP/HTTP collector (JSON encoding, /v1/traces)."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0, headers: Optional[Dict[str, str]] = None):
+        self.endpoint = endpoint if endpoint.rstrip("/").endswith("/v1/traces") \
+            else endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+
+    def write(self, payloads: List[Dict[str, Any]]) -> None:
+        body = {"resourceSpans": [rs for payload in payloads for rs in payload["resourceSpans"]]}
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(body, separators=(",", ":"), default=str).encode("utf-8"),
+            headers=self.headers,
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class BatchSpanExporter:
+    """
+    Background batch exporter with bounded memory.
+
+    enqueue() never blocks; when more than max_queue_size payloads are waiting
+    the oldest are dropped and counted. A daemon thread flushes batches to the
+    sink; shutdown() flushes what is left.
+    """
+
+    def __init__(
+        self,
+        sink: SpanSink,
+        max_queue_size: int = 2048,
+        batch_size: int = 100,
+        interval_ms: int = 5000,
+    ):
+        self.sink = sink
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.interval = interval_ms / 1000.0
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._cond = threading.Condition()
+        self._running = True
+        self._flush_requested = False
+        self._in_flight = 0
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, payload: Dict[str, Any]) -> None:
+        """Queue one OTLP payload for export."""
+        with self._cond:
+            if not self._running:
+                return
+            if len(self._queue) >= self.max_queue_size:
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(payload)
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify()
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Export everything queued so far.
+
+        Returns:
+            True if the queue drained within timeout
+        """
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify()
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._in_flight, timeout
+            )
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Flush remaining payloads and stop the export thread."""
+        self.flush(timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _take_batch(self) -> Optional[List[Dict[str, Any]]]:
+        with self._cond:
+            while self._running:
+                if self._queue and (self._flush_requested or len(self._queue) >= self.batch_size):
+                    break
+                if not self._cond.wait(self.interval) and self._queue:
+                    break  # Interval elapsed with work queued
+            if not self._queue:
+                self._flush_requested = False
+                self._cond.notify_all()
+                return None
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            self._in_flight = len(batch)
+            if not self._queue:
+                self._flush_requested = False
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                with self._cond:
+                    if not self._running:
+                        return
+                continue
+            try:
+                self.sink.write(batch)
+                self.exported += len(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                logger.warning(f"Trace export failed ({len(batch)} traces dropped): {e}")
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._cond.notify_all()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Export counters."""
+        with self._cond:
+            return {
+                "queued": len(self._queue),
+                "exported": self.exported,
+                "dropped": self.dropped,
+                "failed": self.failed,
+            }
@@ -6,7 +6,7 @@ EPIC: MD-2514 - [MAESTRO] Sub-EPIC 6: Workflow State Persistence
 
 Provides:
 - Unified state store interface
-- JSON and PostgreSQL backends
+- JSON, PostgreSQL and async PostgreSQL backends
 - State synchronization between components
 - State versioning and history
 - State recovery on restart
@@ -15,9 +15,10 @@ Provides:
 - State diff and merge for branches (MD-2514)
 """
 
-from .store import StateStore, StateEntry
+from .store import StateStore, StateEntry, StateChange, ChangeBatch
 from .json_backend import JSONStateStore
 from .postgres_backend import PostgreSQLStateStore
+from .asyncpg_backend import AsyncPostgreSQLStateStore
 from .manager import StateManager
 from .sync import StateSync
 from .versioning import StateVersioning
@@ -58,8 +59,11 @@ __all__ = [
     # Core store (MD-2528)
     "StateStore",
     "StateEntry",
+    "StateChange",
+    "ChangeBatch",
     "JSONStateStore",
     "PostgreSQLStateStore",
+    "AsyncPostgreSQLStateStore",
     "StateManager",
     "StateSync",
     "StateVersioning",
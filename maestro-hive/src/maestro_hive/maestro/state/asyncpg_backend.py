@@ -0,0 +1,536 @@
+"""
+Async PostgreSQL State Store - asyncpg-backed state persistence
+
+EPIC: MD-2528 - AC-1: Unified state store (PostgreSQL backend)
+
+Non-blocking counterpart of PostgreSQLStateStore for code running on an
+event loop. Shares the schema, version-assignment and change-feed tables
+with the psycopg2 backend, so both can serve the same database.
+
+Optional write-behind buffering coalesces saves into batched statements;
+checkpoint() flushes the buffer so callers get a durable point to recover to.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .postgres_backend import (
+    PostgreSQLStateStore,
+    advance_change_feed,
+    assign_batch_versions,
+    batch_save_sql,
+    prune_deletions_sql,
+    schema_statements,
+    split_feed_cursor,
+)
+from .store import ChangeBatch, StateChange, StateEntry
+
+logger = logging.getLogger(__name__)
+
+try:
+    import asyncpg
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    asyncpg = None
+    ASYNCPG_AVAILABLE = False
+
+
+class AsyncPostgreSQLStateStore:
+    """
+    asyncpg-based state store.
+
+    Features:
+    - Connection pool without blocking the event loop
+    - Single-statement saves with atomic version assignment
+    - save_many() for batched inserts in one round trip
+    - Optional write-behind buffer flushed on interval, size or checkpoint()
+
+    Write-behind trades durability for throughput: save_deferred() returns
+    before the entry is written, and entries buffered when the process dies
+    are lost. Reads of a key with buffered writes flush first, so a store
+    always observes its own writes.
+    """
+
+    CHANGE_FEED_OVERLAP = PostgreSQLStateStore.CHANGE_FEED_OVERLAP
+    DELETION_RETENTION_SECONDS = PostgreSQLStateStore.DELETION_RETENTION_SECONDS
+
+    def __init__(
+        self,
+        connection_string: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        table_name: str = "state_entries",
+        write_behind: bool = False,
+        flush_interval: float = 0.05,
+        max_buffer: int = 500,
+    ):
+        """
+        Initialize async PostgreSQL state store.
+
+        Args:
+            connection_string: PostgreSQL connection URL
+            min_size: Minimum pool connections
+            max_size: Maximum pool connections
+            table_name: Name of state table
+            write_behind: Flush buffered saves from a background task
+            flush_interval: Seconds between background flushes
+            max_buffer: Buffered entries that trigger an immediate flush
+        """
+        self.connection_string = connection_string
+        self.min_size = min_size
+        self.max_size = max_size
+        self.table_name = table_name
+        self.notify_channel = f"{table_name}_changes"
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+
+        self._pool = None
+        self._buffer: List[Tuple[str, Dict[str, Any], Optional[str], Dict[str, Any]]] = []
+        self._pending_keys: Dict[str, int] = {}
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._stats = {"saves": 0, "deferred": 0, "flushes": 0, "flushed_entries": 0}
+
+    @property
+    def is_available(self) -> bool:
+        """Check if asyncpg is installed and the pool is connected."""
+        return ASYNCPG_AVAILABLE and self._pool is not None
+
+    async def connect(self) -> None:
+        """Create the connection pool, schema and background flusher."""
+        if not ASYNCPG_AVAILABLE:
+            raise RuntimeError(
+                "asyncpg not available - install with: pip install asyncpg"
+            )
+        if self._pool is not None:
+            return
+
+        self._pool = await asyncpg.create_pool(
+            self.connection_string,
+            min_size=self.min_size,
+            max_size=self.max_size,
+        )
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                for statement in schema_statements(self.table_name):
+                    await conn.execute(statement)
+
+        self._flush_lock = asyncio.Lock()
+        if self.write_behind:
+            self._flusher = asyncio.create_task(self._flush_loop())
+        logger.info(f"AsyncPostgreSQLStateStore connected (write_behind={self.write_behind})")
+
+    async def close(self) -> None:
+        """Flush buffered writes and close the pool."""
+        if self._flusher:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        if self._pool is not None:
+            await self.flush()
+            await self._pool.close()
+            self._pool = None
+            logger.info("AsyncPostgreSQLStateStore closed")
+
+    def _require_pool(self) -> None:
+        if self._pool is None:
+            raise RuntimeError("AsyncPostgreSQLStateStore not connected")
+
+    # Writes
+
+    async def save(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        component_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> StateEntry:
+        """Save state with a new version in one round trip."""
+        self._require_pool()
+        if key in self._pending_keys:
+            # Keep version order with earlier deferred saves of this key
+            await self.flush()
+
+        timestamp = datetime.utcnow()
+        version = await self._pool.fetchval(
+            f"""
+            WITH head AS (
+                INSERT INTO {self.table_name}_heads AS h (key, version)
+                VALUES ($1, 1)
+                ON CONFLICT (key) DO UPDATE SET version = h.version + 1
+                RETURNING h.version
+            ),
+            ins AS (
+                INSERT INTO {self.table_name}
+                (key, value, version, timestamp, component_id, metadata)
+                SELECT $1, $2::text::jsonb, head.version, $3::timestamp,
+                       $4::varchar, $5::text::jsonb
+                FROM head
+                RETURNING version
+            )
+            SELECT version FROM ins, (
+                SELECT pg_notify($6::text, 'save')
+            ) AS notified
+            """,
+            key,
+            json.dumps(value),
+            timestamp,
+            component_id,
+            json.dumps(metadata or {}),
+            self.notify_channel,
+        )
+        self._stats["saves"] += 1
+        return StateEntry(
+            key=key,
+            value=value,
+            version=version,
+            timestamp=timestamp,
+            component_id=component_id,
+            metadata=metadata or {},
+        )
+
+    async def save_many(
+        self,
+        entries: List[tuple],
+        component_id: Optional[str] = None,
+    ) -> List[StateEntry]:
+        """
+        Save many entries in one statement and one transaction.
+
+        Args:
+            entries: (key, value) or (key, value, metadata) tuples
+            component_id: ID of saving component
+
+        Returns:
+            Saved entries in input order
+        """
+        if not entries:
+            return []
+        self._require_pool()
+
+        keys = [e[0] for e in entries]
+        values = [e[1] for e in entries]
+        metadatas = [(e[2] if len(e) > 2 else None) or {} for e in entries]
+        timestamp = datetime.utcnow()
+
+        rows = await self._pool.fetch(
+            batch_save_sql(self.table_name, "$1", "$2", "$3",
+                           "$4::timestamp", "$5::varchar", "$6::text"),
+            keys,
+            [json.dumps(v) for v in values],
+            [json.dumps(m) for m in metadatas],
+            timestamp,
+            component_id,
+            self.notify_channel,
+        )
+        versions = assign_batch_versions(keys, [(row[0], row[1]) for row in rows])
+        self._stats["saves"] += len(entries)
+        return [
+            StateEntry(
+                key=key,
+                value=value,
+                version=version,
+                timestamp=timestamp,
+                component_id=component_id,
+                metadata=metadata,
+            )
+            for key, value, metadata, version in zip(keys, values, metadatas, versions)
+        ]
+
+    async def save_deferred(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        component_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Buffer a save for the next flush.
+
+        The version is assigned when the buffer is flushed. Flushes
+        immediately once max_buffer entries are waiting.
+        """
+        self._buffer.append((key, value, component_id, metadata or {}))
+        self._pending_keys[key] = self._pending_keys.get(key, 0) + 1
+        self._stats["deferred"] += 1
+        if len(self._buffer) >= self.max_buffer:
+            await self.flush()
+
+    async def flush(self) -> List[StateEntry]:
+        """
+        Write all buffered saves.
+
+        Consecutive entries with the same component_id go out in one
+        save_many(), in buffer order, so saves of one key from different
+        components keep their order. On failure the unwritten entries go
+        back to the front of the buffer.
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            if not self._buffer:
+                return []
+            batch, self._buffer = self._buffer, []
+
+            saved: List[StateEntry] = []
+            start = 0
+            for component_id, run in itertools.groupby(batch, key=lambda item: item[2]):
+                group = [(key, value, metadata) for key, value, _, metadata in run]
+                try:
+                    saved.extend(await self.save_many(group, component_id))
+                except Exception:
+                    # Earlier runs committed; requeue the rest in order
+                    self._buffer = batch[start:] + self._buffer
+                    raise
+                start += len(group)
+                for key, _, _ in group:
+                    self._release_pending(key)
+
+            self._stats["flushes"] += 1
+            self._stats["flushed_entries"] += len(saved)
+            return saved
+
+    async def checkpoint(self) -> int:
+        """
+        Flush buffered saves and return the change-feed watermark.
+
+        Everything saved before the call is durable and visible to
+        changes_since() readers once their cursor's watermark reaches it.
+        """
+        await self.flush()
+        self._require_pool()
+        return await self._pool.fetchval(f"""
+            SELECT GREATEST(
+                (SELECT COALESCE(MAX(change_id), 0) FROM {self.table_name}),
+                (SELECT COALESCE(MAX(change_id), 0) FROM {self.table_name}_deletions)
+            )
+        """)
+
+    async def delete(self, key: str) -> bool:
+        """Delete all versions of a key, including buffered saves."""
+        self._require_pool()
+        if key in self._pending_keys:
+            self._buffer = [item for item in self._buffer if item[0] != key]
+            del self._pending_keys[key]
+
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                result = await conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE key = $1", key
+                )
+                await conn.execute(
+                    f"DELETE FROM {self.table_name}_heads WHERE key = $1", key
+                )
+                deleted = not result.endswith(" 0")
+                if deleted:
+                    await conn.execute(
+                        f"INSERT INTO {self.table_name}_deletions (key) VALUES ($1)", key
+                    )
+                    await conn.execute(
+                        prune_deletions_sql(self.table_name, "$1"),
+                        self.DELETION_RETENTION_SECONDS,
+                    )
+                    await conn.execute(
+                        "SELECT pg_notify($1, $2)", self.notify_channel, f"0:{key}"
+                    )
+        return deleted
+
+    async def prune_versions(self, key: str, keep_count: int = 10) -> int:
+        """Remove old versions keeping only the most recent."""
+        self._require_pool()
+        result = await self._pool.execute(
+            f"""
+            DELETE FROM {self.table_name}
+            WHERE key = $1 AND version NOT IN (
+                SELECT version FROM {self.table_name}
+                WHERE key = $1
+                ORDER BY version DESC
+                LIMIT $2
+            )
+            """,
+            key,
+            keep_count,
+        )
+        return int(result.split()[-1])
+
+    # Reads
+
+    async def load(self, key: str, version: Optional[int] = None) -> Optional[StateEntry]:
+        """Load state, latest version by default."""
+        await self._flush_if_pending(key)
+        self._require_pool()
+        if version is None:
+            row = await self._pool.fetchrow(
+                f"""
+                SELECT e.key, e.value, e.version, e.timestamp, e.component_id, e.metadata
+                FROM {self.table_name}_heads h
+                JOIN {self.table_name} e ON e.key = h.key AND e.version = h.version
+                WHERE h.key = $1
+                """,
+                key,
+            )
+        else:
+            row = await self._pool.fetchrow(
+                f"""
+                SELECT key, value, version, timestamp, component_id, metadata
+                FROM {self.table_name}
+                WHERE key = $1 AND version = $2
+                """,
+                key,
+                version,
+            )
+        return self._row_to_entry(row) if row else None
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists."""
+        if key in self._pending_keys:
+            return True
+        self._require_pool()
+        return await self._pool.fetchval(
+            f"SELECT EXISTS(SELECT 1 FROM {self.table_name}_heads WHERE key = $1)", key
+        )
+
+    async def list_keys(self, prefix: Optional[str] = None) -> List[str]:
+        """List all keys, optionally filtered by prefix."""
+        await self.flush()
+        self._require_pool()
+        if prefix:
+            rows = await self._pool.fetch(
+                f"SELECT key FROM {self.table_name}_heads WHERE key LIKE $1 ORDER BY key",
+                f"{prefix}%",
+            )
+        else:
+            rows = await self._pool.fetch(
+                f"SELECT key FROM {self.table_name}_heads ORDER BY key"
+            )
+        return [row[0] for row in rows]
+
+    async def list_versions(self, key: str) -> List[StateEntry]:
+        """Get version history for a key."""
+        await self._flush_if_pending(key)
+        self._require_pool()
+        rows = await self._pool.fetch(
+            f"""
+            SELECT key, value, version, timestamp, component_id, metadata
+            FROM {self.table_name}
+            WHERE key = $1
+            ORDER BY version ASC
+            """,
+            key,
+        )
+        return [self._row_to_entry(row) for row in rows]
+
+    async def get_latest_version(self, key: str) -> int:
+        """Get the latest version number."""
+        await self._flush_if_pending(key)
+        self._require_pool()
+        version = await self._pool.fetchval(
+            f"SELECT version FROM {self.table_name}_heads WHERE key = $1", key
+        )
+        return version or 0
+
+    async def prune_deletions(self, max_age_seconds: Optional[float] = None) -> int:
+        """Remove deletion tombstones older than max_age_seconds."""
+        self._require_pool()
+        if max_age_seconds is None:
+            max_age_seconds = self.DELETION_RETENTION_SECONDS
+        return await self._pool.fetchval(
+            prune_deletions_sql(self.table_name, "$1"), max_age_seconds
+        )
+
+    async def changes_since(self, cursor: Any = None) -> ChangeBatch:
+        """Watermark query on change_id; see PostgreSQLStateStore.changes_since."""
+        self._require_pool()
+        if cursor is not None:
+            watermark, _ = split_feed_cursor(cursor)
+            rows = await self._pool.fetch(
+                f"""
+                SELECT key, version, component_id, change_id
+                FROM {self.table_name} WHERE change_id > $1
+                UNION ALL
+                SELECT key, 0, NULL, change_id
+                FROM {self.table_name}_deletions WHERE change_id > $1
+                ORDER BY change_id
+                """,
+                watermark - self.CHANGE_FEED_OVERLAP,
+            )
+            pruned_through = await self._pool.fetchval(
+                f"SELECT pruned_through FROM {self.table_name}_feed_meta"
+            )
+            if watermark >= pruned_through:
+                return advance_change_feed(
+                    cursor, [tuple(row) for row in rows], self.CHANGE_FEED_OVERLAP
+                )
+
+        watermark = await self.checkpoint()
+        rows = await self._pool.fetch(
+            f"""
+            SELECT change_id FROM {self.table_name}
+            WHERE change_id > $1 AND change_id <= $2
+            UNION ALL
+            SELECT change_id FROM {self.table_name}_deletions
+            WHERE change_id > $1 AND change_id <= $2
+            """,
+            watermark - self.CHANGE_FEED_OVERLAP,
+            watermark,
+        )
+        delivered = tuple(sorted(row[0] for row in rows))
+        rows = await self._pool.fetch(f"""
+            SELECT h.key, h.version, e.component_id
+            FROM {self.table_name}_heads h
+            JOIN {self.table_name} e ON e.key = h.key AND e.version = h.version
+            ORDER BY h.key
+        """)
+        changes = [StateChange(row[0], row[1], row[2]) for row in rows]
+        return ChangeBatch(changes=changes, cursor=(watermark, delivered), snapshot=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get write and buffer statistics."""
+        return {
+            **self._stats,
+            "buffered": len(self._buffer),
+            "write_behind": self.write_behind,
+        }
+
+    # Internals
+
+    async def _flush_loop(self) -> None:
+        """Background flusher for write-behind mode."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Write-behind flush failed ({len(self._buffer)} buffered): {e}")
+
+    async def _flush_if_pending(self, key: str) -> None:
+        if key in self._pending_keys:
+            await self.flush()
+
+    def _release_pending(self, key: str) -> None:
+        count = self._pending_keys.get(key, 0) - 1
+        if count > 0:
+            self._pending_keys[key] = count
+        else:
+            self._pending_keys.pop(key, None)
+
+    @staticmethod
+    def _row_to_entry(row: Any) -> StateEntry:
+        value, metadata = row[1], row[5]
+        return StateEntry(
+            key=row[0],
+            value=value if isinstance(value, dict) else json.loads(value),
+            version=row[2],
+            timestamp=row[3],
+            component_id=row[4],
+            metadata=metadata if isinstance(metadata, dict) else json.loads(metadata or "{}"),
+        )
@@ -6,16 +6,19 @@ EPIC: MD-2528 - AC-1: Unified state store (JSON backend)
 File-based state storage for development and simple deployments.
 """
 
+import fcntl
 import json
 import logging
 import os
 import shutil
+import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from threading import RLock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from .store import StateEntry, StateStore
+from .store import ChangeBatch, StateChange, StateEntry, StateStore
 
 logger = logging.getLogger(__name__)
 
@@ -35,12 +38,24 @@ class JSONStateStore(StateStore):
                     v001.json
                     v002.json
                     ...
+            _journal.jsonl  - Change feed: one (key, version) line per save/delete
+            _journal.lock   - flock() target serialising journal writers
+
+    The journal is append-only and compacted to one line per live key once it
+    grows past journal_compact_bytes. Its first line holds a journal_id that
+    changes on compaction, so readers holding an old cursor resynchronise.
+    Appends and compaction hold an exclusive lock on _journal.lock, so a
+    process cannot append to a journal another process is replacing.
     """
 
+    JOURNAL_FILE = "_journal.jsonl"
+    JOURNAL_LOCK_FILE = "_journal.lock"
+
     def __init__(
         self,
         state_dir: str = "/var/maestro/state",
         max_versions: int = 100,
+        journal_compact_bytes: int = 4 * 1024 * 1024,
     ):
         """
         Initialize JSON state store.
@@ -48,15 +63,179 @@ class JSONStateStore(StateStore):
         Args:
             state_dir: Directory for state files
             max_versions: Maximum versions to retain per key
+            journal_compact_bytes: Journal size that triggers compaction
         """
         self.state_dir = Path(state_dir)
         self.max_versions = max_versions
+        self.journal_compact_bytes = journal_compact_bytes
         self._locks: Dict[str, RLock] = {}
         self._global_lock = RLock()
+        self._journal_path = self.state_dir / self.JOURNAL_FILE
+        self._journal_lock_path = self.state_dir / self.JOURNAL_LOCK_FILE
+        self._journal_lock_depth = 0
+        self._journal_base_size = 0
 
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_journal()
         logger.info(f"JSONStateStore initialized at {self.state_dir}")
 
+    # ------------------------------------------------------------------
+    # Change journal
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _journal_lock(self) -> Iterator[None]:
+        """Hold the journal lock across threads and processes (re-entrant)."""
+        with self._global_lock:
+            if self._journal_lock_depth:
+                self._journal_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._journal_lock_depth -= 1
+                return
+            with open(self._journal_lock_path, "a") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                self._journal_lock_depth = 1
+                try:
+                    yield
+                finally:
+                    self._journal_lock_depth = 0
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _read_journal_id(self) -> Optional[str]:
+        """Read the journal_id header, or None if there is no valid journal."""
+        try:
+            with open(self._journal_path, "rb") as f:
+                return json.loads(f.readline())["journal_id"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _ensure_journal(self) -> None:
+        """Create the journal from current.json files if it does not exist."""
+        with self._journal_lock():
+            if self._read_journal_id():
+                return
+            changes = []
+            for item in self.state_dir.iterdir():
+                current = item / "current.json"
+                if item.is_dir() and current.exists():
+                    try:
+                        with open(current, "r") as f:
+                            data = json.load(f)
+                        changes.append(StateChange(
+                            key=data["key"],
+                            version=data.get("version", 1),
+                            component_id=data.get("component_id"),
+                        ))
+                    except Exception as e:
+                        logger.warning(f"Skipping unreadable state {current}: {e}")
+            self._write_journal(changes)
+
+    def _write_journal(self, changes: List[StateChange]) -> None:
+        """Atomically replace the journal with a new journal_id."""
+        lines = [json.dumps({"journal_id": uuid.uuid4().hex})]
+        lines.extend(
+            json.dumps({"key": c.key, "version": c.version, "component_id": c.component_id})
+            for c in changes
+        )
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        temp_path = self._journal_path.with_suffix(".tmp")
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self._journal_path)
+        self._journal_base_size = len(data)
+
+    def _append_journal(self, change: StateChange) -> None:
+        """Record a change, compacting the journal when it grows large."""
+        line = json.dumps({
+            "key": change.key,
+            "version": change.version,
+            "component_id": change.component_id,
+        }) + "\n"
+        with self._journal_lock():
+            # Open by path under the lock so a concurrent compaction's
+            # replacement is the file we append to
+            with open(self._journal_path, "a") as f:
+                f.write(line)
+                size = f.tell()
+            if size > max(self.journal_compact_bytes, 4 * self._journal_base_size):
+                self._compact_journal()
+
+    @staticmethod
+    def _parse_journal(data: bytes) -> List[StateChange]:
+        changes = []
+        for line in data.splitlines():
+            if line:
+                record = json.loads(line)
+                changes.append(StateChange(
+                    key=record["key"],
+                    version=record["version"],
+                    component_id=record.get("component_id"),
+                ))
+        return changes
+
+    @staticmethod
+    def _latest_per_key(changes: List[StateChange]) -> List[StateChange]:
+        latest: Dict[str, StateChange] = {}
+        for change in changes:
+            if change.version == 0:
+                latest.pop(change.key, None)
+            else:
+                latest.pop(change.key, None)
+                latest[change.key] = change
+        return list(latest.values())
+
+    def _compact_journal(self) -> None:
+        """Rewrite the journal with one line per live key."""
+        with self._journal_lock():
+            with open(self._journal_path, "rb") as f:
+                f.readline()
+                changes = self._parse_journal(f.read())
+            self._write_journal(self._latest_per_key(changes))
+            logger.debug(f"Compacted state journal to {self._journal_base_size} bytes")
+
+    def changes_since(self, cursor: Any = None) -> ChangeBatch:
+        """
+        Read the change journal from cursor.
+
+        An idle poll costs one stat() call. A cursor from before a compaction
+        (or None) yields a snapshot of every live key.
+        """
+        try:
+            stat = self._journal_path.stat()
+        except FileNotFoundError:
+            self._ensure_journal()
+            stat = self._journal_path.stat()
+
+        if cursor is not None:
+            journal_id, offset, inode = cursor
+            if stat.st_ino == inode and stat.st_size == offset:
+                return ChangeBatch(changes=[], cursor=cursor)
+
+        with open(self._journal_path, "rb") as f:
+            header = f.readline()
+            journal_id = json.loads(header)["journal_id"]
+            snapshot = cursor is None or cursor[0] != journal_id
+            if not snapshot:
+                f.seek(cursor[1])
+            start = f.tell()
+            data = f.read()
+            inode = os.fstat(f.fileno()).st_ino
+
+        # Only consume complete lines; a concurrent append may be mid-write
+        end = data.rfind(b"\n") + 1
+        changes = self._parse_journal(data[:end])
+        if snapshot:
+            changes = self._latest_per_key(changes)
+        return ChangeBatch(
+            changes=changes,
+            cursor=(journal_id, start + end, inode),
+            snapshot=snapshot,
+        )
+
     def _get_lock(self, key: str) -> RLock:
         """Get or create lock for key."""
         with self._global_lock:
@@ -124,6 +303,7 @@ class JSONStateStore(StateStore):
                 json.dump(entry.to_dict(), f, indent=2)
 
             logger.debug(f"Saved state {key} v{new_version}")
+            self._append_journal(StateChange(key, new_version, component_id))
 
             # Auto-prune if needed
             if new_version > self.max_versions:
@@ -164,6 +344,7 @@ class JSONStateStore(StateStore):
             key_dir = self._key_dir(key)
             if key_dir.exists():
                 shutil.rmtree(key_dir)
+                self._append_journal(StateChange(key, 0))
                 logger.info(f"Deleted state {key}")
                 return True
             return False
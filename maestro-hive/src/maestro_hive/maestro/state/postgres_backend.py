@@ -8,13 +8,199 @@ Production-grade state storage with PostgreSQL backend.
 
 import json
 import logging
+import select
+import threading
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from .store import StateEntry, StateStore
+from .store import ChangeBatch, StateChange, StateEntry, StateStore
 
 logger = logging.getLogger(__name__)
 
+# Rows from transactions that commit out of sequence order can appear below
+# the watermark, so each poll re-reads this many change_ids below it
+CHANGE_FEED_OVERLAP = 256
+
+# Deletion tombstones older than this are pruned; readers whose cursor is
+# older than the newest pruned tombstone resynchronise from a snapshot
+DELETION_RETENTION_SECONDS = 7 * 24 * 3600
+
+
+def schema_statements(table_name: str) -> List[str]:
+    """
+    DDL shared by the psycopg2 and asyncpg backends.
+
+    The {table}_heads table holds the latest version per key; saves bump it
+    with INSERT ... ON CONFLICT DO UPDATE, which row-locks the key so version
+    assignment is atomic without a separate SELECT MAX(version).
+    """
+    t = table_name
+    return [
+        f"""
+        CREATE TABLE IF NOT EXISTS {t} (
+            id SERIAL PRIMARY KEY,
+            key VARCHAR(255) NOT NULL,
+            value JSONB NOT NULL,
+            version INTEGER NOT NULL,
+            timestamp TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            component_id VARCHAR(255),
+            metadata JSONB DEFAULT '{{}}',
+            UNIQUE(key, version)
+        )
+        """,
+        f"CREATE INDEX IF NOT EXISTS idx_{t}_key ON {t}(key)",
+        f"CREATE INDEX IF NOT EXISTS idx_{t}_key_version ON {t}(key, version DESC)",
+        # Change feed
+        f"CREATE SEQUENCE IF NOT EXISTS {t}_change_seq",
+        f"""
+        ALTER TABLE {t}
+        ADD COLUMN IF NOT EXISTS change_id BIGINT NOT NULL
+        DEFAULT nextval('{t}_change_seq')
+        """,
+        f"CREATE INDEX IF NOT EXISTS idx_{t}_change_id ON {t}(change_id)",
+        f"""
+        CREATE TABLE IF NOT EXISTS {t}_deletions (
+            change_id BIGINT PRIMARY KEY DEFAULT nextval('{t}_change_seq'),
+            key VARCHAR(255) NOT NULL,
+            deleted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+        """,
+        f"""
+        CREATE TABLE IF NOT EXISTS {t}_feed_meta (
+            id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+            pruned_through BIGINT NOT NULL DEFAULT 0
+        )
+        """,
+        f"INSERT INTO {t}_feed_meta DEFAULT VALUES ON CONFLICT DO NOTHING",
+        # Latest version per key; backfilled once when first created
+        f"""
+        DO $$
+        BEGIN
+            IF to_regclass('{t}_heads') IS NULL THEN
+                CREATE TABLE {t}_heads (
+                    key VARCHAR(255) PRIMARY KEY,
+                    version INTEGER NOT NULL
+                );
+                INSERT INTO {t}_heads (key, version)
+                SELECT key, MAX(version) FROM {t} GROUP BY key;
+            END IF;
+        END $$
+        """,
+    ]
+
+
+def batch_save_sql(
+    table_name: str,
+    keys: str,
+    values: str,
+    metadata: str,
+    timestamp: str,
+    component_id: str,
+    channel: str,
+) -> str:
+    """
+    Single-statement batch insert with atomic version assignment.
+
+    Placeholders are passed in so the same SQL serves psycopg2 (%(name)s)
+    and asyncpg ($n). Each key's head is bumped once by the number of rows
+    for that key; rows then take consecutive versions below the new head.
+    Returns (key, version) rows; see assign_batch_versions().
+    """
+    t = table_name
+    return f"""
+        WITH input AS (
+            SELECT * FROM unnest({keys}::varchar[], {values}::text[], {metadata}::text[])
+                WITH ORDINALITY AS i(key, value, metadata, ord)
+        ),
+        counts AS (
+            SELECT key, COUNT(*)::int AS n FROM input GROUP BY key
+        ),
+        heads AS (
+            INSERT INTO {t}_heads AS h (key, version)
+            SELECT key, n FROM counts
+            ON CONFLICT (key) DO UPDATE SET version = h.version + EXCLUDED.version
+            RETURNING h.key, h.version
+        ),
+        ins AS (
+            INSERT INTO {t} (key, value, version, timestamp, component_id, metadata)
+            SELECT i.key, i.value::jsonb,
+                   heads.version - counts.n
+                       + (ROW_NUMBER() OVER (PARTITION BY i.key ORDER BY i.ord))::int,
+                   {timestamp}, {component_id}, i.metadata::jsonb
+            FROM input i
+            JOIN counts ON counts.key = i.key
+            JOIN heads ON heads.key = i.key
+            RETURNING key, version
+        )
+        SELECT ins.key, ins.version
+        FROM ins, (SELECT pg_notify({channel}, 'batch')) AS notified
+    """
+
+
+def assign_batch_versions(keys: List[str], rows: List[tuple]) -> List[int]:
+    """Map (key, version) rows from batch_save_sql() back to input order."""
+    by_key: Dict[str, List[int]] = {}
+    for key, version in rows:
+        by_key.setdefault(key, []).append(version)
+    for versions in by_key.values():
+        versions.sort(reverse=True)
+    return [by_key[key].pop() for key in keys]
+
+
+def prune_deletions_sql(table_name: str, max_age: str) -> str:
+    """
+    Delete tombstones older than max_age seconds, returning the count.
+
+    Raises {table}_feed_meta.pruned_through in the same statement so
+    changes_since() can tell a cursor now missing deletions to resync.
+    """
+    t = table_name
+    return f"""
+        WITH pruned AS (
+            DELETE FROM {t}_deletions
+            WHERE deleted_at < NOW() - make_interval(secs => {max_age}::double precision)
+            RETURNING change_id
+        ),
+        marked AS (
+            UPDATE {t}_feed_meta
+            SET pruned_through = GREATEST(pruned_through, (SELECT MAX(change_id) FROM pruned))
+            WHERE EXISTS (SELECT 1 FROM pruned)
+            RETURNING 1
+        )
+        SELECT COUNT(*) FROM pruned
+    """
+
+
+def split_feed_cursor(cursor: Any) -> Tuple[int, Tuple[int, ...]]:
+    """Return (watermark, delivered change_ids in the overlap window)."""
+    if isinstance(cursor, (tuple, list)):
+        return cursor[0], tuple(cursor[1])
+    return cursor, ()
+
+
+def advance_change_feed(
+    cursor: Any,
+    rows: Sequence[tuple],
+    overlap: int = CHANGE_FEED_OVERLAP,
+) -> ChangeBatch:
+    """
+    Build a batch from (key, version, component_id, change_id) rows read
+    above the cursor's overlap floor.
+
+    The cursor carries the change_ids already delivered inside the overlap
+    window, so re-read rows are dropped and only late commits come through.
+    """
+    watermark, delivered = split_feed_cursor(cursor)
+    seen = set(delivered)
+    fresh = [row for row in rows if row[3] > watermark or row[3] not in seen]
+    watermark = max([watermark] + [row[3] for row in rows])
+    floor = watermark - overlap
+    seen.update(row[3] for row in fresh)
+    return ChangeBatch(
+        changes=[StateChange(row[0], row[1], row[2]) for row in fresh],
+        cursor=(watermark, tuple(sorted(i for i in seen if i > floor))),
+    )
+
 
 class PostgreSQLStateStore(StateStore):
     """
@@ -38,8 +224,29 @@ class PostgreSQLStateStore(StateStore):
         );
         CREATE INDEX idx_state_key ON state_entries(key);
         CREATE INDEX idx_state_key_version ON state_entries(key, version DESC);
+        CREATE TABLE state_entries_heads (
+            key VARCHAR(255) PRIMARY KEY,
+            version INTEGER NOT NULL
+        );
+
+    Versions are assigned by upserting the key's row in {table}_heads in the
+    same statement as the insert, so concurrent saves never collide and a
+    save is a single round trip. See schema_statements().
+
+    Change feed:
+        Every inserted version and every deletion takes a change_id from the
+        shared sequence {table}_change_seq (deletions are recorded in
+        {table}_deletions). changes_since() is a watermark query on
+        change_id, and save/delete NOTIFY {table}_changes so watchers can
+        sync immediately instead of polling. The cursor is (watermark,
+        change_ids delivered within CHANGE_FEED_OVERLAP of it), so rows
+        re-read to catch late commits are not delivered twice. delete()
+        prunes tombstones older than DELETION_RETENTION_SECONDS.
     """
 
+    CHANGE_FEED_OVERLAP = CHANGE_FEED_OVERLAP
+    DELETION_RETENTION_SECONDS = DELETION_RETENTION_SECONDS
+
     def __init__(
         self,
         connection_string: Optional[str] = None,
@@ -57,6 +264,7 @@ class PostgreSQLStateStore(StateStore):
         self.connection_string = connection_string
         self.pool_size = pool_size
         self.table_name = table_name
+        self.notify_channel = f"{table_name}_changes"
         self._pool = None
 
         # Try to import psycopg2
@@ -103,26 +311,8 @@ class PostgreSQLStateStore(StateStore):
         conn = self._pool.getconn()
         try:
             with conn.cursor() as cur:
-                cur.execute(f"""
-                    CREATE TABLE IF NOT EXISTS {self.table_name} (
-                        id SERIAL PRIMARY KEY,
-                        key VARCHAR(255) NOT NULL,
-                        value JSONB NOT NULL,
-                        version INTEGER NOT NULL,
-                        timestamp TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-                        component_id VARCHAR(255),
-                        metadata JSONB DEFAULT '{{}}',
-                        UNIQUE(key, version)
-                    )
-                """)
-                cur.execute(f"""
-                    CREATE INDEX IF NOT EXISTS idx_{self.table_name}_key
-                    ON {self.table_name}(key)
-                """)
-                cur.execute(f"""
-                    CREATE INDEX IF NOT EXISTS idx_{self.table_name}_key_version
-                    ON {self.table_name}(key, version DESC)
-                """)
+                for statement in schema_statements(self.table_name):
+                    cur.execute(statement)
             conn.commit()
         finally:
             self._pool.putconn(conn)
@@ -150,33 +340,39 @@ class PostgreSQLStateStore(StateStore):
 
         conn = self._pool.getconn()
         try:
+            timestamp = datetime.utcnow()
             with conn.cursor() as cur:
-                # Get next version
-                cur.execute(
-                    f"SELECT COALESCE(MAX(version), 0) + 1 FROM {self.table_name} WHERE key = %s",
-                    (key,)
-                )
-                new_version = cur.fetchone()[0]
-
-                timestamp = datetime.utcnow()
-
-                # Insert new version
+                # Assign the version and insert in one statement; the heads
+                # upsert row-locks the key until commit
                 cur.execute(
                     f"""
-                    INSERT INTO {self.table_name}
-                    (key, value, version, timestamp, component_id, metadata)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    RETURNING id
-                    """,
-                    (
-                        key,
-                        json.dumps(value),
-                        new_version,
-                        timestamp,
-                        component_id,
-                        json.dumps(metadata or {}),
+                    WITH head AS (
+                        INSERT INTO {self.table_name}_heads AS h (key, version)
+                        VALUES (%(key)s, 1)
+                        ON CONFLICT (key) DO UPDATE SET version = h.version + 1
+                        RETURNING h.version
+                    ),
+                    ins AS (
+                        INSERT INTO {self.table_name}
+                        (key, value, version, timestamp, component_id, metadata)
+                        SELECT %(key)s, %(value)s, head.version, %(timestamp)s,
+                               %(component_id)s, %(metadata)s
+                        FROM head
+                        RETURNING version
                     )
+                    SELECT version, pg_notify(%(channel)s, version || ':' || %(key)s)
+                    FROM ins
+                    """,
+                    {
+                        "key": key,
+                        "value": json.dumps(value),
+                        "timestamp": timestamp,
+                        "component_id": component_id,
+                        "metadata": json.dumps(metadata or {}),
+                        "channel": self.notify_channel,
+                    }
                 )
+                new_version = cur.fetchone()[0]
 
             conn.commit()
 
@@ -199,6 +395,78 @@ class PostgreSQLStateStore(StateStore):
         finally:
             self._pool.putconn(conn)
 
+    def save_many(
+        self,
+        entries: List[tuple],
+        component_id: Optional[str] = None,
+    ) -> List[StateEntry]:
+        """
+        Save many entries in one statement and one transaction.
+
+        Saves of the same key within a batch get consecutive versions in
+        input order.
+
+        Args:
+            entries: (key, value) or (key, value, metadata) tuples
+            component_id: ID of saving component
+
+        Returns:
+            Saved entries in input order
+        """
+        if not entries:
+            return []
+        if not self._check_available():
+            raise RuntimeError("PostgreSQL backend not available")
+
+        keys = [e[0] for e in entries]
+        values = [e[1] for e in entries]
+        metadatas = [(e[2] if len(e) > 2 else None) or {} for e in entries]
+
+        conn = self._pool.getconn()
+        try:
+            timestamp = datetime.utcnow()
+            with conn.cursor() as cur:
+                cur.execute(
+                    batch_save_sql(self.table_name, "%(keys)s", "%(values)s", "%(metadata)s",
+                                   "%(timestamp)s", "%(component_id)s", "%(channel)s"),
+                    {
+                        "keys": keys,
+                        "values": [json.dumps(v) for v in values],
+                        "metadata": [json.dumps(m) for m in metadatas],
+                        "timestamp": timestamp,
+                        "component_id": component_id,
+                        "channel": self.notify_channel,
+                    }
+                )
+                versions = assign_batch_versions(keys, cur.fetchall())
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Failed to save batch of {len(entries)} states: {e}")
+            raise
+        finally:
+            self._pool.putconn(conn)
+
+        return [
+            StateEntry(
+                key=key,
+                value=value,
+                version=version,
+                timestamp=timestamp,
+                component_id=component_id,
+                metadata=metadata,
+            )
+            for key, value, metadata, version in zip(keys, values, metadatas, versions)
+        ]
+
+    def batch_save(
+        self,
+        entries: List[tuple],
+        component_id: Optional[str] = None,
+    ) -> List[StateEntry]:
+        """Save multiple state entries in one round trip."""
+        return self.save_many(entries, component_id)
+
     def load(
         self,
         key: str,
@@ -261,6 +529,23 @@ class PostgreSQLStateStore(StateStore):
                     (key,)
                 )
                 deleted = cur.rowcount > 0
+                cur.execute(
+                    f"DELETE FROM {self.table_name}_heads WHERE key = %s",
+                    (key,)
+                )
+                if deleted:
+                    cur.execute(
+                        f"INSERT INTO {self.table_name}_deletions (key) VALUES (%s)",
+                        (key,)
+                    )
+                    cur.execute(
+                        prune_deletions_sql(self.table_name, "%s"),
+                        (self.DELETION_RETENTION_SECONDS,)
+                    )
+                    cur.execute(
+                        "SELECT pg_notify(%s, %s)",
+                        (self.notify_channel, f"0:{key}")
+                    )
             conn.commit()
 
             if deleted:
@@ -301,7 +586,7 @@ class PostgreSQLStateStore(StateStore):
                 if prefix:
                     cur.execute(
                         f"""
-                        SELECT DISTINCT key FROM {self.table_name}
+                        SELECT key FROM {self.table_name}_heads
                         WHERE key LIKE %s
                         ORDER BY key
                         """,
@@ -309,7 +594,7 @@ class PostgreSQLStateStore(StateStore):
                     )
                 else:
                     cur.execute(
-                        f"SELECT DISTINCT key FROM {self.table_name} ORDER BY key"
+                        f"SELECT key FROM {self.table_name}_heads ORDER BY key"
                     )
                 return [row[0] for row in cur.fetchall()]
         finally:
@@ -356,10 +641,11 @@ class PostgreSQLStateStore(StateStore):
         try:
             with conn.cursor() as cur:
                 cur.execute(
-                    f"SELECT COALESCE(MAX(version), 0) FROM {self.table_name} WHERE key = %s",
+                    f"SELECT version FROM {self.table_name}_heads WHERE key = %s",
                     (key,)
                 )
-                return cur.fetchone()[0]
+                row = cur.fetchone()
+                return row[0] if row else 0
         finally:
             self._pool.putconn(conn)
 
@@ -402,6 +688,147 @@ class PostgreSQLStateStore(StateStore):
         finally:
             self._pool.putconn(conn)
 
+    def prune_deletions(self, max_age_seconds: Optional[float] = None) -> int:
+        """Remove deletion tombstones older than max_age_seconds."""
+        if not self._check_available():
+            return 0
+        if max_age_seconds is None:
+            max_age_seconds = self.DELETION_RETENTION_SECONDS
+
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(prune_deletions_sql(self.table_name, "%s"), (max_age_seconds,))
+                pruned = cur.fetchone()[0]
+            conn.commit()
+            return pruned
+
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Failed to prune deletions: {e}")
+            return 0
+        finally:
+            self._pool.putconn(conn)
+
+    def changes_since(self, cursor: Any = None) -> ChangeBatch:
+        """
+        Watermark query on change_id.
+
+        With no cursor, or one older than the newest pruned tombstone,
+        returns the latest version of every key (without values) and a
+        cursor at the current watermark.
+        """
+        if not self._check_available():
+            return ChangeBatch(changes=[], cursor=cursor, snapshot=cursor is None)
+
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                if cursor is not None:
+                    watermark, _ = split_feed_cursor(cursor)
+                    floor = watermark - self.CHANGE_FEED_OVERLAP
+                    cur.execute(
+                        f"""
+                        SELECT key, version, component_id, change_id
+                        FROM {self.table_name} WHERE change_id > %s
+                        UNION ALL
+                        SELECT key, 0, NULL, change_id
+                        FROM {self.table_name}_deletions WHERE change_id > %s
+                        ORDER BY change_id
+                        """,
+                        (floor, floor)
+                    )
+                    rows = cur.fetchall()
+                    # Checked after the read: a prune committed before it shows here
+                    cur.execute(f"SELECT pruned_through FROM {self.table_name}_feed_meta")
+                    if watermark >= cur.fetchone()[0]:
+                        return advance_change_feed(cursor, rows, self.CHANGE_FEED_OVERLAP)
+
+                # Read the watermark and the ids below it before the heads, so
+                # every id marked delivered is reflected in the snapshot
+                cur.execute(f"""
+                    SELECT GREATEST(
+                        (SELECT COALESCE(MAX(change_id), 0) FROM {self.table_name}),
+                        (SELECT COALESCE(MAX(change_id), 0) FROM {self.table_name}_deletions)
+                    )
+                """)
+                watermark = cur.fetchone()[0]
+                floor = watermark - self.CHANGE_FEED_OVERLAP
+                cur.execute(
+                    f"""
+                    SELECT change_id FROM {self.table_name}
+                    WHERE change_id > %s AND change_id <= %s
+                    UNION ALL
+                    SELECT change_id FROM {self.table_name}_deletions
+                    WHERE change_id > %s AND change_id <= %s
+                    """,
+                    (floor, watermark, floor, watermark)
+                )
+                delivered = tuple(sorted(row[0] for row in cur.fetchall()))
+                cur.execute(f"""
+                    SELECT h.key, h.version, e.component_id
+                    FROM {self.table_name}_heads h
+                    JOIN {self.table_name} e ON e.key = h.key AND e.version = h.version
+                    ORDER BY h.key
+                """)
+                changes = [StateChange(row[0], row[1], row[2]) for row in cur.fetchall()]
+                return ChangeBatch(changes=changes, cursor=(watermark, delivered), snapshot=True)
+        finally:
+            self._pool.putconn(conn)
+
+    def watch(self, callback: Callable[[], None]) -> Optional[Callable[[], None]]:
+        """
+        LISTEN for change notifications on a dedicated connection.
+
+        The callback also fires after every (re)connect, since notifications
+        sent while disconnected are lost.
+        """
+        if not self._check_available():
+            return None
+
+        stop = threading.Event()
+
+        def listen() -> None:
+            conn = None
+            while not stop.is_set():
+                try:
+                    if conn is None:
+                        conn = self._psycopg2.connect(self.connection_string)
+                        conn.autocommit = True
+                        with conn.cursor() as cur:
+                            cur.execute(f"LISTEN {self.notify_channel}")
+                        callback()
+                    if select.select([conn], [], [], 1.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    if conn.notifies:
+                        conn.notifies.clear()
+                        callback()
+                except Exception as e:
+                    logger.warning(f"LISTEN {self.notify_channel} failed: {e}")
+                    if conn is not None:
+                        try:
+                            conn.close()
+                        except Exception:
+                            pass
+                        conn = None
+                    stop.wait(1.0)
+            if conn is not None:
+                conn.close()
+
+        thread = threading.Thread(
+            target=listen,
+            daemon=True,
+            name=f"PGListen-{self.notify_channel}",
+        )
+        thread.start()
+
+        def unwatch() -> None:
+            stop.set()
+            thread.join(timeout=5.0)
+
+        return unwatch
+
     def close(self) -> None:
         """Close connection pool."""
         if self._pool:
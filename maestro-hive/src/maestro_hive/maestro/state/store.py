@@ -10,7 +10,7 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +59,37 @@ class StateEntry:
         )
 
 
+@dataclass
+class StateChange:
+    """
+    One entry in a store's change feed.
+
+    Attributes:
+        key: State key
+        version: New latest version, or 0 if the key was deleted
+        component_id: Component that made the change (if known)
+    """
+    key: str
+    version: int
+    component_id: Optional[str] = None
+
+
+@dataclass
+class ChangeBatch:
+    """
+    Result of StateStore.changes_since().
+
+    Attributes:
+        changes: Changes in the order they happened
+        cursor: Opaque position to pass to the next changes_since() call
+        snapshot: True if changes lists every live key (e.g. first call or
+            after the feed was reset); keys not listed have been deleted
+    """
+    changes: List[StateChange]
+    cursor: Any
+    snapshot: bool = False
+
+
 class StateStore(ABC):
     """
     Abstract interface for state storage.
@@ -249,6 +280,41 @@ class StateStore(ABC):
             results.append(entry)
         return results
 
+    def changes_since(self, cursor: Any = None) -> ChangeBatch:
+        """
+        Get keys whose latest version changed since cursor.
+
+        The default implementation returns a snapshot of (key, latest version)
+        for every key without loading values. Backends override this with a
+        feed whose cost is proportional to the number of changes.
+
+        Args:
+            cursor: Cursor from a previous batch, or None to start
+
+        Returns:
+            ChangeBatch with the changes and the next cursor
+        """
+        changes = [
+            StateChange(key=key, version=self.get_latest_version(key))
+            for key in self.list_keys()
+        ]
+        return ChangeBatch(changes=changes, cursor=None, snapshot=True)
+
+    def watch(self, callback: Callable[[], None]) -> Optional[Callable[[], None]]:
+        """
+        Register for push notification of changes.
+
+        The callback only signals that changes_since() has something new;
+        it may be called from another thread.
+
+        Args:
+            callback: Called when the store changes
+
+        Returns:
+            Function that stops watching, or None if the backend cannot push
+        """
+        return None
+
     def batch_load(self, keys: List[str]) -> Dict[str, Optional[StateEntry]]:
         """
         Load multiple state entries.
@@ -4,6 +4,10 @@ State Synchronization - Component state coordination
 EPIC: MD-2528 - AC-2: State synchronization between components
 
 Handles state synchronization across distributed components.
+Changes are read from the store's change feed (StateStore.changes_since), so
+each sync costs time proportional to what changed rather than to the total
+number of keys; backends that can push (StateStore.watch) wake the sync loop
+immediately.
 """
 
 import logging
@@ -14,7 +18,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Set
 
-from .store import StateEntry, StateStore
+from .store import StateChange, StateEntry, StateStore
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +48,8 @@ class StateSync:
     State synchronization service.
 
     Coordinates state updates across components with:
-    - Change detection
+    - Change detection via the store change feed
+    - Push-triggered sync where the backend supports it
     - Conflict resolution
     - Event broadcasting
     """
@@ -61,7 +66,8 @@ class StateSync:
         Args:
             store: State store backend
             component_id: Unique ID for this component
-            sync_interval: Seconds between sync checks
+            sync_interval: Seconds between sync checks (fallback when the
+                store cannot push changes)
         """
         self.store = store
         self.component_id = component_id
@@ -70,9 +76,14 @@ class StateSync:
         self._status = SyncStatus.IDLE
         self._subscriptions: Dict[str, Set[Callable]] = {}
         self._version_cache: Dict[str, int] = {}
+        self._feed_cursor: Any = None
         self._sync_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
+        self._unwatch: Optional[Callable[[], None]] = None
+        self._sync_lock = threading.Lock()
         self._lock = threading.Lock()
+        self._changes_processed = 0
 
         logger.info(f"StateSync initialized for component {component_id}")
 
@@ -123,6 +134,7 @@ class StateSync:
             return
 
         self._stop_event.clear()
+        self._unwatch = self.store.watch(self._wakeup.set)
         self._sync_thread = threading.Thread(
             target=self._sync_loop,
             daemon=True,
@@ -134,6 +146,10 @@ class StateSync:
     def stop(self) -> None:
         """Stop background sync thread."""
         self._stop_event.set()
+        self._wakeup.set()
+        if self._unwatch:
+            self._unwatch()
+            self._unwatch = None
         if self._sync_thread:
             self._sync_thread.join(timeout=5.0)
         self._status = SyncStatus.IDLE
@@ -146,56 +162,63 @@ class StateSync:
         Returns:
             List of sync events detected
         """
-        self._status = SyncStatus.SYNCING
-        events = []
-
-        try:
-            # Get all keys
-            keys = self.store.list_keys()
-
-            for key in keys:
-                entry = self.store.load(key)
-                if not entry:
-                    continue
-
-                cached_version = self._version_cache.get(key, 0)
-
-                if entry.version > cached_version:
-                    # State was updated
-                    event = SyncEvent(
-                        event_type="update",
-                        key=key,
-                        version=entry.version,
-                        component_id=entry.component_id or "unknown",
-                        details={"previous_version": cached_version},
-                    )
-                    events.append(event)
-                    self._notify_subscribers(event)
-                    self._version_cache[key] = entry.version
-
-            # Check for deletions
-            cached_keys = set(self._version_cache.keys())
-            current_keys = set(keys)
-            deleted_keys = cached_keys - current_keys
-
-            for key in deleted_keys:
-                event = SyncEvent(
-                    event_type="delete",
-                    key=key,
-                    version=0,
-                    component_id=self.component_id,
-                )
-                events.append(event)
-                self._notify_subscribers(event)
-                del self._version_cache[key]
-
-            self._status = SyncStatus.SYNCED
-
-        except Exception as e:
-            logger.error(f"Sync error: {e}")
-            self._status = SyncStatus.ERROR
-
-        return events
+        with self._sync_lock:
+            self._status = SyncStatus.SYNCING
+            events = []
+
+            try:
+                batch = self.store.changes_since(self._feed_cursor)
+
+                for change in batch.changes:
+                    event = self._apply_change(change)
+                    if event:
+                        events.append(event)
+
+                if batch.snapshot:
+                    # Anything cached but absent from a snapshot was deleted
+                    live_keys = {change.key for change in batch.changes}
+                    for key in [k for k in self._version_cache if k not in live_keys]:
+                        events.append(self._apply_change(StateChange(key=key, version=0)))
+
+                self._feed_cursor = batch.cursor
+                self._changes_processed += len(batch.changes)
+                self._status = SyncStatus.SYNCED
+
+            except Exception as e:
+                logger.error(f"Sync error: {e}")
+                self._status = SyncStatus.ERROR
+
+            return events
+
+    def _apply_change(self, change: StateChange) -> Optional[SyncEvent]:
+        """Update the version cache from a feed entry and notify subscribers."""
+        cached_version = self._version_cache.get(change.key, 0)
+
+        if change.version == 0:
+            if change.key not in self._version_cache:
+                return None
+            event = SyncEvent(
+                event_type="delete",
+                key=change.key,
+                version=0,
+                component_id=self.component_id,
+            )
+            del self._version_cache[change.key]
+        elif change.version > cached_version:
+            # State was updated
+            event = SyncEvent(
+                event_type="update",
+                key=change.key,
+                version=change.version,
+                component_id=change.component_id or "unknown",
+                details={"previous_version": cached_version},
+            )
+            self._version_cache[change.key] = change.version
+        else:
+            return None
+
+        self._notify_subscribers(event)
+        return event
 
     def publish_update(
         self,
@@ -273,13 +296,15 @@ class StateSync:
     def _sync_loop(self) -> None:
         """Background sync loop."""
         while not self._stop_event.is_set():
+            self._wakeup.clear()
             try:
                 self.sync_now()
             except Exception as e:
                 logger.error(f"Sync loop error: {e}")
                 self._status = SyncStatus.ERROR
 
-            self._stop_event.wait(self.sync_interval)
+            # Woken early by store notifications or stop()
+            self._wakeup.wait(self.sync_interval)
 
     def _notify_subscribers(self, event: SyncEvent) -> None:
         """Notify matching subscribers of event."""
@@ -315,4 +340,6 @@ class StateSync:
             "cached_keys": len(self._version_cache),
             "subscriptions": len(self._subscriptions),
             "sync_interval": self.sync_interval,
+            "push_enabled": self._unwatch is not None,
+            "changes_processed": self._changes_processed,
         }
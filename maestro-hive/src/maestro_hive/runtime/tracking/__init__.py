@@ -26,7 +26,7 @@ from .models import (
 )
 from .config import TrackerConfig
 from .tracker import ExecutionTracker
-from .stream import StreamPublisher
+from .stream import StreamPublisher, OverflowPolicy, StreamOverflowError
 from .query import QueryService
 
 __all__ = [
@@ -43,5 +43,7 @@ __all__ = [
     # Main components
     "ExecutionTracker",
     "StreamPublisher",
+    "OverflowPolicy",
+    "StreamOverflowError",
     "QueryService",
 ]
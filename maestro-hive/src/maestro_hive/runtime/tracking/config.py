@@ -25,6 +25,9 @@ class TrackerConfig:
         stream_events: Whether to enable event streaming
         store_decisions: Whether to store decisions in history
         retention_days: Days to retain execution data
+        query_max_executions: Maximum executions cached for queries
+        stream_overflow_policy: What a full subscriber buffer does with new events
+            (drop_oldest, drop_newest, coalesce, disconnect)
     """
     enabled: bool = True
     stream_buffer_size: int = 1000
@@ -35,6 +38,8 @@ class TrackerConfig:
     stream_events: bool = True
     store_decisions: bool = True
     retention_days: int = 90
+    query_max_executions: int = 100_000
+    stream_overflow_policy: str = "drop_oldest"
 
     @classmethod
     def from_env(cls) -> "TrackerConfig":
@@ -49,6 +54,8 @@ class TrackerConfig:
             stream_events=os.getenv("TRACKING_STREAM_EVENTS", "true").lower() == "true",
             store_decisions=os.getenv("TRACKING_STORE_DECISIONS", "true").lower() == "true",
             retention_days=int(os.getenv("TRACKING_RETENTION_DAYS", "90")),
+            query_max_executions=int(os.getenv("TRACKING_QUERY_MAX_EXECUTIONS", "100000")),
+            stream_overflow_policy=os.getenv("TRACKING_STREAM_OVERFLOW", "drop_oldest"),
         )
 
     @classmethod
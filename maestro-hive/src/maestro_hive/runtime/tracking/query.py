@@ -5,18 +5,52 @@ EPIC: MD-2558
 AC-5: Queryable execution history for analytics
 
 Provides querying, filtering, and analytics for execution history.
+
+Cached executions are kept in a bounded, time-partitioned store:
+- Partitions cover a fixed time window of started_at and are scanned newest
+  first, so paginated queries stop as soon as the page is full
+- Set indexes on persona, outcome, correlation, user and tags narrow the
+  candidates before any execution is inspected
+- Duration, tokens, cost, outcome and persona are also held in array-backed
+  columns so analytics aggregate without touching the execution objects
+  (vectorised with numpy when available)
+- Oldest partitions are evicted past max_executions or the retention window;
+  each partition keeps a heap of its rows by (started_at, seq) so trimming
+  pops from the front, and tombstoned rows are compacted away once they
+  outnumber the live ones
 """
 
+import base64
+import heapq
 import logging
-from dataclasses import dataclass
+import math
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from uuid import UUID
 
 from .models import TrackedExecution, ExecutionOutcome, DecisionType
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_OUTCOME_CODES = {outcome: code for code, outcome in enumerate(ExecutionOutcome)}
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _timestamp(value: datetime) -> float:
+    """Seconds since the epoch for a (naive UTC or aware) datetime."""
+    if value.tzinfo is not None:
+        return value.timestamp()
+    return (value - _EPOCH).total_seconds()
+
 
 @dataclass
 class ExecutionFilter:
@@ -56,6 +90,96 @@ class AnalyticsResult:
             self.top_personas = []
 
 
+@dataclass
+class ExecutionPage:
+    """A page of executions with a cursor for the next page."""
+    items: List[TrackedExecution] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class _Partition:
+    """Executions whose started_at falls in one time window, stored column-wise."""
+
+    # Tombstoned rows are compacted away once they outnumber live ones
+    COMPACT_MIN_ROWS = 64
+
+    def __init__(self, key: int):
+        self.key = key
+        self.executions: List[Optional[TrackedExecution]] = []
+        self.seq = array('q')
+        self.started = array('d')
+        self.duration = array('d')   # NaN when unknown
+        self.tokens = array('q')
+        self.cost = array('d')
+        self.outcome = array('b')
+        self.persona = array('l')
+        self.alive = bytearray()
+        self.live = 0
+        # (started, seq, row) min-heap; entries for dead or moved rows are stale
+        self.order: List[Tuple[float, int, int]] = []
+
+    def append(self, execution: TrackedExecution, seq: int, started: float, persona_code: int) -> int:
+        row = len(self.executions)
+        self.executions.append(execution)
+        self.seq.append(seq)
+        self.started.append(started)
+        self.duration.append(0.0)
+        self.tokens.append(0)
+        self.cost.append(0.0)
+        self.outcome.append(0)
+        self.persona.append(persona_code)
+        self.alive.append(1)
+        self.live += 1
+        self.set_metrics(row, execution, persona_code)
+        heapq.heappush(self.order, (started, seq, row))
+        return row
+
+    def set_started(self, row: int, started: float) -> None:
+        if self.started[row] != started:
+            self.started[row] = started
+            heapq.heappush(self.order, (started, self.seq[row], row))
+
+    def set_metrics(self, row: int, execution: TrackedExecution, persona_code: int) -> None:
+        self.duration[row] = float(execution.duration_ms) if execution.duration_ms is not None else math.nan
+        self.tokens[row] = execution.token_count or 0
+        self.cost[row] = execution.cost_usd or 0.0
+        self.outcome[row] = _OUTCOME_CODES[execution.outcome]
+        self.persona[row] = persona_code
+
+    def remove(self, row: int) -> None:
+        self.executions[row] = None
+        self.alive[row] = 0
+        self.live -= 1
+
+    def rows(self) -> Iterator[int]:
+        alive = self.alive
+        return (i for i in range(len(alive)) if alive[i])
+
+    def oldest(self) -> int:
+        """Row of the live execution with the smallest (started, seq)."""
+        order = self.order
+        while True:
+            started, seq, row = order[0]
+            if self.alive[row] and self.started[row] == started and self.seq[row] == seq:
+                return row
+            heapq.heappop(order)
+
+    def needs_compaction(self) -> bool:
+        size = len(self.executions)
+        return size >= self.COMPACT_MIN_ROWS and size > 2 * self.live
+
+    def compact(self) -> None:
+        """Drop tombstoned rows; row numbers change, callers must remap."""
+        keep = list(self.rows())
+        self.executions = [self.executions[r] for r in keep]
+        for name in ("seq", "started", "duration", "tokens", "cost", "outcome", "persona"):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, (column[r] for r in keep)))
+        self.alive = bytearray(b"\x01" * len(keep))
+        self.order = [(self.started[r], self.seq[r], r) for r in range(len(keep))]
+        heapq.heapify(self.order)
+
+
 class QueryService:
     """
     Service for querying execution history (AC-5).
@@ -79,26 +203,283 @@ class QueryService:
         )
     """
 
-    def __init__(self, history_store: Optional[Any] = None):
+    def __init__(
+        self,
+        history_store: Optional[Any] = None,
+        max_executions: int = 100_000,
+        partition_seconds: int = 3600,
+        retention: Optional[timedelta] = None,
+    ):
         """
         Initialize the query service.
 
         Args:
             history_store: Optional ExecutionHistoryStore for database queries
+            max_executions: Maximum executions kept in the in-memory cache
+            partition_seconds: Width of each time partition
+            retention: Drop cached executions older than this (relative to
+                the newest cached execution)
         """
         self._history_store = history_store
+        self.max_executions = max_executions
+        self.partition_seconds = partition_seconds
+        self.retention = retention
+
         self._cache: Dict[UUID, TrackedExecution] = {}
+        self._partitions: Dict[int, _Partition] = {}
+        self._partition_keys: List[int] = []   # sorted ascending
+        self._rows: Dict[UUID, Tuple[int, int]] = {}  # id -> (partition key, row)
+        self._seq = 0
+
+        # Secondary indexes: value -> execution ids
+        self._by_persona: Dict[str, Set[UUID]] = {}
+        self._by_outcome: Dict[ExecutionOutcome, Set[UUID]] = {}
+        self._by_correlation: Dict[str, Set[UUID]] = {}
+        self._by_user: Dict[str, Set[UUID]] = {}
+        self._by_tag: Dict[str, Set[UUID]] = {}
+        self._indexed: Dict[UUID, Tuple[str, ExecutionOutcome, Optional[str], Optional[str], Tuple[str, ...]]] = {}
+
+        self._persona_codes: Dict[str, int] = {}
+        self._persona_names: List[str] = []
 
         logger.info("QueryService initialized")
 
+    # =========================================================================
+    # Cache maintenance
+    # =========================================================================
+
     def cache_execution(self, execution: TrackedExecution) -> None:
-        """Add an execution to the in-memory cache."""
+        """
+        Add or refresh an execution in the in-memory cache.
+
+        Call again after an execution's outcome, timing, tokens or context
+        change so indexes and columns follow (the tracker does this when an
+        execution finishes).
+        """
+        ctx = execution.trace_context
+        persona_code = self._persona_code(ctx.persona_id)
+        started = _timestamp(execution.started_at)
+        key = int(started // self.partition_seconds)
+
+        location = self._rows.get(execution.id)
+        if location is not None and location[0] == key:
+            partition = self._partitions[location[0]]
+            partition.executions[location[1]] = execution
+            partition.set_started(location[1], started)
+            partition.set_metrics(location[1], execution, persona_code)
+        else:
+            if location is not None:
+                self._remove_row(execution.id)
+            partition = self._partitions.get(key)
+            if partition is None:
+                partition = self._add_partition(key)
+            self._seq += 1
+            self._rows[execution.id] = (key, partition.append(execution, self._seq, started, persona_code))
+
         self._cache[execution.id] = execution
+        self._reindex(execution)
+        self._evict()
 
     def get_cached(self, execution_id: UUID) -> Optional[TrackedExecution]:
         """Get an execution from cache."""
         return self._cache.get(execution_id)
 
+    def _persona_code(self, persona_id: str) -> int:
+        code = self._persona_codes.get(persona_id)
+        if code is None:
+            code = len(self._persona_names)
+            self._persona_codes[persona_id] = code
+            self._persona_names.append(persona_id)
+        return code
+
+    def _add_partition(self, key: int) -> _Partition:
+        partition = _Partition(key)
+        self._partitions[key] = partition
+        keys = self._partition_keys
+        if not keys or key > keys[-1]:
+            keys.append(key)
+        else:
+            keys.insert(next(i for i, k in enumerate(keys) if k > key), key)
+        return partition
+
+    def _reindex(self, execution: TrackedExecution) -> None:
+        ctx = execution.trace_context
+        entry = (ctx.persona_id, execution.outcome, ctx.correlation_id, ctx.user_id, tuple(ctx.tags))
+        previous = self._indexed.get(execution.id)
+        if previous == entry:
+            return
+        if previous is not None:
+            self._unindex(execution.id, previous)
+        self._indexed[execution.id] = entry
+        persona_id, outcome, correlation_id, user_id, tags = entry
+        self._by_persona.setdefault(persona_id, set()).add(execution.id)
+        self._by_outcome.setdefault(outcome, set()).add(execution.id)
+        if correlation_id:
+            self._by_correlation.setdefault(correlation_id, set()).add(execution.id)
+        if user_id:
+            self._by_user.setdefault(user_id, set()).add(execution.id)
+        for tag in tags:
+            self._by_tag.setdefault(tag, set()).add(execution.id)
+
+    def _unindex(self, execution_id: UUID, entry: Tuple) -> None:
+        persona_id, outcome, correlation_id, user_id, tags = entry
+        pairs = [(self._by_persona, persona_id), (self._by_outcome, outcome)]
+        if correlation_id:
+            pairs.append((self._by_correlation, correlation_id))
+        if user_id:
+            pairs.append((self._by_user, user_id))
+        pairs.extend((self._by_tag, tag) for tag in tags)
+        for index, value in pairs:
+            ids = index.get(value)
+            if ids is not None:
+                ids.discard(execution_id)
+                if not ids:
+                    del index[value]
+
+    def _remove_row(self, execution_id: UUID) -> None:
+        key, row = self._rows.pop(execution_id)
+        partition = self._partitions[key]
+        partition.remove(row)
+        if partition.live == 0:
+            del self._partitions[key]
+            self._partition_keys.remove(key)
+        elif partition.needs_compaction():
+            partition.compact()
+            for new_row, execution in enumerate(partition.executions):
+                self._rows[execution.id] = (key, new_row)
+
+    def _forget(self, execution_id: UUID) -> None:
+        self._remove_row(execution_id)
+        self._cache.pop(execution_id, None)
+        entry = self._indexed.pop(execution_id, None)
+        if entry is not None:
+            self._unindex(execution_id, entry)
+
+    def _evict(self) -> None:
+        """Drop the oldest partitions past max_executions or the retention window."""
+        if self.retention is not None and self._partition_keys:
+            horizon = (self._partition_keys[-1] + 1) * self.partition_seconds - self.retention.total_seconds()
+            while len(self._partition_keys) > 1 and (self._partition_keys[0] + 1) * self.partition_seconds <= horizon:
+                self._drop_partition(self._partition_keys[0])
+
+        excess = len(self._cache) - self.max_executions
+        while excess > 0 and self._partition_keys:
+            oldest = self._partitions[self._partition_keys[0]]
+            if oldest.live <= excess and len(self._partition_keys) > 1:
+                excess -= oldest.live
+                self._drop_partition(oldest.key)
+                continue
+            # Trim the oldest rows of the remaining partition
+            for _ in range(min(excess, oldest.live)):
+                self._forget(oldest.executions[oldest.oldest()].id)
+            excess = 0
+
+    def _drop_partition(self, key: int) -> None:
+        partition = self._partitions[key]
+        # Collect ids first: forgetting rows may compact the partition
+        for execution_id in [partition.executions[row].id for row in partition.rows()]:
+            self._forget(execution_id)
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def _candidates(
+        self,
+        persona_id: Optional[str] = None,
+        outcome: Optional[ExecutionOutcome] = None,
+        outcomes: Optional[List[ExecutionOutcome]] = None,
+        tags: Optional[List[str]] = None,
+        user_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+    ) -> Optional[Set[UUID]]:
+        """Intersect the relevant indexes; None means no index applies."""
+        sets: List[Set[UUID]] = []
+        if persona_id:
+            sets.append(self._by_persona.get(persona_id, set()))
+        if outcome:
+            sets.append(self._by_outcome.get(outcome, set()))
+        if outcomes:
+            sets.append(set().union(*(self._by_outcome.get(o, set()) for o in outcomes)))
+        if tags:
+            sets.append(set().union(*(self._by_tag.get(t, set()) for t in tags)))
+        if user_id:
+            sets.append(self._by_user.get(user_id, set()))
+        if correlation_id:
+            sets.append(self._by_correlation.get(correlation_id, set()))
+        if not sets:
+            return None
+        sets.sort(key=len)
+        return sets[0].intersection(*sets[1:]) if len(sets) > 1 else set(sets[0])
+
+    def _iter_matches(
+        self,
+        criteria: Dict[str, Any],
+        cursor: Optional[Tuple[float, int]] = None,
+    ) -> Iterator[TrackedExecution]:
+        """Yield matching executions ordered by started_at (newest first)."""
+        candidates = self._candidates(
+            persona_id=criteria.get("persona_id"),
+            outcome=criteria.get("outcome"),
+            outcomes=criteria.get("outcomes"),
+            tags=criteria.get("tags"),
+            user_id=criteria.get("user_id"),
+            correlation_id=criteria.get("correlation_id"),
+        )
+        if candidates is not None and not candidates:
+            return
+
+        since, until = criteria.get("since"), criteria.get("until")
+        low = _timestamp(since) // self.partition_seconds if since else None
+        high = _timestamp(until) // self.partition_seconds if until else None
+        if cursor is not None:
+            cursor_key = cursor[0] // self.partition_seconds
+            high = cursor_key if high is None else min(high, cursor_key)
+
+        # Candidate rows grouped by partition, when an index narrowed the set
+        by_partition: Optional[Dict[int, List[int]]] = None
+        if candidates is not None:
+            by_partition = {}
+            for execution_id in candidates:
+                key, row = self._rows[execution_id]
+                by_partition.setdefault(key, []).append(row)
+
+        for key in reversed(self._partition_keys):
+            if high is not None and key > high:
+                continue
+            if low is not None and key < low:
+                break
+            partition = self._partitions[key]
+            if by_partition is not None:
+                rows = by_partition.get(key)
+                if not rows:
+                    continue
+            else:
+                rows = list(partition.rows())
+
+            started, seq = partition.started, partition.seq
+            rows.sort(key=lambda r: (started[r], -seq[r]), reverse=True)
+            for row in rows:
+                if cursor is not None and (started[row], -seq[row]) >= (cursor[0], -cursor[1]):
+                    continue
+                execution = partition.executions[row]
+                if self._matches_filter(execution, **criteria):
+                    yield execution
+
+    def _cursor_for(self, execution: TrackedExecution) -> str:
+        key, row = self._rows[execution.id]
+        partition = self._partitions[key]
+        raw = f"{partition.started[row]!r}:{partition.seq[row]}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[float, int]:
+        try:
+            started, seq = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+            return float(started), int(seq)
+        except Exception:
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+
     async def filter(
         self,
         persona_id: Optional[str] = None,
@@ -136,32 +517,47 @@ class QueryService:
         Returns:
             List of matching TrackedExecution objects
         """
-        # Use cache if no history store
+        criteria = dict(
+            persona_id=persona_id, outcome=outcome, outcomes=outcomes,
+            since=since, until=until, tags=tags, user_id=user_id,
+            correlation_id=correlation_id, min_duration_ms=min_duration_ms,
+            max_duration_ms=max_duration_ms, has_errors=has_errors,
+        )
         results = []
+        for index, execution in enumerate(self._iter_matches(criteria)):
+            if index >= offset + limit:
+                break
+            if index >= offset:
+                results.append(execution)
+        return results
+
+    async def filter_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        **criteria: Any,
+    ) -> ExecutionPage:
+        """
+        Cursor-based pagination over filter results (newest first).
 
-        for execution in self._cache.values():
-            if not self._matches_filter(
-                execution,
-                persona_id=persona_id,
-                outcome=outcome,
-                outcomes=outcomes,
-                since=since,
-                until=until,
-                tags=tags,
-                user_id=user_id,
-                correlation_id=correlation_id,
-                min_duration_ms=min_duration_ms,
-                max_duration_ms=max_duration_ms,
-                has_errors=has_errors,
-            ):
-                continue
-            results.append(execution)
-
-        # Sort by started_at descending
-        results.sort(key=lambda e: e.started_at, reverse=True)
+        Args:
+            cursor: next_cursor from the previous page (None for the first page)
+            limit: Page size
+            **criteria: Same keyword filters as filter()
 
-        # Apply pagination
-        return results[offset:offset + limit]
+        Returns:
+            ExecutionPage with items and the cursor for the next page
+        """
+        position = self._decode_cursor(cursor) if cursor else None
+        items = []
+        has_more = False
+        for execution in self._iter_matches(criteria, cursor=position):
+            if len(items) == limit:
+                has_more = True
+                break
+            items.append(execution)
+        next_cursor = self._cursor_for(items[-1]) if has_more else None
+        return ExecutionPage(items=items, next_cursor=next_cursor)
 
     def _matches_filter(
         self,
@@ -252,59 +648,140 @@ class QueryService:
         Returns:
             AnalyticsResult with aggregated metrics
         """
-        # Filter relevant executions
-        executions = await self.filter(
-            persona_id=persona_id,
-            since=since,
-            until=until,
-            limit=10000,  # Get all for analytics
-        )
-
-        if not executions:
+        low = _timestamp(since) if since else None
+        high = _timestamp(until) if until else None
+        persona_code = self._persona_codes.get(persona_id) if persona_id else None
+        if persona_id and persona_code is None:
             return AnalyticsResult()
 
-        # Calculate metrics
-        count = len(executions)
-        success_count = sum(1 for e in executions if e.outcome == ExecutionOutcome.SUCCESS)
-        failed_count = sum(1 for e in executions if e.outcome == ExecutionOutcome.FAILED)
-        success_rate = success_count / count if count > 0 else 0.0
-
-        durations = [e.duration_ms for e in executions if e.duration_ms is not None]
-        avg_duration = sum(durations) / len(durations) if durations else 0.0
-        min_duration = min(durations) if durations else None
-        max_duration = max(durations) if durations else None
+        count = success_count = failed_count = duration_count = 0
+        duration_sum = 0.0
+        min_duration: Optional[float] = None
+        max_duration: Optional[float] = None
+        total_tokens = 0
+        total_cost = 0.0
+        persona_counts: Dict[int, int] = {}
+        decisions_by_type: Dict[str, int] = {}
+        success_code = _OUTCOME_CODES[ExecutionOutcome.SUCCESS]
+        failed_code = _OUTCOME_CODES[ExecutionOutcome.FAILED]
 
-        total_tokens = sum(e.token_count or 0 for e in executions)
-        total_cost = sum(e.cost_usd or 0.0 for e in executions)
+        for key in self._partition_keys:
+            if low is not None and (key + 1) * self.partition_seconds < low:
+                continue
+            if high is not None and key * self.partition_seconds > high:
+                break
+            partition = self._partitions[key]
+            stats = self._aggregate_partition(partition, low, high, persona_code, success_code, failed_code)
+            if stats is None:
+                continue
+            rows, agg = stats
+            count += agg["count"]
+            success_count += agg["success"]
+            failed_count += agg["failed"]
+            duration_count += agg["duration_count"]
+            duration_sum += agg["duration_sum"]
+            if agg["duration_count"]:
+                min_duration = agg["duration_min"] if min_duration is None else min(min_duration, agg["duration_min"])
+                max_duration = agg["duration_max"] if max_duration is None else max(max_duration, agg["duration_max"])
+            total_tokens += agg["tokens"]
+            total_cost += agg["cost"]
+            for code, n in agg["personas"].items():
+                persona_counts[code] = persona_counts.get(code, 0) + n
+
+            # Decisions are variable-length, so count them per execution
+            for row in rows:
+                for d in partition.executions[row].decisions:
+                    dtype = d.decision_type.value
+                    decisions_by_type[dtype] = decisions_by_type.get(dtype, 0) + 1
+
+        if not count:
+            return AnalyticsResult()
 
-        # Count decisions by type
-        decisions_by_type: Dict[str, int] = {}
-        for e in executions:
-            for d in e.decisions:
-                dtype = d.decision_type.value
-                decisions_by_type[dtype] = decisions_by_type.get(dtype, 0) + 1
-
-        # Top personas
-        persona_counts: Dict[str, int] = {}
-        for e in executions:
-            pid = e.trace_context.persona_id
-            persona_counts[pid] = persona_counts.get(pid, 0) + 1
-        top_personas = sorted(persona_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_personas = sorted(
+            ((self._persona_names[code], n) for code, n in persona_counts.items()),
+            key=lambda x: x[1], reverse=True,
+        )[:10]
 
         return AnalyticsResult(
             count=count,
             success_count=success_count,
             failed_count=failed_count,
-            success_rate=success_rate,
-            avg_duration_ms=avg_duration,
-            min_duration_ms=min_duration,
-            max_duration_ms=max_duration,
+            success_rate=success_count / count,
+            avg_duration_ms=duration_sum / duration_count if duration_count else 0.0,
+            min_duration_ms=int(min_duration) if min_duration is not None else None,
+            max_duration_ms=int(max_duration) if max_duration is not None else None,
             total_tokens=total_tokens,
             total_cost_usd=total_cost,
             decisions_by_type=decisions_by_type,
             top_personas=top_personas,
         )
 
+    def _aggregate_partition(
+        self,
+        partition: _Partition,
+        low: Optional[float],
+        high: Optional[float],
+        persona_code: Optional[int],
+        success_code: int,
+        failed_code: int,
+    ) -> Optional[Tuple[List[int], Dict[str, Any]]]:
+        """Aggregate one partition's columns over rows matching time and persona."""
+        if NUMPY_AVAILABLE:
+            mask = np.frombuffer(partition.alive, dtype=np.uint8).astype(bool)
+            started = np.frombuffer(partition.started, dtype=np.float64)
+            if low is not None:
+                mask &= started >= low
+            if high is not None:
+                mask &= started <= high
+            personas = np.frombuffer(partition.persona, dtype=np.dtype(partition.persona.typecode))
+            if persona_code is not None:
+                mask &= personas == persona_code
+            rows = np.flatnonzero(mask)
+            if not len(rows):
+                return None
+            outcome = np.frombuffer(partition.outcome, dtype=np.int8)[rows]
+            duration = np.frombuffer(partition.duration, dtype=np.float64)[rows]
+            known = duration[~np.isnan(duration)]
+            codes, counts = np.unique(personas[rows], return_counts=True)
+            return rows.tolist(), {
+                "count": int(len(rows)),
+                "success": int(np.count_nonzero(outcome == success_code)),
+                "failed": int(np.count_nonzero(outcome == failed_code)),
+                "duration_count": int(len(known)),
+                "duration_sum": float(known.sum()),
+                "duration_min": float(known.min()) if len(known) else None,
+                "duration_max": float(known.max()) if len(known) else None,
+                "tokens": int(np.frombuffer(partition.tokens, dtype=np.int64)[rows].sum()),
+                "cost": float(np.frombuffer(partition.cost, dtype=np.float64)[rows].sum()),
+                "personas": dict(zip(codes.tolist(), counts.tolist())),
+            }
+
+        started = partition.started
+        rows = [
+            r for r in partition.rows()
+            if (low is None or started[r] >= low)
+            and (high is None or started[r] <= high)
+            and (persona_code is None or partition.persona[r] == persona_code)
+        ]
+        if not rows:
+            return None
+        known = [partition.duration[r] for r in rows if not math.isnan(partition.duration[r])]
+        personas: Dict[int, int] = {}
+        for r in rows:
+            personas[partition.persona[r]] = personas.get(partition.persona[r], 0) + 1
+        return rows, {
+            "count": len(rows),
+            "success": sum(1 for r in rows if partition.outcome[r] == success_code),
+            "failed": sum(1 for r in rows if partition.outcome[r] == failed_code),
+            "duration_count": len(known),
+            "duration_sum": sum(known),
+            "duration_min": min(known) if known else None,
+            "duration_max": max(known) if known else None,
+            "tokens": sum(partition.tokens[r] for r in rows),
+            "cost": sum(partition.cost[r] for r in rows),
+            "personas": personas,
+        }
+
     async def get_recent(
         self,
         limit: int = 10,
@@ -344,12 +821,7 @@ class QueryService:
         outcome: Optional[ExecutionOutcome] = None,
     ) -> int:
         """Count executions matching criteria."""
-        executions = await self.filter(
-            since=since,
-            outcome=outcome,
-            limit=100000,
-        )
-        return len(executions)
+        return sum(1 for _ in self._iter_matches({"since": since, "outcome": outcome}))
 
     def _record_to_tracked(self, record: Any) -> TrackedExecution:
         """Convert an ExecutionRecord to TrackedExecution."""
@@ -5,19 +5,128 @@ EPIC: MD-2558
 AC-3: Real-time streaming of execution progress
 
 Provides real-time event streaming via async generators.
+
+Fan-out is lock-free: publish() hands each event to every subscriber's
+bounded buffer without awaiting, so a slow subscriber only affects itself.
+When a buffer is full the subscriber's OverflowPolicy decides what happens;
+terminal events are always delivered. Callbacks run on a dispatcher task
+rather than inside publish().
 """
 
 import asyncio
+import inspect
 import logging
-from collections import defaultdict
-from datetime import datetime
-from typing import AsyncIterator, Callable, Dict, List, Optional, Set
-from uuid import UUID
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
 
 from .models import ExecutionEvent, EventType
 
 logger = logging.getLogger(__name__)
 
+TERMINAL_EVENT_TYPES = frozenset({
+    EventType.EXECUTION_COMPLETED,
+    EventType.EXECUTION_FAILED,
+    EventType.EXECUTION_CANCELLED,
+})
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a subscriber's buffer is full."""
+    DROP_OLDEST = "drop_oldest"    # Discard the oldest buffered event
+    DROP_NEWEST = "drop_newest"    # Discard the incoming event
+    COALESCE = "coalesce"          # Replace the newest buffered event of the same type
+    DISCONNECT = "disconnect"      # End the subscription with StreamOverflowError
+
+
+class StreamOverflowError(Exception):
+    """Raised to a subscriber disconnected by the DISCONNECT overflow policy."""
+
+    def __init__(self, execution_id: UUID, buffer_size: int):
+        super().__init__(f"Subscriber for execution {execution_id} exceeded buffer of {buffer_size} events")
+        self.execution_id = execution_id
+        self.buffer_size = buffer_size
+
+
+class _Subscription:
+    """Bounded event buffer for one subscriber."""
+
+    def __init__(
+        self,
+        execution_id: UUID,
+        buffer_size: int,
+        policy: OverflowPolicy,
+        event_types: Optional[List[EventType]] = None,
+    ):
+        self.execution_id = execution_id
+        self.buffer_size = buffer_size
+        self.policy = policy
+        self.event_types = frozenset(event_types) if event_types else None
+        self.buffer: Deque[ExecutionEvent] = deque()
+        self.ready = asyncio.Event()
+        self.closed = False
+        self.overflowed = False
+        self.dropped = 0
+
+    def offer(self, event: ExecutionEvent) -> bool:
+        """
+        Buffer an event without waiting, applying the overflow policy.
+
+        Returns:
+            True if the buffer overflowed
+        """
+        if self.closed:
+            return False
+        if self.event_types is not None and event.event_type not in self.event_types \
+                and event.event_type not in TERMINAL_EVENT_TYPES:
+            return False
+
+        if len(self.buffer) >= self.buffer_size:
+            if event.event_type in TERMINAL_EVENT_TYPES:
+                # Terminal events are never lost; make room for them
+                self._drop_oldest_non_terminal()
+            elif self.policy == OverflowPolicy.DROP_NEWEST:
+                self.dropped += 1
+                return True
+            elif self.policy == OverflowPolicy.DISCONNECT:
+                self.overflowed = True
+                self.closed = True
+                self.buffer.clear()
+                self.ready.set()
+                return True
+            elif self.policy == OverflowPolicy.COALESCE and self._replace_same_type(event):
+                self.dropped += 1
+                return True
+            else:
+                self._drop_oldest_non_terminal()
+            self.buffer.append(event)
+            self.ready.set()
+            return True
+
+        self.buffer.append(event)
+        self.ready.set()
+        return False
+
+    def _drop_oldest_non_terminal(self) -> None:
+        for i, buffered in enumerate(self.buffer):
+            if buffered.event_type not in TERMINAL_EVENT_TYPES:
+                del self.buffer[i]
+                self.dropped += 1
+                return
+
+    def _replace_same_type(self, event: ExecutionEvent) -> bool:
+        for i in range(len(self.buffer) - 1, -1, -1):
+            if self.buffer[i].event_type == event.event_type:
+                self.buffer[i] = event
+                return True
+        return False
+
+    def close(self) -> None:
+        self.closed = True
+        self.ready.set()
+
 
 class StreamPublisher:
     """
@@ -36,60 +145,118 @@ class StreamPublisher:
         await publisher.publish(event)
     """
 
-    def __init__(self, buffer_size: int = 1000):
+    def __init__(
+        self,
+        buffer_size: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ):
         """
         Initialize the publisher.
 
         Args:
-            buffer_size: Maximum events to buffer per execution
+            buffer_size: Maximum events to buffer per subscriber
+            overflow_policy: Default policy when a subscriber's buffer is full
         """
         self.buffer_size = buffer_size
-        self._queues: Dict[UUID, List[asyncio.Queue]] = defaultdict(list)
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        # Subscriber tuples are replaced, never mutated, so publish can iterate
+        # them without a lock
+        self._subscribers: Dict[UUID, Tuple[_Subscription, ...]] = {}
         self._completed: Set[UUID] = set()
-        self._callbacks: Dict[UUID, List[Callable[[ExecutionEvent], None]]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        self._completion_events: Dict[UUID, asyncio.Event] = {}
+        self._callbacks: Dict[UUID, List[Callable[[ExecutionEvent], Any]]] = {}
 
-        logger.info(f"StreamPublisher initialized with buffer_size={buffer_size}")
+        # Callback dispatch happens on a background task, in publish order
+        self._callback_queue: Optional[asyncio.Queue] = None
+        self._callback_task: Optional[asyncio.Task] = None
+        self.dropped_callbacks = 0
+
+        logger.info(f"StreamPublisher initialized with buffer_size={buffer_size}, "
+                    f"overflow_policy={self.overflow_policy.value}")
 
     async def publish(self, event: ExecutionEvent) -> None:
         """
         Publish an event to all subscribers.
 
+        Never waits on subscribers or callbacks.
+
         Args:
             event: The event to publish
         """
         execution_id = event.execution_id
 
-        async with self._lock:
-            queues = self._queues.get(execution_id, [])
-
-            # Publish to all subscriber queues
-            for queue in queues:
-                if queue.qsize() < self.buffer_size:
-                    await queue.put(event)
-                else:
-                    logger.warning(f"Buffer full for execution {execution_id}, dropping event")
+        for subscription in self._subscribers.get(execution_id, ()):
+            if subscription.offer(event) and (subscription.dropped <= 1 or subscription.dropped % self.buffer_size == 0):
+                logger.warning(f"Buffer full for execution {execution_id} "
+                               f"({subscription.policy.value}, {subscription.dropped} dropped)")
 
-            # Call synchronous callbacks
-            callbacks = self._callbacks.get(execution_id, [])
-            for callback in callbacks:
-                try:
-                    callback(event)
-                except Exception as e:
-                    logger.error(f"Callback error: {e}")
+        callbacks = self._callbacks.get(execution_id)
+        if callbacks:
+            self._dispatch_callbacks(event, tuple(callbacks))
 
         # Mark completion events
-        if event.event_type in (
-            EventType.EXECUTION_COMPLETED,
-            EventType.EXECUTION_FAILED,
-            EventType.EXECUTION_CANCELLED,
-        ):
+        if event.event_type in TERMINAL_EVENT_TYPES:
             self._completed.add(execution_id)
+            waiter = self._completion_events.get(execution_id)
+            if waiter is not None:
+                waiter.set()
+
+    def _dispatch_callbacks(self, event: ExecutionEvent, callbacks: Tuple[Callable, ...]) -> None:
+        if self._callback_task is None or self._callback_task.done():
+            self._callback_queue = asyncio.Queue(maxsize=self.buffer_size)
+            self._callback_task = asyncio.get_running_loop().create_task(
+                self._run_callbacks(self._callback_queue)
+            )
+        queue = self._callback_queue
+        if queue.full():
+            queue.get_nowait()
+            queue.task_done()
+            self.dropped_callbacks += 1
+            logger.warning("Callback queue full, dropping oldest event")
+        queue.put_nowait((event, callbacks))
+
+    @staticmethod
+    async def _run_callbacks(queue: asyncio.Queue) -> None:
+        """Invoke callbacks in publish order; async callbacks are awaited."""
+        while True:
+            event, callbacks = await queue.get()
+            try:
+                for callback in callbacks:
+                    try:
+                        result = callback(event)
+                        if inspect.isawaitable(result):
+                            await result
+                    except Exception as e:
+                        logger.error(f"Callback error: {e}")
+            finally:
+                queue.task_done()
+
+    async def drain_callbacks(self) -> None:
+        """Wait until every queued callback has run."""
+        if self._callback_task is not None and not self._callback_task.done():
+            await self._callback_queue.join()
+
+    async def close(self) -> None:
+        """Stop the callback dispatcher, discarding callbacks not yet run."""
+        task, queue = self._callback_task, self._callback_queue
+        self._callback_task = self._callback_queue = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        # Release anyone blocked in drain_callbacks()
+        while not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
 
     async def subscribe(
         self,
         execution_id: UUID,
         event_types: Optional[List[EventType]] = None,
+        overflow_policy: Optional[OverflowPolicy] = None,
     ) -> AsyncIterator[ExecutionEvent]:
         """
         Subscribe to events for an execution (AC-3).
@@ -97,72 +264,75 @@ class StreamPublisher:
         Args:
             execution_id: The execution to subscribe to
             event_types: Optional filter for specific event types
+            overflow_policy: Override the publisher's default overflow policy
 
         Yields:
             ExecutionEvents as they occur
-        """
-        queue: asyncio.Queue = asyncio.Queue(maxsize=self.buffer_size)
 
-        async with self._lock:
-            self._queues[execution_id].append(queue)
+        Raises:
+            StreamOverflowError: If disconnected by the DISCONNECT policy
+        """
+        subscription = _Subscription(
+            execution_id,
+            self.buffer_size,
+            OverflowPolicy(overflow_policy or self.overflow_policy),
+            event_types,
+        )
+        self._subscribers[execution_id] = self._subscribers.get(execution_id, ()) + (subscription,)
 
         try:
             while True:
-                # Check if execution is complete
-                if execution_id in self._completed and queue.empty():
-                    break
-
-                try:
-                    # Wait for events with timeout to check completion
-                    event = await asyncio.wait_for(queue.get(), timeout=1.0)
+                if not subscription.buffer:
+                    # Execution already finished (or publisher cleaned up)
+                    if subscription.closed or execution_id in self._completed:
+                        break
+                    subscription.ready.clear()
+                    await subscription.ready.wait()
+                    continue
 
-                    # Filter by event type if specified
-                    if event_types and event.event_type not in event_types:
-                        continue
+                event = subscription.buffer.popleft()
 
+                # Filter by event type if specified
+                if subscription.event_types is None or event.event_type in subscription.event_types:
                     yield event
 
-                    # Stop on terminal events
-                    if event.event_type in (
-                        EventType.EXECUTION_COMPLETED,
-                        EventType.EXECUTION_FAILED,
-                        EventType.EXECUTION_CANCELLED,
-                    ):
-                        break
+                # Stop on terminal events
+                if event.event_type in TERMINAL_EVENT_TYPES:
+                    break
 
-                except asyncio.TimeoutError:
-                    # Check completion status periodically
-                    continue
+            if subscription.overflowed:
+                raise StreamOverflowError(execution_id, self.buffer_size)
 
         finally:
             # Cleanup
-            async with self._lock:
-                if execution_id in self._queues:
-                    try:
-                        self._queues[execution_id].remove(queue)
-                    except ValueError:
-                        pass
-                    if not self._queues[execution_id]:
-                        del self._queues[execution_id]
+            subscription.closed = True
+            remaining = tuple(s for s in self._subscribers.get(execution_id, ()) if s is not subscription)
+            if remaining:
+                self._subscribers[execution_id] = remaining
+            else:
+                self._subscribers.pop(execution_id, None)
 
     def add_callback(
         self,
         execution_id: UUID,
-        callback: Callable[[ExecutionEvent], None],
+        callback: Callable[[ExecutionEvent], Any],
     ) -> None:
         """
-        Add a synchronous callback for events.
+        Add a callback for events.
+
+        Callbacks run on the publisher's dispatcher task after publish()
+        returns; coroutine functions are awaited.
 
         Args:
             execution_id: The execution to receive callbacks for
             callback: Function to call with each event
         """
-        self._callbacks[execution_id].append(callback)
+        self._callbacks.setdefault(execution_id, []).append(callback)
 
     def remove_callback(
         self,
         execution_id: UUID,
-        callback: Callable[[ExecutionEvent], None],
+        callback: Callable[[ExecutionEvent], Any],
     ) -> None:
         """Remove a callback."""
         if execution_id in self._callbacks:
@@ -170,6 +340,8 @@ class StreamPublisher:
                 self._callbacks[execution_id].remove(callback)
             except ValueError:
                 pass
+            if not self._callbacks[execution_id]:
+                del self._callbacks[execution_id]
 
     async def wait_for_completion(
         self,
@@ -186,17 +358,15 @@ class StreamPublisher:
         Returns:
             True if completed, False if timeout
         """
-        start = datetime.utcnow()
+        if execution_id in self._completed:
+            return True
 
-        while True:
-            if execution_id in self._completed:
-                return True
-
-            elapsed = (datetime.utcnow() - start).total_seconds()
-            if timeout and elapsed > timeout:
-                return False
-
-            await asyncio.sleep(0.1)
+        waiter = self._completion_events.setdefault(execution_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(waiter.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
     def is_complete(self, execution_id: UUID) -> bool:
         """Check if an execution is complete."""
@@ -204,13 +374,94 @@ class StreamPublisher:
 
     def subscriber_count(self, execution_id: UUID) -> int:
         """Get the number of subscribers for an execution."""
-        return len(self._queues.get(execution_id, []))
+        return len(self._subscribers.get(execution_id, ()))
+
+    def dropped_count(self, execution_id: UUID) -> int:
+        """Events dropped or coalesced across an execution's current subscribers."""
+        return sum(s.dropped for s in self._subscribers.get(execution_id, ()))
 
     async def cleanup(self, execution_id: UUID) -> None:
         """Clean up resources for a completed execution."""
-        async with self._lock:
-            if execution_id in self._queues:
-                del self._queues[execution_id]
-            if execution_id in self._callbacks:
-                del self._callbacks[execution_id]
-            self._completed.discard(execution_id)
+        for subscription in self._subscribers.pop(execution_id, ()):
+            subscription.close()
+        stop_dispatcher = (
+            self._callbacks.pop(execution_id, None) is not None
+            and not self._callbacks
+            and asyncio.current_task() is not self._callback_task
+        )
+        if stop_dispatcher:
+            # Last registered callbacks gone: let queued ones finish, then
+            # stop the dispatcher (publish restarts it on demand)
+            await self.drain_callbacks()
+            await self.close()
+        self._completion_events.pop(execution_id, None)
+        self._completed.discard(execution_id)
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+async def benchmark_fanout(
+    subscriber_counts: Tuple[int, ...] = (1, 10, 100, 1000),
+    events: int = 2000,
+    buffer_size: int = 1000,
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+) -> List[Dict[str, Any]]:
+    """
+    Measure publish throughput against subscriber count.
+
+    Subscribers consume concurrently with the publisher; the run ends when
+    every subscriber has received the terminal event.
+
+    Returns:
+        One result per subscriber count with events/sec and delivery counts
+    """
+    results = []
+    for count in subscriber_counts:
+        publisher = StreamPublisher(buffer_size=buffer_size, overflow_policy=overflow_policy)
+        execution_id = uuid4()
+        received = [0] * count
+
+        async def consume(index: int) -> None:
+            async for _ in publisher.subscribe(execution_id):
+                received[index] += 1
+
+        consumers = [asyncio.create_task(consume(i)) for i in range(count)]
+        await asyncio.sleep(0)
+
+        start = time.perf_counter()
+        for n in range(events - 1):
+            await publisher.publish(ExecutionEvent(
+                execution_id=execution_id,
+                event_type=EventType.PROGRESS_UPDATE,
+                progress_percent=100.0 * n / events,
+            ))
+            if n % 100 == 0:
+                await asyncio.sleep(0)
+        await publisher.publish(ExecutionEvent(
+            execution_id=execution_id, event_type=EventType.EXECUTION_COMPLETED
+        ))
+        publish_elapsed = time.perf_counter() - start
+        await asyncio.gather(*consumers)
+        total_elapsed = time.perf_counter() - start
+
+        results.append({
+            "subscribers": count,
+            "events": events,
+            "publish_events_per_sec": events / publish_elapsed if publish_elapsed else float("inf"),
+            "delivered_events_per_sec": sum(received) / total_elapsed if total_elapsed else float("inf"),
+            "delivered": sum(received),
+            "dropped": events * count - sum(received),
+        })
+    return results
+
+
+if __name__ == "__main__":
+    for row in asyncio.run(benchmark_fanout()):
+        print(
+            f"{row['subscribers']:>5} subscribers: "
+            f"{row['publish_events_per_sec']:>10.0f} published/s, "
+            f"{row['delivered_events_per_sec']:>10.0f} delivered/s, "
+            f"{row['dropped']} dropped"
+        )
@@ -17,7 +17,7 @@ AC-5: Queryable execution history for analytics
 import asyncio
 import logging
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from uuid import UUID, uuid4
 
@@ -31,7 +31,7 @@ from .models import (
     EventType,
     DecisionType,
 )
-from .stream import StreamPublisher
+from .stream import OverflowPolicy, StreamPublisher
 from .query import QueryService
 
 logger = logging.getLogger(__name__)
@@ -90,11 +90,16 @@ class ExecutionTracker:
 
         # Event streaming (AC-3)
         self._stream_publisher = StreamPublisher(
-            buffer_size=self.config.stream_buffer_size
+            buffer_size=self.config.stream_buffer_size,
+            overflow_policy=OverflowPolicy(self.config.stream_overflow_policy),
         )
 
         # Query service (AC-5)
-        self._query_service = QueryService(history_store=history_store)
+        self._query_service = QueryService(
+            history_store=history_store,
+            max_executions=self.config.query_max_executions,
+            retention=timedelta(days=self.config.retention_days),
+        )
 
         logger.info(f"ExecutionTracker initialized (enabled={self.config.enabled})")
 
@@ -356,6 +361,7 @@ class ExecutionTracker:
         )
         execution.token_count = token_count
         execution.cost_usd = cost_usd
+        self._query_service.cache_execution(execution)
 
         # Store in history (AC-4)
         await self._store_in_history(execution)
@@ -406,6 +412,7 @@ class ExecutionTracker:
             error_message=error_message,
             error_details=error_details,
         )
+        self._query_service.cache_execution(execution)
 
         # Store in history (AC-4)
         await self._store_in_history(execution)
@@ -443,6 +450,7 @@ class ExecutionTracker:
         execution.completed_at = datetime.utcnow()
         execution.duration_ms = int((execution.completed_at - execution.started_at).total_seconds() * 1000)
         execution.error_message = reason
+        self._query_service.cache_execution(execution)
 
         await self._store_in_history(execution)
 
@@ -1025,15 +1025,28 @@ class TeamExecutionEngineV2:
     - Contract-first parallel execution
     - Separation of personas and contracts
     """
-    
+
+    # Quality Fabric validation stage defaults (STEP 6)
+    qf_max_concurrent_validations: int = 4
+    qf_max_file_bytes: int = 1024 * 1024
+
     def __init__(
         self,
         output_dir: Optional[str] = None,
         session_manager: Optional[SessionManager] = None,
-        contract_manager: Optional[ContractManager] = None
+        contract_manager: Optional[ContractManager] = None,
+        qf_max_concurrent_validations: Optional[int] = None,
+        qf_max_file_bytes: Optional[int] = None
     ):
         self.output_dir = Path(output_dir or OUTPUT_CONFIG.get("default_output_dir", "./generated_project"))
         self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Quality Fabric validation limits: personas validated in parallel and
+        # bytes read per created file
+        if qf_max_concurrent_validations is not None:
+            self.qf_max_concurrent_validations = max(1, qf_max_concurrent_validations)
+        if qf_max_file_bytes is not None:
+            self.qf_max_file_bytes = qf_max_file_bytes
         
         self.session_manager = session_manager or SessionManager()
         # contract_manager will need StateManager - for now skip it
@@ -1179,6 +1192,123 @@ class TeamExecutionEngineV2:
             logger.warning(f"Enforcer check failed (allowing action): {e}")
             return True  # Fail-open for backward compatibility (AC-4)
 
+    # =========================================================================
+    # QUALITY FABRIC VALIDATION HELPERS
+    # =========================================================================
+
+    def _read_file_capped(self, file_path: str) -> str:
+        """Read up to qf_max_file_bytes of a created file, trying output_dir as a fallback."""
+        try:
+            path = Path(file_path)
+            if not path.is_file():
+                path = self.output_dir / file_path
+                if not path.is_file():
+                    return ""
+            with open(path, "rb") as f:
+                data = f.read(self.qf_max_file_bytes)
+            return data.decode("utf-8", errors="replace")
+        except Exception as e:
+            logger.warning(f"Failed to read file {file_path}: {e}")
+            return ""
+
+    async def _read_created_files(self, file_paths: List[str]) -> Dict[str, str]:
+        """
+        Read each distinct created file once, off the event loop.
+
+        Args:
+            file_paths: Paths reported by personas (duplicates allowed)
+
+        Returns:
+            Mapping of path to (size-capped) content
+        """
+        unique_paths = list(dict.fromkeys(file_paths))
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(self._read_file_capped, f) for f in unique_paths)
+        )
+        return dict(zip(unique_paths, contents))
+
+    @staticmethod
+    def _build_qf_output(persona_result: ExecutionResult, contents: Dict[str, str]) -> Dict[str, Any]:
+        """Build the Quality Fabric artifact payload from pre-read file contents."""
+        files = persona_result.files_created
+
+        def artifacts(selected):
+            return [{"name": f, "content": contents.get(f, "")} for f in files if selected(f)]
+
+        return {
+            "code_files": artifacts(lambda f: f.endswith(('.py', '.ts', '.js', '.java'))),
+            "test_files": artifacts(lambda f: 'test' in f.lower()),
+            "documentation": artifacts(lambda f: f.endswith(('.md', '.rst', '.txt'))),
+            "config_files": artifacts(lambda f: f.endswith(('.yaml', '.yml', '.json', '.toml'))),
+            "metadata": {
+                "quality_score": persona_result.quality_score,
+                "completeness_score": persona_result.completeness_score,
+                "contract_fulfilled": persona_result.contract_fulfilled
+            }
+        }
+
+    async def _validate_personas_concurrently(
+        self,
+        qf_client: Any,
+        persona_results: Dict[str, ExecutionResult],
+        persona_type_mapping: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate every persona's output with Quality Fabric.
+
+        Files are read once up front and shared between personas and artifact
+        categories; at most qf_max_concurrent_validations requests are in
+        flight. A persona whose validation fails gets an ``error`` entry
+        instead of aborting the whole stage.
+
+        Args:
+            qf_client: QualityFabricClient instance
+            persona_results: Persona execution results keyed by persona ID
+            persona_type_mapping: Normalised persona ID -> QFPersonaType
+
+        Returns:
+            Validation summaries keyed by persona ID, in persona order
+        """
+        contents = await self._read_created_files(
+            [f for result in persona_results.values() for f in result.files_created]
+        )
+        semaphore = asyncio.Semaphore(self.qf_max_concurrent_validations)
+
+        async def validate(persona_id, persona_result):
+            # Determine persona type from ID
+            persona_type_key = persona_id.lower().replace("-", "_").replace(" ", "_")
+            qf_persona_type = persona_type_mapping.get(persona_type_key)
+            if qf_persona_type is None:
+                qf_persona_type = QFPersonaType.BACKEND_DEVELOPER
+            output = self._build_qf_output(persona_result, contents)
+
+            async with semaphore:
+                try:
+                    validation = await qf_client.validate_persona_output(
+                        persona_id=persona_id,
+                        persona_type=qf_persona_type,
+                        output=output
+                    )
+                except Exception as e:
+                    logger.warning(f"   {persona_id}: validation failed: {e}")
+                    return {"error": str(e)}
+
+            logger.info(f"   {persona_id}: {validation.status} ({validation.overall_score:.0f}%)")
+            return {
+                "status": validation.status,
+                "overall_score": validation.overall_score,
+                "gates_passed": validation.gates_passed,
+                "gates_failed": validation.gates_failed,
+                "recommendations": validation.recommendations,
+                "requires_revision": validation.requires_revision
+            }
+
+        persona_ids = list(persona_results)
+        summaries = await asyncio.gather(
+            *(validate(pid, persona_results[pid]) for pid in persona_ids)
+        )
+        return dict(zip(persona_ids, summaries))
+
     async def execute(
         self,
         requirement: str,
@@ -1483,47 +1613,16 @@ class TeamExecutionEngineV2:
                     "ux_designer": QFPersonaType.UX_DESIGNER,
                 }
 
-                # Validate each persona's output
-                for persona_id, persona_result in execution_result.persona_results.items():
-                    # Determine persona type from ID
-                    persona_type_key = persona_id.lower().replace("-", "_").replace(" ", "_")
-                    qf_persona_type = persona_type_mapping.get(persona_type_key, QFPersonaType.BACKEND_DEVELOPER)
-
-                    # Prepare artifacts for Quality Fabric
-                    output = {
-                        "code_files": [{"name": f, "content": self._read_file_safe(f)} for f in persona_result.files_created if f.endswith(('.py', '.ts', '.js', '.java'))],
-                        "test_files": [{"name": f, "content": self._read_file_safe(f)} for f in persona_result.files_created if 'test' in f.lower()],
-                        "documentation": [{"name": f, "content": self._read_file_safe(f)} for f in persona_result.files_created if f.endswith(('.md', '.rst', '.txt'))],
-                        "config_files": [{"name": f, "content": self._read_file_safe(f)} for f in persona_result.files_created if f.endswith(('.yaml', '.yml', '.json', '.toml'))],
-                        "metadata": {
-                            "quality_score": persona_result.quality_score,
-                            "completeness_score": persona_result.completeness_score,
-                            "contract_fulfilled": persona_result.contract_fulfilled
-                        }
-                    }
-
-                    # Call Quality Fabric
-                    validation = await qf_client.validate_persona_output(
-                        persona_id=persona_id,
-                        persona_type=qf_persona_type,
-                        output=output
-                    )
-
-                    qf_validations[persona_id] = {
-                        "status": validation.status,
-                        "overall_score": validation.overall_score,
-                        "gates_passed": validation.gates_passed,
-                        "gates_failed": validation.gates_failed,
-                        "recommendations": validation.recommendations,
-                        "requires_revision": validation.requires_revision
-                    }
-
-                    logger.info(f"   {persona_id}: {validation.status} ({validation.overall_score:.0f}%)")
+                # Read every created file once, then validate personas concurrently
+                qf_validations = await self._validate_personas_concurrently(
+                    qf_client, execution_result.persona_results, persona_type_mapping
+                )
 
                 # Evaluate phase gate
                 persona_results_for_gate = [
                     {"persona_id": pid, "overall_score": v["overall_score"]}
                     for pid, v in qf_validations.items()
+                    if "error" not in v
                 ]
 
                 phase_gate = await qf_client.evaluate_phase_gate(
@@ -8,17 +8,20 @@ AC-2: Process restart auto-resumes from checkpoint
 
 This module integrates with existing StateManager and CheckpointManager
 to provide persistent state management for the unified execution module.
+Checkpoints are written to a content-addressed CheckpointStore, so persona
+state that has not changed is shared between checkpoints.
 """
 
 import asyncio
 import logging
 import os
 import threading
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, fields
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, TypeVar
 
+from ..execution.checkpoint_store import CheckpointIntegrityError, CheckpointStore, ManifestEntry
 from .config import ExecutionConfig, StateConfig, get_execution_config
 
 logger = logging.getLogger(__name__)
@@ -77,13 +80,15 @@ class StatePersistence:
 
     Integrates with:
     - StateManager: Thread-safe in-memory state with notifications
-    - CheckpointManager: Atomic disk persistence with SHA-256 verification
+    - CheckpointStore: Content-addressed, compressed checkpoints with a manifest
+    - CheckpointManager: Restore of checkpoints written by earlier versions
 
     Features:
     - AC-1: Persists to /var/maestro/state by default
     - AC-2: Auto-restore from latest checkpoint on startup
     - Thread-safe operations
     - Atomic writes (temp file + rename)
+    - One chunk per persona state, so unchanged personas are not rewritten
     - Auto-checkpoint at configurable intervals
     """
 
@@ -118,6 +123,9 @@ class StatePersistence:
         # Try to integrate with existing infrastructure
         self._state_manager = self._get_state_manager()
         self._checkpoint_manager = self._get_checkpoint_manager()
+        self._checkpoint_store = CheckpointStore(
+            self._checkpoint_dir, split_keys=("persona_states",)
+        )
 
         # Auto-restore from checkpoint (AC-2)
         if auto_restore and self._workflow_id:
@@ -308,74 +316,64 @@ class StatePersistence:
         """
         Create a checkpoint of current state.
 
+        The state checksum is the checkpoint's content hash (tree hash in the
+        CheckpointStore), so it is computed from per-field chunk hashes rather
+        than a second serialisation of the whole state.
+
         Args:
             checkpoint_id: Optional checkpoint ID (auto-generated if None)
 
         Returns:
             Checkpoint ID
         """
-        import hashlib
-        import json
-
         with self._lock:
             # Generate checkpoint ID
             cp_id = checkpoint_id or f"cp_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
 
-            # Compute checksum
-            state_bytes = json.dumps(self._state.to_dict(), sort_keys=True).encode()
-            self._state.checksum = hashlib.sha256(state_bytes).hexdigest()
+            # Shallow field map: the store serialises each field (and each
+            # persona state) as its own chunk
+            data = {
+                f.name: getattr(self._state, f.name)
+                for f in fields(self._state)
+                if f.name != "checksum"
+            }
+            entry = self._checkpoint_store.save(
+                self._workflow_id,
+                data,
+                checkpoint_id=cp_id,
+                phase=self._state.phase,
+                metadata={"step": self._state.step, "status": self._state.status},
+            )
+            self._state.checksum = entry.tree
 
-            if self._checkpoint_manager:
-                # Use CheckpointManager for atomic writes
-                try:
-                    from maestro_hive.maestro.state.checkpoint import WorkflowState, StateMetadata
+            pruned = self._checkpoint_store.prune(
+                self._workflow_id, keep=self.state_config.max_checkpoints_per_workflow
+            )
 
-                    workflow_state = WorkflowState(
-                        workflow_id=self._workflow_id,
-                        phase=self._state.phase,
-                        step=self._state.step,
-                        data=self._state.to_dict(),
-                        metadata=StateMetadata(executor_version="2.1"),
-                        checksum=self._state.checksum,
-                    )
+        # Garbage collection walks the whole shared store, so it runs only
+        # every so many deletions, and outside the state lock
+        if pruned:
+            self._checkpoint_store.maybe_gc()
 
-                    cp = self._checkpoint_manager.create_checkpoint(
-                        workflow_id=self._workflow_id,
-                        state=workflow_state,
-                    )
-                    logger.info(f"Checkpoint created via CheckpointManager: {cp.checkpoint_id}")
-                    return cp.checkpoint_id
-                except Exception as e:
-                    logger.warning(f"CheckpointManager failed, using fallback: {e}")
-
-            # Fallback: Direct file write
-            cp_path = self._checkpoint_dir / f"{self._workflow_id}_{cp_id}.json"
-            self._atomic_write(cp_path, state_bytes)
-            logger.info(f"Checkpoint created: {cp_path}")
-            return cp_id
-
-    def _atomic_write(self, path: Path, data: bytes) -> None:
-        """Atomically write data to file."""
-        import tempfile
-
-        # Write to temp file, then rename
-        temp_fd, temp_path = tempfile.mkstemp(
-            suffix=".tmp",
-            dir=path.parent,
+        logger.info(
+            f"Checkpoint created: {cp_id} ({entry.size_bytes} bytes, "
+            f"{entry.stored_bytes} bytes written)"
         )
+        return cp_id
 
+    def _restore_entry(self, entry: ManifestEntry) -> bool:
+        """Restore state from a CheckpointStore manifest entry."""
         try:
-            with os.fdopen(temp_fd, "wb") as f:
-                f.write(data)
-                f.flush()
-                os.fsync(f.fileno())
-            os.rename(temp_path, path)
-        except Exception:
-            try:
-                os.unlink(temp_path)
-            except OSError:
-                pass
-            raise
+            data = self._checkpoint_store.load_tree(
+                entry.tree, verify=self.state_config.verify_checksum_on_load
+            )
+        except CheckpointIntegrityError as e:
+            logger.error(f"Checkpoint {entry.checkpoint_id} failed integrity check: {e}")
+            return False
+        data["checksum"] = entry.tree
+        self._state = ExecutionState.from_dict(data)
+        logger.info(f"State restored from checkpoint: {entry.checkpoint_id}")
+        return True
 
     def restore(self, checkpoint_id: str) -> bool:
         """
@@ -390,6 +388,10 @@ class StatePersistence:
         import json
 
         with self._lock:
+            entry = self._checkpoint_store.get_entry(self._workflow_id, checkpoint_id)
+            if entry and self._restore_entry(entry):
+                return True
+
             if self._checkpoint_manager:
                 try:
                     cp = self._checkpoint_manager.get_checkpoint(
@@ -424,6 +426,10 @@ class StatePersistence:
         import json
 
         with self._lock:
+            entry = self._checkpoint_store.latest(self._workflow_id)
+            if entry and self._restore_entry(entry):
+                return True
+
             if self._checkpoint_manager:
                 try:
                     latest = self._checkpoint_manager.get_latest_checkpoint(
@@ -455,12 +461,21 @@ class StatePersistence:
 
     def list_checkpoints(self) -> List[Dict[str, Any]]:
         """List all available checkpoints for this workflow."""
-        checkpoints = []
+        checkpoints = [
+            {
+                "checkpoint_id": entry.checkpoint_id,
+                "version": entry.version,
+                "created_at": entry.created_at,
+            }
+            for entry in self._checkpoint_store.entries(self._workflow_id)
+        ]
 
         if self._checkpoint_manager:
             try:
                 cps = self._checkpoint_manager.list_checkpoints(self._workflow_id)
                 for cp in cps:
+                    if any(c["checkpoint_id"] == cp.checkpoint_id for c in checkpoints):
+                        continue
                     checkpoints.append({
                         "checkpoint_id": cp.checkpoint_id,
                         "version": cp.version,
@@ -23,10 +23,15 @@ Message Flow:
 """
 
 import asyncio
+import json
 import logging
 import os
+import sqlite3
 import sys
+import threading
+import time
 import uuid
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -115,18 +120,141 @@ class DAGWorkflowExecute(BaseModel):
 # WebSocket Connection Manager
 # ---------------------------------------------------------------------------
 
+# Message types where a newer event for the same execution/node supersedes an
+# older one still waiting in a client's queue
+COALESCED_MESSAGE_TYPES = {'phase_progress', 'workflow_progress', 'execution_progress', 'status_update'}
+
+# WebSocket close code used when a client cannot keep up with the event rate
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class ClientChannel:
+    """
+    Outbound queue for a single WebSocket client.
+
+    Payloads are pre-serialised JSON strings shared between clients. A drain
+    task sends them in order so a slow socket only delays itself. A progress
+    event replaces the pending one with the same coalesce key in place, but
+    only while nothing uncoalesced has been queued after it; otherwise it is
+    appended, so it is never delivered ahead of an event it followed.
+    """
+
+    def __init__(self, websocket: WebSocket, workflow_id: str, max_queue: int, send_timeout: float):
+        self.websocket = websocket
+        self.workflow_id = workflow_id
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self._queue: Dict[int, str] = {}
+        self._keys: Dict[Any, int] = {}
+        self._slot_keys: Dict[int, Any] = {}
+        self._next_slot = 0
+        self._barrier = -1  # slot of the newest uncoalesced payload
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.sent = 0
+        self.coalesced = 0
+
+    def start(self, on_failure) -> None:
+        """Start the drain task; on_failure(channel, reason) is called if sending fails"""
+        self._task = asyncio.create_task(self._drain(on_failure))
+
+    def offer(self, payload: str, coalesce_key: Any = None) -> bool:
+        """
+        Queue a payload without waiting.
+
+        Returns:
+            False if the queue is full (the client is too slow)
+        """
+        if self.closed:
+            return True
+        if coalesce_key is not None:
+            slot = self._keys.get(coalesce_key)
+            if slot is not None and slot > self._barrier:
+                self._queue[slot] = payload
+                self.coalesced += 1
+                return True
+        if len(self._queue) >= self.max_queue:
+            return False
+
+        slot = self._next_slot
+        self._next_slot += 1
+        self._queue[slot] = payload
+        if coalesce_key is not None:
+            # Only the newest pending event for a key is ever replaced
+            self._keys[coalesce_key] = slot
+            self._slot_keys[slot] = coalesce_key
+        else:
+            self._barrier = slot
+        self._ready.set()
+        return True
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    async def _drain(self, on_failure) -> None:
+        try:
+            while not self.closed:
+                await self._ready.wait()
+                while self._queue:
+                    slot = next(iter(self._queue))
+                    payload = self._queue.pop(slot)
+                    key = self._slot_keys.pop(slot, None)
+                    if key is not None and self._keys.get(key) == slot:
+                        del self._keys[key]
+                    await asyncio.wait_for(self.websocket.send_text(payload), self.send_timeout)
+                    self.sent += 1
+                self._ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            on_failure(self, f"send timed out after {self.send_timeout}s")
+        except Exception as e:
+            on_failure(self, str(e))
+
+    async def close(self, code: Optional[int] = None, reason: str = "") -> None:
+        """Stop draining and optionally close the socket"""
+        self.closed = True
+        self._queue.clear()
+        self._keys.clear()
+        self._slot_keys.clear()
+        if self._task and self._task is not asyncio.current_task():
+            self._task.cancel()
+        if code is not None:
+            try:
+                await self.websocket.close(code=code, reason=reason)
+            except Exception:
+                pass
+
+
 class ConnectionManager:
-    """Manages WebSocket connections for workflow updates"""
+    """
+    Manages WebSocket connections for workflow updates.
 
-    def __init__(self):
+    broadcast() serialises each message once and hands it to per-client
+    queues, so it never waits on a socket. Clients whose queue overflows or
+    whose send times out are disconnected.
+    """
+
+    def __init__(self, max_queue: int = 256, send_timeout: float = 10.0):
         self.active_connections: Dict[str, List[WebSocket]] = {}
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self._channels: Dict[WebSocket, ClientChannel] = {}
+        self.evicted_clients = 0
 
     async def connect(self, websocket: WebSocket, workflow_id: str):
         """Accept and track WebSocket connection"""
         await websocket.accept()
-        if workflow_id not in self.active_connections:
-            self.active_connections[workflow_id] = []
-        self.active_connections[workflow_id].append(websocket)
+        self.register(websocket, workflow_id)
+
+    def register(self, websocket: WebSocket, workflow_id: str):
+        """Track an already-accepted WebSocket connection"""
+        self.active_connections.setdefault(workflow_id, []).append(websocket)
+        channel = ClientChannel(websocket, workflow_id, self.max_queue, self.send_timeout)
+        self._channels[websocket] = channel
+        channel.start(self._on_send_failure)
         logger.info(f"📡 WebSocket connected for workflow: {workflow_id} (total: {len(self.active_connections[workflow_id])})")
 
     def disconnect(self, websocket: WebSocket, workflow_id: str):
@@ -136,38 +264,181 @@ class ConnectionManager:
                 self.active_connections[workflow_id].remove(websocket)
             if not self.active_connections[workflow_id]:
                 del self.active_connections[workflow_id]
+        channel = self._channels.pop(websocket, None)
+        if channel:
+            asyncio.ensure_future(channel.close())
         logger.info(f"📡 WebSocket disconnected for workflow: {workflow_id}")
 
+    def _evict(self, channel: ClientChannel, reason: str):
+        """Drop a client that cannot keep up"""
+        if self._channels.get(channel.websocket) is not channel:
+            return
+        self.evicted_clients += 1
+        logger.warning(f"🐢 Evicting slow WebSocket client for workflow {channel.workflow_id}: {reason}")
+        self.disconnect(channel.websocket, channel.workflow_id)
+        asyncio.ensure_future(channel.close(SLOW_CONSUMER_CLOSE_CODE, "Slow consumer"))
+
+    def _on_send_failure(self, channel: ClientChannel, reason: str):
+        self._evict(channel, reason)
+
+    @staticmethod
+    def _coalesce_key(message: dict) -> Any:
+        if message.get('type') in COALESCED_MESSAGE_TYPES:
+            return (message.get('type'), message.get('execution_id'), message.get('node_id'))
+        return None
+
     async def broadcast(self, workflow_id: str, message: dict):
         """Broadcast message to all connected clients for this workflow"""
-        import sys
-        sys.stderr.write(f"DEBUG broadcast(): workflow_id={workflow_id}, has_connections={workflow_id in self.active_connections}\n")
-        sys.stderr.flush()
+        websockets = self.active_connections.get(workflow_id)
+        if not websockets:
+            return
 
-        if workflow_id in self.active_connections:
-            logger.info(f"📤 Broadcasting to {len(self.active_connections[workflow_id])} clients: {message.get('type')}")
-            for connection in self.active_connections[workflow_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception as e:
-                    logger.error(f"Error broadcasting to WebSocket: {e}")
+        payload = json.dumps(message, default=str)
+        key = self._coalesce_key(message)
+        logger.debug(f"📤 Broadcasting to {len(websockets)} clients: {message.get('type')}")
+        for websocket in list(websockets):
+            channel = self._channels.get(websocket)
+            if channel and not channel.offer(payload, key):
+                self._evict(channel, f"queue full ({channel.max_queue} messages)")
+
+    async def send_personal(self, websocket: WebSocket, message: dict):
+        """Queue a message for one client, behind anything already queued for it"""
+        channel = self._channels.get(websocket)
+        if channel is None:
+            await websocket.send_json(message)
+        elif not channel.offer(json.dumps(message, default=str)):
+            self._evict(channel, f"queue full ({channel.max_queue} messages)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Connection and queue statistics"""
+        channels = list(self._channels.values())
+        return {
+            'workflows': len(self.active_connections),
+            'clients': len(channels),
+            'queued_messages': sum(c.pending for c in channels),
+            'sent_messages': sum(c.sent for c in channels),
+            'coalesced_messages': sum(c.coalesced for c in channels),
+            'evicted_clients': self.evicted_clients
+        }
 
-        sys.stderr.write(f"DEBUG broadcast(): completed\n")
-        sys.stderr.flush()
+    async def close_all(self):
+        """Close every client channel (used on shutdown)"""
+        for websocket, channel in list(self._channels.items()):
+            self.disconnect(websocket, channel.workflow_id)
+            await channel.close(1001, "Server shutting down")
 
 
 # ---------------------------------------------------------------------------
-# In-Memory Execution Store
+# Execution Store
 # ---------------------------------------------------------------------------
 
 class ExecutionStore:
-    """Simple in-memory store for execution status"""
+    """
+    Execution status store.
 
-    def __init__(self):
+    Records live in memory; when db_path is given every change is also
+    written through to SQLite (WAL mode) together with the workflow
+    definition and completed phase outputs, so executions survive an API
+    restart and can be resumed.
+
+    Unfinished rows carry an owner and a lease. Writes and renew_leases()
+    extend the lease; another process only resumes an execution after
+    claim() takes over an expired (or unowned) lease.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, lease_seconds: float = 60.0):
         self.executions: Dict[str, Dict[str, Any]] = {}
         self.phase_status: Dict[str, Dict[str, str]] = {}  # execution_id -> {node_id: status}
+        self.definitions: Dict[str, Dict[str, Any]] = {}  # execution_id -> {nodes, edges}
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.owner_id = f"{os.getpid()}-{uuid.uuid4().hex[:12]}"
+        self._conn = None
+
+        if db_path:
+            if db_path != ":memory:":
+                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            with self._conn:
+                self._conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS executions (
+                        execution_id TEXT PRIMARY KEY,
+                        workflow_id TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        updated_at TEXT NOT NULL,
+                        record TEXT NOT NULL,
+                        definition TEXT,
+                        owner TEXT,
+                        lease_expires REAL
+                    )
+                    """
+                )
+                columns = {row[1] for row in self._conn.execute("PRAGMA table_info(executions)")}
+                for column, sql_type in (('owner', 'TEXT'), ('lease_expires', 'REAL')):
+                    if column not in columns:
+                        self._conn.execute(f"ALTER TABLE executions ADD COLUMN {column} {sql_type}")
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_executions_status ON executions(status)"
+                )
+            self._load()
+
+    def _load(self):
+        """Load persisted executions into memory"""
+        rows = self._conn.execute(
+            "SELECT execution_id, record, definition FROM executions ORDER BY rowid"
+        ).fetchall()
+        for execution_id, record, definition in rows:
+            self._cache_row(execution_id, record, definition)
+        if rows:
+            logger.info(f"📂 Loaded {len(rows)} executions from {self.db_path}")
+
+    def _cache_row(self, execution_id: str, record: str, definition: Optional[str]):
+        execution = json.loads(record)
+        self.executions[execution_id] = execution
+        self.phase_status[execution_id] = {p['node_id']: p['status'] for p in execution['phases']}
+        if definition:
+            self.definitions[execution_id] = json.loads(definition)
+
+    def _persist(self, execution_id: str):
+        """Write one execution record through to SQLite, taking or extending its lease"""
+        if self._conn is None or execution_id not in self.executions:
+            return
+        execution = self.executions[execution_id]
+        definition = self.definitions.get(execution_id)
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO executions
+                    (execution_id, workflow_id, status, updated_at, record, definition, owner, lease_expires)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(execution_id) DO UPDATE SET
+                    workflow_id = excluded.workflow_id,
+                    status = excluded.status,
+                    updated_at = excluded.updated_at,
+                    record = excluded.record,
+                    definition = excluded.definition,
+                    owner = excluded.owner,
+                    lease_expires = excluded.lease_expires
+                """,
+                (
+                    execution_id, execution['workflow_id'], execution['status'],
+                    execution['updated_at'], json.dumps(execution, default=str),
+                    json.dumps(definition, default=str) if definition else None,
+                    self.owner_id, time.time() + self.lease_seconds
+                )
+            )
 
-    def create(self, execution_id: str, workflow_id: str, workflow_name: str, nodes: List[WorkflowNode]) -> Dict[str, Any]:
+    def create(
+        self,
+        execution_id: str,
+        workflow_id: str,
+        workflow_name: str,
+        nodes: List[WorkflowNode],
+        edges: Optional[List[WorkflowEdge]] = None
+    ) -> Dict[str, Any]:
         """Create new execution record"""
         execution = {
             'execution_id': execution_id,
@@ -194,9 +465,14 @@ class ExecutionStore:
             ]
         }
         self.executions[execution_id] = execution
+        self.definitions[execution_id] = {
+            'nodes': [node.dict() for node in nodes],
+            'edges': [edge.dict() for edge in (edges or [])]
+        }
 
         # Initialize phase status tracking
         self.phase_status[execution_id] = {node.id: 'pending' for node in nodes}
+        self._persist(execution_id)
 
         logger.info(f"📝 Created execution: {execution_id} with {len(nodes)} phases")
         return execution
@@ -215,8 +491,17 @@ class ExecutionStore:
             if error:
                 self.executions[execution_id]['error'] = error
 
-    def update_phase_status(self, execution_id: str, node_id: str, status: str):
-        """Update specific phase status"""
+            self._persist(execution_id)
+
+    def update_phase_status(
+        self,
+        execution_id: str,
+        node_id: str,
+        status: str,
+        outputs: Optional[Dict[str, Any]] = None,
+        artifacts: Optional[List[Dict[str, Any]]] = None
+    ):
+        """Update specific phase status (completed phases keep their outputs and artifacts)"""
         if execution_id in self.executions:
             # Update phase status tracking
             if execution_id in self.phase_status:
@@ -235,15 +520,269 @@ class ExecutionStore:
 
                         if status == 'completed':
                             self.executions[execution_id]['completed_phases'] += 1
+                            phase['outputs'] = outputs or {}
+                            phase['artifacts'] = artifacts or []
 
                     break
 
+            self._persist(execution_id)
             logger.info(f"📝 Updated phase {node_id} in execution {execution_id}: {status}")
 
     def get(self, execution_id: str) -> Optional[Dict[str, Any]]:
         """Get execution record"""
         return self.executions.get(execution_id)
 
+    def get_phase(self, execution_id: str, node_id: str) -> Optional[Dict[str, Any]]:
+        """Get one phase record of an execution"""
+        execution = self.executions.get(execution_id)
+        if execution is None:
+            return None
+        return next((p for p in execution['phases'] if p['node_id'] == node_id), None)
+
+    def incomplete(self) -> List[str]:
+        """
+        IDs of executions left pending or running whose lease has lapsed
+        (e.g. their process died), so they can be claimed and resumed
+        """
+        if self._conn is None:
+            return []
+        rows = self._conn.execute(
+            """
+            SELECT execution_id FROM executions
+            WHERE status IN ('pending', 'running') AND definition IS NOT NULL
+              AND (owner IS NULL OR lease_expires IS NULL OR lease_expires < ?)
+            ORDER BY rowid
+            """,
+            (time.time(),)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def claim(self, execution_id: str) -> bool:
+        """
+        Take over an unfinished execution whose lease has lapsed.
+
+        The conditional UPDATE is atomic across processes sharing the
+        database, so at most one of them wins. The winner reloads the
+        record, which another process may have advanced since _load().
+
+        Returns:
+            True if this store now owns the execution
+        """
+        if self._conn is None:
+            return False
+        now = time.time()
+        with self._conn:
+            claimed = self._conn.execute(
+                """
+                UPDATE executions SET owner = ?, lease_expires = ?
+                WHERE execution_id = ? AND status IN ('pending', 'running')
+                  AND (owner IS NULL OR lease_expires IS NULL OR lease_expires < ?)
+                """,
+                (self.owner_id, now + self.lease_seconds, execution_id, now)
+            ).rowcount == 1
+            if claimed:
+                record, definition = self._conn.execute(
+                    "SELECT record, definition FROM executions WHERE execution_id = ?",
+                    (execution_id,)
+                ).fetchone()
+        if claimed:
+            self._cache_row(execution_id, record, definition)
+        return claimed
+
+    def renew_leases(self) -> int:
+        """Extend the lease on every unfinished execution this store owns"""
+        if self._conn is None:
+            return 0
+        with self._conn:
+            return self._conn.execute(
+                """
+                UPDATE executions SET lease_expires = ?
+                WHERE owner = ? AND status IN ('pending', 'running')
+                """,
+                (time.time() + self.lease_seconds, self.owner_id)
+            ).rowcount
+
+    def close(self):
+        """Close the SQLite connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+# ---------------------------------------------------------------------------
+# Phase Worker Pool
+# ---------------------------------------------------------------------------
+
+class _PhaseJob:
+    """A queued phase coroutine and the caller-side future awaiting it"""
+
+    def __init__(self, key: str, coro_factory, future: asyncio.Future, caller_loop):
+        self.key = key
+        self.coro_factory = coro_factory
+        self.future = future
+        self.caller_loop = caller_loop
+        self.task: Optional[asyncio.Task] = None
+        self.worker_loop = None
+        self.cancelled = False
+
+
+class PhaseWorkerPool:
+    """
+    Long-lived worker threads, each running its own event loop, that execute
+    phase coroutines.
+
+    Jobs are queued per workflow key and handed out round-robin, so one
+    workflow with many queued phases cannot starve the others. Workers reuse
+    their loop for every phase instead of creating and closing one per call.
+    """
+
+    def __init__(self, workers: int = 8):
+        self.workers = max(1, workers)
+        self._queues: Dict[str, deque] = {}
+        self._rotation: deque = deque()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._running = False
+        self.active = 0
+        self.completed = 0
+
+    def start(self):
+        """Start worker threads (idempotent)"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        for n in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"phase-worker-{n}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"🧵 Phase worker pool started ({self.workers} workers)")
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stop workers; queued jobs are cancelled"""
+        with self._cond:
+            self._running = False
+            pending = [job for queue in self._queues.values() for job in queue]
+            self._queues.clear()
+            self._rotation.clear()
+            self._cond.notify_all()
+        for job in pending:
+            self._resolve(job, exc=asyncio.CancelledError())
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    async def submit(self, key: str, coro_factory, timeout: Optional[float] = None):
+        """
+        Run coro_factory() on a worker loop and wait for its result.
+
+        Args:
+            key: Fairness key (workflow or execution ID)
+            coro_factory: Zero-argument callable returning the coroutine to run
+            timeout: Seconds to wait before cancelling the phase
+
+        Raises:
+            asyncio.TimeoutError: If the phase exceeds timeout
+        """
+        self.start()
+        loop = asyncio.get_running_loop()
+        job = _PhaseJob(key, coro_factory, loop.create_future(), loop)
+        with self._cond:
+            if key not in self._queues:
+                self._queues[key] = deque()
+                self._rotation.append(key)
+            self._queues[key].append(job)
+            self._cond.notify()
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(job.future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            self._cancel(job)
+            raise
+
+    def _cancel(self, job: _PhaseJob):
+        with self._cond:
+            job.cancelled = True
+            queue = self._queues.get(job.key)
+            if queue and job in queue:
+                queue.remove(job)
+            if job.task is not None and job.worker_loop is not None:
+                job.worker_loop.call_soon_threadsafe(job.task.cancel)
+
+    def _next_job(self) -> Optional[_PhaseJob]:
+        with self._cond:
+            while self._running:
+                while self._rotation:
+                    key = self._rotation.popleft()
+                    queue = self._queues.get(key)
+                    if not queue:
+                        self._queues.pop(key, None)
+                        continue
+                    job = queue.popleft()
+                    if queue:
+                        self._rotation.append(key)
+                    else:
+                        del self._queues[key]
+                    return job
+                self._cond.wait()
+            return None
+
+    def _resolve(self, job: _PhaseJob, result: Any = None, exc: Optional[BaseException] = None):
+        def _set():
+            if job.future.done():
+                return
+            if isinstance(exc, asyncio.CancelledError):
+                job.future.cancel()
+            elif exc is not None:
+                job.future.set_exception(exc)
+            else:
+                job.future.set_result(result)
+        try:
+            job.caller_loop.call_soon_threadsafe(_set)
+        except RuntimeError:
+            pass  # Caller loop already closed
+
+    def _worker(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            while True:
+                job = self._next_job()
+                if job is None:
+                    break
+                with self._cond:
+                    if job.cancelled:
+                        continue
+                    job.worker_loop = loop
+                    self.active += 1
+                result, error = None, None
+                try:
+                    # coro_factory() may raise; that fails the job, not the worker
+                    with self._cond:
+                        job.task = loop.create_task(job.coro_factory())
+                        if job.cancelled:
+                            job.task.cancel()
+                    result = loop.run_until_complete(job.task)
+                except BaseException as e:
+                    error = e
+                # Count the job before waking the caller so stats are current
+                with self._cond:
+                    self.active -= 1
+                    self.completed += 1
+                self._resolve(job, result=result, exc=error)
+        finally:
+            loop.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Worker pool statistics"""
+        with self._cond:
+            return {
+                'workers': self.workers,
+                'active': self.active,
+                'queued': sum(len(q) for q in self._queues.values()),
+                'completed': self.completed
+            }
+
 
 # ---------------------------------------------------------------------------
 # FastAPI Application
@@ -266,8 +805,14 @@ app.add_middleware(
 
 # Global instances
 manager = ConnectionManager()
-execution_store = ExecutionStore()
+# Persistence and resume are opt-in: set WORKFLOW_EXECUTION_DB to a SQLite path
+execution_store = ExecutionStore(
+    db_path=os.getenv("WORKFLOW_EXECUTION_DB") or None,
+    lease_seconds=float(os.getenv("WORKFLOW_EXECUTION_LEASE_SECONDS", "60"))
+)
+phase_pool = PhaseWorkerPool(workers=int(os.getenv("PHASE_WORKERS", "8")))
 background_tasks = set()
+_lease_task: Optional[asyncio.Task] = None
 
 # JWT Manager for WebSocket authentication
 if JWT_AVAILABLE:
@@ -299,6 +844,8 @@ async def startup_event():
 
     Pattern from maestro-engine-new/src/bff/main.py
     """
+    global _lease_task
+
     logger.info("=" * 80)
     logger.info("🚀 Workflow API V2 Starting...")
     logger.info("=" * 80)
@@ -331,8 +878,24 @@ async def startup_event():
     logger.info(f"  - WebSocket Updates: enabled")
     logger.info(f"  - Background Tasks: enabled")
     logger.info(f"  - USE_REAL_EXECUTION: {USE_REAL_EXECUTION}")
+    logger.info(f"  - Phase Workers: {phase_pool.workers}")
+    logger.info(f"  - Execution Store: {execution_store.db_path or 'in-memory'}")
     logger.info("=" * 80)
 
+    if execution_store.db_path:
+        _lease_task = asyncio.create_task(maintain_execution_leases())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop WebSocket drain tasks, phase workers and the execution store"""
+    if _lease_task is not None:
+        _lease_task.cancel()
+    await manager.close_all()
+    phase_pool.shutdown()
+    execution_store.close()
+
+
 async def get_team_engine():
     """
     Lazy load Team Execution Engine to avoid slow startup.
@@ -709,6 +1272,29 @@ async def execute_workflow_background(
             node_id = node.id
             phase_type = node.phase_type
 
+            # Phases completed before a restart are not re-run; replay their
+            # stored outputs so clients see the same phase_completed event
+            if execution_store.phase_status.get(execution_id, {}).get(node_id) == 'completed':
+                logger.info(f"⏭️  Phase {i}/{len(nodes)} already completed: {node_id}")
+                phase = execution_store.get_phase(execution_id, node_id) or {}
+                await manager.broadcast(workflow_id, {
+                    'type': 'phase_completed',
+                    'execution_id': execution_id,
+                    'workflow_id': workflow_id,
+                    'node_id': node_id,
+                    'phase_type': phase_type,
+                    'phase_label': node.label,
+                    'phase_number': i,
+                    'total_phases': len(nodes),
+                    'status': 'completed',
+                    'outputs': phase.get('outputs', {}),
+                    'message': f'Phase {i}/{len(nodes)} completed: {phase_type}',
+                    'timestamp': datetime.now().isoformat(),
+                    'artifacts': phase.get('artifacts', []),
+                    'resumed': True
+                })
+                continue
+
             sys.stderr.write(f"DEBUG: node_id={node_id}, phase_type={phase_type}\n")
             sys.stderr.flush()
 
@@ -796,30 +1382,21 @@ async def execute_workflow_background(
                         requirement += f"\nExecutor AI: {node.phase_config.executor_ai}"
 
                     sys.stderr.write(f"DEBUG: Requirement built successfully (length={len(requirement)})\n")
-                    sys.stderr.write(f"DEBUG: About to call engine.execute_phase() in thread pool\n")
+                    sys.stderr.write(f"DEBUG: About to call engine.execute_phase() on phase worker pool\n")
                     sys.stderr.flush()
 
                     # Execute using team engine (SplitMode API)
-                    # Run in thread pool to prevent blocking the event loop (30 min timeout per phase)
-                    def _sync_execute_phase():
-                        """Synchronous wrapper to run async execute_phase in thread with own event loop"""
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            return loop.run_until_complete(
-                                engine.execute_phase(
-                                    phase_name=phase_type,
-                                    checkpoint=None,
-                                    requirement=requirement,
-                                    progress_callback=None
-                                )
-                            )
-                        finally:
-                            loop.close()
-
+                    # Run on the shared phase worker pool so the API loop stays
+                    # responsive (30 min timeout per phase)
                     try:
-                        context = await asyncio.wait_for(
-                            asyncio.to_thread(_sync_execute_phase),
+                        context = await phase_pool.submit(
+                            execution_id,
+                            lambda: engine.execute_phase(
+                                phase_name=phase_type,
+                                checkpoint=None,
+                                requirement=requirement,
+                                progress_callback=None
+                            ),
                             timeout=1800.0  # 30 minutes per phase
                         )
                     except asyncio.TimeoutError:
@@ -882,7 +1459,9 @@ async def execute_workflow_background(
                 logger.info(f"📄 Generated dummy artifact: {artifact['name']}")
 
             # 4c. Send phase completed message with artifacts
-            execution_store.update_phase_status(execution_id, node_id, 'completed')
+            execution_store.update_phase_status(
+                execution_id, node_id, 'completed', outputs=phase_outputs, artifacts=artifacts
+            )
 
             await manager.broadcast(workflow_id, {
                 'type': 'phase_completed',
@@ -954,6 +1533,8 @@ async def health_check():
         "status": "healthy",
         "service": "workflow-api-v2",
         "version": "2.0.0",
+        "websockets": manager.get_stats(),
+        "phase_workers": phase_pool.get_stats(),
         "timestamp": datetime.now().isoformat()
     }
 
@@ -984,6 +1565,96 @@ async def download_artifact(filename: str):
     )
 
 
+def launch_execution(
+    execution_id: str,
+    workflow_id: str,
+    workflow_name: str,
+    nodes: List[WorkflowNode],
+    edges: List[WorkflowEdge]
+) -> asyncio.Task:
+    """Start execute_workflow_background as a tracked background task"""
+    sys.stderr.write(f"📋 Creating background task for execution_id: {execution_id}\n")
+    sys.stderr.flush()
+
+    task = asyncio.create_task(
+        execute_workflow_background(
+            execution_id=execution_id,
+            workflow_id=workflow_id,
+            workflow_name=workflow_name,
+            nodes=nodes,
+            edges=edges
+        )
+    )
+    background_tasks.add(task)
+
+    # Add done callback with error logging
+    def task_done_callback(t):
+        background_tasks.discard(t)
+        if t.cancelled():
+            return
+        if t.exception():
+            sys.stderr.write(f"❌ Background task failed with exception: {t.exception()}\n")
+            sys.stderr.flush()
+            logger.error(f"Background task exception: {t.exception()}", exc_info=t.exception())
+        else:
+            sys.stderr.write(f"✅ Background task completed successfully\n")
+            sys.stderr.flush()
+
+    task.add_done_callback(task_done_callback)
+    return task
+
+
+def resume_incomplete_executions() -> int:
+    """
+    Restart executions a dead process left pending or running.
+
+    Each one is claimed first, so when several API processes share the
+    database only one resumes it. Completed phases are skipped (their
+    stored outputs are replayed); the phase that was in flight is re-run.
+
+    Returns:
+        Number of executions resumed
+    """
+    resumed = 0
+    for execution_id in execution_store.incomplete():
+        if not execution_store.claim(execution_id):
+            continue
+        execution = execution_store.get(execution_id)
+        definition = execution_store.definitions[execution_id]
+        try:
+            nodes = [WorkflowNode(**n) for n in definition.get('nodes', [])]
+            edges = [WorkflowEdge(**e) for e in definition.get('edges', [])]
+        except Exception as e:
+            logger.error(f"❌ Cannot resume {execution_id}: {e}")
+            execution_store.update_status(execution_id, 'failed', error=f"Resume failed: {e}")
+            continue
+
+        logger.info(f"♻️  Resuming execution {execution_id} ({execution['completed_phases']}/{len(nodes)} phases done)")
+        launch_execution(
+            execution_id=execution_id,
+            workflow_id=execution['workflow_id'],
+            workflow_name=execution['workflow_name'],
+            nodes=nodes,
+            edges=edges
+        )
+        resumed += 1
+    return resumed
+
+
+async def maintain_execution_leases(interval: Optional[float] = None):
+    """Renew this process's leases and resume executions whose owner died"""
+    interval = interval or execution_store.lease_seconds / 3
+    while True:
+        try:
+            execution_store.renew_leases()
+            resumed = resume_incomplete_executions()
+            if resumed:
+                logger.info(f"♻️  Resumed {resumed} incomplete executions")
+        except Exception as e:
+            logger.error(f"❌ Execution lease maintenance failed: {e}", exc_info=True)
+        await asyncio.sleep(interval)
+
+
 @app.post("/api/workflow/execute")
 async def execute_workflow(params: DAGWorkflowExecute):
     """
@@ -1023,37 +1694,18 @@ async def execute_workflow(params: DAGWorkflowExecute):
             execution_id=execution_id,
             workflow_id=params.workflow_id,
             workflow_name=params.workflow_name,
-            nodes=params.nodes
+            nodes=params.nodes,
+            edges=params.edges
         )
 
         # Start background execution
-        import sys
-        sys.stderr.write(f"📋 Creating background task for execution_id: {execution_id}\n")
-        sys.stderr.flush()
-
-        task = asyncio.create_task(
-            execute_workflow_background(
-                execution_id=execution_id,
-                workflow_id=params.workflow_id,
-                workflow_name=params.workflow_name,
-                nodes=params.nodes,
-                edges=params.edges
-            )
+        launch_execution(
+            execution_id=execution_id,
+            workflow_id=params.workflow_id,
+            workflow_name=params.workflow_name,
+            nodes=params.nodes,
+            edges=params.edges
         )
-        background_tasks.add(task)
-
-        # Add done callback with error logging
-        def task_done_callback(t):
-            background_tasks.discard(t)
-            if t.exception():
-                sys.stderr.write(f"❌ Background task failed with exception: {t.exception()}\n")
-                sys.stderr.flush()
-                logger.error(f"Background task exception: {t.exception()}", exc_info=t.exception())
-            else:
-                sys.stderr.write(f"✅ Background task completed successfully\n")
-                sys.stderr.flush()
-
-        task.add_done_callback(task_done_callback)
 
         # Return immediately with execution details
         logger.info(f"✅ Execution {execution_id} queued, returning to frontend")
@@ -1433,14 +2085,12 @@ async def websocket_endpoint(
         logger.warning(f"⚠️  WebSocket connection without authentication (JWT not available): {workflow_id}")
 
     # STEP 3: Register connection with manager (already accepted above)
-    if workflow_id not in manager.active_connections:
-        manager.active_connections[workflow_id] = []
-    manager.active_connections[workflow_id].append(websocket)
-    logger.info(f"📡 WebSocket connected for workflow: {workflow_id} (total: {len(manager.active_connections[workflow_id])})")
+    manager.register(websocket, workflow_id)
 
     try:
-        # Send connection confirmation with user info
-        await websocket.send_json({
+        # Send connection confirmation with user info (queued with broadcasts
+        # so the drain task is the only writer on the socket)
+        await manager.send_personal(websocket, {
             'type': 'connected',
             'workflow_id': workflow_id,
             'user_id': user_id,
@@ -1454,7 +2104,7 @@ async def websocket_endpoint(
             logger.debug(f"📨 Received from client: {data}")
 
             # Echo back (for heartbeat/ping-pong)
-            await websocket.send_json({
+            await manager.send_personal(websocket, {
                 'type': 'pong',
                 'message': 'Server received your message',
                 'timestamp': datetime.now().isoformat()
@@ -0,0 +1,79 @@
+"""
+ACC Cycle Analyzer Test Suite
+
+Tests for streaming cycle detection and feedback-arc-set breaking candidates.
+Test IDs: ACC-311 to ACC-314
+"""
+
+import pytest
+
+from acc.cycle_analyzer import CycleAnalyzer
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+@pytest.fixture
+def analyzer(tmp_path):
+    """Cycle analyzer with an isolated approvals file."""
+    return CycleAnalyzer(approved_cycles_path=str(tmp_path / "approved_cycles.json"))
+
+
+@pytest.fixture
+def shared_edge_dependencies():
+    """Two cycles sharing the services.core -> dal.repo edge."""
+    return {
+        'services.core': ['dal.repo'],
+        'dal.repo': ['services.core', 'utils.cache'],
+        'utils.cache': ['services.core'],
+        'api.routes': ['services.core'],
+    }
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_acc_311_detect_cycles_streams_bounded(analyzer):
+    """ACC-311: detect_cycles is a lazy generator honouring max_cycles"""
+    dependencies = {f"m{i}": [f"m{j}" for j in range(9) if j != i] for i in range(9)}
+
+    stream = analyzer.detect_cycles(dependencies, max_cycles=25)
+    assert iter(stream) is stream
+    assert len(list(stream)) == 25
+
+
+def test_acc_312_feedback_arc_set(analyzer, shared_edge_dependencies):
+    """ACC-312: A single shared edge breaks both cycles"""
+    arcs = analyzer.find_feedback_arc_set(shared_edge_dependencies)
+
+    assert arcs == [('services.core', 'dal.repo')]
+
+
+def test_acc_313_breaking_candidates_prefer_feedback_arcs(analyzer, shared_edge_dependencies):
+    """ACC-313: Feedback-arc-set edges rank first in breaking candidates"""
+    arcs = set(analyzer.find_feedback_arc_set(shared_edge_dependencies))
+    cycle = ['services.core', 'dal.repo', 'utils.cache']
+
+    candidates = analyzer.find_breaking_candidates(cycle, shared_edge_dependencies, arcs)
+
+    best = candidates[0]
+    assert (best.source, best.target) in arcs
+    assert "minimum breaking set" in best.suggestion
+
+
+def test_acc_314_analyze_cycles_consumes_generator(analyzer, shared_edge_dependencies):
+    """ACC-314: analyze_cycles accepts a generator and stops at max_cycles"""
+    reports = analyzer.analyze_cycles(
+        analyzer.detect_cycles(shared_edge_dependencies),
+        shared_edge_dependencies
+    )
+    assert len(reports) == 2
+
+    limited = analyzer.analyze_cycles(
+        analyzer.detect_cycles(shared_edge_dependencies),
+        shared_edge_dependencies,
+        max_cycles=1
+    )
+    assert len(limited) == 1
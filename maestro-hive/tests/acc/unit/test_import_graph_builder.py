@@ -23,6 +23,7 @@ import pytest
 import networkx as nx
 
 from acc.import_graph_builder import (
+    CACHE_FORMAT_VERSION,
     ImportGraphBuilder,
     ImportGraph,
     ModuleInfo
@@ -785,6 +786,187 @@ def func_b():
     assert len(graph.modules) >= 2
 
 
+# ============================================================================
+# Category 5: Parse Modes and Cache Format
+# ============================================================================
+
+def _write_chain_project(project_dir, count=30):
+    """Write a package of modules where each imports the previous one."""
+    pkg = project_dir / "chain"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    for i in range(count):
+        body = f"from chain import mod_{i - 1}\n" if i else ""
+        (pkg / f"mod_{i}.py").write_text(body + f"\ndef func_{i}():\n    pass\n")
+    return pkg
+
+
+def test_acc_031_process_pool_matches_thread_pool(temp_project_dir):
+    """ACC-031: Process-pool parsing produces the same graph as thread parsing"""
+    _write_chain_project(temp_project_dir)
+
+    thread_builder = ImportGraphBuilder(
+        str(temp_project_dir), parse_mode="thread", load_cache=False
+    )
+    process_builder = ImportGraphBuilder(
+        str(temp_project_dir), parse_mode="process", chunk_size=7, load_cache=False
+    )
+
+    thread_graph = thread_builder.build_graph(use_cache=False)
+    process_graph = process_builder.build_graph(use_cache=False)
+
+    assert set(process_graph.modules) == set(thread_graph.modules)
+    assert set(process_graph.graph.edges()) == set(thread_graph.graph.edges())
+    assert all(info.file_hash for info in process_graph.modules.values())
+
+
+def test_acc_032_stat_fast_path_skips_reparse(temp_project_dir, monkeypatch):
+    """ACC-032: Unchanged files are served from cache without reading them"""
+    pkg = _write_chain_project(temp_project_dir, count=5)
+
+    builder = create_builder(temp_project_dir)
+    builder.build_graph(parallel=False)
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("unchanged file was re-parsed")
+
+    monkeypatch.setattr(builder, "_parse_file", fail_parse)
+    graph = builder.build_graph(parallel=False)
+
+    assert graph.build_metrics.files_cached == graph.build_metrics.total_files
+    assert "chain.mod_4" in graph.modules
+
+    # Editing one file re-parses only that file
+    monkeypatch.undo()
+    (pkg / "mod_4.py").write_text("import chain.mod_0\n")
+    graph = builder.build_graph(parallel=False)
+
+    assert graph.build_metrics.files_cached == graph.build_metrics.total_files - 1
+    assert graph.get_dependencies("chain.mod_4") == ["chain.mod_0"]
+
+
+def test_acc_033_cache_round_trip(temp_project_dir):
+    """ACC-033: Compact JSON cache is reloaded by a fresh builder and survives deletions"""
+    pkg = _write_chain_project(temp_project_dir, count=5)
+
+    first = create_builder(temp_project_dir)
+    first.build_graph(parallel=False)
+    assert first.cache_path.name == ".acc_cache.json"
+    data = json.loads(first.cache_path.read_text())
+    assert data["version"] == CACHE_FORMAT_VERSION
+    assert all(isinstance(record, list) for record in data["modules"].values())
+
+    second = create_builder(temp_project_dir)
+    assert set(second._module_cache) == set(first._module_cache)
+    graph = second.build_graph(parallel=False)
+    assert graph.build_metrics.files_cached == graph.build_metrics.total_files
+
+    (pkg / "mod_2.py").unlink()
+    second.build_graph(parallel=False)
+    third = create_builder(temp_project_dir)
+    assert str(pkg / "mod_2.py") not in third._module_cache
+
+
+def test_acc_034_legacy_json_cache_is_read(temp_project_dir):
+    """ACC-034: A version 1.0 .acc_cache.json is still read, then rewritten compactly"""
+    _write_chain_project(temp_project_dir, count=3)
+    builder = create_builder(temp_project_dir)
+    expected = builder.build_graph(parallel=False).get_dependencies("chain.mod_2")
+    legacy = {
+        "version": "1.0",
+        "project_path": str(temp_project_dir),
+        "modules": {
+            path: {
+                "module_name": info.module_name,
+                "file_path": str(info.file_path),
+                "imports": info.imports,
+                "from_imports": info.from_imports,
+                "file_hash": info.file_hash,
+                "file_stat": list(builder._file_stats[path]),
+            }
+            for path, info in builder._module_cache.items()
+        },
+    }
+    builder.cache_path.write_text(json.dumps(legacy))
+
+    reloaded = create_builder(temp_project_dir)
+    graph = reloaded.build_graph(parallel=False)
+    assert graph.build_metrics.files_cached == 4
+    assert graph.get_dependencies("chain.mod_2") == expected
+
+    reloaded.flush_cache()
+    assert json.loads(builder.cache_path.read_text())["version"] == CACHE_FORMAT_VERSION
+
+
+def _dense_graph(size):
+    """ImportGraph where every module imports every other module."""
+    graph = ImportGraph()
+    for i in range(size):
+        for j in range(size):
+            if i != j:
+                graph.add_dependency(f"m{i}", f"m{j}")
+    return graph
+
+
+def test_acc_035_bounded_cycle_enumeration():
+    """ACC-035: Cycle enumeration is capped by count and length"""
+    graph = _dense_graph(12)  # Billions of simple cycles
+
+    start = time.time()
+    cycles = graph.find_cycles(max_cycles=50)
+    assert len(cycles) == 50
+    assert time.time() - start < 5.0
+
+    short = graph.find_cycles(max_length=2, max_cycles=None, max_cycles_per_component=None)
+    assert len(short) == 66  # One 2-cycle per unordered pair
+    assert all(len(c) == 2 for c in short)
+
+
+def test_acc_036_cycles_enumerated_per_component():
+    """ACC-036: A dense component can't starve smaller components"""
+    graph = _dense_graph(10)
+    graph.add_dependency("a", "b")
+    graph.add_dependency("b", "a")
+
+    components = graph.cyclic_components()
+    assert components[0] == {"a", "b"}
+
+    cycles = graph.find_cycles(max_cycles=20, max_cycles_per_component=10)
+    assert ["a", "b"] in cycles or ["b", "a"] in cycles
+    assert len(cycles) == 11
+
+
+def test_acc_037_feedback_arc_set_breaks_all_cycles():
+    """ACC-037: Removing the feedback arc set leaves an acyclic graph"""
+    graph = _dense_graph(8)
+    graph.add_dependency("solo", "solo")
+    graph.add_dependency("x", "y")
+
+    arcs = graph.feedback_arc_set()
+    assert ("solo", "solo") in arcs
+    assert ("x", "y") not in arcs
+
+    pruned = graph.graph.copy()
+    pruned.remove_edges_from(arcs)
+    assert nx.is_directed_acyclic_graph(pruned)
+    assert len(arcs) <= graph.graph.number_of_edges() // 2 + 1
+
+
+def test_acc_038_feedback_arc_set_large_component():
+    """ACC-038: A large random component is broken deterministically"""
+    edges = nx.gnm_random_graph(3000, 12000, directed=True, seed=7).edges()
+    graph = ImportGraph()
+    for source, target in edges:
+        graph.add_dependency(f"m{source}", f"m{target}")
+
+    arcs = graph.feedback_arc_set()
+    pruned = graph.graph.copy()
+    pruned.remove_edges_from(arcs)
+    assert nx.is_directed_acyclic_graph(pruned)
+    assert len(arcs) < graph.graph.number_of_edges() // 2
+    assert graph.feedback_arc_set() == arcs
+
+
 # ============================================================================
 # Test Summary and Reporting
 # ============================================================================
@@ -823,3 +1005,37 @@ def test_suite_summary():
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
+
+
+def test_acc_039_broken_process_pool_falls_back_to_threads(temp_project_dir, monkeypatch):
+    """ACC-039: A broken process pool re-parses on threads instead of dropping files"""
+    from concurrent.futures import Future
+    from concurrent.futures.process import BrokenProcessPool
+
+    import acc.import_graph_builder as builder_module
+
+    _write_chain_project(temp_project_dir)
+
+    class BrokenPool:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def submit(self, fn, *args):
+            future = Future()
+            future.set_exception(BrokenProcessPool("worker died"))
+            return future
+
+    monkeypatch.setattr(builder_module, "ProcessPoolExecutor", BrokenPool)
+    builder = ImportGraphBuilder(
+        str(temp_project_dir), parse_mode="process", chunk_size=7, load_cache=False
+    )
+    graph = builder.build_graph(use_cache=False)
+
+    assert "chain.mod_19" in graph.modules
+    assert graph.build_metrics.files_failed == 0
@@ -0,0 +1,218 @@
+"""
+ACC Watch Mode Test Suite
+
+Tests for incremental import graph updates and delta rule evaluation.
+Test IDs: ACC-301 to ACC-307
+
+Categories:
+1. Incremental graph updates (301-303): edits, deletions, new modules
+2. Affected-scope evaluation (304): only affected rules run
+3. Watcher deltas (305-307): new/resolved violations, cycles, auto-detection
+"""
+
+import pytest
+
+from acc.import_graph_builder import ImportGraphBuilder
+from acc.rule_engine import Component, Rule, RuleEngine, RuleType, Severity
+from acc.watch_mode import ArchitectureWatcher
+
+
+# ============================================================================
+# Test Fixtures
+# ============================================================================
+
+@pytest.fixture
+def layered_project(tmp_path):
+    """Create a small web/core/db project without violations."""
+    project = tmp_path / "layered"
+    for package in ("web", "core", "db"):
+        (project / package).mkdir(parents=True)
+        (project / package / "__init__.py").write_text("")
+
+    (project / "web" / "views.py").write_text("import core.models\n")
+    (project / "core" / "models.py").write_text("import db.session\n")
+    (project / "core" / "service.py").write_text("import core.models\n")
+    (project / "db" / "session.py").write_text("x = 1\n")
+    return project
+
+
+@pytest.fixture
+def layered_engine():
+    """Rule engine with a layering rule and a no-cycles rule on core."""
+    engine = RuleEngine(components=[
+        Component(name="Web", paths=["web."]),
+        Component(name="Core", paths=["core."]),
+        Component(name="Db", paths=["db."]),
+    ])
+    engine.add_rules([
+        Rule(
+            id="core-not-web",
+            rule_type=RuleType.MUST_NOT_CALL,
+            severity=Severity.BLOCKING,
+            description="Core must not call Web",
+            component="Core",
+            target="Web"
+        ),
+        Rule(
+            id="db-not-core",
+            rule_type=RuleType.MUST_NOT_CALL,
+            severity=Severity.BLOCKING,
+            description="Db must not call Core",
+            component="Db",
+            target="Core"
+        ),
+        Rule(
+            id="core-no-cycles",
+            rule_type=RuleType.NO_CYCLES,
+            severity=Severity.BLOCKING,
+            description="Core must not have cycles",
+            component="Core"
+        ),
+    ])
+    return engine
+
+
+def make_builder(project):
+    builder = ImportGraphBuilder(str(project), cache_path=str(project / ".cache.bin"))
+    builder.exclusions = ['__pycache__']
+    return builder
+
+
+# ============================================================================
+# Category 1: Incremental Graph Updates
+# ============================================================================
+
+def test_acc_301_update_graph_reresolves_changed_module(layered_project):
+    """ACC-301: Editing a file patches only its outgoing edges"""
+    builder = make_builder(layered_project)
+    graph = builder.build_graph(parallel=False)
+    assert graph.get_dependencies("core.models") == ["db.session"]
+
+    path = layered_project / "core" / "models.py"
+    path.write_text("import web.views\n")
+    delta = builder.update_graph(graph, [path])
+
+    assert delta.changed_modules == {"core.models"}
+    assert delta.edges_removed == {("core.models", "db.session")}
+    assert delta.edges_added == {("core.models", "web.views")}
+    assert graph.get_dependencies("core.models") == ["web.views"]
+    assert "db.session" in delta.affected_modules
+
+
+def test_acc_302_update_graph_removes_deleted_module(layered_project):
+    """ACC-302: Deleting a file removes its node and edges"""
+    builder = make_builder(layered_project)
+    graph = builder.build_graph(parallel=False)
+
+    path = layered_project / "db" / "session.py"
+    path.unlink()
+    delta = builder.update_graph(graph, [path])
+
+    assert delta.removed_modules == {"db.session"}
+    assert ("core.models", "db.session") in delta.edges_removed
+    assert "db.session" not in graph.modules
+    assert graph.get_dependencies("core.models") == []
+
+
+def test_acc_303_update_graph_links_new_module_to_existing_importers(layered_project):
+    """ACC-303: A new module gains edges from modules that already import it"""
+    (layered_project / "web" / "views.py").write_text("import core.models\nimport core.audit\n")
+    builder = make_builder(layered_project)
+    graph = builder.build_graph(parallel=False)
+    assert "core.audit" not in graph.modules
+
+    path = layered_project / "core" / "audit.py"
+    path.write_text("y = 2\n")
+    delta = builder.update_graph(graph, [path])
+
+    assert delta.added_modules == {"core.audit"}
+    assert ("web.views", "core.audit") in delta.edges_added
+    assert "core.audit" in graph.get_dependencies("web.views")
+
+
+# ============================================================================
+# Category 2: Affected-Scope Evaluation
+# ============================================================================
+
+def test_acc_304_evaluate_affected_skips_unrelated_rules(layered_engine):
+    """ACC-304: Only rules for affected components are evaluated"""
+    dependencies = {
+        "core.models": ["web.views"],
+        "db.session": ["core.models"],
+    }
+
+    result = layered_engine.evaluate_affected(dependencies, {"core.models"})
+
+    assert result.rules_evaluated == 1
+    assert [v.rule_id for v in result.violations] == ["core-not-web"]
+    assert result.files_analyzed == 1
+
+
+# ============================================================================
+# Category 3: Watcher Deltas
+# ============================================================================
+
+def test_acc_305_watcher_reports_new_and_resolved_violations(layered_project, layered_engine):
+    """ACC-305: Deltas contain introduced and resolved violations only"""
+    watcher = ArchitectureWatcher(
+        str(layered_project), layered_engine, builder=make_builder(layered_project)
+    )
+    full = watcher.start()
+    assert full.violations == []
+
+    path = layered_project / "core" / "models.py"
+    path.write_text("import db.session\nimport web.views\n")
+    delta = watcher.apply_changes([path])
+
+    # web.views already imports core.models, so this also closes a cycle
+    assert delta.is_delta
+    assert sorted(v.rule_id for v in delta.violations) == ["core-no-cycles", "core-not-web"]
+    assert delta.resolved_violations == []
+    assert len(watcher.violations) == 2
+
+    # Unrelated edit does not re-report the existing violation
+    other = layered_project / "db" / "session.py"
+    other.write_text("x = 2\n")
+    delta = watcher.apply_changes([other])
+    assert delta.violations == []
+    assert delta.resolved_violations == []
+
+    path.write_text("import db.session\n")
+    delta = watcher.apply_changes([path])
+    assert delta.violations == []
+    assert sorted(v.rule_id for v in delta.resolved_violations) == ["core-no-cycles", "core-not-web"]
+    assert watcher.violations == []
+    assert delta.to_dict()['summary']['resolved'] == 2
+
+
+def test_acc_306_watcher_tracks_cycles_in_affected_components(layered_project, layered_engine):
+    """ACC-306: Cycles introduced or broken by an edit are reported"""
+    watcher = ArchitectureWatcher(
+        str(layered_project), layered_engine, builder=make_builder(layered_project)
+    )
+    watcher.start()
+
+    path = layered_project / "core" / "models.py"
+    path.write_text("import db.session\nimport core.service\n")
+    delta = watcher.apply_changes([path])
+    assert [v.rule_id for v in delta.violations] == ["core-no-cycles"]
+
+    path.write_text("import db.session\n")
+    delta = watcher.apply_changes([path])
+    assert [v.rule_id for v in delta.resolved_violations] == ["core-no-cycles"]
+    assert watcher.violations == []
+
+
+def test_acc_307_watcher_detects_changes_from_stat(layered_project, layered_engine):
+    """ACC-307: apply_changes() without paths detects edits from stat signatures"""
+    watcher = ArchitectureWatcher(
+        str(layered_project), layered_engine, builder=make_builder(layered_project)
+    )
+    watcher.start()
+
+    assert watcher.apply_changes().violations == []
+
+    (layered_project / "db" / "session.py").write_text("import core.models\n")
+    delta = watcher.apply_changes()
+
+    assert "db-not-core" in {v.rule_id for v in delta.violations}
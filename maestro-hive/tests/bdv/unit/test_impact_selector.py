@@ -0,0 +1,196 @@
+"""
+BDV Test Impact Selection
+
+Test IDs: BDV-701 to BDV-711
+
+Test Categories:
+1. Contract mapping (701-703): explicit contract map, transitive importers, name fallback
+2. Selection rules (704-706): changed features, full-run fallbacks, safety sample
+3. Integration (707-711): git diff input, orchestrator run_impacted report,
+   cache placement, one read per feature file, nothing impacted
+"""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from acc.import_graph_builder import ImportGraphBuilder
+from bdv.bdv_runner import BDVOrchestrator, BDVRunner, RetryConfig
+from bdv.impact_selector import ImpactSelection, TestImpactSelector
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Services with an auth -> session dependency and three tagged features."""
+    root = tmp_path / "repo"
+    for package in ("services", "services/auth_api", "services/billing", "services/common"):
+        (root / package).mkdir(parents=True)
+        (root / package / "__init__.py").write_text("")
+    (root / "services/common/session.py").write_text("TOKEN = 1\n")
+    (root / "services/auth_api/login.py").write_text("import services.common.session\n")
+    (root / "services/billing/invoice.py").write_text("x = 1\n")
+
+    features = root / "features"
+    features.mkdir()
+    (features / "login.feature").write_text("@contract:AuthAPI:v1.0\nFeature: Login\n")
+    (features / "invoice.feature").write_text("@contract:BillingAPI:v2.0\nFeature: Invoice\n")
+    (features / "profile.feature").write_text("@contract:ProfileAPI:v1.0\nFeature: Profile\n")
+    (features / "health.feature").write_text("Feature: Health\n")
+    return root
+
+
+def make_selector(root, **kwargs):
+    builder = ImportGraphBuilder(str(root), cache_path=str(root / ".cache.bin"))
+    kwargs.setdefault("safety_sample_rate", 0)
+    kwargs.setdefault("safety_sample_min", 0)
+    return TestImpactSelector(str(root), "features", builder=builder, **kwargs)
+
+
+def names(paths):
+    return sorted(p.name for p in paths)
+
+
+class TestContractMapping:
+    """Contract mapping tests (BDV-701 to BDV-703)"""
+
+    def test_bdv_701_explicit_contract_map(self, project):
+        """BDV-701: Modules matching a contract's patterns select its features"""
+        selector = make_selector(project, contract_map={"BillingAPI": ["services.billing.*"]})
+        selection = selector.select(["services/billing/invoice.py"])
+
+        assert names(selection.selected) == ["invoice.feature"]
+        assert selection.affected_contracts == {"BillingAPI"}
+        assert names(selection.skipped) == ["health.feature", "login.feature", "profile.feature"]
+
+    def test_bdv_702_transitive_importers_are_affected(self, project):
+        """BDV-702: A change reaches contracts through modules importing it"""
+        selector = make_selector(project)
+        selection = selector.select(["services/common/session.py"])
+
+        assert "services.auth_api.login" in selection.affected_modules
+        assert names(selection.selected) == ["login.feature"]
+        assert "contract AuthAPI" in selection.reasons[str(selection.selected[0])]
+
+    def test_bdv_703_unrelated_change_selects_nothing(self, project):
+        """BDV-703: Modules mapped to no contract select no features"""
+        selector = make_selector(project)
+        selection = selector.select(["services/billing/invoice.py"])
+
+        assert selection.selected == []
+        assert selection.reduction == 1.0
+
+
+class TestSelectionRules:
+    """Selection rule tests (BDV-704 to BDV-706)"""
+
+    def test_bdv_704_changed_feature_selected(self, project):
+        """BDV-704: Editing a feature file selects it"""
+        selector = make_selector(project)
+        selection = selector.select([project / "features" / "health.feature"])
+
+        assert names(selection.selected) == ["health.feature"]
+        assert selection.reasons[str(selection.selected[0])] == "feature changed"
+
+    @pytest.mark.parametrize("changed", [
+        "features/conftest.py",
+        "features/steps/login_steps.py",
+        "requirements.txt",
+    ])
+    def test_bdv_705_full_run_fallback(self, project, changed):
+        """BDV-705: Shared BDV code and config changes run everything"""
+        selector = make_selector(project)
+        selection = selector.select([changed])
+
+        assert selection.full_run
+        assert selection.full_run_reason
+        assert len(selection.selected) == 4
+        assert selection.skipped == []
+
+    def test_bdv_706_safety_sample_is_deterministic(self, project):
+        """BDV-706: Unimpacted features are sampled reproducibly"""
+        selector = make_selector(project, safety_sample_rate=0.5, safety_sample_min=1)
+        first = selector.select(["services/common/session.py"])
+        second = selector.select(["services/common/session.py"])
+
+        assert names(first.selected) == ["login.feature"]
+        assert len(first.safety_sample) == 2
+        assert first.safety_sample == second.safety_sample
+        assert len(first.skipped) == 1
+        assert first.to_dict()["reasons"][str(first.safety_sample[0])] == "safety sample"
+
+
+class TestIntegration:
+    """Integration tests (BDV-707 to BDV-708)"""
+
+    def test_bdv_707_select_from_git(self, project):
+        """BDV-707: Changed files are read from git diff and untracked files"""
+        def git(*args):
+            subprocess.run(["git", *args], cwd=project, check=True, capture_output=True)
+
+        git("init", "-q")
+        git("-c", "user.email=t@example.com", "-c", "user.name=t", "add", "-A")
+        git("-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-qm", "init")
+        (project / "services/common/session.py").write_text("TOKEN = 2\n")
+
+        selector = make_selector(project)
+        selection = selector.select_from_git("HEAD")
+
+        assert [p.name for p in selection.changed_files if p.suffix == ".py"] == ["session.py"]
+        assert names(selection.selected) == ["login.feature"]
+
+    @patch('bdv.bdv_runner.subprocess.run')
+    def test_bdv_708_orchestrator_runs_impacted_only(self, mock_run, project, monkeypatch):
+        """BDV-708: pytest is given only the impacted features"""
+        monkeypatch.chdir(project)
+        mock_run.return_value = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+        orchestrator = BDVOrchestrator(
+            features_path=str(project / "features"),
+            retry_config=RetryConfig(max_retries=0)
+        )
+        result = orchestrator.run_impacted(
+            changed_files=["services/common/session.py"],
+            selector=make_selector(project),
+            iteration_id="impact"
+        )
+
+        assert mock_run.call_count == 1
+        argv = mock_run.call_args.args[0]
+        selected = [argv[i + 1] for i, arg in enumerate(argv) if arg == BDVRunner.FEATURE_OPTION]
+        assert selected == [str(project / "features" / "login.feature")]
+        assert not any(arg.endswith(".feature") for arg in argv if arg not in selected)
+        report = result.summary["impact_selection"]
+        assert len(report["skipped"]) == 3
+        assert report["affected_contracts"] == ["AuthAPI"]
+
+    def test_bdv_709_default_cache_outside_project(self, project, tmp_path):
+        """BDV-709: The default builder caches under cache_dir, not the project"""
+        cache_dir = tmp_path / "cache"
+        selector = TestImpactSelector(str(project), "features", cache_dir=str(cache_dir))
+        selector.select(["services/common/session.py"])
+
+        assert selector.builder.cache_path.parent == cache_dir
+        assert selector.builder.cache_path.exists()
+        assert not list(project.glob(".acc_cache*"))
+
+    def test_bdv_710_features_read_once(self, project):
+        """BDV-710: Each feature's tags are read once per selection"""
+        selector = make_selector(project)
+        with patch.object(
+            BDVRunner, "extract_contract_tags", autospec=True,
+            side_effect=BDVRunner.extract_contract_tags
+        ) as extract:
+            selection = selector.select(["services/common/session.py"])
+
+        assert names(selection.selected) == ["login.feature"]
+        assert extract.call_count == 4
+
+    def test_bdv_711_no_impacted_features(self, project):
+        """BDV-711: Nothing impacted yields an empty result with the report"""
+        orchestrator = BDVOrchestrator(features_path=str(project / "features"))
+        result = orchestrator.run_impacted(
+            changed_files=["README.md"], selector=make_selector(project), iteration_id="none"
+        )
+        assert result.total_scenarios == 0 and result.iteration_id == "none"
+        assert result.summary["message"] == "No impacted features"
+        assert len(result.summary["impact_selection"]["skipped"]) == 4
@@ -0,0 +1,286 @@
+"""
+Unit Tests for ContractRegistry indexes, plan cache and SQLite store
+
+Covers:
+- Indexed list_contracts and search_contracts agree with a full scan
+- Indexes follow lifecycle transitions and updates
+- Execution plans are cached until the dependency subgraph changes
+- Contracts, events and dependencies survive a reload from SQLite
+- Stored contracts are JSON and are loaded by ID on first access
+"""
+
+import json
+import random
+
+import pytest
+from contracts.models import (
+    AcceptanceCriterion,
+    ContractBreach,
+    ContractBreachedEvent,
+    ContractLifecycle,
+    ContractVerifiedEvent,
+    CriterionResult,
+    UniversalContract,
+    VerificationResult,
+)
+from contracts.registry import (
+    ContractRegistry,
+    DependencyCycleError,
+)
+from contracts.store import ContractStore, ContractSummary
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+WORDS = ["login", "auth", "api", "form", "payment", "report", "search", "profile", "token", "cart"]
+TYPES = ["UX_DESIGN", "API_SPECIFICATION", "SECURITY_POLICY"]
+TAGS = ["ui", "backend", "security", "billing", "mobile"]
+
+
+def make_contract(contract_id, depends_on=None, **overrides):
+    fields = dict(
+        contract_id=contract_id,
+        contract_type="TEST",
+        name=f"Contract {contract_id}",
+        description="Test",
+        provider_agent="agent",
+        consumer_agents=[],
+        specification={},
+        acceptance_criteria=[],
+        depends_on=list(depends_on or []),
+    )
+    fields.update(overrides)
+    return UniversalContract(**fields)
+
+
+def random_contracts(count, seed=11):
+    rng = random.Random(seed)
+    contracts = []
+    for i in range(count):
+        contracts.append(make_contract(
+            f"c{i:04d}",
+            contract_type=rng.choice(TYPES),
+            name=" ".join(rng.sample(WORDS, 2)).title(),
+            description=" ".join(rng.choice(WORDS) for _ in range(8)),
+            provider_agent=rng.choice(["ux", "backend", "qa"]),
+            consumer_agents=rng.sample(["frontend", "qa", "ops"], rng.randint(0, 2)),
+            priority=rng.choice(["HIGH", "MEDIUM", "LOW"]),
+            is_blocking=rng.random() < 0.5,
+            tags=rng.sample(TAGS, rng.randint(0, 3)),
+        ))
+    return contracts
+
+
+def scan_search(registry, query, search_fields):
+    """Reference implementation: substring scan over every contract."""
+    q = query.lower()
+    matches = []
+    for contract in registry._contracts.values():
+        for field in search_fields:
+            if field == "tags":
+                hit = any(q in tag.lower() for tag in contract.tags)
+            else:
+                hit = q in getattr(contract, field).lower()
+            if hit:
+                matches.append(contract.contract_id)
+                break
+    return matches
+
+
+# ============================================================================
+# Indexed Queries
+# ============================================================================
+
+class TestIndexedQueries:
+    """Indexed list/search return the same results as a full scan"""
+
+    def test_search_matches_scan(self):
+        registry = ContractRegistry()
+        registry.register_contracts(random_contracts(300))
+
+        for query in ["auth", "Login Form", "pay", "ui", "ity", "zzz", "a", "", "c001"]:
+            for fields in (["name", "description", "tags"], ["contract_id", "contract_type"], ["tags"]):
+                expected = scan_search(registry, query, fields)
+                actual = [c.contract_id for c in registry.search_contracts(query, fields)]
+                assert actual == expected, (query, fields)
+
+    def test_list_matches_scan(self):
+        registry = ContractRegistry()
+        contracts = random_contracts(300)
+        registry.register_contracts(contracts)
+
+        result = registry.list_contracts(
+            contract_type="API_SPECIFICATION", priority="HIGH", tags=["backend"]
+        )
+        expected = [
+            c for c in contracts
+            if c.contract_type == "API_SPECIFICATION" and c.priority == "HIGH" and "backend" in c.tags
+        ]
+        assert result == expected
+
+        result = registry.list_contracts(consumer_agent="qa", is_blocking=False)
+        assert result == [c for c in contracts if "qa" in c.consumer_agents and not c.is_blocking]
+
+    def test_indexes_follow_transitions_and_updates(self):
+        registry = ContractRegistry()
+        contract = make_contract("c1", tags=["ui"])
+        registry.register_contract(contract)
+
+        registry.propose_contract("c1", proposer="agent")
+        assert registry.list_contracts(lifecycle_state=ContractLifecycle.DRAFT) == []
+        assert registry.list_contracts(lifecycle_state=ContractLifecycle.PROPOSED) == [contract]
+
+        contract.tags = ["checkout"]
+        contract.name = "Checkout Flow"
+        registry.update_contract(contract)
+        assert registry.list_contracts(tags=["ui"]) == []
+        assert registry.list_contracts(tags=["checkout"]) == [contract]
+        assert registry.search_contracts("checkout") == [contract]
+        assert registry.search_contracts("Contract c1") == []
+
+
+# ============================================================================
+# Execution Plan Cache
+# ============================================================================
+
+class TestExecutionPlanCache:
+    """create_execution_plan reuses plans until dependencies change"""
+
+    def test_plan_cached_across_state_changes(self):
+        registry = ContractRegistry()
+        registry.register_contracts([make_contract("c1"), make_contract("c2", ["c1"])])
+
+        first = registry.create_execution_plan()
+        registry.propose_contract("c1", proposer="agent")
+        second = registry.create_execution_plan()
+
+        assert second.plan_id != first.plan_id
+        assert second.execution_order == first.execution_order == ["c1", "c2"]
+        assert registry._plan_cache[None][3].execution_order == ["c1", "c2"]
+
+        # Callers may modify the returned plan without affecting the cache
+        second.execution_order.reverse()
+        assert registry.create_execution_plan().execution_order == ["c1", "c2"]
+
+    def test_plan_invalidated_by_dependency_change(self):
+        registry = ContractRegistry()
+        registry.register_contracts([make_contract("c1"), make_contract("c2"), make_contract("c3")])
+
+        assert registry.create_execution_plan(["c1", "c2"]).parallel_groups == [["c1", "c2"]]
+        assert registry.create_execution_plan().parallel_groups == [["c1", "c2", "c3"]]
+
+        c2 = registry.get_contract("c2")
+        c2.depends_on.append("c1")
+        registry.update_contract(c2)
+
+        assert registry.create_execution_plan(["c1", "c2"]).parallel_groups == [["c1"], ["c2"]]
+        assert registry.create_execution_plan().parallel_groups == [["c1", "c3"], ["c2"]]
+
+        registry.register_contract(make_contract("c4", ["c3"]))
+        assert registry.create_execution_plan().execution_order == ["c1", "c3", "c2", "c4"]
+
+    def test_cycle_detection_without_graph_copy(self):
+        registry = ContractRegistry()
+        registry.register_contracts([make_contract("a"), make_contract("b", ["a"])])
+
+        a = registry.get_contract("a")
+        a.depends_on = ["b"]
+        with pytest.raises(DependencyCycleError):
+            registry.update_contract(a)
+        with pytest.raises(DependencyCycleError):
+            registry.register_contract(make_contract("self", ["self"]))
+
+
+# ============================================================================
+# SQLite Store
+# ============================================================================
+
+class TestContractStore:
+    """Contracts persist to and reload from SQLite"""
+
+    def test_reload_restores_contracts_and_indexes(self, tmp_path):
+        db_path = str(tmp_path / "contracts.db")
+        registry = ContractRegistry(db_path=db_path)
+        registry.register_contracts([
+            make_contract("c1", tags=["ui"], name="Login Form"),
+            make_contract("c2", ["c1"], name="Auth API"),
+        ])
+        registry.propose_contract("c1", proposer="ux")
+        registry.accept_contract("c1", acceptor="frontend")
+
+        reloaded = ContractRegistry(db_path=db_path)
+
+        c1 = reloaded.get_contract("c1")
+        assert c1.lifecycle_state == ContractLifecycle.IN_PROGRESS
+        assert [e.event_type for e in reloaded.get_contract_history("c1")] == ["proposed", "accepted"]
+        assert [c.contract_id for c in reloaded.get_dependents("c1")] == ["c2"]
+        assert reloaded.list_contracts(lifecycle_state=ContractLifecycle.IN_PROGRESS) == [c1]
+        assert [c.contract_id for c in reloaded.search_contracts("login")] == ["c1"]
+        assert reloaded.create_execution_plan().execution_order == ["c1", "c2"]
+
+        # New registrations continue the stored registration order
+        reloaded.register_contract(make_contract("c0"))
+        assert [c.contract_id for c in reloaded.list_contracts()] == ["c1", "c2", "c0"]
+
+    def test_store_tables_are_queryable(self, tmp_path):
+        db_path = str(tmp_path / "contracts.db")
+        registry = ContractRegistry(db_path=db_path)
+        registry.register_contract(make_contract("c1", tags=["ui", "auth"], consumer_agents=["qa"]))
+        registry.delete_contract("c1")
+
+        store = ContractStore(db_path)
+        assert store.count() == 1
+        assert store._conn.execute(
+            "SELECT lifecycle_state FROM contracts WHERE contract_id = 'c1'"
+        ).fetchone() == ("rejected",)
+        assert sorted(r[0] for r in store._conn.execute(
+            "SELECT tag FROM contract_tags WHERE contract_id = 'c1'"
+        )) == ["auth", "ui"]
+        store.close()
+
+    def test_contracts_stored_as_json_and_round_trip(self, tmp_path):
+        db_path = str(tmp_path / "contracts.db")
+        registry = ContractRegistry(db_path=db_path)
+        contract = make_contract(
+            "c1",
+            specification={"endpoints": ["/login"]},
+            acceptance_criteria=[AcceptanceCriterion("ac1", "Loads", "http", {"url": "/"})],
+        )
+        registry.register_contract(contract)
+        registry.propose_contract("c1", proposer="ux")
+        result = VerificationResult(
+            "c1", False, "failed", [CriterionResult("ac1", False, 500, 200, "error")]
+        )
+        contract.add_event(ContractVerifiedEvent("e1", "verified", "c1", verification_result=result))
+        contract.add_event(ContractBreachedEvent(
+            "e2", "breached", "c1", breach=ContractBreach("b1", "c1", "major", "down", ["ac1"])
+        ))
+        registry.update_contract(contract)
+
+        store = ContractStore(db_path)
+        data = store._conn.execute("SELECT data FROM contracts").fetchone()[0]
+        assert json.loads(data)["events"][0]["event_class"] == "ContractProposedEvent"
+
+        loaded = store.get("c1")
+        assert loaded.to_dict() == contract.to_dict()
+        assert loaded.events[0].contract is loaded
+        assert type(loaded.events[2].breach) is ContractBreach
+        assert store.get("missing") is None
+        store.close()
+
+    def test_reload_reads_contracts_on_demand(self, tmp_path):
+        db_path = str(tmp_path / "contracts.db")
+        contracts = random_contracts(50)
+        ContractRegistry(db_path=db_path).register_contracts(contracts)
+
+        reloaded = ContractRegistry(db_path=db_path)
+        assert all(isinstance(c, ContractSummary) for c in reloaded._contracts.peek_all())
+        assert [c.contract_id for c in reloaded.search_contracts("c001", ["contract_id"])] == [
+            f"c001{i}" for i in range(10)
+        ]
+        assert reloaded.get_contract("c0042").contract_id == "c0042"
+        loaded = [c for c in reloaded._contracts.peek_all() if isinstance(c, UniversalContract)]
+        assert len(loaded) == 11
+        assert reloaded.list_contracts() == contracts
@@ -0,0 +1,186 @@
+"""
+DDE Unit Tests: CapabilityRegistry skill index (memory-only mode)
+
+Tests the skill -> agents inverted index used for routing:
+- Posting lists sorted by proficiency
+- Availability bitsets
+- Incremental updates on capability and status changes
+- Indexed queries agree with a full scan
+
+Test IDs: DDE-1001 through DDE-1008
+"""
+
+import random
+
+import pytest
+
+from dde.capability_registry import (
+    AgentCapability,
+    AgentProfile,
+    CapabilityRegistry,
+    SkillIndex,
+)
+
+
+@pytest.fixture
+def registry():
+    reg = CapabilityRegistry(taxonomy_path="config/capability_taxonomy.yaml")
+    reg.register_agent("py-5", "Py Expert", "backend", {"Backend:Python": 5, "Testing:Unit": 3})
+    reg.register_agent("fastapi-3", "FastAPI Dev", "backend", {"Backend:Python:FastAPI": 3})
+    reg.register_agent("react-4", "React Dev", "frontend", {"Web:React": 4})
+    for agent_id in ("py-5", "fastapi-3", "react-4"):
+        reg.update_agent_status(agent_id, status="available")
+    return reg
+
+
+def scan_find_capable(reg, required_skills, min_proficiency=1, availability_required=False, limit=10):
+    """Reference implementation: full scan over every agent."""
+    search = set(required_skills)
+    for skill in required_skills:
+        search.update(reg.taxonomy.expand_capability(skill))
+    matches = []
+    for agent, _ in reg._agent_cache.values():
+        if availability_required and agent.availability_status != "available":
+            continue
+        overlap = {c.skill_id for c in agent.capabilities} & search
+        if overlap:
+            max_prof = max(agent.get_proficiency(s) for s in overlap)
+            if max_prof >= min_proficiency:
+                matches.append((agent, max_prof, len(overlap)))
+    matches.sort(key=lambda x: (x[1], x[2]), reverse=True)
+    return [a.agent_id for a, _, _ in matches[:limit]]
+
+
+def scan_route(reg, required_skills, min_proficiency=1, availability_required=True, limit=5):
+    """Reference implementation of route_task scoring every agent."""
+    candidates = []
+    for agent, _ in reg._agent_cache.values():
+        if availability_required and agent.availability_status != "available":
+            continue
+        score = reg.calculate_match_score(agent, required_skills)
+        if score.components["proficiency"] * 5 < min_proficiency:
+            continue
+        candidates.append((agent.agent_id, score.total))
+    candidates.sort(key=lambda x: x[1], reverse=True)
+    return candidates[:limit]
+
+
+@pytest.mark.unit
+@pytest.mark.dde
+class TestSkillIndex:
+    """Index structure (DDE-1001 to DDE-1003)"""
+
+    def test_dde_1001_postings_sorted_by_proficiency(self, registry):
+        """DDE-1001: Posting lists list the most proficient agents first"""
+        registry.register_agent("py-2", "Py Junior", "backend", {"Backend:Python": 2})
+        registry.register_agent("py-4", "Py Senior", "backend", {"Backend:Python": 4})
+
+        postings = registry._index.postings("Backend:Python")
+        assert postings == [("py-5", 5), ("py-4", 4), ("py-2", 2)]
+        assert registry.get_capability_coverage()["Backend:Python"] == 3
+
+    def test_dde_1002_availability_bitsets(self, registry):
+        """DDE-1002: Status changes move agents between availability bitsets"""
+        index = registry._index
+        assert index.agent_ids(index.status_mask("available")) == ["py-5", "fastapi-3", "react-4"]
+
+        registry.update_agent_status("fastapi-3", status="busy")
+        assert index.agent_ids(index.status_mask("available")) == ["py-5", "react-4"]
+        assert index.agent_ids(index.status_mask("busy")) == ["fastapi-3"]
+
+    def test_dde_1003_min_proficiency_mask(self):
+        """DDE-1003: skill_mask honours minimum proficiency via the sorted postings"""
+        index = SkillIndex()
+        for agent_id, prof in (("a", 1), ("b", 3), ("c", 5)):
+            index.upsert(AgentProfile(
+                agent_id=agent_id, name=agent_id, persona_type="dev",
+                capabilities=[AgentCapability(skill_id="Data:SQL", proficiency=prof)]
+            ))
+
+        assert index.agent_ids(index.skill_mask(["Data:SQL"], min_proficiency=3)) == ["b", "c"]
+        assert index.agent_ids(index.skill_mask(["Data:SQL"])) == ["a", "b", "c"]
+
+
+@pytest.mark.unit
+@pytest.mark.dde
+class TestIncrementalUpdates:
+    """Index maintenance (DDE-1004 to DDE-1006)"""
+
+    def test_dde_1004_add_and_update_capability(self, registry):
+        """DDE-1004: add_capability/update_capability are reflected immediately"""
+        registry.add_capability("react-4", "Backend:Python:Django", 4)
+        assert "react-4" in [a.agent_id for a in registry.find_capable_agents(["Backend:Python:Django"])]
+
+        registry.update_capability("fastapi-3", "Backend:Python:FastAPI", 5)
+        assert registry._index.postings("Backend:Python:FastAPI") == [("fastapi-3", 5)]
+
+    def test_dde_1005_remove_capability_and_unregister(self, registry):
+        """DDE-1005: Removed capabilities and agents leave the index"""
+        registry.remove_capability("py-5", "Testing:Unit")
+        assert registry.find_capable_agents(["Testing:Unit"]) == []
+        assert "Testing:Unit" not in registry.get_capability_coverage()
+
+        registry.unregister_agent("react-4")
+        assert "react-4" not in registry._index
+        assert registry.find_capable_agents(["Web:React"]) == []
+
+    def test_dde_1006_status_filter_in_queries(self, registry):
+        """DDE-1006: Unavailable agents drop out of availability-filtered queries"""
+        registry.update_agent_status("py-5", status="offline")
+
+        capable = registry.find_capable_agents(["Backend:Python:FastAPI"], availability_required=True)
+        assert [a.agent_id for a in capable] == ["fastapi-3"]
+        # FastAPI is a child of Backend:Python, so it does not satisfy the parent skill
+        assert registry.route_task(["Backend:Python"]) == []
+        assert [a.agent_id for a, _ in registry.route_task(["Backend:Python:FastAPI"])] == ["fastapi-3"]
+
+
+@pytest.mark.unit
+@pytest.mark.dde
+class TestIndexedQueriesMatchScan:
+    """Equivalence with a full scan (DDE-1007 to DDE-1008)"""
+
+    @pytest.fixture
+    def large_registry(self):
+        rng = random.Random(7)
+        reg = CapabilityRegistry(taxonomy_path="config/capability_taxonomy.yaml")
+        skills = [f"Cat{c}:Lang{l}:Fw{f}" for c in range(3) for l in range(3) for f in range(3)]
+        skills += [f"Cat{c}:Lang{l}" for c in range(3) for l in range(3)]
+        for i in range(300):
+            caps = {s: rng.randint(1, 5) for s in rng.sample(skills, 4)}
+            reg.register_agent(f"agent-{i}", f"Agent {i}", "dev", caps)
+            reg.update_agent_status(
+                f"agent-{i}",
+                status=rng.choice(["available", "busy", "offline"]),
+                wip=rng.randint(0, 3)
+            )
+            reg.record_quality_score(f"agent-{i}", f"task-{i}", rng.random())
+        return reg
+
+    @pytest.mark.parametrize("required,min_prof,available", [
+        (["Cat0:Lang1:Fw2"], 1, False),
+        (["Cat1:Lang0:Fw0", "Cat2:Lang2"], 3, True),
+        (["Cat2:Lang1:Fw1"], 5, False),
+    ])
+    def test_dde_1007_find_capable_agents(self, large_registry, required, min_prof, available):
+        """DDE-1007: find_capable_agents matches the full-scan result"""
+        indexed = large_registry.find_capable_agents(
+            required, min_proficiency=min_prof, availability_required=available, limit=50
+        )
+        assert [a.agent_id for a in indexed] == scan_find_capable(
+            large_registry, required, min_prof, available, limit=50
+        )
+
+    @pytest.mark.parametrize("required,min_prof", [
+        (["Cat0:Lang1:Fw2"], 1),
+        (["Cat1:Lang0:Fw0", "Cat2:Lang2"], 3),
+    ])
+    def test_dde_1008_route_task(self, large_registry, required, min_prof):
+        """DDE-1008: route_task ranks the same agents as scoring every agent"""
+        routed = large_registry.route_task(required, min_proficiency=min_prof, limit=10)
+        expected = scan_route(large_registry, required, min_prof, limit=10)
+
+        assert [(a.agent_id, s.total) for a, s in routed] == expected
+        assert large_registry.get_best_agent(required)[0].agent_id == scan_route(
+            large_registry, required, limit=1
+        )[0][0]
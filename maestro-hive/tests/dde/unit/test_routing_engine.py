@@ -0,0 +1,202 @@
+"""
+DDE Unit Tests: RoutingEngine batch assignment
+
+Tests batch routing as a global assignment problem:
+- Hungarian fallback agrees with brute force
+- Optimal plan beats greedy on contended batches
+- WIP capacity is respected
+- SciPy and pure-Python solvers agree
+- route_batch commits WIP and routing stats
+- TaskMatcher.score_batch agrees with per-pair scoring
+
+Test IDs: DDE-1101 through DDE-1107
+"""
+
+import itertools
+import random
+
+import pytest
+
+import dde.agent_evaluator as agent_evaluator_module
+import dde.agent_registry as agent_registry_module
+import dde.performance_tracker as performance_tracker_module
+import dde.routing_engine as routing_engine_module
+import dde.task_matcher as task_matcher_module
+from dde.agent_registry import AgentCapability, AgentProfile, AgentRegistry
+from dde.performance_tracker import PerformanceTracker
+from dde.routing_engine import (
+    RoutingEngine,
+    RoutingStrategy,
+    _hungarian,
+    benchmark_batch_routing,
+)
+from dde.task_matcher import TaskRequirements
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """RoutingEngine over an empty registry and tracker in tmp_path."""
+    monkeypatch.setattr(agent_registry_module, "_registry",
+                        AgentRegistry(storage_path=str(tmp_path / "agents")))
+    monkeypatch.setattr(performance_tracker_module, "_tracker",
+                        PerformanceTracker(storage_path=str(tmp_path / "performance")))
+    monkeypatch.setattr(task_matcher_module, "_matcher", None)
+    monkeypatch.setattr(agent_evaluator_module, "_evaluator", None)
+    return RoutingEngine()
+
+
+def make_agent(agent_id, skills, wip_limit=1):
+    return AgentProfile(
+        agent_id=agent_id,
+        name=agent_id,
+        persona_type="test",
+        wip_limit=wip_limit,
+        capabilities=[AgentCapability(skill_id=s, proficiency=p) for s, p in skills.items()]
+    )
+
+
+def make_task(task_id, skills, effort=1.0):
+    return TaskRequirements(
+        task_id=task_id,
+        task_type="test",
+        required_skills=skills,
+        estimated_effort_hours=effort
+    )
+
+
+def contended_batch():
+    """The generalist is slightly better at Python, but the only React agent."""
+    agents = [
+        make_agent("generalist", {"Backend:Python": 5, "Frontend:React": 4}),
+        make_agent("python-dev", {"Backend:Python": 4}),
+    ]
+    tasks = [
+        make_task("py-task", ["Backend:Python"]),
+        make_task("react-task", ["Frontend:React"]),
+    ]
+    return tasks, agents
+
+
+@pytest.mark.unit
+@pytest.mark.dde
+class TestBatchAssignment:
+    """Batch planning without side effects"""
+
+    def test_dde_1101_hungarian_matches_brute_force(self):
+        """DDE-1101: Pure-Python Hungarian finds the minimum-cost assignment"""
+        rng = random.Random(7)
+        for rows, cols in [(3, 3), (3, 5), (5, 3), (4, 6)]:
+            cost = [[rng.uniform(0, 10) for _ in range(cols)] for _ in range(rows)]
+            pairs = _hungarian(cost)
+            assert len(pairs) == min(rows, cols)
+
+            if rows <= cols:
+                best = min(
+                    sum(cost[r][c] for r, c in enumerate(perm))
+                    for perm in itertools.permutations(range(cols), rows)
+                )
+            else:
+                best = min(
+                    sum(cost[r][c] for c, r in enumerate(perm))
+                    for perm in itertools.permutations(range(rows), cols)
+                )
+            assert sum(cost[r][c] for r, c in pairs) == pytest.approx(best)
+
+    def test_dde_1102_optimal_beats_greedy_on_contended_batch(self, engine):
+        """DDE-1102: Greedy lets the first task take the only React agent"""
+        tasks, agents = contended_batch()
+
+        greedy = engine.plan_batch(tasks, method="greedy", agents=agents)
+        optimal = engine.plan_batch(tasks, method="optimal", agents=agents)
+
+        assert greedy.assignments == {"py-task": "generalist"}
+        assert greedy.unassigned == ["react-task"]
+        assert optimal.assignments == {"py-task": "python-dev", "react-task": "generalist"}
+        assert optimal.unassigned == []
+        assert optimal.total_score > greedy.total_score
+
+    def test_dde_1103_capacity_respected(self, engine):
+        """DDE-1103: No agent receives more tasks than free WIP slots"""
+        agents = [
+            make_agent("a", {"Backend:Python": 5}, wip_limit=3),
+            make_agent("b", {"Backend:Python": 3}, wip_limit=2),
+        ]
+        agents[0].current_wip = 1
+        tasks = [make_task(f"t{i}", ["Backend:Python"], effort=i + 1) for i in range(6)]
+
+        for method in ("optimal", "greedy"):
+            plan = engine.plan_batch(tasks, method=method, agents=agents)
+            counts = {}
+            for agent_id in plan.assignments.values():
+                counts[agent_id] = counts.get(agent_id, 0) + 1
+            assert counts == {"a": 2, "b": 2}
+            assert len(plan.unassigned) == 2
+            assert plan.makespan_hours == max(plan.agent_load_hours.values())
+
+    def test_dde_1104_scipy_and_fallback_agree(self, engine, monkeypatch):
+        """DDE-1104: SciPy and the Hungarian fallback reach the same optimum"""
+        pytest.importorskip("scipy")
+        tasks, agents = routing_engine_module._synthetic_batch(40, 12, random.Random(3))
+
+        with_scipy = engine.plan_batch(tasks, agents=agents)
+        monkeypatch.setattr(routing_engine_module, "SCIPY_AVAILABLE", False)
+        fallback = engine.plan_batch(tasks, agents=agents)
+
+        assert with_scipy.solver == "scipy"
+        assert fallback.solver == "hungarian"
+        assert len(fallback.assignments) == len(with_scipy.assignments)
+        assert fallback.total_score == pytest.approx(with_scipy.total_score)
+
+
+@pytest.mark.unit
+@pytest.mark.dde
+class TestBatchRouting:
+    """route_batch with OPTIMAL_ASSIGNMENT"""
+
+    def test_dde_1105_route_batch_commits_wip_and_stats(self, engine):
+        """DDE-1105: Optimal batch routing updates agent WIP and routing stats"""
+        tasks, agents = contended_batch()
+        for agent in agents:
+            engine.registry.register_agent(agent)
+
+        decisions = engine.route_batch(tasks, strategy=RoutingStrategy.OPTIMAL_ASSIGNMENT)
+
+        assert {d.task_id: d.agent_id for d in decisions} == {
+            "py-task": "python-dev", "react-task": "generalist"
+        }
+        assert all(d.strategy_used == "optimal_assignment" for d in decisions)
+        assert engine.registry.get_agent("generalist").current_wip == 1
+        assert engine.registry.get_agent("python-dev").current_wip == 1
+        assert engine.get_routing_stats()['total_routed'] == 2
+
+        # Both agents are now at their WIP limit
+        assert engine.route_batch(tasks, strategy=RoutingStrategy.OPTIMAL_ASSIGNMENT) == []
+
+    def test_dde_1106_benchmark_reports_both_methods(self, engine):
+        """DDE-1106: Benchmark compares greedy and optimal on the same batch"""
+        results = benchmark_batch_routing(batch_sizes=(60,), engine=engine)
+
+        assert len(results) == 1
+        result = results[0]
+        assert result['tasks'] == 60
+        assert result['optimal']['assigned'] >= result['greedy']['assigned']
+        if result['optimal']['assigned'] == result['greedy']['assigned']:
+            assert result['score_gain'] >= 0
+        assert engine.registry.list_agents() == []
+
+    def test_dde_1107_score_batch_matches_pair_scores(self, engine):
+        """DDE-1107: Batch rows equal per-pair scores minus the load component"""
+        tasks, agents = contended_batch()
+        tasks.append(make_task("py-task-2", ["Backend:Python"]))
+        matcher = engine.matcher
+
+        rows = matcher.score_batch(tasks, agents)
+        assert rows[0] is rows[2]
+        assert rows[1][1] is None
+        for task, row in zip(tasks, rows):
+            for agent, base in zip(agents, row):
+                if base is None:
+                    continue
+                match = matcher.score(agent, task)
+                load = match.load_score * matcher.weights['load']
+                assert base == pytest.approx(match.score - load)
@@ -0,0 +1,153 @@
+"""
+Tests for AgentTracer tail sampling, recent-trace store and batched export.
+
+Tests cover:
+- Failed and slow traces are always kept; the rest follow sample_rate
+- Finished traces live in a bounded ring buffer
+- Active traces and spans per trace are bounded
+- OTLP/JSON encoding and batched export to a JSON lines file
+- Export queue drops the oldest payloads when full
+"""
+
+import json
+import threading
+from datetime import timedelta
+
+import pytest
+
+from maestro_hive.execution.agent_tracer import (
+    AgentTracer,
+    SpanKind,
+    SpanStatus,
+    TracerConfig,
+)
+from maestro_hive.execution.trace_export import BatchSpanExporter
+
+
+def run_trace(tracer, name="op", fail=False, duration_ms=None):
+    trace = tracer.start_trace(name, metadata={"workflow": "wf-1"})
+    span = tracer.start_span("child", kind=SpanKind.CLIENT, attributes={"n": 1, "ok": True})
+    tracer.end_span(span, SpanStatus.ERROR if fail else SpanStatus.OK, "boom" if fail else None)
+    if duration_ms is not None:
+        trace.start_time -= timedelta(milliseconds=duration_ms)
+    return tracer.end_trace(trace.trace_id)
+
+
+class TestTailSampling:
+    """Sampling decisions are made when the trace ends."""
+
+    def test_slow_and_failed_traces_always_kept(self):
+        tracer = AgentTracer(TracerConfig(sample_rate=0.0, slow_trace_threshold_ms=1000))
+
+        fast = run_trace(tracer)
+        failed = run_trace(tracer, fail=True)
+        slow = run_trace(tracer, duration_ms=2000)
+
+        assert tracer.get_trace(fast.trace_id) is None
+        assert tracer.get_trace(failed.trace_id).metadata["sampling.reason"] == "error"
+        assert tracer.get_trace(slow.trace_id).metadata["sampling.reason"] == "slow"
+        assert tracer.get_stats()["sampling"] == {
+            "kept_error": 1,
+            "kept_slow": 1,
+            "kept_sampled": 0,
+            "dropped": 1,
+            "abandoned": 0,
+        }
+
+    def test_sample_rate_applies_to_normal_traces(self):
+        tracer = AgentTracer(TracerConfig(sample_rate=1.0))
+        trace = run_trace(tracer)
+        assert tracer.get_trace(trace.trace_id).metadata["sampling.reason"] == "sampled"
+
+
+class TestBoundedStore:
+    """Memory stays bounded regardless of trace volume."""
+
+    def test_recent_traces_ring_buffer(self):
+        tracer = AgentTracer(TracerConfig(max_recent_traces=3))
+        traces = [run_trace(tracer, name=f"op{i}") for i in range(5)]
+
+        recent = tracer.get_recent_traces()
+        assert [t.trace_id for t in recent] == [t.trace_id for t in reversed(traces[2:])]
+        assert tracer.get_trace(traces[0].trace_id) is None
+        assert tracer.get_stats()["active_traces"] == 0
+
+        assert tracer.clear_completed_traces(max_age_hours=0) == 3
+        assert tracer.get_recent_traces() == []
+
+    def test_active_traces_and_spans_bounded(self):
+        tracer = AgentTracer(TracerConfig(max_active_traces=2, max_spans_per_trace=2))
+        first = tracer.start_trace("a")
+        for _ in range(4):
+            tracer.end_span(tracer.start_span("s"))
+        assert len(first.spans) == 2
+        assert first.metadata["dropped_spans"] == 2
+
+        tracer.start_trace("b")
+        tracer.start_trace("c")
+        assert tracer.get_trace(first.trace_id) is None
+        assert tracer.get_stats()["sampling"]["abandoned"] == 1
+
+
+class TestExport:
+    """OTLP/JSON encoding and background batch export."""
+
+    def test_otlp_encoding(self):
+        tracer = AgentTracer(TracerConfig(service_name="svc"))
+        trace = run_trace(tracer, fail=True)
+
+        payload = json.loads(tracer.export_trace(trace.trace_id, format="otlp"))
+        resource_spans = payload["resourceSpans"][0]
+        assert {"key": "service.name", "value": {"stringValue": "svc"}} in \
+            resource_spans["resource"]["attributes"]
+
+        root, child = resource_spans["scopeSpans"][0]["spans"]
+        assert root["traceId"] == trace.trace_id and len(root["spanId"]) == 16
+        assert "parentSpanId" not in root
+        assert child["parentSpanId"] == root["spanId"]
+        assert child["kind"] == 3
+        assert child["status"] == {"code": 2, "message": "boom"}
+        assert {"key": "n", "value": {"intValue": "1"}} in child["attributes"]
+        assert {"key": "ok", "value": {"boolValue": True}} in child["attributes"]
+        assert int(child["endTimeUnixNano"]) >= int(child["startTimeUnixNano"]) > 0
+
+    def test_batched_export_to_file(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        tracer = AgentTracer(TracerConfig(
+            sample_rate=0.0,
+            export_path=str(path),
+            export_batch_size=2,
+            export_interval_ms=60_000,
+        ))
+        kept = [run_trace(tracer, fail=True) for _ in range(3)]
+        run_trace(tracer)  # Dropped by sampling
+
+        assert tracer.flush(timeout=5)
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [l["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["traceId"] for l in lines] == \
+            [t.trace_id for t in kept]
+        assert tracer.get_stats()["exporters"][0]["exported"] == 3
+        tracer.shutdown()
+
+    def test_export_queue_drops_oldest_when_full(self):
+        release = threading.Event()
+        written = []
+
+        class BlockingSink:
+            def write(self, payloads):
+                release.wait(5)
+                written.extend(payloads)
+
+        exporter = BatchSpanExporter(BlockingSink(), max_queue_size=3, batch_size=1, interval_ms=10)
+        exporter.enqueue({"n": 0})  # Picked up by the blocked writer
+        for _ in range(100):
+            if exporter.get_stats()["queued"] == 0:
+                break
+            threading.Event().wait(0.01)
+        for n in range(1, 6):
+            exporter.enqueue({"n": n})
+
+        assert exporter.get_stats()["dropped"] == 2
+        release.set()
+        exporter.shutdown(timeout=5)
+        assert [p["n"] for p in written] == [0, 3, 4, 5]
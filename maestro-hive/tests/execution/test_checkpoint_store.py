@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Unit tests for CheckpointStore and content-addressed CheckpointManager storage
+
+Tests cover:
+- Round trip and chunk sharing between near-identical checkpoints
+- Manifest listing without reading payloads
+- Integrity verification of stored chunks
+- Pruning and garbage collection of unreferenced chunks
+- CheckpointManager listing of mixed JSON-file and stored checkpoints
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from maestro_hive.execution.checkpoint_manager import CheckpointManager
+from maestro_hive.execution.checkpoint_store import (
+    CheckpointIntegrityError,
+    CheckpointStore,
+)
+
+
+def workflow_state(phase, personas=20):
+    return {
+        "workflow_id": "wf-store",
+        "phase": phase,
+        "persona_states": {
+            f"persona_{i}": {"status": "done", "output": "x" * 2000, "index": i}
+            for i in range(personas)
+        },
+        "metrics": {"phase": phase},
+    }
+
+
+class TestCheckpointStore:
+    """Tests for CheckpointStore"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return CheckpointStore(tmp_path, gc_grace_seconds=0)
+
+    def test_round_trip_and_chunk_sharing(self, store):
+        first = store.save("wf-store", workflow_state("design"), phase="design")
+        # 20 personas, workflow_id, phase, metrics and the tree
+        assert store.get_stats()["objects"] == 24
+
+        state = workflow_state("build")
+        state["persona_states"]["persona_3"]["status"] = "retrying"
+        second = store.save("wf-store", state, phase="build")
+
+        assert store.load("wf-store", first.checkpoint_id) == workflow_state("design")
+        assert store.load("wf-store", second.checkpoint_id) == state
+        assert first.tree != second.tree
+        assert (first.version, second.version) == (1, 2)
+
+        # Only the changed persona, phase, metrics and the tree are new
+        assert store.get_stats()["objects"] == 28
+        assert second.size_bytes == pytest.approx(first.size_bytes, abs=20)
+        assert second.stored_bytes < first.stored_bytes
+        stats = store.get_stats()
+        assert stats["stored_bytes"] < stats["logical_bytes"] / 10
+
+    def test_manifest_listing_does_not_read_payloads(self, store, monkeypatch):
+        ids = [store.save("wf-store", workflow_state(p), phase=p).checkpoint_id
+               for p in ("design", "build", "test")]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("payload read")
+
+        monkeypatch.setattr(store, "get_object", fail)
+        assert [e.checkpoint_id for e in store.entries("wf-store")] == ids
+        assert store.latest("wf-store").phase == "test"
+        assert store.get_entry("wf-store", ids[1]).phase == "build"
+
+    def test_resaving_id_replaces_entry(self, store):
+        store.save("wf-store", {"step": 1}, checkpoint_id="cp")
+        store.save("wf-store", {"step": 2}, checkpoint_id="cp")
+        assert len(store.entries("wf-store")) == 1
+        assert store.load("wf-store", "cp") == {"step": 2}
+
+    def test_corrupted_chunk_detected(self, store):
+        entry = store.save("wf-store", {"payload": "original"})
+        digest = store.get_object(entry.tree)["fields"]["payload"]
+        store._object_path(digest).write_bytes(b'"tampered"')
+
+        with pytest.raises(CheckpointIntegrityError):
+            store.load("wf-store", entry.checkpoint_id)
+        assert store.load("wf-store", entry.checkpoint_id, verify=False) == {"payload": "tampered"}
+
+    def test_prune_and_gc(self, store):
+        for phase in ("design", "build", "test"):
+            store.save("wf-store", {"phase": phase, "blob": phase * 1000})
+        shared = store.save("wf-other", {"blob": "design" * 1000})
+
+        assert store.prune("wf-store", keep=1) == 2
+        deleted = store.gc()
+
+        # Two trees and two "phase" chunks; the design blob is still referenced by wf-other
+        assert deleted == 5
+        assert store.load("wf-other", shared.checkpoint_id) == {"blob": "design" * 1000}
+        assert store.load("wf-store", store.latest("wf-store").checkpoint_id)["phase"] == "test"
+
+    def test_maybe_gc_is_amortised(self, tmp_path):
+        store = CheckpointStore(tmp_path, gc_grace_seconds=0, gc_interval=3)
+        for step in range(5):
+            store.save("wf-store", {"step": step})
+
+        store.prune("wf-store", keep=3)
+        assert store.maybe_gc() == 0
+        assert len(list(store.objects_dir.glob("??/*"))) == 10
+
+        store.prune("wf-store", keep=2)
+        # Third deletion: the trees and step chunks of all three go
+        assert store.maybe_gc() == 6
+        assert store.maybe_gc() == 0
+        assert len(list(store.objects_dir.glob("??/*"))) == 4
+
+    def test_maybe_gc_after_garbage_bytes(self, tmp_path):
+        store = CheckpointStore(tmp_path, gc_grace_seconds=0, gc_garbage_bytes=1)
+        store.save("wf-store", {"step": 1})
+        store.save("wf-store", {"step": 2})
+
+        store.prune("wf-store", keep=1)
+        assert store.maybe_gc() == 2
+
+
+class TestCheckpointManagerStore:
+    """Tests for CheckpointManager with content-addressed checkpoints"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        manager = CheckpointManager(checkpoint_dir=tmp_path, max_checkpoints_per_workflow=3)
+        manager.store.gc_grace_seconds = 0
+        return manager
+
+    def test_mixed_listing_and_rotation(self, manager):
+        workflow_dir = manager.checkpoint_dir / "wf-mixed"
+        workflow_dir.mkdir()
+        with open(workflow_dir / "checkpoint_legacy.json", "w") as f:
+            json.dump({
+                "workflow_id": "wf-mixed",
+                "checkpoint_metadata": {"version": 1, "created_at": "2020-01-01T00:00:00"},
+            }, f)
+
+        saved = [manager.save_checkpoint("wf-mixed", p, {"workflow_id": "wf-mixed", "phase": p})
+                 for p in ("design", "build")]
+        checkpoints = manager.list_checkpoints("wf-mixed")
+
+        assert [cp.phase for cp in checkpoints] == ["build", "design", "legacy"]
+        assert manager.load_checkpoint(checkpoints[0]) == {"workflow_id": "wf-mixed", "phase": "build"}
+        assert manager.load_checkpoint(checkpoints[2])["workflow_id"] == "wf-mixed"
+        assert manager.get_latest_checkpoint("wf-mixed").checkpoint_id == saved[1].checkpoint_id
+
+        manager.save_checkpoint("wf-mixed", "test", {"phase": "test"})
+        assert [cp.phase for cp in manager.list_checkpoints("wf-mixed")] == ["test", "build", "design"]
+        assert not (workflow_dir / "checkpoint_legacy.json").exists()
+
+    def test_file_index_skips_unchanged_files(self, manager, monkeypatch):
+        workflow_dir = manager.checkpoint_dir / "wf-index"
+        workflow_dir.mkdir()
+        for phase in ("design", "build"):
+            with open(workflow_dir / f"checkpoint_{phase}.json", "w") as f:
+                json.dump({"workflow_id": "wf-index", "checkpoint_metadata": {"version": 1}}, f)
+
+        first = manager.list_checkpoints("wf-index")
+        parsed = []
+        original = manager._parse_checkpoint
+        monkeypatch.setattr(
+            manager, "_parse_checkpoint",
+            lambda path, wf: parsed.append(path.name) or original(path, wf),
+        )
+
+        assert manager.list_checkpoints("wf-index") == first
+        assert parsed == []
+
+        with open(workflow_dir / "checkpoint_build.json", "w") as f:
+            json.dump({"workflow_id": "wf-index", "checkpoint_metadata": {"version": 2}}, f)
+        versions = {cp.phase: cp.version for cp in manager.list_checkpoints("wf-index")}
+        assert parsed == ["checkpoint_build.json"]
+        assert versions == {"design": 1, "build": 2}
+
+    def test_archive_includes_stored_checkpoints(self, manager, tmp_path):
+        import zipfile
+
+        manager.save_checkpoint("wf-archive", "design", {"workflow_id": "wf-archive"})
+        archive = manager.archive_workflow("wf-archive", archive_dir=tmp_path / "out")
+
+        names = zipfile.ZipFile(archive).namelist()
+        assert len(names) == 1 and names[0].startswith("checkpoint_design_")
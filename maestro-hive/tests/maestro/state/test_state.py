@@ -8,10 +8,13 @@ Tests all acceptance criteria:
 - AC-4: State recovery on restart
 """
 
+import multiprocessing
+import os
 import shutil
 import tempfile
 import threading
 import time
+import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -30,6 +33,12 @@ from maestro_hive.maestro.state import (
     StateSync,
     StateVersioning,
 )
+from maestro_hive.maestro.state.asyncpg_backend import AsyncPostgreSQLStateStore
+from maestro_hive.maestro.state.postgres_backend import (
+    advance_change_feed,
+    assign_batch_versions,
+    schema_statements,
+)
 from maestro_hive.maestro.state.sync import SyncEvent, SyncStatus
 
 
@@ -285,6 +294,253 @@ class TestPostgreSQLStateStore:
         assert hasattr(store, "list_keys")
         assert hasattr(store, "list_versions")
 
+    def test_schema_tracks_version_heads(self):
+        """Versions come from the heads table, backfilled once."""
+        ddl = "\n".join(schema_statements("entries"))
+        assert "CREATE TABLE entries_heads" in ddl
+        assert "SELECT key, MAX(version) FROM entries GROUP BY key" in ddl
+
+    def test_batch_versions_follow_input_order(self):
+        """Repeated keys in a batch take consecutive versions in order."""
+        rows = [("b", 1), ("a", 5), ("a", 4), ("a", 6)]
+        assert assign_batch_versions(["a", "b", "a", "a"], rows) == [4, 1, 5, 6]
+
+    def test_change_feed_skips_rows_already_delivered(self):
+        """Overlap re-reads are dropped; late commits below the watermark are not."""
+        batch = advance_change_feed((10, (9, 10)), [("a", 2, None, 9), ("b", 1, None, 10)])
+        assert batch.changes == [] and batch.cursor == (10, (9, 10))
+
+        rows = [("late", 1, None, 8), ("a", 2, None, 9), ("c", 1, None, 11)]
+        batch = advance_change_feed(batch.cursor, rows, overlap=2)
+        assert [(c.key, c.version) for c in batch.changes] == [("late", 1), ("c", 1)]
+        assert batch.cursor == (11, (10, 11))
+
+
+class TestAsyncPostgreSQLStateStore:
+    """Tests for AsyncPostgreSQLStateStore write-behind buffering."""
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        store = AsyncPostgreSQLStateStore("postgresql://unused", max_buffer=3)
+        store.batches = []
+
+        async def save_many(entries, component_id=None):
+            store.batches.append((component_id, [e[0] for e in entries]))
+            return [StateEntry(key=e[0], value=e[1], version=1) for e in entries]
+
+        monkeypatch.setattr(store, "save_many", save_many)
+        return store
+
+    async def test_deferred_saves_flush_in_batches(self, store):
+        await store.save_deferred("a", {"n": 1}, component_id="c1")
+        await store.save_deferred("b", {"n": 2}, component_id="c2")
+        assert store.batches == []
+        assert await store.exists("a")
+
+        await store.save_deferred("a", {"n": 3}, component_id="c1")
+        assert store.batches == [("c1", ["a"]), ("c2", ["b"]), ("c1", ["a"])]
+        assert store.get_stats()["buffered"] == 0
+        assert store._pending_keys == {}
+
+    async def test_flush_keeps_buffer_order_across_components(self, store):
+        store.max_buffer = 10
+        await store.save_deferred("k", {"v": 1}, component_id="A")
+        await store.save_deferred("k", {"v": 2}, component_id="B")
+        await store.save_deferred("j", {"v": 1}, component_id="B")
+        await store.save_deferred("k", {"v": 3}, component_id="A")
+        await store.flush()
+        assert store.batches == [("A", ["k"]), ("B", ["k", "j"]), ("A", ["k"])]
+
+    async def test_failed_flush_requeues_unwritten_runs(self, store):
+        store.max_buffer = 10
+        calls = []
+
+        async def fail_second(entries, component_id=None):
+            calls.append(component_id)
+            if len(calls) == 2:
+                raise ConnectionError("down")
+            return [StateEntry(key=e[0], value=e[1], version=1) for e in entries]
+
+        store.save_many = fail_second
+        for component_id in ("A", "B", "A"):
+            await store.save_deferred("k", {"c": component_id}, component_id=component_id)
+        with pytest.raises(ConnectionError):
+            await store.flush()
+        assert [item[2] for item in store._buffer] == ["B", "A"]
+        assert store._pending_keys == {"k": 2}
+
+    async def test_failed_flush_requeues_unwritten(self, store):
+        async def fail(entries, component_id=None):
+            raise ConnectionError("down")
+
+        await store.save_deferred("a", {"n": 1})
+        store.save_many = fail
+        with pytest.raises(ConnectionError):
+            await store.flush()
+        assert store.get_stats()["buffered"] == 1
+        assert "a" in store._pending_keys
+
+    async def test_unavailable_without_asyncpg(self, monkeypatch):
+        from maestro_hive.maestro.state import asyncpg_backend
+
+        monkeypatch.setattr(asyncpg_backend, "ASYNCPG_AVAILABLE", False)
+        store = AsyncPostgreSQLStateStore("postgresql://unused")
+        assert store.is_available is False
+        with pytest.raises(RuntimeError):
+            await store.connect()
+
+
+@pytest.fixture(scope="module")
+def postgres_url(tmp_path_factory):
+    """
+    PostgreSQL DSN: MAESTRO_TEST_POSTGRES_URL, else a throwaway pgserver
+    instance; skipped when neither is available.
+    """
+    url = os.environ.get("MAESTRO_TEST_POSTGRES_URL")
+    if url:
+        yield url
+        return
+    pgserver = pytest.importorskip("pgserver")
+    server = pgserver.get_server(str(tmp_path_factory.mktemp("pgdata")), cleanup_mode="stop")
+    yield server.get_uri()
+    server.cleanup()
+
+
+class TestPostgreSQLIntegration:
+    """Runs the backends' SQL against a real database."""
+
+    @pytest.fixture
+    def table(self):
+        return f"state_{uuid.uuid4().hex[:10]}"
+
+    @pytest.fixture
+    def store(self, postgres_url, table):
+        pytest.importorskip("psycopg2")
+        store = PostgreSQLStateStore(postgres_url, table_name=table)
+        assert store.is_available()
+        yield store
+        store.close()
+
+    def test_save_and_batch_versions(self, store):
+        assert store.save("a", {"n": 1}, component_id="c1").version == 1
+        assert store.save("a", {"n": 2}).version == 2
+
+        saved = store.save_many([("a", {"n": 3}), ("b", {"n": 1}), ("a", {"n": 4}, {"m": 1})], "c2")
+        assert [(e.key, e.version) for e in saved] == [("a", 3), ("b", 1), ("a", 4)]
+
+        latest = store.load("a")
+        assert latest.version == 4 and latest.value == {"n": 4}
+        assert latest.metadata == {"m": 1} and latest.component_id == "c2"
+        assert store.load("a", version=1).value == {"n": 1}
+        assert [e.version for e in store.list_versions("a")] == [1, 2, 3, 4]
+        assert store.get_latest_version("a") == 4
+        assert store.list_keys() == ["a", "b"]
+
+    def test_concurrent_saves_never_collide(self, store):
+        errors = []
+
+        def worker(i):
+            try:
+                for j in range(10):
+                    store.save("shared", {"w": i, "j": j})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert [e.version for e in store.list_versions("shared")] == list(range(1, 41))
+
+    def test_change_feed_and_delete(self, store):
+        store.save("a", {"n": 1})
+        snapshot = store.changes_since(None)
+        assert snapshot.snapshot and [(c.key, c.version) for c in snapshot.changes] == [("a", 1)]
+
+        store.save_many([("b", {"n": 1}), ("a", {"n": 2})])
+        assert store.delete("b")
+        batch = store.changes_since(snapshot.cursor)
+        assert not batch.snapshot
+        assert [(c.key, c.version) for c in batch.changes] == [("a", 2), ("b", 0)]
+        assert store.list_keys() == ["a"] and store.get_latest_version("b") == 0
+
+        idle = store.changes_since(batch.cursor)
+        assert idle.changes == [] and idle.cursor == batch.cursor
+        store.save("c", {"n": 1})
+        batch = store.changes_since(batch.cursor)
+        assert [(c.key, c.version) for c in batch.changes] == [("c", 1)]
+
+    def test_pruned_deletions_force_snapshot(self, store):
+        store.save("a", {"n": 1})
+        store.save("b", {"n": 1})
+        stale = store.changes_since(None).cursor
+        assert store.delete("b")
+        current = store.changes_since(stale).cursor
+
+        assert store.prune_deletions(max_age_seconds=0) == 1
+        batch = store.changes_since(stale)
+        assert batch.snapshot and [(c.key, c.version) for c in batch.changes] == [("a", 1)]
+        assert not store.changes_since(current).snapshot
+
+    def test_heads_backfilled_for_existing_table(self, postgres_url, table):
+        pytest.importorskip("psycopg2")
+        import psycopg2
+
+        conn = psycopg2.connect(postgres_url)
+        with conn, conn.cursor() as cur:
+            cur.execute(schema_statements(table)[0])
+            cur.execute(
+                f"INSERT INTO {table} (key, value, version) VALUES ('a', '{{}}', 1), ('a', '{{}}', 2)"
+            )
+        conn.close()
+
+        store = PostgreSQLStateStore(postgres_url, table_name=table)
+        try:
+            assert store.save("a", {"n": 3}).version == 3
+        finally:
+            store.close()
+
+    async def test_async_store_round_trip(self, postgres_url, table):
+        pytest.importorskip("asyncpg")
+        store = AsyncPostgreSQLStateStore(postgres_url, table_name=table, max_buffer=100)
+        await store.connect()
+        try:
+            assert (await store.save("k", {"v": 0}, component_id="A")).version == 1
+            saved = await store.save_many([("k", {"v": "x"}), ("j", {"v": 1})], "B")
+            assert [(e.key, e.version) for e in saved] == [("k", 2), ("j", 1)]
+
+            # Deferred saves of one key from different components keep order
+            for v, component_id in ((1, "A"), (2, "B"), (3, "A")):
+                await store.save_deferred("k", {"v": v}, component_id=component_id)
+            await store.flush()
+
+            history = await store.list_versions("k")
+            assert [(e.version, e.value, e.component_id) for e in history[-3:]] == [
+                (3, {"v": 1}, "A"), (4, {"v": 2}, "B"), (5, {"v": 3}, "A")
+            ]
+            latest = await store.load("k")
+            assert latest.version == 5 and latest.value == {"v": 3}
+            assert await store.get_latest_version("k") == 5
+
+            snapshot = await store.changes_since(None)
+            assert await store.delete("j")
+            batch = await store.changes_since(snapshot.cursor)
+            assert [(c.key, c.version) for c in batch.changes] == [("j", 0)]
+            assert (await store.changes_since(batch.cursor)).changes == []
+            assert await store.prune_deletions(max_age_seconds=0) == 1
+            assert (await store.changes_since(snapshot.cursor)).snapshot
+        finally:
+            await store.close()
+
+
+def _save_keys_with_compaction(state_dir, prefix):
+    store = JSONStateStore(state_dir=state_dir, journal_compact_bytes=256)
+    for n in range(40):
+        store.save(key=f"{prefix}/k{n}", value={})
+        store.save(key=f"{prefix}/k{n}", value={})
+
 
 class TestStateSync:
     """Tests for StateSync (AC-2)."""
@@ -367,6 +623,114 @@ class TestStateSync:
         # Should be idle after stop
         assert sync.status == SyncStatus.IDLE
 
+    def test_json_change_feed_is_incremental(self, store):
+        """Test journal feed returns only changes after the cursor."""
+        store.save(key="a", value={"n": 1})
+        store.save(key="b", value={"n": 1})
+
+        first = store.changes_since(None)
+        assert first.snapshot
+        assert [(c.key, c.version) for c in first.changes] == [("a", 1), ("b", 1)]
+
+        idle = store.changes_since(first.cursor)
+        assert idle.changes == [] and idle.cursor == first.cursor
+
+        store.save(key="a", value={"n": 2}, component_id="other")
+        store.delete("b")
+        batch = store.changes_since(first.cursor)
+        assert not batch.snapshot
+        assert [(c.key, c.version, c.component_id) for c in batch.changes] == [
+            ("a", 2, "other"),
+            ("b", 0, None),
+        ]
+
+    def test_sync_does_not_load_values(self, sync, store):
+        """Test sync reads the change feed instead of loading every key."""
+        for i in range(20):
+            store.save(key=f"k{i}", value={"i": i})
+        no_load = patch.object(store, "load", side_effect=AssertionError("value loaded"))
+
+        with no_load:
+            assert len(sync.sync_now()) == 20
+        store.save(key="k3", value={"i": 33})
+        store.delete("k4")
+        with no_load:
+            events = sync.sync_now()
+
+        assert [(e.event_type, e.key, e.version) for e in events] == [
+            ("update", "k3", 2),
+            ("delete", "k4", 0),
+        ]
+        assert sync.status == SyncStatus.SYNCED
+
+    def test_journal_compaction_resyncs(self, temp_dir):
+        """Test a compacted journal yields a snapshot and deletions are still seen."""
+        store = JSONStateStore(state_dir=temp_dir, journal_compact_bytes=512)
+        sync = StateSync(store=store, component_id="c")
+        store.save(key="keep", value={})
+        store.save(key="gone", value={})
+        sync.sync_now()
+
+        store.delete("gone")
+        for i in range(20):
+            store.save(key="keep", value={"i": i})
+
+        events = sync.sync_now()
+        assert ("delete", "gone") in [(e.event_type, e.key) for e in events]
+        assert sync._version_cache == {"keep": 21}
+
+        # A fresh store instance reuses the existing journal
+        assert JSONStateStore(state_dir=temp_dir).changes_since(None).changes[0].version == 21
+
+    def test_journal_appends_survive_compaction_in_other_processes(self, temp_dir):
+        """Test the journal lock keeps appends from landing in a replaced journal."""
+        JSONStateStore(state_dir=temp_dir)
+        ctx = multiprocessing.get_context("fork")
+        workers = [
+            ctx.Process(target=_save_keys_with_compaction, args=(temp_dir, f"p{i}"))
+            for i in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+
+        changes = JSONStateStore(state_dir=temp_dir).changes_since(None).changes
+        assert sorted((c.key, c.version) for c in changes) == sorted(
+            (f"p{i}/k{n}", 2) for i in range(3) for n in range(40)
+        )
+
+    def test_default_change_feed_snapshot(self, store):
+        """Test the base-class feed snapshots versions for backends without one."""
+        store.save(key="x", value={})
+        store.save(key="x", value={})
+
+        batch = StateStore.changes_since(store)
+        assert batch.snapshot
+        assert [(c.key, c.version) for c in batch.changes] == [("x", 2)]
+
+    def test_push_notification_wakes_sync(self, temp_dir):
+        """Test a store watch callback triggers sync before the interval."""
+        class PushStore(JSONStateStore):
+            def watch(self, callback):
+                self.notify = callback
+                return lambda: None
+
+        store = PushStore(state_dir=temp_dir)
+        sync = StateSync(store=store, component_id="c", sync_interval=60)
+        seen = threading.Event()
+        sync.subscribe("pushed", lambda event: seen.set())
+        sync.start()
+        try:
+            time.sleep(0.05)
+            store.save(key="pushed", value={})
+            store.notify()
+            assert seen.wait(2.0)
+            assert sync.get_sync_stats()["push_enabled"] is True
+        finally:
+            sync.stop()
+
     def test_pattern_matching(self, sync):
         """Test key pattern matching."""
         assert sync._matches_pattern("test/key", "test/*") is True
@@ -0,0 +1,229 @@
+"""
+Tests for the indexed QueryService store
+
+EPIC: MD-2558
+AC-5: Queryable execution history for analytics
+
+Tests cover:
+- Indexed, partitioned filter() agrees with a full scan
+- Cursor pagination walks every match exactly once
+- Columnar analytics agree with and without numpy
+- Cache is bounded by max_executions and retention
+- Trimming a partition pops its oldest rows and compacts tombstones
+- Re-caching a finished execution moves it between outcome indexes
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from maestro_hive.runtime.tracking import query as query_module
+from maestro_hive.runtime.tracking.models import (
+    TrackedExecution,
+    TraceContext,
+    Decision,
+    ExecutionOutcome,
+    DecisionType,
+)
+from maestro_hive.runtime.tracking.query import QueryService
+from maestro_hive.runtime.tracking.tracker import ExecutionTracker
+from maestro_hive.runtime.tracking.config import TrackerConfig
+
+
+NOW = datetime(2026, 3, 1, 12, 0, 0)
+PERSONAS = ["reviewer", "coder", "tester", "architect"]
+OUTCOMES = [ExecutionOutcome.SUCCESS, ExecutionOutcome.FAILED, ExecutionOutcome.RUNNING]
+
+
+def random_executions(count, seed=5):
+    rng = random.Random(seed)
+    executions = []
+    for _ in range(count):
+        execution = TrackedExecution(
+            trace_context=TraceContext(
+                persona_id=rng.choice(PERSONAS),
+                correlation_id=rng.choice(["c1", "c2", None]),
+                user_id=rng.choice(["alice", "bob"]),
+                tags=rng.sample(["prod", "batch", "ci"], rng.randint(0, 2)),
+            ),
+            # Whole minutes so several executions share a timestamp
+            started_at=NOW - timedelta(minutes=rng.randint(0, 3 * 24 * 60)),
+            outcome=rng.choice(OUTCOMES),
+            duration_ms=rng.choice([None, rng.randint(10, 5000)]),
+            token_count=rng.choice([None, rng.randint(1, 2000)]),
+            cost_usd=rng.choice([None, 0.01, 0.02]),
+            error_message=rng.choice([None, "boom"]),
+        )
+        for _ in range(rng.randint(0, 2)):
+            execution.add_decision(Decision(decision_type=rng.choice(list(DecisionType))))
+        executions.append(execution)
+    return executions
+
+
+def scan(query, **criteria):
+    """Reference implementation: check every cached execution, stable sort."""
+    matches = [e for e in query._cache.values() if query._matches_filter(e, **criteria)]
+    matches.sort(key=lambda e: e.started_at, reverse=True)
+    return matches
+
+
+@pytest.fixture
+def query():
+    query = QueryService(partition_seconds=6 * 3600)
+    for execution in random_executions(600):
+        query.cache_execution(execution)
+    return query
+
+
+class TestIndexedFilter:
+    """filter() and filter_page() agree with a full scan."""
+
+    CRITERIA = [
+        {},
+        {"persona_id": "coder"},
+        {"outcome": ExecutionOutcome.FAILED, "user_id": "bob"},
+        {"outcomes": [ExecutionOutcome.SUCCESS, ExecutionOutcome.RUNNING], "tags": ["ci", "prod"]},
+        {"correlation_id": "c2", "has_errors": True},
+        {"since": NOW - timedelta(hours=30), "until": NOW - timedelta(hours=7)},
+        {"persona_id": "tester", "min_duration_ms": 1000, "since": NOW - timedelta(days=2)},
+        {"persona_id": "nobody"},
+    ]
+
+    @pytest.mark.asyncio
+    async def test_filter_matches_scan(self, query):
+        for criteria in self.CRITERIA:
+            expected = scan(query, **criteria)
+            assert await query.filter(limit=10000, **criteria) == expected, criteria
+            assert await query.filter(limit=7, offset=11, **criteria) == expected[11:18], criteria
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_visits_each_match_once(self, query):
+        for criteria in self.CRITERIA:
+            seen = []
+            page = await query.filter_page(limit=25, **criteria)
+            seen.extend(page.items)
+            while page.next_cursor:
+                page = await query.filter_page(cursor=page.next_cursor, limit=25, **criteria)
+                seen.extend(page.items)
+            assert seen == scan(query, **criteria), criteria
+
+        with pytest.raises(ValueError):
+            await query.filter_page(cursor="not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_count(self, query):
+        since = NOW - timedelta(days=1)
+        assert await query.count(since=since, outcome=ExecutionOutcome.SUCCESS) == len(
+            scan(query, since=since, outcome=ExecutionOutcome.SUCCESS)
+        )
+
+
+class TestColumnarAnalytics:
+    """get_analytics() aggregates column arrays."""
+
+    @pytest.mark.asyncio
+    async def test_analytics_match_reference(self, query, monkeypatch):
+        since = NOW - timedelta(days=2)
+        executions = scan(query, since=since, persona_id="reviewer")
+        durations = [e.duration_ms for e in executions if e.duration_ms is not None]
+
+        results = [await query.get_analytics(since=since, persona_id="reviewer")]
+        monkeypatch.setattr(query_module, "NUMPY_AVAILABLE", False)
+        results.append(await query.get_analytics(since=since, persona_id="reviewer"))
+
+        for analytics in results:
+            assert analytics.count == len(executions)
+            assert analytics.success_count == sum(e.outcome == ExecutionOutcome.SUCCESS for e in executions)
+            assert analytics.failed_count == sum(e.outcome == ExecutionOutcome.FAILED for e in executions)
+            assert analytics.avg_duration_ms == pytest.approx(sum(durations) / len(durations))
+            assert analytics.min_duration_ms == min(durations)
+            assert analytics.max_duration_ms == max(durations)
+            assert analytics.total_tokens == sum(e.token_count or 0 for e in executions)
+            assert analytics.total_cost_usd == pytest.approx(sum(e.cost_usd or 0.0 for e in executions))
+            assert sum(analytics.decisions_by_type.values()) == sum(len(e.decisions) for e in executions)
+            assert analytics.top_personas == [("reviewer", len(executions))]
+
+    @pytest.mark.asyncio
+    async def test_analytics_top_personas(self, query):
+        analytics = await query.get_analytics()
+        assert analytics.count == 600
+        assert dict(analytics.top_personas) == {
+            p: len(scan(query, persona_id=p)) for p in PERSONAS
+        }
+
+
+class TestBoundedStore:
+    """Cache size is bounded and indexes follow updates."""
+
+    @pytest.mark.asyncio
+    async def test_max_executions_evicts_oldest(self):
+        query = QueryService(max_executions=100, partition_seconds=3600)
+        executions = random_executions(300)
+        for execution in executions:
+            query.cache_execution(execution)
+
+        assert len(query._cache) == 100
+        kept = await query.filter(limit=1000)
+        newest = sorted(executions, key=lambda e: e.started_at, reverse=True)
+        # Everything kept is at least as new as anything evicted
+        evicted = [e for e in executions if e.id not in query._cache]
+        assert min(e.started_at for e in kept) >= max(e.started_at for e in evicted)
+        assert kept[0] == newest[0]
+        assert set(query._by_persona.keys()) <= set(PERSONAS)
+        assert sum(len(ids) for ids in query._by_persona.values()) == 100
+
+    @pytest.mark.asyncio
+    async def test_trimming_one_partition_pops_oldest_and_compacts(self):
+        query = QueryService(max_executions=50, partition_seconds=24 * 3600)
+        rng = random.Random(11)
+        executions = [
+            TrackedExecution(started_at=NOW - timedelta(seconds=rng.randint(0, 3600)))
+            for _ in range(2000)
+        ]
+        for execution in executions:
+            query.cache_execution(execution)
+
+        (partition,) = query._partitions.values()
+        assert partition.live == 50
+        # Tombstones are compacted, and row numbers stay consistent
+        assert len(partition.executions) <= 2 * max(50, partition.COMPACT_MIN_ROWS)
+        for execution_id, (key, row) in query._rows.items():
+            assert query._partitions[key].executions[row].id == execution_id
+
+        # Survivors are the 50 newest by (started_at, insertion order)
+        ranked = sorted(enumerate(executions), key=lambda p: (p[1].started_at, p[0]))
+        assert set(query._cache) == {e.id for _, e in ranked[-50:]}
+        kept = await query.filter(limit=100)
+        assert [e.started_at for e in kept] == sorted((e.started_at for e in kept), reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_retention_drops_old_partitions(self):
+        query = QueryService(partition_seconds=3600, retention=timedelta(days=1))
+        old = TrackedExecution(started_at=NOW - timedelta(days=3))
+        query.cache_execution(old)
+        query.cache_execution(TrackedExecution(started_at=NOW))
+
+        assert query.get_cached(old.id) is None
+        assert len(await query.filter()) == 1
+
+    @pytest.mark.asyncio
+    async def test_tracker_recaches_finished_execution(self):
+        tracker = ExecutionTracker(config=TrackerConfig(stream_events=False))
+        execution = await tracker.start_execution(persona_id="coder")
+        query = tracker.query_service
+
+        assert await query.filter(outcome=ExecutionOutcome.RUNNING) == [execution]
+
+        await tracker.complete_execution(execution.id, token_count=42, cost_usd=0.5)
+
+        assert await query.filter(outcome=ExecutionOutcome.RUNNING) == []
+        assert await query.filter(outcome=ExecutionOutcome.SUCCESS) == [execution]
+        analytics = await query.get_analytics(persona_id="coder")
+        assert analytics.success_count == 1
+        assert analytics.total_tokens == 42
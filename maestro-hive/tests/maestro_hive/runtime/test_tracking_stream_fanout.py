@@ -0,0 +1,212 @@
+"""
+Tests for StreamPublisher fan-out and overflow policies
+
+EPIC: MD-2558
+AC-3: Real-time streaming of execution progress
+
+Tests cover:
+- publish() never waits on a subscriber that is not reading
+- Each overflow policy (drop-oldest, drop-newest, coalesce, disconnect)
+- Terminal events survive a full buffer
+- Callbacks run after publish() returns, in order, including async ones
+- The fan-out benchmark reports throughput per subscriber count
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from maestro_hive.runtime.tracking.models import ExecutionEvent, EventType
+from maestro_hive.runtime.tracking.stream import (
+    OverflowPolicy,
+    StreamOverflowError,
+    StreamPublisher,
+    benchmark_fanout,
+)
+
+
+def progress(execution_id, percent, event_type=EventType.PROGRESS_UPDATE):
+    return ExecutionEvent(execution_id=execution_id, event_type=event_type, progress_percent=percent)
+
+
+def completed(execution_id):
+    return ExecutionEvent(execution_id=execution_id, event_type=EventType.EXECUTION_COMPLETED)
+
+
+async def publish_then_collect(publisher, execution_id, events, **subscribe_kwargs):
+    """Register a subscriber, publish everything without it reading, then drain it."""
+    stream = publisher.subscribe(execution_id, **subscribe_kwargs)
+    first = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)  # Subscriber registered and waiting
+
+    for event in events:
+        await publisher.publish(event)
+
+    received = [await first]
+    async for event in stream:
+        received.append(event)
+    return received
+
+
+class TestOverflowPolicies:
+    """Full subscriber buffers follow the configured policy."""
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_keeps_latest_and_terminal(self):
+        publisher = StreamPublisher(buffer_size=3)
+        execution_id = uuid4()
+        events = [progress(execution_id, p) for p in range(10)] + [completed(execution_id)]
+
+        received = await publish_then_collect(publisher, execution_id, events)
+
+        # The terminal event takes the oldest remaining slot
+        assert [e.progress_percent for e in received[:-1]] == [8, 9]
+        assert received[-1].event_type == EventType.EXECUTION_COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_keeps_earliest(self):
+        publisher = StreamPublisher(buffer_size=3, overflow_policy=OverflowPolicy.DROP_NEWEST)
+        execution_id = uuid4()
+        events = [progress(execution_id, p) for p in range(10)] + [completed(execution_id)]
+
+        received = await publish_then_collect(publisher, execution_id, events)
+
+        assert [e.progress_percent for e in received[:-1]] == [1, 2]
+        assert received[-1].event_type == EventType.EXECUTION_COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_coalesce_replaces_same_event_type(self):
+        publisher = StreamPublisher(buffer_size=4)
+        execution_id = uuid4()
+        events = [
+            progress(execution_id, 0),
+            progress(execution_id, 0, EventType.EXECUTION_STARTED),
+            progress(execution_id, 0, EventType.DECISION_MADE),
+        ] + [progress(execution_id, p) for p in range(1, 10)] + [completed(execution_id)]
+
+        received = await publish_then_collect(
+            publisher, execution_id, events, overflow_policy=OverflowPolicy.COALESCE
+        )
+
+        assert [(e.event_type, e.progress_percent) for e in received] == [
+            (EventType.EXECUTION_STARTED, 0),
+            (EventType.DECISION_MADE, 0),
+            (EventType.PROGRESS_UPDATE, 9),
+            (EventType.EXECUTION_COMPLETED, None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_raises_to_slow_subscriber_only(self):
+        publisher = StreamPublisher(buffer_size=3)
+        execution_id = uuid4()
+        fast = []
+
+        async def fast_reader():
+            async for event in publisher.subscribe(execution_id):
+                fast.append(event)
+
+        fast_task = asyncio.create_task(fast_reader())
+        slow = publisher.subscribe(execution_id, overflow_policy=OverflowPolicy.DISCONNECT)
+        first = asyncio.ensure_future(slow.__anext__())
+        await asyncio.sleep(0)
+
+        for p in range(10):
+            await publisher.publish(progress(execution_id, p))
+            await asyncio.sleep(0)
+        await publisher.publish(completed(execution_id))
+        await fast_task
+
+        assert len(fast) == 11
+        await first
+        with pytest.raises(StreamOverflowError):
+            async for _ in slow:
+                pass
+        assert publisher.subscriber_count(execution_id) == 0
+
+
+class TestFanOut:
+    """publish() does not wait on subscribers or callbacks."""
+
+    @pytest.mark.asyncio
+    async def test_callbacks_run_off_publish_path_in_order(self):
+        publisher = StreamPublisher()
+        execution_id = uuid4()
+        seen = []
+
+        def sync_callback(event):
+            seen.append(("sync", event.progress_percent))
+
+        async def async_callback(event):
+            await asyncio.sleep(0)
+            seen.append(("async", event.progress_percent))
+
+        def failing_callback(event):
+            raise RuntimeError("boom")
+
+        publisher.add_callback(execution_id, sync_callback)
+        publisher.add_callback(execution_id, failing_callback)
+        publisher.add_callback(execution_id, async_callback)
+
+        for p in range(3):
+            await publisher.publish(progress(execution_id, p))
+        assert seen == []
+
+        await publisher.drain_callbacks()
+        assert seen == [(kind, p) for p in range(3) for kind in ("sync", "async")]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_and_close_stop_callback_task(self):
+        publisher = StreamPublisher()
+        execution_id = uuid4()
+        seen = []
+        publisher.add_callback(execution_id, seen.append)
+
+        await publisher.publish(completed(execution_id))
+        task = publisher._callback_task
+        await publisher.cleanup(execution_id)
+        assert len(seen) == 1
+        assert task.cancelled() and publisher._callback_task is None
+
+        release = asyncio.Event()
+
+        async def blocked(event):
+            await release.wait()
+
+        publisher.add_callback(execution_id, blocked)
+        await publisher.publish(progress(execution_id, 1))
+        await publisher.publish(progress(execution_id, 2))
+        task = publisher._callback_task
+        drain = asyncio.create_task(publisher.drain_callbacks())
+        await asyncio.sleep(0)
+        assert not drain.done()
+
+        await publisher.close()
+        await asyncio.wait_for(drain, timeout=1)
+        assert task.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_completion(self):
+        publisher = StreamPublisher()
+        execution_id = uuid4()
+
+        waiter = asyncio.create_task(publisher.wait_for_completion(execution_id, timeout=5))
+        await asyncio.sleep(0)
+        await publisher.publish(completed(execution_id))
+
+        assert await waiter is True
+        assert await publisher.wait_for_completion(uuid4(), timeout=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_benchmark_reports_each_subscriber_count(self):
+        results = await benchmark_fanout(subscriber_counts=(1, 20), events=300)
+
+        assert [r["subscribers"] for r in results] == [1, 20]
+        for row in results:
+            assert row["publish_events_per_sec"] > 0
+            assert row["delivered"] + row["dropped"] == 300 * row["subscribers"]
@@ -0,0 +1 @@
+"""Tests for workflow module."""
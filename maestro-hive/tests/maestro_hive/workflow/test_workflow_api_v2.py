@@ -0,0 +1,366 @@
+"""
+Tests for the Workflow API V2 WebSocket fan-out, phase pool and execution store
+
+Tests cover:
+- Progress events coalesce in place without overtaking later events
+- Clients whose queue overflows or whose send times out are evicted
+- PhaseWorkerPool runs phases on its worker loops and surfaces their errors
+- A failing coro_factory fails its job without killing the worker
+- ExecutionStore round-trips records, definitions and phase outputs
+- Only one store can claim an execution whose lease has lapsed
+- Resuming replays completed phases and runs only the remaining ones
+"""
+
+import asyncio
+import json
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "src"))
+
+from maestro_hive.workflow import workflow_api_v2 as api
+from maestro_hive.workflow.workflow_api_v2 import (
+    SLOW_CONSUMER_CLOSE_CODE,
+    ClientChannel,
+    ConnectionManager,
+    ExecutionStore,
+    PhaseConfig,
+    PhaseWorkerPool,
+    WorkflowEdge,
+    WorkflowNode,
+)
+
+
+def make_nodes(count=2):
+    return [
+        WorkflowNode(id=f"n{i}", phase_type="requirements", label=f"Phase {i}", phase_config=PhaseConfig())
+        for i in range(1, count + 1)
+    ]
+
+
+class FakeWebSocket:
+    """Records sent payloads; sends block while the gate is closed."""
+
+    def __init__(self, open_gate=True):
+        self.sent = []
+        self.closed_with = None
+        self.gate = asyncio.Event()
+        if open_gate:
+            self.gate.set()
+
+    async def send_text(self, payload):
+        await self.gate.wait()
+        self.sent.append(json.loads(payload))
+
+    async def close(self, code=None, reason=""):
+        self.closed_with = code
+
+
+def progress(node_id, percent):
+    return {'type': 'phase_progress', 'execution_id': 'e1', 'node_id': node_id, 'percent': percent}
+
+
+async def settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def pool():
+    pool = PhaseWorkerPool(workers=2)
+    yield pool
+    pool.shutdown()
+
+
+class TestClientChannel:
+    """Per-client queues coalesce progress without reordering events."""
+
+    @pytest.mark.asyncio
+    async def test_progress_coalesces_in_place(self):
+        websocket = FakeWebSocket(open_gate=False)
+        channel = ClientChannel(websocket, "wf", max_queue=10, send_timeout=5)
+        channel.start(lambda *args: None)
+        manager = ConnectionManager()
+
+        for message in [progress("n1", 10), progress("n2", 10), progress("n1", 20), progress("n1", 30)]:
+            channel.offer(json.dumps(message), manager._coalesce_key(message))
+        assert channel.pending == 2
+        assert channel.coalesced == 2
+
+        websocket.gate.set()
+        await settle()
+        assert [(m['node_id'], m['percent']) for m in websocket.sent] == [("n1", 30), ("n2", 10)]
+        await channel.close()
+
+    @pytest.mark.asyncio
+    async def test_progress_never_overtakes_later_event(self):
+        websocket = FakeWebSocket(open_gate=False)
+        channel = ClientChannel(websocket, "wf", max_queue=10, send_timeout=5)
+        channel.start(lambda *args: None)
+        manager = ConnectionManager()
+        completed = {'type': 'phase_completed', 'execution_id': 'e1', 'node_id': 'n1'}
+
+        for message in [progress("n1", 50), completed, progress("n1", 60), progress("n1", 70)]:
+            channel.offer(json.dumps(message), manager._coalesce_key(message))
+
+        websocket.gate.set()
+        await settle()
+        assert [(m['type'], m.get('percent')) for m in websocket.sent] == [
+            ('phase_progress', 50),
+            ('phase_completed', None),
+            ('phase_progress', 70),
+        ]
+        # The older key slot was drained without dropping the newer one
+        assert channel.pending == 0 and channel._keys == {}
+        await channel.close()
+
+
+class TestConnectionManager:
+    """Slow clients are evicted without holding up the others."""
+
+    @pytest.mark.asyncio
+    async def test_queue_overflow_evicts_only_slow_client(self):
+        manager = ConnectionManager(max_queue=3, send_timeout=5)
+        slow, fast = FakeWebSocket(open_gate=False), FakeWebSocket()
+        manager.register(slow, "wf")
+        manager.register(fast, "wf")
+
+        for n in range(5):
+            await manager.broadcast("wf", {'type': 'log', 'n': n})
+            await settle()
+
+        assert manager.evicted_clients == 1
+        assert slow.closed_with == SLOW_CONSUMER_CLOSE_CODE
+        assert manager.active_connections["wf"] == [fast]
+        assert [m['n'] for m in fast.sent] == [0, 1, 2, 3, 4]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_evicts_client(self):
+        manager = ConnectionManager(max_queue=10, send_timeout=0.05)
+        stuck = FakeWebSocket(open_gate=False)
+        manager.register(stuck, "wf")
+
+        await manager.broadcast("wf", {'type': 'log'})
+        await asyncio.sleep(0.2)
+
+        assert manager.evicted_clients == 1
+        assert stuck.closed_with == SLOW_CONSUMER_CLOSE_CODE
+        assert "wf" not in manager.active_connections
+        assert manager.get_stats()['clients'] == 0
+
+
+class TestPhaseWorkerPool:
+    """Phases run on worker loops and report results, errors and timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_runs_phases_on_worker_threads(self, pool):
+        async def phase(n):
+            await asyncio.sleep(0.01)
+            return n * 2, threading.current_thread().name
+
+        results = await asyncio.gather(*(pool.submit(f"wf-{n % 3}", lambda n=n: phase(n)) for n in range(10)))
+
+        assert [value for value, _ in results] == [n * 2 for n in range(10)]
+        assert {name for _, name in results} <= {"phase-worker-0", "phase-worker-1"}
+        assert pool.get_stats()["completed"] == 10
+
+    @pytest.mark.asyncio
+    async def test_phase_exception_reaches_caller(self, pool):
+        async def phase():
+            raise ValueError("phase broke")
+
+        with pytest.raises(ValueError, match="phase broke"):
+            await pool.submit("wf", phase)
+
+    @pytest.mark.asyncio
+    async def test_failing_factory_fails_job_and_worker_survives(self):
+        pool = PhaseWorkerPool(workers=1)
+        try:
+            def factory():
+                raise RuntimeError("no coroutine")
+
+            with pytest.raises(RuntimeError, match="no coroutine"):
+                await asyncio.wait_for(pool.submit("wf", factory), 5)
+
+            async def phase():
+                return "ok"
+
+            assert await asyncio.wait_for(pool.submit("wf", phase), 5) == "ok"
+            assert pool.get_stats()["active"] == 0
+        finally:
+            pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_phase(self, pool):
+        cancelled = threading.Event()
+
+        async def phase():
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.submit("wf", phase, timeout=0.05)
+        assert await asyncio.to_thread(cancelled.wait, 5)
+
+
+class TestExecutionStore:
+    """Records persist across reopen and leases decide who may resume."""
+
+    def test_round_trip_with_phase_outputs(self, tmp_path):
+        db_path = str(tmp_path / "executions.db")
+        store = ExecutionStore(db_path=db_path)
+        store.create("e1", "wf", "Workflow", make_nodes(), [WorkflowEdge(source="n1", target="n2")])
+        store.update_status("e1", "running")
+        store.update_phase_status("e1", "n1", "running")
+        store.update_phase_status(
+            "e1", "n1", "completed", outputs={"summary": "done"}, artifacts=[{"name": "req.md"}]
+        )
+        store.close()
+
+        reopened = ExecutionStore(db_path=db_path)
+        execution = reopened.get("e1")
+        assert execution["status"] == "running"
+        assert execution["completed_phases"] == 1
+        assert reopened.phase_status["e1"] == {"n1": "completed", "n2": "pending"}
+        assert reopened.get_phase("e1", "n1")["outputs"] == {"summary": "done"}
+        assert reopened.get_phase("e1", "n1")["artifacts"] == [{"name": "req.md"}]
+        assert reopened.definitions["e1"]["edges"] == [{"source": "n1", "target": "n2"}]
+        reopened.close()
+
+    def test_live_lease_blocks_claim(self, tmp_path):
+        db_path = str(tmp_path / "executions.db")
+        owner = ExecutionStore(db_path=db_path)
+        owner.create("e1", "wf", "Workflow", make_nodes())
+
+        other = ExecutionStore(db_path=db_path)
+        assert other.incomplete() == []
+        assert other.claim("e1") is False
+        owner.close()
+        other.close()
+
+    def test_expired_lease_is_claimed_once(self, tmp_path):
+        db_path = str(tmp_path / "executions.db")
+        dead = ExecutionStore(db_path=db_path, lease_seconds=-1)
+        dead.create("e1", "wf", "Workflow", make_nodes())
+        dead.update_phase_status("e1", "n1", "completed", outputs={"k": 1})
+        dead.close()
+
+        first = ExecutionStore(db_path=db_path)
+        second = ExecutionStore(db_path=db_path)
+        assert first.incomplete() == ["e1"]
+        assert first.claim("e1") is True
+        assert second.claim("e1") is False
+        assert second.incomplete() == []
+        assert first.get_phase("e1", "n1")["outputs"] == {"k": 1}
+        first.close()
+        second.close()
+
+    def test_claim_reloads_progress_made_after_load(self, tmp_path):
+        db_path = str(tmp_path / "executions.db")
+        dead = ExecutionStore(db_path=db_path, lease_seconds=-1)
+        dead.create("e1", "wf", "Workflow", make_nodes())
+
+        stale = ExecutionStore(db_path=db_path)
+        dead.update_phase_status("e1", "n1", "completed")
+        dead.close()
+
+        assert stale.phase_status["e1"]["n1"] == "pending"
+        assert stale.claim("e1") is True
+        assert stale.phase_status["e1"]["n1"] == "completed"
+        stale.close()
+
+    def test_finished_execution_is_never_claimed(self, tmp_path):
+        db_path = str(tmp_path / "executions.db")
+        dead = ExecutionStore(db_path=db_path, lease_seconds=-1)
+        dead.create("e1", "wf", "Workflow", make_nodes())
+        dead.update_status("e1", "completed")
+        dead.close()
+
+        store = ExecutionStore(db_path=db_path)
+        assert store.incomplete() == []
+        assert store.claim("e1") is False
+        store.close()
+
+    def test_upgrades_table_without_lease_columns(self, tmp_path):
+        db_path = str(tmp_path / "executions.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE executions (execution_id TEXT PRIMARY KEY, workflow_id TEXT NOT NULL, "
+            "status TEXT NOT NULL, updated_at TEXT NOT NULL, record TEXT NOT NULL, definition TEXT)"
+        )
+        conn.commit()
+        conn.close()
+
+        store = ExecutionStore(db_path=db_path)
+        store.create("e1", "wf", "Workflow", make_nodes())
+        assert store.renew_leases() == 1
+        store.close()
+
+    def test_in_memory_store_has_nothing_to_resume(self):
+        store = ExecutionStore()
+        store.create("e1", "wf", "Workflow", make_nodes())
+        assert store.incomplete() == []
+        assert store.claim("e1") is False
+
+
+class RecordingManager:
+    def __init__(self):
+        self.messages = []
+
+    async def broadcast(self, workflow_id, message):
+        self.messages.append(message)
+
+
+class TestResume:
+    """Resumed executions skip finished phases but keep their outputs."""
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_completed_phases(self, tmp_path, monkeypatch):
+        db_path = str(tmp_path / "executions.db")
+        dead = ExecutionStore(db_path=db_path, lease_seconds=-1)
+        dead.create("e1", "wf", "Workflow", make_nodes(3))
+        dead.update_status("e1", "running")
+        dead.update_phase_status("e1", "n1", "completed", outputs={"summary": "kept"}, artifacts=[{"name": "n1.md"}])
+        dead.update_phase_status("e1", "n2", "running")
+        dead.close()
+
+        store = ExecutionStore(db_path=db_path)
+        manager = RecordingManager()
+        ran = []
+        real_sleep = asyncio.sleep
+
+        def fake_artifact(execution_id, node_id, phase_type, phase_number):
+            ran.append(node_id)
+            return {"name": f"{node_id}.md"}
+
+        async def no_sleep(delay, *args, **kwargs):
+            await real_sleep(0)
+
+        monkeypatch.setattr(api, "execution_store", store)
+        monkeypatch.setattr(api, "manager", manager)
+        monkeypatch.setattr(api, "USE_REAL_EXECUTION", False)
+        monkeypatch.setattr(api, "generate_dummy_artifact", fake_artifact)
+        monkeypatch.setattr(api.asyncio, "sleep", no_sleep)
+
+        assert api.resume_incomplete_executions() == 1
+        # A second pass finds nothing: this process now holds the lease
+        assert api.resume_incomplete_executions() == 0
+        await asyncio.gather(*list(api.background_tasks))
+
+        assert ran == ["n2", "n3"]
+        assert store.get("e1")["status"] == "completed"
+        completed = [m for m in manager.messages if m["type"] == "phase_completed"]
+        assert [m["node_id"] for m in completed] == ["n1", "n2", "n3"]
+        assert completed[0]["outputs"] == {"summary": "kept"}
+        assert completed[0]["artifacts"] == [{"name": "n1.md"}]
+        assert completed[0]["resumed"] is True
+        store.close()
@@ -0,0 +1,140 @@
+"""
+Tests for the Quality Fabric validation stage in Team Execution Engine V2
+
+Tests verify:
+- Each created file is read once and shared across categories and personas
+- File reads are capped at qf_max_file_bytes
+- Personas are validated concurrently under the configured limit
+- A failing persona validation does not abort the others
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Add paths for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from maestro_hive.teams.team_execution_v2 import ExecutionResult, TeamExecutionEngineV2
+
+
+def make_result(persona_id, files):
+    return ExecutionResult(
+        persona_id=persona_id,
+        contract_id=f"contract-{persona_id}",
+        success=True,
+        files_created=files,
+        deliverables={},
+        contract_fulfilled=True,
+        fulfillment_score=1.0,
+        missing_deliverables=[],
+        quality_issues=[],
+        duration_seconds=1.0,
+        parallel_execution=True,
+        quality_score=0.9,
+        completeness_score=0.8,
+        recommendations=[],
+        risks_identified=[],
+    )
+
+
+class FakeQualityFabricClient:
+    """Records concurrency and payloads of validate_persona_output calls"""
+
+    def __init__(self, fail_for=()):
+        self.fail_for = set(fail_for)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.outputs = {}
+
+    async def validate_persona_output(self, persona_id, persona_type, output):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if persona_id in self.fail_for:
+                raise RuntimeError("service unavailable")
+            self.outputs[persona_id] = output
+            return SimpleNamespace(
+                status="pass",
+                overall_score=90.0,
+                gates_passed=["coverage"],
+                gates_failed=[],
+                recommendations=[],
+                requires_revision=False,
+            )
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = TeamExecutionEngineV2.__new__(TeamExecutionEngineV2)
+    engine.output_dir = tmp_path
+    return engine
+
+
+class TestQualityFabricValidationStage:
+    """Tests for TeamExecutionEngineV2._validate_personas_concurrently"""
+
+    @pytest.mark.asyncio
+    async def test_files_read_once_and_shared(self, engine, tmp_path):
+        """A file listed in several categories and personas is read once"""
+        (tmp_path / "test_qf_stage_api.py").write_text("def test_api(): pass")
+        (tmp_path / "qf_stage_notes.md").write_text("# Docs")
+
+        persona_results = {
+            "backend_developer": make_result("backend_developer", ["test_qf_stage_api.py", "qf_stage_notes.md"]),
+            "qa_engineer": make_result("qa_engineer", ["test_qf_stage_api.py"]),
+        }
+        client = FakeQualityFabricClient()
+        reads = []
+        original = TeamExecutionEngineV2._read_file_capped
+
+        def counting_read(self, file_path):
+            reads.append(file_path)
+            return original(self, file_path)
+
+        with patch.object(TeamExecutionEngineV2, "_read_file_capped", counting_read):
+            validations = await engine._validate_personas_concurrently(
+                client, persona_results, {"backend_developer": "backend", "qa_engineer": "qa"}
+            )
+
+        assert sorted(reads) == ["qf_stage_notes.md", "test_qf_stage_api.py"]
+        assert list(validations) == ["backend_developer", "qa_engineer"]
+        assert validations["qa_engineer"]["overall_score"] == 90.0
+
+        output = client.outputs["backend_developer"]
+        assert output["code_files"] == [{"name": "test_qf_stage_api.py", "content": "def test_api(): pass"}]
+        assert output["test_files"] == output["code_files"]
+        assert output["documentation"] == [{"name": "qf_stage_notes.md", "content": "# Docs"}]
+        assert output["metadata"]["completeness_score"] == 0.8
+
+    @pytest.mark.asyncio
+    async def test_reads_are_size_capped(self, engine, tmp_path):
+        """Content beyond qf_max_file_bytes is not read; missing files are empty"""
+        (tmp_path / "big.json").write_text("x" * 100)
+        engine.qf_max_file_bytes = 10
+
+        contents = await engine._read_created_files(["big.json", "missing.yaml", "big.json"])
+
+        assert contents == {"big.json": "x" * 10, "missing.yaml": ""}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_and_failure_isolation(self, engine):
+        """At most qf_max_concurrent_validations run at once; failures are per persona"""
+        engine.qf_max_concurrent_validations = 3
+        persona_results = {f"persona_{i}": make_result(f"persona_{i}", []) for i in range(10)}
+        client = FakeQualityFabricClient(fail_for={"persona_4"})
+
+        validations = await engine._validate_personas_concurrently(
+            client, persona_results, {f"persona_{i}": "dev" for i in range(10)}
+        )
+
+        assert client.max_in_flight == 3
+        assert list(validations) == list(persona_results)
+        assert validations["persona_4"] == {"error": "service unavailable"}
+        assert all(v["status"] == "pass" for pid, v in validations.items() if pid != "persona_4")
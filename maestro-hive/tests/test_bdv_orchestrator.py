@@ -23,7 +23,8 @@ from bdv.bdv_runner import (
     BDVRunner,
     BDVResult,
     ScenarioResult,
-    RetryConfig
+    RetryConfig,
+    reset_feature_modules
 )
 
 
@@ -276,6 +277,133 @@ class TestBDVOrchestrator:
         assert mock_run.call_count == 2
 
 
+class TestWarmWorkerMode:
+    """Tests for process-based worker execution"""
+
+    @pytest.fixture
+    def bdv_project(self, tmp_path, monkeypatch):
+        """Minimal features/ layout as expected by BDVRunner._build_pytest_args"""
+        features = tmp_path / "features"
+        features.mkdir()
+        (features / "pytest_bdv.ini").write_text("[pytest]\n")
+        (features / "conftest.py").write_text(
+            "def pytest_addoption(parser):\n"
+            "    parser.addoption('--bdv-feature', action='append', default=[])\n"
+        )
+        (features / "test_generated_features.py").write_text(
+            "import os\n"
+            "def test_passes():\n"
+            "    assert True\n"
+            "def test_fails():\n"
+            "    assert os.getpid() < 0, 'ran in worker'\n"
+        )
+        (features / "a.feature").write_text("Feature: A\n")
+        (features / "b.feature").write_text("Feature: B\n")
+        # Paths are anchored to the features directory, not the cwd
+        elsewhere = tmp_path / "elsewhere"
+        elsewhere.mkdir()
+        monkeypatch.chdir(elsewhere)
+        yield features
+        # In-process runs leave the generated module imported
+        sys.modules.pop("test_generated_features", None)
+
+    def test_invalid_execution_mode(self):
+        """Test unknown execution modes are rejected"""
+        with pytest.raises(ValueError):
+            BDVOrchestrator(execution_mode="fiber")
+
+    def test_pytest_args_do_not_depend_on_cwd(self, bdv_project):
+        """Test the BDV ini and generated module are absolute paths"""
+        runner = BDVRunner("http://localhost:8000", str(bdv_project))
+        args = runner._build_pytest_args(["a.feature"])
+
+        assert args[args.index("-c") + 1] == str(bdv_project.resolve() / "pytest_bdv.ini")
+        assert args[-1] == str(bdv_project.resolve() / "test_generated_features.py")
+        assert args[args.index("--bdv-feature") + 1] == str(Path("a.feature").resolve())
+
+    def test_reset_feature_modules_drops_only_feature_code(self, bdv_project):
+        """Test in-process reruns see edited step code after a reset"""
+        runner = BDVRunner("http://localhost:8000", str(bdv_project))
+        runner.run_with_pytest_bdd([str(bdv_project / "a.feature")])
+        assert "test_generated_features" in sys.modules
+
+        assert reset_feature_modules(str(bdv_project)) >= 1
+        assert "test_generated_features" not in sys.modules
+        assert "pytest" in sys.modules
+
+        (bdv_project / "test_generated_features.py").write_text(
+            "def test_edited():\n"
+            "    assert True\n"
+        )
+        result = runner.run_with_pytest_bdd([str(bdv_project / "a.feature")])
+        assert [s.scenario_name for s in result.scenarios] == ["test_edited"]
+
+    def test_run_with_pytest_bdd_collects_scenarios(self, bdv_project):
+        """Test in-process pytest run produces per-test ScenarioResults"""
+        runner = BDVRunner("http://localhost:8000", str(bdv_project))
+        result = runner.run_with_pytest_bdd([str(bdv_project / "a.feature")], iteration_id="inproc")
+
+        assert result.total_scenarios == 2
+        assert result.passed == 1
+        assert result.failed == 1
+        failed = [s for s in result.scenarios if s.status == 'failed'][0]
+        assert failed.scenario_name == "test_fails"
+        assert "ran in worker" in failed.error_message
+
+    def test_teardown_error_does_not_duplicate_scenario(self, bdv_project):
+        """Test a test failing in call and teardown is reported once"""
+        (bdv_project / "test_generated_features.py").write_text(
+            "import pytest\n"
+            "@pytest.fixture\n"
+            "def broken_teardown():\n"
+            "    yield\n"
+            "    raise RuntimeError('teardown broke')\n"
+            "def test_fails_twice(broken_teardown):\n"
+            "    assert False\n"
+            "def test_teardown_only(broken_teardown):\n"
+            "    assert True\n"
+        )
+        runner = BDVRunner("http://localhost:8000", str(bdv_project))
+        result = runner.run_with_pytest_bdd([str(bdv_project / "a.feature")])
+
+        assert [s.scenario_name for s in result.scenarios] == ["test_fails_twice", "test_teardown_only"]
+        assert result.total_scenarios == 2
+        assert result.failed == 2
+        assert "teardown broke" in result.scenarios[1].error_message
+
+    def test_parallel_suite_in_worker_processes(self, bdv_project):
+        """Test parallel suite runs pytest in warm worker processes reused across runs"""
+        orchestrator = BDVOrchestrator(
+            features_path=str(bdv_project),
+            max_workers=2,
+            retry_config=RetryConfig(max_retries=0),
+            execution_mode="process"
+        )
+        try:
+            result = orchestrator.run_suite(iteration_id="warm-1", parallel=True)
+            pool = orchestrator._worker_pool
+            workers = {w: p.pid for w, p in pool._processes.items()}
+
+            # Edited test code is picked up by the same workers
+            (bdv_project / "test_generated_features.py").write_text(
+                "def test_passes():\n"
+                "    assert True\n"
+            )
+            second = orchestrator.run_suite(iteration_id="warm-2", parallel=True)
+            assert {w: p.pid for w, p in pool._processes.items()} == workers
+            assert pool.workers_recycled == 0
+        finally:
+            orchestrator.close()
+
+        assert result.total_scenarios == 4
+        assert result.passed == 2
+        assert result.failed == 2
+        assert result.summary['worker_mode'] == 'process'
+        assert second.total_scenarios == 2
+        assert second.failed == 0
+        assert orchestrator._worker_pool is None
+
+
 class TestIntegration:
     """Integration tests with quality-fabric API"""
 
@@ -13,7 +13,7 @@ import pytest
 import time
 from pathlib import Path
 from datetime import datetime
-from threading import Thread
+from threading import Lock, Thread
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -29,8 +29,12 @@ from bdv.parallel_runner import (
     TestItem,
     TestResult,
     ParallelResult,
+    SchedulingPolicy,
+    DurationHistory,
     create_test_items_from_features,
-    estimate_test_duration
+    estimate_test_duration,
+    simulate_schedule,
+    compare_schedules
 )
 
 
@@ -578,6 +582,184 @@ class TestUtilityFunctions:
         assert duration == 2.5  # Average of 2.0, 3.0, 2.5
 
 
+class TestDurationAwareScheduling:
+    """Tests for LPT scheduling, duration history and makespan simulation"""
+
+    @staticmethod
+    def _skewed_tests():
+        tests = [
+            TestItem(id=f"short-{i}", feature_file="a.feature",
+                     scenario_name=f"Short {i}", estimated_duration=1.0)
+            for i in range(8)
+        ]
+        tests.append(TestItem(id="long", feature_file="b.feature",
+                              scenario_name="Long", estimated_duration=8.0))
+        return tests
+
+    def test_lpt_dispatches_longest_first(self):
+        """Test LPT policy orders equal-priority tests by duration"""
+        scheduler = DependencyScheduler(policy=SchedulingPolicy.LPT)
+        scheduler.add_tests(self._skewed_tests())
+
+        ready = scheduler.get_ready_tests(max_count=1)
+        assert ready[0].id == "long"
+
+    def test_lpt_prefers_long_critical_path(self):
+        """Test LPT counts durations of dependents, not just the test itself"""
+        tests = [
+            TestItem(id="setup", feature_file="a.feature", scenario_name="Setup",
+                     estimated_duration=1.0),
+            TestItem(id="heavy", feature_file="a.feature", scenario_name="Heavy",
+                     estimated_duration=5.0, dependencies=["setup"]),
+            TestItem(id="medium", feature_file="b.feature", scenario_name="Medium",
+                     estimated_duration=3.0),
+        ]
+        scheduler = DependencyScheduler(policy=SchedulingPolicy.LPT)
+        scheduler.add_tests(tests)
+
+        ready = scheduler.get_ready_tests(max_count=1)
+        assert ready[0].id == "setup"
+
+    def test_priority_still_wins_over_duration(self):
+        """Test static priority is respected before duration"""
+        tests = self._skewed_tests()
+        tests[0].priority = 10
+        scheduler = DependencyScheduler(policy=SchedulingPolicy.LPT)
+        scheduler.add_tests(tests)
+
+        ready = scheduler.get_ready_tests(max_count=2)
+        assert [t.id for t in ready] == ["short-0", "long"]
+
+    def test_mark_completed_is_idempotent(self):
+        """Test completing a test twice does not release dependents early"""
+        tests = [
+            TestItem(id="a", feature_file="f", scenario_name="A"),
+            TestItem(id="b", feature_file="f", scenario_name="B"),
+            TestItem(id="c", feature_file="f", scenario_name="C", dependencies=["a", "b"]),
+        ]
+        scheduler = DependencyScheduler()
+        scheduler.add_tests(tests)
+        scheduler.get_ready_tests()
+
+        scheduler.mark_completed("a")
+        scheduler.mark_completed("a")
+        assert scheduler.get_ready_tests() == []
+
+        scheduler.mark_completed("b")
+        assert [t.id for t in scheduler.get_ready_tests()] == ["c"]
+
+    def test_simulation_lpt_reduces_makespan(self):
+        """Test LPT avoids a long test starting last"""
+        priority = simulate_schedule(self._skewed_tests(), 4, SchedulingPolicy.PRIORITY)
+        lpt = simulate_schedule(self._skewed_tests(), 4, SchedulingPolicy.LPT)
+
+        assert priority.predicted_makespan == 10.0
+        assert lpt.predicted_makespan == 8.0
+        assert lpt.total_work == 16.0
+        assert lpt.efficiency == 0.5
+
+    def test_simulation_respects_dependencies(self):
+        """Test simulated makespan includes dependency chains"""
+        tests = [
+            TestItem(id="a", feature_file="f", scenario_name="A", estimated_duration=2.0),
+            TestItem(id="b", feature_file="f", scenario_name="B", estimated_duration=3.0,
+                     dependencies=["a"]),
+        ]
+        sim = simulate_schedule(tests, 4)
+
+        assert sim.predicted_makespan == 5.0
+        assert sim.order == ["a", "b"]
+
+    def test_compare_schedules(self):
+        """Test comparison covers every policy"""
+        comparison = compare_schedules(self._skewed_tests(), 4)
+        assert set(comparison) == {"priority", "lpt"}
+        assert comparison["lpt"]["predicted_makespan"] <= comparison["priority"]["predicted_makespan"]
+
+    def test_duration_history_roundtrip(self, tmp_path):
+        """Test history records, smooths and persists durations"""
+        path = tmp_path / "durations.json"
+        history = DurationHistory(path, alpha=0.5)
+        result = ParallelResult(
+            total_tests=1, passed=1, failed=0, skipped=0, duration=1.0,
+            worker_count=1, workers=[],
+            results=[TestResult(test_id="t", worker_id="w", status="passed", duration=4.0)]
+        )
+        history.record(result)
+        result.results[0].duration = 2.0
+        history.record(result)
+        history.save()
+
+        reloaded = DurationHistory(path)
+        assert reloaded.estimate("t") == 3.0
+        assert reloaded.estimate("unknown", default=1.5) == 1.5
+
+    def test_runner_uses_history_and_reports_prediction(self, tmp_path):
+        """Test runner applies history estimates and records predicted makespan"""
+        history = DurationHistory(tmp_path / "durations.json")
+        runner = ParallelTestRunner(
+            max_workers=2,
+            scheduling_policy=SchedulingPolicy.LPT,
+            duration_history=history
+        )
+        tests = [
+            TestItem(id=f"t{i}", feature_file="f", scenario_name=f"T{i}")
+            for i in range(4)
+        ]
+
+        def sleepy_runner(test, worker_id):
+            time.sleep(0.01)
+            return TestResult(test_id=test.id, worker_id=worker_id,
+                              status='passed', duration=0.01 * (int(test.id[1:]) + 1))
+
+        result = runner.run_parallel(tests, sleepy_runner)
+        assert result.passed == 4
+        assert result.predicted_makespan == 2.0  # Default 1s estimates
+        assert result.to_dict()['predicted_makespan'] == 2.0
+        assert len(history) == 4
+        assert (tmp_path / "durations.json").exists()
+
+        # Second run dispatches the historically slowest test first
+        order = []
+
+        def recording_runner(test, worker_id):
+            order.append(test.id)
+            return TestResult(test_id=test.id, worker_id=worker_id, status='passed')
+
+        runner = ParallelTestRunner(
+            max_workers=1,
+            scheduling_policy=SchedulingPolicy.LPT,
+            duration_history=DurationHistory(tmp_path / "durations.json")
+        )
+        runner.run_parallel(tests, recording_runner)
+        assert order == ["t3", "t2", "t1", "t0"]
+
+    def test_runner_never_exceeds_worker_count(self):
+        """Test only idle workers receive tests"""
+        runner = ParallelTestRunner(max_workers=2)
+        tests = [
+            TestItem(id=f"t{i}", feature_file="f", scenario_name=f"T{i}")
+            for i in range(6)
+        ]
+        active = []
+        peak = []
+        lock = Lock()
+
+        def tracking_runner(test, worker_id):
+            with lock:
+                active.append(worker_id)
+                peak.append(len(active))
+                assert active.count(worker_id) == 1
+            time.sleep(0.01)
+            with lock:
+                active.remove(worker_id)
+            return TestResult(test_id=test.id, worker_id=worker_id, status='passed')
+
+        result = runner.run_parallel(tests, tracking_runner)
+        assert result.passed == 6
+        assert max(peak) <= 2
+
+
 class TestWorkerState:
     """Tests for WorkerState enum"""
 
@@ -0,0 +1,167 @@
+"""
+Tests for the BDV warm worker pool
+
+Validates:
+- Warm-up runs once per worker (imports, fixtures, initializer)
+- Tasks stream back through Futures, including exceptions
+- Crashed workers fail their task and are replaced
+- ParallelTestRunner integration
+"""
+
+import os
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bdv.parallel_runner import ParallelTestRunner, ResourceType, TestItem, TestResult
+from bdv.worker_pool import (
+    WarmWorkerPool,
+    WorkerCrashedError,
+    WorkerSetup,
+    get_worker_context
+)
+
+
+# Module-level task functions so they can be sent to worker processes
+
+_factory_calls = 0
+
+
+def make_connection():
+    global _factory_calls
+    _factory_calls += 1
+    return {"pid": os.getpid(), "created": _factory_calls}
+
+
+def describe_worker():
+    context = get_worker_context()
+    connection = context.acquire(ResourceType.DATABASE)
+    try:
+        return {
+            "pid": os.getpid(),
+            "worker_id": context.worker_id,
+            "factory_calls": _factory_calls,
+            "modules": sorted(context.modules),
+            "connection_pid": connection["pid"],
+        }
+    finally:
+        context.release(ResourceType.DATABASE, connection)
+
+
+def add(a, b):
+    return a + b
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+def crash():
+    os._exit(3)
+
+
+def run_test_item(test, worker_id):
+    return TestResult(
+        test_id=test.id,
+        worker_id=worker_id,
+        status='passed',
+        duration=0.0,
+        output=str(os.getpid())
+    )
+
+
+@pytest.fixture
+def warm_setup():
+    return WorkerSetup(
+        step_modules=["json"],
+        resource_factories={ResourceType.DATABASE: (2, make_connection)}
+    )
+
+
+class TestWarmWorkerPool:
+    """Tests for WarmWorkerPool"""
+
+    def test_fixtures_built_once_per_worker(self, warm_setup):
+        """Test fixtures and imports are created at start-up, not per task"""
+        with WarmWorkerPool(max_workers=2, setup=warm_setup) as pool:
+            results = [pool.submit(describe_worker).result(timeout=30) for _ in range(6)]
+
+        for result in results:
+            assert result["pid"] != os.getpid()
+            assert result["connection_pid"] == result["pid"]
+            assert result["factory_calls"] == 2  # pool_size, never rebuilt
+            assert result["modules"] == ["json"]
+        assert len({r["pid"] for r in results}) <= 2
+
+    def test_results_and_exceptions_stream_back(self):
+        """Test results and task exceptions resolve their futures"""
+        with WarmWorkerPool(max_workers=2) as pool:
+            assert pool.map(add, [1, 2, 3], [10, 20, 30]) == [11, 22, 33]
+
+            future = pool.submit(fail, "boom")
+            with pytest.raises(ValueError, match="boom"):
+                future.result(timeout=30)
+            assert pool.tasks_completed == 4
+
+    def test_crashed_worker_is_replaced(self):
+        """Test a dying worker fails its task and the pool keeps serving"""
+        with WarmWorkerPool(max_workers=1) as pool:
+            with pytest.raises(WorkerCrashedError):
+                pool.submit(crash).result(timeout=30)
+            assert pool.submit(add, 1, 1).result(timeout=30) == 2
+            assert pool.workers_restarted == 1
+
+    def test_workers_recycled_after_max_tasks(self, warm_setup):
+        """Test each worker serves at most max_tasks_per_worker tasks"""
+        with WarmWorkerPool(max_workers=2, setup=warm_setup, max_tasks_per_worker=1) as pool:
+            results = [pool.submit(describe_worker).result(timeout=30) for _ in range(4)]
+            assert pool.workers_recycled == 4
+            assert pool.workers_restarted == 0
+            assert len(pool.worker_ids) == 2
+
+        # Every task ran in a fresh, fully warmed process
+        assert len({r["pid"] for r in results}) == 4
+        assert all(r["modules"] == ["json"] for r in results)
+        assert pool._retired == []
+
+    def test_submit_after_shutdown_raises(self):
+        """Test the pool rejects work once shut down"""
+        pool = WarmWorkerPool(max_workers=1)
+        pool.start()
+        pool.shutdown()
+        with pytest.raises(RuntimeError):
+            pool.submit(add, 1, 2)
+
+    def test_no_worker_context_in_parent(self):
+        """Test get_worker_context() is None outside workers"""
+        assert get_worker_context() is None
+
+
+class TestParallelRunnerWithWarmPool:
+    """Tests for ParallelTestRunner using warm worker processes"""
+
+    def test_runs_tests_in_worker_processes(self):
+        """Test runner dispatches through the pool and keeps it warm"""
+        tests = [
+            TestItem(id=f"t{i}", feature_file="f", scenario_name=f"T{i}")
+            for i in range(5)
+        ]
+        tests[4].dependencies = ["t0"]
+
+        with WarmWorkerPool(max_workers=2) as pool:
+            runner = ParallelTestRunner(max_workers=2, worker_pool=pool)
+            first = runner.run_parallel(tests, run_test_item)
+            second = runner.run_parallel(tests, run_test_item)
+            worker_pids = set(pool._processes[w].pid for w in pool.worker_ids)
+
+        assert first.passed == 5
+        assert second.passed == 5
+        pids = {int(r.output) for r in first.results + second.results}
+        assert os.getpid() not in pids
+        assert pids <= worker_pids
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
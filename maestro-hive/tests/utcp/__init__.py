@@ -0,0 +1 @@
+"""UTCP Test Suite Package"""
@@ -0,0 +1,163 @@
+"""
+UTCP ToolRegistry Tests
+
+Tests for health scheduling and catalog caching:
+- health_check_all respects the concurrency limit
+- Scheduled first checks are spread over the interval
+- Healthy tools back off, failing tools are probed faster
+- Hung health checks time out
+- to_catalog() is cached between registry mutations
+"""
+
+import asyncio
+import random
+from typing import Dict, List, Set
+
+import pytest
+
+from utcp.base import ToolConfig, ToolResult, UTCPTool
+from utcp.tool_registry import HealthStatus, ToolRegistry
+
+
+class FakeTool(UTCPTool):
+    """Tool whose health is controlled by class-level state."""
+
+    calls: Dict[str, List[float]] = {}
+    failing: Set[str] = set()
+    delay = 0.0
+    active = 0
+    peak = 0
+
+    @property
+    def config(self) -> ToolConfig:
+        return ToolConfig(
+            name=self.credentials["name"],
+            version="1.0.0",
+            capabilities=[],
+            required_credentials=["name"],
+            timeout=float(self.credentials.get("timeout", 5)),
+        )
+
+    async def health_check(self) -> ToolResult:
+        name = self.credentials["name"]
+        FakeTool.calls.setdefault(name, []).append(asyncio.get_running_loop().time())
+        FakeTool.active += 1
+        FakeTool.peak = max(FakeTool.peak, FakeTool.active)
+        try:
+            await asyncio.sleep(FakeTool.delay)
+        finally:
+            FakeTool.active -= 1
+        if name in FakeTool.failing:
+            return ToolResult.fail("service down")
+        return ToolResult.ok({"status": "ok"})
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_tool():
+    FakeTool.calls = {}
+    FakeTool.failing = set()
+    FakeTool.delay = 0.0
+    FakeTool.active = 0
+    FakeTool.peak = 0
+
+
+def make_registry(names, **kwargs) -> ToolRegistry:
+    registry = ToolRegistry(auto_health_check=False, **kwargs)
+    registry._rng = random.Random(0)
+    for name in names:
+        registry.register_tool(FakeTool, credentials={"name": name})
+    return registry
+
+
+class TestHealthChecks:
+    """Bounded concurrency and timeouts"""
+
+    async def test_health_check_all_bounds_concurrency(self):
+        FakeTool.delay = 0.02
+        registry = make_registry([f"tool{i}" for i in range(6)], max_concurrent_checks=2)
+
+        results = await registry.health_check_all()
+
+        assert FakeTool.peak == 2
+        assert all(h.status == HealthStatus.HEALTHY for h in results.values())
+
+    async def test_hung_health_check_times_out(self):
+        FakeTool.delay = 1.0
+        registry = ToolRegistry(auto_health_check=False)
+        registry.register_tool(FakeTool, credentials={"name": "slow", "timeout": "0.05"})
+
+        health = await registry.health_check("slow")
+
+        assert health.status == HealthStatus.DEGRADED
+        assert health.error_message == "TimeoutError"
+
+
+class TestHealthScheduler:
+    """Jittered, adaptive scheduling"""
+
+    async def test_first_checks_spread_over_interval(self):
+        registry = make_registry([f"tool{i}" for i in range(10)], health_check_interval=0.4)
+
+        await registry.start_health_monitoring()
+        await asyncio.sleep(0.5)
+        await registry.stop_health_monitoring()
+
+        first_checks = sorted(times[0] for times in FakeTool.calls.values())
+        assert len(first_checks) == 10
+        # Not a single burst: first checks span most of the interval
+        assert first_checks[-1] - first_checks[0] > 0.2
+
+    async def test_intervals_adapt_to_health(self):
+        FakeTool.failing = {"flaky"}
+        registry = make_registry(
+            ["flaky", "steady"],
+            health_check_interval=0.1,
+            min_health_check_interval=0.02,
+            max_health_check_interval=0.4,
+            health_check_jitter=0.0,
+        )
+
+        await registry.start_health_monitoring()
+        await asyncio.sleep(0.8)
+        schedule = registry.get_health_schedule()
+        await registry.stop_health_monitoring()
+
+        assert schedule["flaky"]["interval_seconds"] == pytest.approx(0.02)
+        assert schedule["steady"]["interval_seconds"] > 0.1
+        assert len(FakeTool.calls["flaky"]) > 3 * len(FakeTool.calls["steady"])
+        assert registry.get_tool("flaky").health.status == HealthStatus.UNHEALTHY
+
+    async def test_scheduler_picks_up_new_tools(self):
+        registry = make_registry(["first"], health_check_interval=0.05)
+
+        await registry.start_health_monitoring()
+        registry.register_tool(FakeTool, credentials={"name": "second"})
+        await asyncio.sleep(0.2)
+        await registry.stop_health_monitoring()
+
+        assert "second" in FakeTool.calls
+        assert registry.get_health_schedule() == {}
+
+
+class TestCatalogCache:
+    """to_catalog() caching"""
+
+    async def test_catalog_cached_until_mutation(self):
+        registry = make_registry(["alpha", "beta"])
+
+        catalog = registry.to_catalog()
+        assert registry.to_catalog() is catalog
+        alpha_entry = catalog["tools"]["alpha"]
+
+        registry.deprecate_tool("beta", "use gamma")
+        updated = registry.to_catalog()
+        assert updated is not catalog
+        assert updated["tools"]["beta"]["schema"]["deprecated"] is True
+        # Unchanged tools reuse their cached entry
+        assert updated["tools"]["alpha"] is alpha_entry
+
+        await registry.health_check("alpha")
+        assert registry.to_catalog()["healthy_tools"] == 1
+
+        registry.unregister_tool("alpha")
+        assert registry.to_catalog()["total_tools"] == 1
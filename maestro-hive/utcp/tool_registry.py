@@ -7,6 +7,10 @@ This module implements the Tool Registry for MD-2563, providing:
 - Version tracking for tool evolution
 - Health check and availability status
 - Registration of existing UTCP tools
+- Health scheduler: checks spread over the interval with jitter, bounded
+  concurrency, per-tool adaptive intervals (healthy tools back off, failing
+  tools are probed faster)
+- Catalog cached between registry mutations
 
 Part of: MD-2545 (FOUNDRY-CORE Tool Integration Framework)
 Story: MD-2563 (Tool Registry - Catalog of Available Tools)
@@ -21,9 +25,13 @@ from typing import Any, Callable, Dict, List, Optional, Set, Type, Union
 import inspect
 import hashlib
 import json
+import logging
+import random
 
 from .base import UTCPTool, ToolConfig, ToolCapability, ToolResult
 
+logger = logging.getLogger(__name__)
+
 
 class ToolDomain(str, Enum):
     """Domain categorization for tools."""
@@ -228,6 +236,21 @@ class RegisteredTool:
         }
 
 
+@dataclass
+class HealthCheckSchedule:
+    """Adaptive health check schedule for one tool."""
+    interval: float  # Current interval in seconds
+    next_due: float  # Event loop time of the next check
+    checks: int = 0
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        return {
+            "interval_seconds": round(self.interval, 3),
+            "next_check_in_seconds": round(max(0.0, self.next_due - now), 3),
+            "checks": self.checks,
+        }
+
+
 class ToolRegistry:
     """
     Central registry for UTCP tools.
@@ -251,15 +274,28 @@ class ToolRegistry:
         self,
         health_check_interval: int = 60,
         unhealthy_threshold: int = 3,
-        auto_health_check: bool = True
+        auto_health_check: bool = True,
+        max_concurrent_checks: int = 4,
+        health_check_jitter: float = 0.2,
+        min_health_check_interval: Optional[float] = None,
+        max_health_check_interval: Optional[float] = None,
+        health_backoff_factor: float = 2.0,
     ):
         """
         Initialize the tool registry.
 
         Args:
             health_check_interval: Seconds between automatic health checks
+                (starting interval for each tool)
             unhealthy_threshold: Consecutive failures before marking unhealthy
             auto_health_check: Enable automatic health monitoring
+            max_concurrent_checks: Health checks allowed in flight at once
+            health_check_jitter: Random +/- fraction applied to each interval
+            min_health_check_interval: Interval for degraded/unhealthy tools
+                (default: a quarter of health_check_interval)
+            max_health_check_interval: Ceiling for healthy tools backing off
+                (default: 4x health_check_interval)
+            health_backoff_factor: Interval multiplier after a healthy check
         """
         self._tools: Dict[str, RegisteredTool] = {}
         self._health_check_interval = health_check_interval
@@ -268,6 +304,28 @@ class ToolRegistry:
         self._health_check_task: Optional[asyncio.Task] = None
         self._initialized = False
 
+        # Health scheduler
+        self._max_concurrent_checks = max(1, max_concurrent_checks)
+        self._health_check_jitter = min(max(health_check_jitter, 0.0), 1.0)
+        self._min_health_check_interval = (
+            min_health_check_interval if min_health_check_interval is not None
+            else health_check_interval / 4
+        )
+        self._max_health_check_interval = (
+            max_health_check_interval if max_health_check_interval is not None
+            else health_check_interval * 4
+        )
+        self._health_backoff_factor = health_backoff_factor
+        self._check_semaphore = asyncio.Semaphore(self._max_concurrent_checks)
+        self._schedules: Dict[str, HealthCheckSchedule] = {}
+        self._checks_in_flight: Set[str] = set()
+        self._schedule_changed: Optional[asyncio.Event] = None
+        self._rng = random.Random()
+
+        # Catalog cache: per-tool entries plus the assembled catalog
+        self._catalog_cache: Optional[Dict[str, Any]] = None
+        self._tool_dict_cache: Dict[str, Dict[str, Any]] = {}
+
     async def initialize(self) -> None:
         """Initialize the registry and start health monitoring if enabled."""
         if self._initialized:
@@ -395,6 +453,7 @@ class ToolRegistry:
         )
 
         self._tools[config.name] = registered
+        self._tool_changed(config.name)
         return registered
 
     def _extract_operations(self, tool_class: Type[UTCPTool]) -> Dict[str, OperationSchema]:
@@ -530,6 +589,7 @@ class ToolRegistry:
         """
         if name in self._tools:
             del self._tools[name]
+            self._tool_changed(name)
             return True
         return False
 
@@ -654,21 +714,23 @@ class ToolRegistry:
 
         if not tool.instance:
             # Cannot health check without an instance
-            tool.health = ToolHealthInfo(
+            return self._set_health(name, ToolHealthInfo(
                 status=HealthStatus.UNKNOWN,
                 last_check=datetime.utcnow(),
                 error_message="No instance available for health check",
-            )
-            return tool.health
+            ))
 
         start_time = datetime.utcnow()
 
         try:
-            result = await tool.instance.health_check()
+            # A hung check must not hold a concurrency slot forever
+            result = await asyncio.wait_for(
+                tool.instance.health_check(), timeout=tool.instance.config.timeout
+            )
             latency = (datetime.utcnow() - start_time).total_seconds() * 1000
 
             if result.success:
-                tool.health = ToolHealthInfo(
+                health = ToolHealthInfo(
                     status=HealthStatus.HEALTHY,
                     last_check=datetime.utcnow(),
                     last_success=datetime.utcnow(),
@@ -682,7 +744,7 @@ class ToolRegistry:
                     if consecutive >= self._unhealthy_threshold
                     else HealthStatus.DEGRADED
                 )
-                tool.health = ToolHealthInfo(
+                health = ToolHealthInfo(
                     status=status,
                     last_check=datetime.utcnow(),
                     last_success=tool.health.last_success,
@@ -697,32 +759,46 @@ class ToolRegistry:
                 if consecutive >= self._unhealthy_threshold
                 else HealthStatus.DEGRADED
             )
-            tool.health = ToolHealthInfo(
+            health = ToolHealthInfo(
                 status=status,
                 last_check=datetime.utcnow(),
                 last_success=tool.health.last_success,
                 consecutive_failures=consecutive,
-                error_message=str(e),
+                error_message=str(e) or type(e).__name__,
             )
 
-        return tool.health
+        return self._set_health(name, health)
+
+    def _set_health(self, name: str, health: ToolHealthInfo) -> ToolHealthInfo:
+        tool = self._tools.get(name)
+        if tool is not None:
+            tool.health = health
+            self._tool_dict_cache.pop(name, None)
+            self._catalog_cache = None
+        return health
 
     async def health_check_all(self) -> Dict[str, ToolHealthInfo]:
         """
         Perform health check on all registered tools.
 
+        At most max_concurrent_checks checks run at once.
+
         Returns:
             Dictionary mapping tool names to their health status
         """
         results = {}
 
+        async def bounded_check(name: str) -> ToolHealthInfo:
+            async with self._check_semaphore:
+                return await self.health_check(name)
+
         # Run health checks concurrently
         tasks = []
         tool_names = []
 
         for name, tool in self._tools.items():
             if tool.instance:
-                tasks.append(self.health_check(name))
+                tasks.append(bounded_check(name))
                 tool_names.append(name)
 
         if tasks:
@@ -746,21 +822,21 @@ class ToolRegistry:
         return results
 
     async def start_health_monitoring(self) -> None:
-        """Start automatic health monitoring."""
+        """
+        Start automatic health monitoring.
+
+        Each tool with an instance gets its own schedule. First checks are
+        spread uniformly over one interval; after that each tool's interval
+        grows by health_backoff_factor while it stays healthy (up to
+        max_health_check_interval) and drops to min_health_check_interval
+        while it is degraded or unhealthy. Every interval gets +/- jitter and
+        at most max_concurrent_checks checks run at once.
+        """
         if self._health_check_task is not None:
             return
 
-        async def monitor():
-            while True:
-                try:
-                    await self.health_check_all()
-                    await asyncio.sleep(self._health_check_interval)
-                except asyncio.CancelledError:
-                    break
-                except Exception:
-                    await asyncio.sleep(self._health_check_interval)
-
-        self._health_check_task = asyncio.create_task(monitor())
+        self._schedule_changed = asyncio.Event()
+        self._health_check_task = asyncio.create_task(self._run_health_scheduler())
 
     async def stop_health_monitoring(self) -> None:
         """Stop automatic health monitoring."""
@@ -771,6 +847,129 @@ class ToolRegistry:
             except asyncio.CancelledError:
                 pass
             self._health_check_task = None
+            self._schedule_changed = None
+            self._schedules.clear()
+
+    def get_health_schedule(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Current health check schedule per tool.
+
+        Returns:
+            Dictionary mapping tool names to interval, time to next check and
+            number of scheduled checks run
+        """
+        try:
+            now = asyncio.get_running_loop().time()
+        except RuntimeError:
+            return {}
+        return {name: s.to_dict(now) for name, s in self._schedules.items()}
+
+    async def _run_health_scheduler(self) -> None:
+        """Dispatch due health checks and sleep until the next one is due."""
+        loop = asyncio.get_running_loop()
+        in_flight: Set[asyncio.Task] = set()
+
+        try:
+            while True:
+                now = loop.time()
+                self._sync_schedules(now)
+
+                due = sorted(
+                    (s.next_due, name) for name, s in self._schedules.items()
+                    if s.next_due <= now and name not in self._checks_in_flight
+                )
+                for _, name in due:
+                    self._checks_in_flight.add(name)
+                    task = asyncio.create_task(self._scheduled_check(name))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+
+                upcoming = [
+                    s.next_due for name, s in self._schedules.items()
+                    if name not in self._checks_in_flight
+                ]
+                timeout = (
+                    max(0.0, min(upcoming) - loop.time()) if upcoming
+                    else self._health_check_interval
+                )
+
+                self._schedule_changed.clear()
+                try:
+                    await asyncio.wait_for(self._schedule_changed.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            self._checks_in_flight.clear()
+
+    def _sync_schedules(self, now: float) -> None:
+        """Schedule newly registered tools and drop removed ones."""
+        for name in list(self._schedules):
+            tool = self._tools.get(name)
+            if tool is None or tool.instance is None:
+                del self._schedules[name]
+
+        for name, tool in self._tools.items():
+            if tool.instance is not None and name not in self._schedules:
+                interval = float(self._health_check_interval)
+                # Spread first checks over one interval instead of all at once
+                self._schedules[name] = HealthCheckSchedule(
+                    interval=interval,
+                    next_due=now + self._rng.uniform(0, interval),
+                )
+
+    async def _scheduled_check(self, name: str) -> None:
+        """Run one scheduled check under the concurrency limit and reschedule."""
+        health: Optional[ToolHealthInfo] = None
+        try:
+            async with self._check_semaphore:
+                if name in self._tools:
+                    health = await self.health_check(name)
+        except Exception as e:
+            logger.warning(f"Scheduled health check for '{name}' failed: {e}")
+        finally:
+            self._checks_in_flight.discard(name)
+            schedule = self._schedules.get(name)
+            if schedule is not None:
+                schedule.checks += 1
+                schedule.interval = self._next_health_interval(schedule.interval, health)
+                jitter = self._rng.uniform(-self._health_check_jitter, self._health_check_jitter)
+                schedule.next_due = (
+                    asyncio.get_running_loop().time() + schedule.interval * (1 + jitter)
+                )
+            if self._schedule_changed is not None:
+                self._schedule_changed.set()
+
+    def _next_health_interval(
+        self,
+        interval: float,
+        health: Optional[ToolHealthInfo]
+    ) -> float:
+        """Back off healthy tools, probe failing ones at the minimum interval."""
+        if health is None or health.status in (HealthStatus.DEGRADED, HealthStatus.UNHEALTHY):
+            return self._min_health_check_interval
+        if health.status == HealthStatus.HEALTHY:
+            return min(interval * self._health_backoff_factor, self._max_health_check_interval)
+        return float(self._health_check_interval)
+
+    def _tool_changed(self, name: str) -> None:
+        """Invalidate cached catalog output and wake the health scheduler."""
+        self._tool_dict_cache.pop(name, None)
+        self._catalog_cache = None
+        if self._schedule_changed is not None:
+            self._schedule_changed.set()
+
+    def invalidate_catalog(self) -> None:
+        """
+        Drop cached catalog output.
+
+        Needed only after modifying a RegisteredTool directly; registry
+        methods invalidate the cache themselves.
+        """
+        self._tool_dict_cache.clear()
+        self._catalog_cache = None
 
     def get_version_history(self, name: str) -> List[ToolVersion]:
         """
@@ -823,6 +1022,7 @@ class ToolRegistry:
         )
 
         tool.version_history.append(version_entry)
+        self._tool_changed(name)
         return version_entry
 
     def deprecate_tool(self, name: str, message: str) -> bool:
@@ -842,31 +1042,47 @@ class ToolRegistry:
 
         tool.schema.deprecated = True
         tool.schema.deprecation_message = message
+        self._tool_changed(name)
         return True
 
     def to_catalog(self) -> Dict[str, Any]:
         """
         Export the entire registry as a catalog dictionary.
 
+        The catalog is cached until the registry changes (registration,
+        version, deprecation or health update); generated_at is the time it
+        was built. Per-tool entries are rebuilt only for tools that changed.
+        Treat the returned dictionary as read-only.
+
         Returns:
             Complete catalog of all registered tools
         """
-        return {
-            "tools": {name: tool.to_dict() for name, tool in self._tools.items()},
-            "domains": [d.value for d in ToolDomain],
-            "capabilities": [c.value for c in ToolCapability],
-            "total_tools": len(self._tools),
-            "healthy_tools": len([
-                t for t in self._tools.values()
-                if t.health.status == HealthStatus.HEALTHY
-            ]),
-            "generated_at": datetime.utcnow().isoformat(),
-        }
+        if self._catalog_cache is None:
+            tools = {}
+            for name, tool in self._tools.items():
+                entry = self._tool_dict_cache.get(name)
+                if entry is None:
+                    entry = self._tool_dict_cache[name] = tool.to_dict()
+                tools[name] = entry
+
+            self._catalog_cache = {
+                "tools": tools,
+                "domains": [d.value for d in ToolDomain],
+                "capabilities": [c.value for c in ToolCapability],
+                "total_tools": len(self._tools),
+                "healthy_tools": len([
+                    t for t in self._tools.values()
+                    if t.health.status == HealthStatus.HEALTHY
+                ]),
+                "generated_at": datetime.utcnow().isoformat(),
+            }
+        return self._catalog_cache
 
     async def cleanup(self) -> None:
         """Cleanup registry resources."""
         await self.stop_health_monitoring()
         self._tools.clear()
+        self.invalidate_catalog()
         self._initialized = False
 
 
@@ -278,7 +278,7 @@ async def lifespan(app: FastAPI):
 
     # Initialize Git Manager
     try:
-        git_manager = GitManager(temp_dir="/storage/temp")
+        git_manager = GitManager(temp_dir="/storage/temp", mirror_dir="/storage/mirrors")
         app.state.git_manager = git_manager
         logger.info("Git manager initialized successfully")
     except Exception as e:
@@ -336,6 +336,7 @@ async def lifespan(app: FastAPI):
     # Start background tasks
     asyncio.create_task(health_check_monitor())
     asyncio.create_task(cleanup_stale_services())
+    asyncio.create_task(sweep_git_storage())
 
     yield
 
@@ -813,6 +814,17 @@ async def cleanup_stale_services():
         except Exception as e:
             logger.error("Cleanup task error", error=str(e))
 
+async def sweep_git_storage():
+    """Background task to remove leftover build archives and idle mirrors."""
+    while True:
+        try:
+            if git_manager:
+                await git_manager.sweep()
+            await asyncio.sleep(3600)  # Run every hour
+        except Exception as e:
+            logger.error("Git storage sweep error", error=str(e))
+            await asyncio.sleep(3600)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
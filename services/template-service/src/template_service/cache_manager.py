@@ -6,10 +6,12 @@ Manages template archive caching using Redis and filesystem storage
 import asyncio
 import json
 import os
+import shutil
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
 import redis.asyncio as redis
@@ -23,6 +25,62 @@ class CacheManagerError(Exception):
     pass
 
 
+# Archive index shared by all service instances: archive path -> last
+# access time (sorted set), archive path -> size (hash) and the running
+# byte total. Kept outside the template:cache:* key space.
+LRU_INDEX_KEY = "template:cache_index:lru"
+SIZE_INDEX_KEY = "template:cache_index:sizes"
+TOTAL_BYTES_KEY = "template:cache_index:bytes"
+INDEX_KEYS = [LRU_INDEX_KEY, SIZE_INDEX_KEY, TOTAL_BYTES_KEY]
+# Per archive: set of the template:cache:* keys written for it, so eviction
+# deletes exactly those keys without scanning the keyspace
+ARCHIVE_KEYS_PREFIX = "template:cache_index:keys:"
+
+# Record (or replace) an archive; returns the new byte total
+INDEX_ADD_SCRIPT = """
+local old = redis.call('HGET', KEYS[2], ARGV[1])
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+return redis.call('INCRBY', KEYS[3], tonumber(ARGV[2]) - tonumber(old or 0))
+"""
+
+# Forget archives; returns bytes released
+INDEX_REMOVE_SCRIPT = """
+local freed = 0
+for _, path in ipairs(ARGV) do
+    local size = redis.call('HGET', KEYS[2], path)
+    if size then
+        redis.call('HDEL', KEYS[2], path)
+        freed = freed + tonumber(size)
+    end
+    redis.call('ZREM', KEYS[1], path)
+end
+if freed > 0 then
+    redis.call('DECRBY', KEYS[3], freed)
+end
+return freed
+"""
+
+# Pop least recently used archives until the total is at most ARGV[1]
+# (at most ARGV[2] per call); returns {new_total, path, ...}
+INDEX_POP_SCRIPT = """
+local total = tonumber(redis.call('GET', KEYS[3]) or 0)
+local result = {}
+while total > tonumber(ARGV[1]) and #result < tonumber(ARGV[2]) do
+    local popped = redis.call('ZPOPMIN', KEYS[1])
+    if #popped == 0 then
+        break
+    end
+    local size = redis.call('HGET', KEYS[2], popped[1])
+    redis.call('HDEL', KEYS[2], popped[1])
+    total = redis.call('DECRBY', KEYS[3], tonumber(size or 0))
+    table.insert(result, popped[1])
+end
+table.insert(result, 1, total)
+return result
+"""
+
+
 class CacheManager:
     """
     Manages template archive caching
@@ -32,6 +90,8 @@ class CacheManager:
     - Filesystem storage for archives
     - Cache hit/miss tracking
     - Automatic cache expiration
+    - Running size accounting and LRU eviction via a Redis sorted set
+      (in-process index when Redis is unavailable)
     - Cache statistics
     """
 
@@ -56,6 +116,12 @@ class CacheManager:
         self.default_ttl = timedelta(hours=default_ttl_hours)
         self.max_cache_size_bytes = int(max_cache_size_gb * 1024 * 1024 * 1024)
 
+        # Archive index: built from one directory walk when missing, then
+        # maintained incrementally on store, invalidation and eviction
+        self._index_checked = False
+        self._local_index: Optional["OrderedDict[str, int]"] = None
+        self._local_bytes = 0
+
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -70,32 +136,48 @@ class CacheManager:
         self,
         template_id: UUID,
         version: str,
-        commit_hash: Optional[str] = None
+        commit_hash: Optional[str] = None,
+        format: Optional[str] = None
     ) -> str:
         """Generate Redis cache key"""
+        key = f"template:cache:{template_id}:{version}"
         if commit_hash:
-            return f"template:cache:{template_id}:{version}:{commit_hash[:8]}"
-        return f"template:cache:{template_id}:{version}"
+            key = f"{key}:{commit_hash[:8]}"
+        if format:
+            key = f"{key}:{format}"
+        return key
 
     def _generate_cache_path(
         self,
         template_id: UUID,
         version: str,
-        format: str = "tar.gz"
+        format: str = "tar.gz",
+        commit_hash: Optional[str] = None
     ) -> Path:
-        """Generate filesystem path for cached archive"""
+        """
+        Generate filesystem path for cached archive
+
+        Archives of a resolved commit are stored by commit hash, so every
+        version (branch, tag) that points at the commit shares one file.
+        """
         # Organize by template_id subdirectory
         template_dir = self.cache_dir / str(template_id)
         template_dir.mkdir(parents=True, exist_ok=True)
 
-        filename = f"{version}.{format}"
+        filename = f"{commit_hash}.{format}" if commit_hash else f"{version}.{format}"
         return template_dir / filename
 
+    @staticmethod
+    def _archive_format(archive_path: Path) -> str:
+        """Archive format from a file name (tar.gz or zip)"""
+        return "tar.gz" if archive_path.name.endswith(".tar.gz") else archive_path.suffix.lstrip('.')
+
     async def check_cache(
         self,
         template_id: UUID,
         version: str,
-        commit_hash: Optional[str] = None
+        commit_hash: Optional[str] = None,
+        format: Optional[str] = None
     ) -> Optional[Path]:
         """
         Check if template is cached
@@ -104,11 +186,12 @@ class CacheManager:
             template_id: Template UUID
             version: Version string
             commit_hash: Git commit hash (optional)
+            format: Archive format (optional; any format if omitted)
 
         Returns:
             Path to cached archive if exists, None otherwise
         """
-        cache_key = self._generate_cache_key(template_id, version, commit_hash)
+        cache_key = self._generate_cache_key(template_id, version, commit_hash, format)
 
         try:
             if self.redis:
@@ -122,7 +205,7 @@ class CacheManager:
                     # Verify file still exists
                     if archive_path.exists():
                         # Update access time
-                        await self._update_access_time(cache_key)
+                        await self._update_access_time(cache_key, archive_path)
 
                         logger.info(
                             "cache_hit",
@@ -142,9 +225,12 @@ class CacheManager:
                         )
 
             # Fallback: check filesystem directly
-            for format in ['tar.gz', 'zip']:
-                cache_path = self._generate_cache_path(template_id, version, format)
+            for archive_format in ([format] if format else ['tar.gz', 'zip']):
+                cache_path = self._generate_cache_path(
+                    template_id, version, archive_format, commit_hash
+                )
                 if cache_path.exists():
+                    await self._index_touch(cache_path)
                     logger.info(
                         "cache_hit_filesystem",
                         template_id=str(template_id),
@@ -175,37 +261,46 @@ class CacheManager:
         commit_hash: Optional[str] = None,
         clone_duration_ms: Optional[int] = None,
         archive_duration_ms: Optional[int] = None,
-        checksum: Optional[str] = None
+        checksum: Optional[str] = None,
+        format: Optional[str] = None
     ) -> bool:
         """
         Store template in cache
 
+        With a commit_hash, the version-only key for the format is pointed
+        at the same archive too, so check_cache() without a commit can
+        still serve the last build of a version when it cannot be resolved.
+
         Args:
             template_id: Template UUID
             version: Version string
             archive_path: Path to archive file
             commit_hash: Git commit hash
-            clone_duration_ms: Time to clone repository
+            clone_duration_ms: Time to clone (or fetch) repository
             archive_duration_ms: Time to create archive
             checksum: SHA256 checksum of archive
+            format: Archive format (default: from the archive file name)
 
         Returns:
             True if successfully cached, False otherwise
         """
-        cache_key = self._generate_cache_key(template_id, version, commit_hash)
+        format = format or self._archive_format(archive_path)
+        cache_key = self._generate_cache_key(template_id, version, commit_hash, format)
         cache_storage_path = self._generate_cache_path(
             template_id,
             version,
-            archive_path.suffix.lstrip('.')
+            format,
+            commit_hash
         )
 
         try:
-            # Move/copy archive to cache directory
+            # Move archive to cache directory (copies across filesystems)
             if archive_path != cache_storage_path:
                 await asyncio.get_event_loop().run_in_executor(
                     None,
-                    archive_path.rename,
-                    cache_storage_path
+                    shutil.move,
+                    str(archive_path),
+                    str(cache_storage_path)
                 )
 
             file_size = cache_storage_path.stat().st_size
@@ -216,6 +311,7 @@ class CacheManager:
                     'template_id': str(template_id),
                     'version': version,
                     'commit_hash': commit_hash,
+                    'format': format,
                     'archive_path': str(cache_storage_path),
                     'file_size_bytes': file_size,
                     'checksum': checksum,
@@ -226,12 +322,23 @@ class CacheManager:
                     'archive_duration_ms': archive_duration_ms
                 }
 
-                await self.redis.setex(
-                    cache_key,
-                    int(self.default_ttl.total_seconds()),
-                    json.dumps(cache_data)
+                metadata_keys = [cache_key]
+                if commit_hash:
+                    metadata_keys.append(
+                        self._generate_cache_key(template_id, version, format=format)
+                    )
+                for key in metadata_keys:
+                    await self.redis.setex(
+                        key,
+                        int(self.default_ttl.total_seconds()),
+                        json.dumps(cache_data)
+                    )
+                await self.redis.sadd(
+                    self._archive_keys_key(cache_storage_path), *metadata_keys
                 )
 
+            total_bytes = await self._index_add(cache_storage_path, file_size)
+
             logger.info(
                 "cache_stored",
                 template_id=str(template_id),
@@ -241,7 +348,7 @@ class CacheManager:
             )
 
             # Check if we need to evict old entries
-            await self._check_cache_size()
+            await self._check_cache_size(total_bytes)
 
             return True
 
@@ -253,28 +360,172 @@ class CacheManager:
             )
             return False
 
-    async def _update_access_time(self, cache_key: str):
-        """Update access time and increment access count"""
+    @staticmethod
+    def _archive_keys_key(archive_path: Path) -> str:
+        """Redis set of the metadata keys written for an archive"""
+        return f"{ARCHIVE_KEYS_PREFIX}{archive_path}"
+
+    async def _update_access_time(self, cache_key: str, archive_path: Optional[Path] = None):
+        """
+        Record an access: extend the entry TTL and bump the archive in the
+        LRU index. The metadata JSON is no longer rewritten on every hit;
+        the index score is the last access time.
+        """
+        if archive_path is not None:
+            await self._index_touch(archive_path)
+
         if not self.redis:
             return
 
         try:
-            cache_data_str = await self.redis.get(cache_key)
-            if cache_data_str:
-                cache_data = json.loads(cache_data_str)
-                cache_data['last_accessed'] = datetime.utcnow().isoformat()
-                cache_data['access_count'] = cache_data.get('access_count', 0) + 1
-
-                # Update with extended TTL
-                await self.redis.setex(
-                    cache_key,
-                    int(self.default_ttl.total_seconds()),
-                    json.dumps(cache_data)
-                )
+            await self.redis.expire(cache_key, int(self.default_ttl.total_seconds()))
 
         except Exception as e:
             logger.warning("access_time_update_failed", cache_key=cache_key, error=str(e))
 
+    # ------------------------------------------------------------------
+    # Archive index (sizes and last access times)
+    # ------------------------------------------------------------------
+
+    def _scan_cache_dir(self) -> List[Tuple[str, int, float]]:
+        """(path, size, mtime) of every cached archive, oldest first"""
+        entries = []
+        for cache_file in self.cache_dir.rglob("*"):
+            if cache_file.is_file():
+                stat = cache_file.stat()
+                entries.append((str(cache_file), stat.st_size, stat.st_mtime))
+        entries.sort(key=lambda entry: entry[2])
+        return entries
+
+    async def rebuild_index(self) -> int:
+        """
+        Rebuild the archive index from the cache directory
+
+        Walks the directory once; only needed when the index is missing
+        (first start, Redis flushed) or files were changed outside the
+        service.
+
+        Returns:
+            Total cached bytes
+        """
+        entries = await asyncio.get_event_loop().run_in_executor(None, self._scan_cache_dir)
+        total = sum(size for _, size, _ in entries)
+
+        if self.redis:
+            pipeline = self.redis.pipeline(transaction=True)
+            pipeline.delete(*INDEX_KEYS)
+            if entries:
+                pipeline.hset(SIZE_INDEX_KEY, mapping={path: size for path, size, _ in entries})
+                pipeline.zadd(LRU_INDEX_KEY, {path: mtime for path, _, mtime in entries})
+            pipeline.set(TOTAL_BYTES_KEY, total)
+            await pipeline.execute()
+        else:
+            self._local_index = OrderedDict((path, size) for path, size, _ in entries)
+            self._local_bytes = total
+
+        self._index_checked = True
+        logger.info("cache_index_rebuilt", file_count=len(entries), total_bytes=total)
+        return total
+
+    async def _ensure_index(self):
+        """Build the index on first use if no instance has built it yet"""
+        if self._index_checked:
+            return
+        if self.redis:
+            if await self.redis.exists(TOTAL_BYTES_KEY):
+                self._index_checked = True
+                return
+        elif self._local_index is not None:
+            self._index_checked = True
+            return
+        await self.rebuild_index()
+
+    async def _index_add(self, archive_path: Path, size: int) -> Optional[int]:
+        """Record a stored archive; returns the new byte total"""
+        path = str(archive_path)
+        try:
+            await self._ensure_index()
+            if self.redis:
+                return int(await self.redis.eval(
+                    INDEX_ADD_SCRIPT, len(INDEX_KEYS), *INDEX_KEYS, path, size, time.time()
+                ))
+
+            self._local_bytes += size - self._local_index.pop(path, 0)
+            self._local_index[path] = size
+            return self._local_bytes
+
+        except Exception as e:
+            logger.warning("cache_index_update_failed", archive_path=path, error=str(e))
+            return None
+
+    async def _index_touch(self, archive_path: Path):
+        """Mark an indexed archive as just used"""
+        path = str(archive_path)
+        try:
+            if self.redis:
+                # XX: never resurrect an archive eviction has just popped
+                await self.redis.zadd(LRU_INDEX_KEY, {path: time.time()}, xx=True)
+            elif self._local_index is not None and path in self._local_index:
+                self._local_index.move_to_end(path)
+
+        except Exception as e:
+            logger.warning("cache_index_touch_failed", archive_path=path, error=str(e))
+
+    async def _index_remove(self, archive_paths: Iterable[Path]) -> int:
+        """Forget deleted archives; returns bytes released"""
+        paths = [str(path) for path in archive_paths]
+        if not paths:
+            return 0
+        try:
+            if self.redis:
+                return int(await self.redis.eval(
+                    INDEX_REMOVE_SCRIPT, len(INDEX_KEYS), *INDEX_KEYS, *paths
+                ))
+
+            freed = 0
+            if self._local_index is not None:
+                for path in paths:
+                    freed += self._local_index.pop(path, 0)
+                self._local_bytes -= freed
+            return freed
+
+        except Exception as e:
+            logger.warning("cache_index_update_failed", count=len(paths), error=str(e))
+            return 0
+
+    async def _index_pop_oldest(self, target_bytes: int, limit: int) -> Tuple[List[Path], int]:
+        """
+        Remove least recently used archives from the index until the total
+        is at most target_bytes (at most limit per call)
+
+        Returns:
+            Tuple of (removed archive paths, new byte total)
+        """
+        if self.redis:
+            result = await self.redis.eval(
+                INDEX_POP_SCRIPT, len(INDEX_KEYS), *INDEX_KEYS, target_bytes, limit
+            )
+            paths = [Path(p.decode() if isinstance(p, bytes) else p) for p in result[1:]]
+            return paths, int(result[0])
+
+        paths = []
+        while self._local_index and self._local_bytes > target_bytes and len(paths) < limit:
+            path, size = self._local_index.popitem(last=False)
+            self._local_bytes -= size
+            paths.append(Path(path))
+        return paths, self._local_bytes
+
+    async def _index_totals(self) -> Tuple[int, int]:
+        """(total_bytes, archive_count) from the index"""
+        await self._ensure_index()
+        if self.redis:
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.get(TOTAL_BYTES_KEY)
+            pipeline.zcard(LRU_INDEX_KEY)
+            total, count = await pipeline.execute()
+            return int(total or 0), int(count or 0)
+        return self._local_bytes, len(self._local_index)
+
     async def invalidate_cache(
         self,
         template_id: UUID,
@@ -291,6 +542,7 @@ class CacheManager:
             Number of cache entries invalidated
         """
         count = 0
+        removed: List[Path] = []
 
         try:
             if version:
@@ -302,8 +554,16 @@ class CacheManager:
                 cache_path = self._generate_cache_path(template_id, version)
                 if cache_path.exists():
                     cache_path.unlink()
+                    removed.append(cache_path)
                     count += 1
 
+                # Commit/format-keyed entries of this version; their archives
+                # are immutable and may be shared with other versions, so
+                # files are left to eviction
+                if self.redis:
+                    async for key in self.redis.scan_iter(match=f"{cache_key}:*"):
+                        await self.redis.delete(key)
+
             else:
                 # Invalidate all versions for this template
                 template_dir = self.cache_dir / str(template_id)
@@ -311,6 +571,7 @@ class CacheManager:
                 if template_dir.exists():
                     for cache_file in template_dir.glob("*"):
                         cache_file.unlink()
+                        removed.append(cache_file)
                         count += 1
                     template_dir.rmdir()
 
@@ -337,22 +598,25 @@ class CacheManager:
             )
             return count
 
+        finally:
+            await self._index_remove(removed)
+            try:
+                await self._delete_metadata_for(removed)
+            except Exception as e:
+                logger.warning("cache_metadata_cleanup_failed", error=str(e))
+
     async def get_cache_stats(self) -> dict:
         """
         Get cache statistics
 
+        Sizes and file counts come from the archive index rather than a
+        directory walk.
+
         Returns:
             Dict with cache statistics
         """
         try:
-            # Calculate total cache size
-            total_size = 0
-            file_count = 0
-
-            for cache_file in self.cache_dir.rglob("*"):
-                if cache_file.is_file():
-                    total_size += cache_file.stat().st_size
-                    file_count += 1
+            total_size, file_count = await self._index_totals()
 
             # Get Redis stats if available
             redis_keys = 0
@@ -377,16 +641,22 @@ class CacheManager:
             logger.error("cache_stats_error", error=str(e))
             return {}
 
-    async def _check_cache_size(self):
-        """Check cache size and evict old entries if needed"""
+    async def _check_cache_size(self, total_bytes: Optional[int] = None):
+        """
+        Check cache size and evict old entries if needed
+
+        Args:
+            total_bytes: Current total if already known (e.g. returned by
+                the index update in store_cache)
+        """
         try:
-            stats = await self.get_cache_stats()
-            total_size = stats.get('total_size_bytes', 0)
+            if total_bytes is None:
+                total_bytes, _ = await self._index_totals()
 
-            if total_size > self.max_cache_size_bytes:
+            if total_bytes > self.max_cache_size_bytes:
                 logger.warning(
                     "cache_size_exceeded",
-                    total_size_gb=stats.get('total_size_gb'),
+                    total_size_gb=round(total_bytes / (1024 * 1024 * 1024), 2),
                     max_size_gb=self.max_cache_size_bytes / (1024 * 1024 * 1024)
                 )
 
@@ -395,64 +665,80 @@ class CacheManager:
         except Exception as e:
             logger.error("cache_size_check_error", error=str(e))
 
-    async def _evict_old_entries(self, target_reduction_percent: float = 20.0):
+    async def _evict_old_entries(
+        self,
+        target_reduction_percent: float = 20.0,
+        batch_size: int = 64
+    ):
         """
-        Evict old cache entries based on LRU strategy
+        Evict least recently used archives until the cache is
+        target_reduction_percent below its size limit
+
+        Oldest entries are popped straight off the LRU index, up to
+        batch_size per round trip. Metadata keys recorded for an evicted
+        archive (including the version-only keys) are deleted in the same
+        pass.
 
         Args:
-            target_reduction_percent: Percentage of cache to free up
+            target_reduction_percent: Percentage of the size limit to free up
+            batch_size: Maximum archives popped per index round trip
         """
         try:
-            # Get all cache entries with access times from Redis
-            entries = []
+            await self._ensure_index()
+            target_bytes = int(self.max_cache_size_bytes * (1 - target_reduction_percent / 100))
+            total_bytes, _ = await self._index_totals()
 
-            if self.redis:
-                async for key in self.redis.scan_iter(match="template:cache:*"):
-                    data_str = await self.redis.get(key)
-                    if data_str:
-                        data = json.loads(data_str)
-                        entries.append({
-                            'key': key,
-                            'last_accessed': datetime.fromisoformat(data['last_accessed']),
-                            'file_size': data['file_size_bytes'],
-                            'archive_path': data['archive_path']
-                        })
-
-            # Sort by last accessed (oldest first)
-            entries.sort(key=lambda x: x['last_accessed'])
-
-            # Calculate target bytes to free
-            stats = await self.get_cache_stats()
-            target_bytes = int(stats['total_size_bytes'] * (target_reduction_percent / 100))
-
-            freed_bytes = 0
             evicted_count = 0
+            start_bytes = total_bytes
 
-            for entry in entries:
-                if freed_bytes >= target_bytes:
+            while total_bytes > target_bytes:
+                paths, total_bytes = await self._index_pop_oldest(target_bytes, batch_size)
+                if not paths:
                     break
 
-                # Delete file
-                archive_path = Path(entry['archive_path'])
-                if archive_path.exists():
-                    archive_path.unlink()
-                    freed_bytes += entry['file_size']
-
-                # Delete Redis key
-                if self.redis:
-                    await self.redis.delete(entry['key'])
+                for archive_path in paths:
+                    try:
+                        archive_path.unlink()
+                    except FileNotFoundError:
+                        pass
+                    evicted_count += 1
 
-                evicted_count += 1
+                await self._delete_metadata_for(paths)
 
             logger.info(
                 "cache_eviction_complete",
                 evicted_count=evicted_count,
-                freed_mb=round(freed_bytes / (1024 * 1024), 2)
+                freed_mb=round((start_bytes - total_bytes) / (1024 * 1024), 2)
             )
 
         except Exception as e:
             logger.error("cache_eviction_error", error=str(e))
 
+    async def _delete_metadata_for(self, archive_paths: List[Path]):
+        """
+        Delete the metadata keys recorded for archives by store_cache()
+
+        A recorded key is only deleted while it still points at one of
+        archive_paths; a version-only key may since have moved to a newer
+        archive.
+        """
+        if not self.redis or not archive_paths:
+            return
+
+        paths = {str(path) for path in archive_paths}
+        key_sets = [self._archive_keys_key(path) for path in archive_paths]
+        pipeline = self.redis.pipeline(transaction=False)
+        for key_set in key_sets:
+            pipeline.smembers(key_set)
+        keys = [key for members in await pipeline.execute() for key in members]
+
+        stale = []
+        if keys:
+            for key, cache_data_str in zip(keys, await self.redis.mget(keys)):
+                if cache_data_str and json.loads(cache_data_str).get('archive_path') in paths:
+                    stale.append(key)
+        await self.redis.delete(*stale, *key_sets)
+
     async def clear_all_cache(self) -> Tuple[int, int]:
         """
         Clear all cache entries
@@ -481,6 +767,16 @@ class CacheManager:
                     await self.redis.delete(key)
                     redis_keys += 1
 
+            # Reset the archive index (rebuilt from the empty directory on
+            # next use)
+            self._index_checked = False
+            self._local_index = None
+            self._local_bytes = 0
+            if self.redis:
+                await self.redis.delete(*INDEX_KEYS)
+                async for key in self.redis.scan_iter(match=f"{ARCHIVE_KEYS_PREFIX}*"):
+                    await self.redis.delete(key)
+
             logger.info(
                 "cache_cleared",
                 files_deleted=files_deleted,
@@ -491,4 +787,4 @@ class CacheManager:
 
         except Exception as e:
             logger.error("cache_clear_error", error=str(e))
-            return files_deleted, redis_keys
\ No newline at end of file
+            return files_deleted, redis_keys
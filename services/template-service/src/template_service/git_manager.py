@@ -6,13 +6,14 @@ Handles Git operations for template cloning, archiving, and version management
 import asyncio
 import hashlib
 import os
+import re
 import shutil
 import tarfile
 import tempfile
 import time
 import zipfile
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
 from datetime import datetime
 
 import git
@@ -45,22 +46,70 @@ class ManifestNotFoundError(GitManagerError):
     pass
 
 
+class GitRefNotFoundError(GitManagerError):
+    """Branch, tag or commit does not exist in repository"""
+    pass
+
+
+COMMIT_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent async calls that share a key.
+
+    The first caller starts the work; callers arriving while it runs await
+    the same result (or exception). The work is shielded, so a cancelled
+    request does not abort a build other requests are waiting on.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+
+            def _forget(done: asyncio.Task):
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(_forget)
+        else:
+            logger.debug("single_flight_joined", key=str(key))
+
+        return await asyncio.shield(task)
+
+
 class GitManager:
     """
     Manages Git operations for template repositories
 
     Features:
     - Shallow cloning for efficiency
-    - Archive creation (tar.gz, zip)
+    - Persistent bare mirrors refreshed with incremental fetch
+    - Archive creation (tar.gz, zip), directly from mirrors via git archive
+    - Single-flight coalescing of concurrent archive builds
     - Manifest extraction and validation
-    - Automatic cleanup
+    - Automatic cleanup, including a sweep of stale build archives and
+      idle mirrors
     """
 
+    # Touched whenever a mirror serves a request (FETCH_HEAD tracks fetches)
+    MIRROR_USED_MARKER = "maestro-last-used"
+
     def __init__(
         self,
         temp_dir: str = "/tmp/maestro_templates",
         timeout_seconds: int = 300,
-        clone_depth: int = 1
+        clone_depth: int = 1,
+        mirror_dir: Optional[str] = None,
+        mirror_refresh_seconds: int = 60
     ):
         """
         Initialize Git Manager
@@ -69,17 +118,32 @@ class GitManager:
             temp_dir: Base directory for temporary Git operations
             timeout_seconds: Timeout for Git operations
             clone_depth: Depth for shallow clones (1 = only latest commit)
+            mirror_dir: Directory for persistent bare mirrors
+                (default: <temp_dir>/mirrors)
+            mirror_refresh_seconds: Minimum age of a mirror before a branch
+                or tag lookup fetches from the remote again
         """
         self.temp_dir = Path(temp_dir)
         self.timeout_seconds = timeout_seconds
         self.clone_depth = clone_depth
+        self.mirror_dir = Path(mirror_dir) if mirror_dir else self.temp_dir / "mirrors"
+        self.archive_dir = self.temp_dir / "archives"
+        self.mirror_refresh_seconds = mirror_refresh_seconds
+
+        # Serialises clone/fetch per mirror within this process; other
+        # processes sharing the directory are handled by atomic renames
+        self._mirror_locks: Dict[str, asyncio.Lock] = {}
+        self.single_flight = SingleFlight()
 
-        # Ensure temp directory exists
+        # Ensure temp and mirror directories exist
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.mirror_dir.mkdir(parents=True, exist_ok=True)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
 
         logger.info(
             "git_manager_initialized",
             temp_dir=str(self.temp_dir),
+            mirror_dir=str(self.mirror_dir),
             timeout=timeout_seconds,
             clone_depth=clone_depth
         )
@@ -183,6 +247,316 @@ class GitManager:
             single_branch=True
         )
 
+    # ------------------------------------------------------------------
+    # Bare mirrors
+    # ------------------------------------------------------------------
+
+    def _mirror_path(self, git_url: str) -> Path:
+        """Mirror directory for a repository URL"""
+        digest = hashlib.sha256(git_url.encode()).hexdigest()[:16]
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", git_url.rstrip("/").split("/")[-1])
+        if name.endswith(".git"):
+            name = name[:-4]
+        return self.mirror_dir / f"{name[:48]}-{digest}.git"
+
+    @staticmethod
+    def safe_path_component(name: str, default: str = "template") -> str:
+        """Reduce a display name to a single safe file or directory name"""
+        safe = re.sub(r"[^A-Za-z0-9_.-]+", "-", name or "").strip(".-")
+        return safe[:100] or default
+
+    def build_archive_path(self, template_id: Any, commit_hash: str, format: str) -> Path:
+        """Temporary path an archive of a commit is built at before caching"""
+        return self.archive_dir / f"{template_id}_{commit_hash}.{format}"
+
+    def _mark_mirror_used(self, mirror_path: Path):
+        try:
+            (mirror_path / self.MIRROR_USED_MARKER).touch()
+        except OSError:
+            pass
+
+    def _mirror_age_seconds(self, mirror_path: Path) -> float:
+        """Seconds since the mirror was cloned or last fetched"""
+        marker = mirror_path / "FETCH_HEAD"
+        if not marker.exists():
+            marker = mirror_path
+        return time.time() - marker.stat().st_mtime
+
+    def _sync_create_mirror(self, git_url: str, mirror_path: Path):
+        """Clone a bare mirror into a temporary path, then rename it into place"""
+        staging = self.mirror_dir / f".{mirror_path.name}.{os.getpid()}.{int(time.time() * 1000)}"
+        try:
+            git.Repo.clone_from(git_url, staging, mirror=True)
+            try:
+                staging.rename(mirror_path)
+            except OSError:
+                # Another process finished first; use its mirror
+                if not mirror_path.exists():
+                    raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _sync_fetch_mirror(self, mirror_path: Path):
+        """Incremental fetch of all refs into an existing mirror"""
+        git.Repo(mirror_path).git.fetch(
+            "--prune", "origin", kill_after_timeout=self.timeout_seconds
+        )
+
+    async def ensure_mirror(self, git_url: str, refresh: bool = False) -> Tuple[Path, int]:
+        """
+        Create the bare mirror for a repository, or bring it up to date
+
+        Args:
+            git_url: Repository URL
+            refresh: Fetch even if the mirror is younger than
+                mirror_refresh_seconds
+
+        Returns:
+            Tuple of (mirror_path, duration_ms)
+
+        Raises:
+            GitCloneError: If the mirror cannot be created
+        """
+        start_time = time.time()
+        mirror_path = self._mirror_path(git_url)
+        lock = self._mirror_locks.setdefault(str(mirror_path), asyncio.Lock())
+        loop = asyncio.get_event_loop()
+
+        async with lock:
+            try:
+                if not mirror_path.exists():
+                    logger.info("creating_mirror", git_url=git_url, mirror_path=str(mirror_path))
+                    await loop.run_in_executor(
+                        None, self._sync_create_mirror, git_url, mirror_path
+                    )
+                elif refresh or self._mirror_age_seconds(mirror_path) >= self.mirror_refresh_seconds:
+                    await loop.run_in_executor(None, self._sync_fetch_mirror, mirror_path)
+
+            except GitCommandError as e:
+                if not mirror_path.exists():
+                    logger.error("mirror_clone_failed", git_url=git_url, error=str(e))
+                    raise GitCloneError(f"Failed to mirror {git_url}: {e}")
+                # A stale mirror still serves pinned commits and known refs
+                logger.warning("mirror_fetch_failed", git_url=git_url, error=str(e))
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        return mirror_path, duration_ms
+
+    def _sync_rev_parse(self, mirror_path: Path, version: str) -> Optional[str]:
+        """Commit hash for a branch, tag or commit in the mirror, or None"""
+        try:
+            return git.Repo(mirror_path).git.rev_parse(
+                "--verify", "--quiet", f"{version}^{{commit}}"
+            ).strip()
+        except GitCommandError:
+            return None
+
+    async def resolve_commit(self, git_url: str, version: str = "main") -> Tuple[str, int]:
+        """
+        Resolve a branch, tag or commit hash to a commit via the mirror
+
+        Full commit hashes already in the mirror resolve without touching
+        the remote; branches and tags trigger a fetch once the mirror is
+        older than mirror_refresh_seconds, and unknown refs force one.
+
+        Args:
+            git_url: Repository URL
+            version: Branch, tag or commit hash
+
+        Returns:
+            Tuple of (commit_hash, duration_ms)
+
+        Raises:
+            GitRefNotFoundError: If the version does not exist
+            GitCloneError: If the mirror cannot be created
+        """
+        if not version or version.startswith("-"):
+            raise GitRefNotFoundError(f"Invalid version: {version!r}")
+
+        start_time = time.time()
+        loop = asyncio.get_event_loop()
+        pinned = bool(COMMIT_SHA_PATTERN.match(version))
+
+        mirror_path = self._mirror_path(git_url)
+        if not (pinned and mirror_path.exists()):
+            mirror_path, _ = await self.ensure_mirror(git_url)
+
+        commit = await loop.run_in_executor(None, self._sync_rev_parse, mirror_path, version)
+        if commit is None:
+            await self.ensure_mirror(git_url, refresh=True)
+            commit = await loop.run_in_executor(None, self._sync_rev_parse, mirror_path, version)
+        if commit is None:
+            raise GitRefNotFoundError(f"Version {version} not found in {git_url}")
+        self._mark_mirror_used(mirror_path)
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            "commit_resolved",
+            git_url=git_url,
+            version=version,
+            commit=commit[:8],
+            duration_ms=duration_ms
+        )
+        return commit, duration_ms
+
+    def _sync_archive_commit(
+        self,
+        mirror_path: Path,
+        commit_hash: str,
+        output_path: Path,
+        format: str,
+        prefix: str
+    ):
+        """Synchronous git archive into a temporary file, renamed into place"""
+        if format not in ("tar.gz", "zip"):
+            raise ValueError(f"Unsupported archive format: {format}")
+        self._mark_mirror_used(mirror_path)
+        partial = output_path.with_name(f".{output_path.name}.{os.getpid()}.partial")
+        try:
+            git.Repo(mirror_path).git.archive(
+                f"--format={format}",
+                f"--prefix={prefix}/",
+                f"--output={partial}",
+                commit_hash,
+                kill_after_timeout=self.timeout_seconds
+            )
+            os.replace(partial, output_path)
+        finally:
+            if partial.exists():
+                partial.unlink()
+
+    async def archive_commit(
+        self,
+        git_url: str,
+        commit_hash: str,
+        output_path: Path,
+        format: str = "tar.gz",
+        prefix: str = "template"
+    ) -> Tuple[int, str, int]:
+        """
+        Create an archive of a commit straight from the mirror
+
+        No working tree is checked out; git streams the tree into the
+        archive. Call resolve_commit() first to obtain commit_hash.
+
+        Args:
+            git_url: Repository URL
+            commit_hash: Resolved commit hash
+            output_path: Output archive path
+            format: Archive format (tar.gz or zip)
+            prefix: Top-level directory name inside the archive (reduced to
+                a safe path component)
+
+        Returns:
+            Tuple of (file_size_bytes, checksum_sha256, duration_ms)
+
+        Raises:
+            GitArchiveError: If archive creation fails
+        """
+        start_time = time.time()
+        prefix = self.safe_path_component(prefix)
+
+        try:
+            mirror_path = self._mirror_path(git_url)
+            if not mirror_path.exists():
+                mirror_path, _ = await self.ensure_mirror(git_url)
+
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.get_event_loop().run_in_executor(
+                None,
+                self._sync_archive_commit,
+                mirror_path,
+                commit_hash,
+                output_path,
+                format,
+                prefix
+            )
+
+            file_size = output_path.stat().st_size
+            checksum = await self._calculate_checksum(output_path)
+            duration_ms = int((time.time() - start_time) * 1000)
+
+            logger.info(
+                "archive_created_from_mirror",
+                git_url=git_url,
+                commit=commit_hash[:8],
+                output_path=str(output_path),
+                size_bytes=file_size,
+                duration_ms=duration_ms
+            )
+
+            return file_size, checksum, duration_ms
+
+        except Exception as e:
+            logger.error(
+                "mirror_archive_failed",
+                git_url=git_url,
+                commit=commit_hash[:8],
+                error=str(e)
+            )
+            raise GitArchiveError(f"Failed to archive {commit_hash[:8]} of {git_url}: {e}")
+
+    def _sync_sweep(self, archive_max_age_seconds: float, mirror_max_idle_seconds: float) -> Tuple[int, int]:
+        """Delete stale build archives and idle mirrors; returns (archives, mirrors)"""
+        now = time.time()
+        archives = 0
+        for path in self.archive_dir.iterdir():
+            try:
+                if path.is_file() and now - path.stat().st_mtime > archive_max_age_seconds:
+                    path.unlink()
+                    archives += 1
+            except OSError:
+                continue
+
+        mirrors = 0
+        for path in self.mirror_dir.iterdir():
+            try:
+                if path.name.startswith("."):
+                    # Staging clone or eviction left behind by a dead process
+                    if now - path.stat().st_mtime > archive_max_age_seconds:
+                        shutil.rmtree(path, ignore_errors=True)
+                    continue
+                lock = self._mirror_locks.get(str(path))
+                if lock is not None and lock.locked():
+                    continue
+                marker = path / self.MIRROR_USED_MARKER
+                last_used = (marker if marker.exists() else path).stat().st_mtime
+                if now - last_used <= mirror_max_idle_seconds:
+                    continue
+                # Rename first so no request picks up a half-deleted mirror
+                doomed = self.mirror_dir / f".{path.name}.evict.{os.getpid()}"
+                path.rename(doomed)
+                shutil.rmtree(doomed, ignore_errors=True)
+                self._mirror_locks.pop(str(path), None)
+                mirrors += 1
+            except OSError:
+                continue
+        return archives, mirrors
+
+    async def sweep(
+        self,
+        archive_max_age_seconds: float = 3600,
+        mirror_max_idle_seconds: float = 7 * 24 * 3600
+    ) -> Tuple[int, int]:
+        """
+        Remove build archives left in archive_dir and evict idle mirrors
+
+        Archives normally move into the cache once built; the ones left
+        behind (cache unavailable, failed store, crashed build) are deleted
+        once older than archive_max_age_seconds. Mirrors that have not
+        served a request for mirror_max_idle_seconds are deleted and will
+        be re-cloned on next use.
+
+        Returns:
+            Tuple of (archives_removed, mirrors_removed)
+        """
+        archives, mirrors = await asyncio.get_event_loop().run_in_executor(
+            None, self._sync_sweep, archive_max_age_seconds, mirror_max_idle_seconds
+        )
+        if archives or mirrors:
+            logger.info("git_storage_swept", archives_removed=archives, mirrors_removed=mirrors)
+        return archives, mirrors
+
     async def create_archive(
         self,
         source_dir: Path,
@@ -3,7 +3,6 @@ Templates Router
 Template listing, searching, and downloading endpoints
 """
 
-from pathlib import Path
 from typing import List, Optional
 from uuid import UUID
 import time
@@ -21,7 +20,7 @@ from ..models.template import (
 )
 from ..security import rate_limit_dependency
 from ..auth import get_current_active_user, User
-from ..git_manager import GitManager
+from ..git_manager import GitManager, GitRefNotFoundError
 from ..cache_manager import CacheManager
 from ..dependencies import get_db_pool, get_git_manager, get_cache_manager
 from ..event_tracking import (
@@ -469,85 +468,128 @@ async def download_template(
                         detail="Template does not have Git URL configured"
                     )
 
+        media_type = "application/x-gzip" if format == "tar.gz" else "application/zip"
+
+        # Resolve the version to a commit against the persistent mirror;
+        # archives are cached per commit, so a moved branch is a miss
+        commit_hash = None
+        resolve_ms = None
+        if git_manager:
+            try:
+                commit_hash, resolve_ms = await git_manager.resolve_commit(git_url, version)
+            except GitRefNotFoundError:
+                raise
+            except Exception as e:
+                # Remote or mirror unavailable: serve the last archive built
+                # for this version, if there is one
+                cached_path = cache_manager and await cache_manager.check_cache(
+                    template_id, version, format=format
+                )
+                if not cached_path:
+                    raise
+                logger.warning(
+                    "serving_unresolved_version_from_cache",
+                    template_id=str(template_id),
+                    version=version,
+                    error=str(e)
+                )
+                return FileResponse(
+                    cached_path,
+                    media_type=media_type,
+                    filename=f"{name}-{version}.{format}"
+                )
+
         # Check cache
         if cache_manager:
-            cached_path = await cache_manager.check_cache(template_id, version)
+            cached_path = await cache_manager.check_cache(
+                template_id, version, commit_hash, format=format
+            )
             if cached_path:
                 logger.info("serving_from_cache", template_id=str(template_id), version=version)
                 return FileResponse(
                     cached_path,
-                    media_type="application/x-gzip" if format == "tar.gz" else "application/zip",
+                    media_type=media_type,
                     filename=f"{name}-{version}.{format}"
                 )
 
-        # Clone and archive
+        # Archive straight from the mirror; concurrent misses for the same
+        # commit and format share one build
         if git_manager:
-            clone_dir, commit_hash, clone_ms = await git_manager.clone_repository(
-                git_url,
-                version
-            )
-
-            try:
-                # Create archive
-                archive_path = Path(f"/storage/temp/{template_id}_{version}.{format}")
-                size, checksum, archive_ms = await git_manager.create_archive(
-                    clone_dir,
+            async def build_archive():
+                # Moved into the cache once stored; leftovers are removed by
+                # GitManager.sweep()
+                archive_path = git_manager.build_archive_path(template_id, commit_hash, format)
+                if archive_path.exists():
+                    return archive_path, archive_path.stat().st_size
+
+                size, checksum, archive_ms = await git_manager.archive_commit(
+                    git_url,
+                    commit_hash,
                     archive_path,
-                    format
+                    format,
+                    prefix=name
                 )
 
                 # Store in cache
-                if cache_manager:
-                    await cache_manager.store_cache(
-                        template_id,
-                        version,
-                        archive_path,
-                        commit_hash,
-                        clone_ms,
-                        archive_ms,
-                        checksum
-                    )
+                if cache_manager and await cache_manager.store_cache(
+                    template_id,
+                    version,
+                    archive_path,
+                    commit_hash,
+                    resolve_ms,
+                    archive_ms,
+                    checksum,
+                    format=format
+                ):
+                    archive_path = await cache_manager.check_cache(
+                        template_id, version, commit_hash, format=format
+                    ) or archive_path
+
+                return archive_path, size
+
+            archive_path, size = await git_manager.single_flight.run(
+                (git_url, commit_hash, format),
+                build_archive
+            )
 
-                # Update usage statistics
-                if db_pool:
-                    async with db_pool.acquire() as conn:
-                        await conn.execute(
-                            """
-                            UPDATE templates
-                            SET usage_count = usage_count + 1,
-                                last_accessed_at = NOW()
-                            WHERE id = $1
-                            """,
-                            template_id
-                        )
-
-                logger.info(
-                    "template_downloaded",
-                    template_id=str(template_id),
-                    version=version,
-                    size_mb=round(size / 1024 / 1024, 2)
-                )
+            # Update usage statistics
+            if db_pool:
+                async with db_pool.acquire() as conn:
+                    await conn.execute(
+                        """
+                        UPDATE templates
+                        SET usage_count = usage_count + 1,
+                            last_accessed_at = NOW()
+                        WHERE id = $1
+                        """,
+                        template_id
+                    )
 
-                # Track download event
-                download_duration_ms = (time.time() - start_time) * 1000
-                download_size_mb = size / 1024 / 1024
-                await track_template_download(
-                    template_id=str(template_id),
-                    template_name=name,
-                    template_version=version,
-                    download_format=format,
-                    download_size_mb=download_size_mb,
-                    download_duration_ms=download_duration_ms
-                )
+            logger.info(
+                "template_downloaded",
+                template_id=str(template_id),
+                version=version,
+                commit=commit_hash[:8],
+                size_mb=round(size / 1024 / 1024, 2)
+            )
 
-                return FileResponse(
-                    archive_path,
-                    media_type="application/x-gzip" if format == "tar.gz" else "application/zip",
-                    filename=f"{name}-{version}.{format}"
-                )
+            # Track download event
+            download_duration_ms = (time.time() - start_time) * 1000
+            download_size_mb = size / 1024 / 1024
+            await track_template_download(
+                template_id=str(template_id),
+                template_name=name,
+                template_version=version,
+                download_format=format,
+                download_size_mb=download_size_mb,
+                download_duration_ms=download_duration_ms
+            )
 
-            finally:
-                await git_manager.cleanup_clone(clone_dir)
+            return FileResponse(
+                archive_path,
+                media_type=media_type,
+                filename=f"{name}-{version}.{format}"
+            )
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -556,6 +598,11 @@ async def download_template(
 
     except HTTPException:
         raise
+    except GitRefNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error("download_template_error", template_id=str(template_id), error=str(e))
         raise HTTPException(
@@ -248,7 +248,11 @@ class TestCacheStore:
         )
 
         assert result is True
-        mock_redis.setex.assert_called_once()
+        # Commit-keyed entry, plus the version-only pointer to the same archive
+        assert [c[0][0] for c in mock_redis.setex.call_args_list] == [
+            manager._generate_cache_key(template_id, version, commit_hash, "tar.gz"),
+            manager._generate_cache_key(template_id, version, format="tar.gz"),
+        ]
 
         # Verify Redis call contains correct metadata
         call_args = mock_redis.setex.call_args
@@ -573,8 +577,10 @@ class TestCacheAccessTracking:
         # Check cache (should update access time)
         await manager.check_cache(template_id, version)
 
-        # Verify setex was called to update access time
-        assert mock_redis.setex.call_count >= 1
+        # Verify TTL was extended and the LRU index bumped (existing only)
+        mock_redis.expire.assert_called_once()
+        mock_redis.zadd.assert_called_once()
+        assert mock_redis.zadd.call_args.kwargs['xx'] is True
 
 
 class TestCacheIntegration:
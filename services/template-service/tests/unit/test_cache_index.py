@@ -0,0 +1,130 @@
+"""
+Unit tests for the CacheManager archive index.
+
+Covers running size accounting, LRU eviction from the shared Redis index
+and removal of evicted archives' metadata keys.
+"""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from template_service.cache_manager import CacheManager, TOTAL_BYTES_KEY
+
+
+@pytest.fixture
+def temp_cache_dir(tmp_path):
+    """Cache directory"""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+class TestCacheIndex:
+    """Test running size accounting and LRU index eviction"""
+
+    async def _store(self, manager, temp_cache_dir, name, size):
+        archive = temp_cache_dir / f"{name}.tar.gz"
+        archive.write_bytes(b"x" * size)
+        template_id = uuid4()
+        assert await manager.store_cache(template_id, "v1.0.0", archive)
+        return template_id, manager._generate_cache_path(template_id, "v1.0.0")
+
+    @pytest.mark.asyncio
+    async def test_store_and_invalidate_update_counters(self, temp_cache_dir):
+        """Test totals follow store/invalidate without rescanning"""
+        manager = CacheManager(None, cache_dir=str(temp_cache_dir))
+        template_id, _ = await self._store(manager, temp_cache_dir, "a", 1000)
+        await self._store(manager, temp_cache_dir, "b", 500)
+
+        stats = await manager.get_cache_stats()
+        assert stats['total_size_bytes'] == 1500
+        assert stats['file_count'] == 2
+
+        rescanned = AssertionError("rescanned")
+        with patch.object(manager, "_scan_cache_dir", side_effect=rescanned):
+            await manager.invalidate_cache(template_id)
+            stats = await manager.get_cache_stats()
+        assert stats['total_size_bytes'] == 500
+        assert stats['file_count'] == 1
+
+    @pytest.mark.asyncio
+    async def test_eviction_removes_least_recently_used(self, temp_cache_dir):
+        """Test eviction pops the oldest accessed archives first"""
+        manager = CacheManager(
+            None, cache_dir=str(temp_cache_dir), max_cache_size_gb=2600 / 1024 ** 3
+        )
+        first_id, first_path = await self._store(manager, temp_cache_dir, "a", 1000)
+        _, second_path = await self._store(manager, temp_cache_dir, "b", 1000)
+
+        # Touch the first archive so the second becomes least recently used
+        assert await manager.check_cache(first_id, "v1.0.0") == first_path
+        _, third_path = await self._store(manager, temp_cache_dir, "c", 1000)
+
+        assert first_path.exists() and third_path.exists()
+        assert not second_path.exists()
+        assert (await manager.get_cache_stats())['total_size_bytes'] == 2000
+
+    @pytest.mark.asyncio
+    async def test_redis_index_eviction(self, temp_cache_dir):
+        """Test the Redis sorted-set index shared between instances"""
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        server = fakeredis.FakeServer()
+        max_gb = 2600 / 1024 ** 3
+        writer = CacheManager(
+            fakeredis.aioredis.FakeRedis(server=server),
+            cache_dir=str(temp_cache_dir),
+            max_cache_size_gb=max_gb,
+        )
+        reader = CacheManager(
+            fakeredis.aioredis.FakeRedis(server=server),
+            cache_dir=str(temp_cache_dir),
+            max_cache_size_gb=max_gb,
+        )
+
+        first_id, first_path = await self._store(writer, temp_cache_dir, "a", 1000)
+        _, second_path = await self._store(writer, temp_cache_dir, "b", 1000)
+        assert await reader.check_cache(first_id, "v1.0.0") == first_path
+        await self._store(writer, temp_cache_dir, "c", 1000)
+
+        assert first_path.exists() and not second_path.exists()
+        assert int(await writer.redis.get(TOTAL_BYTES_KEY)) == 2000
+        assert (await reader.get_cache_stats())['file_count'] == 2
+
+    @pytest.mark.asyncio
+    async def test_eviction_deletes_metadata_keys(self, temp_cache_dir):
+        """Test eviction drops every key pointing at an evicted archive"""
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        manager = CacheManager(
+            fakeredis.aioredis.FakeRedis(),
+            cache_dir=str(temp_cache_dir),
+            max_cache_size_gb=2600 / 1024 ** 3,
+        )
+
+        template_id = uuid4()
+        for name, commit in (("a", "a" * 40), ("b", "b" * 40)):
+            archive = temp_cache_dir / f"{name}.tar.gz"
+            archive.write_bytes(b"x" * 1000)
+            assert await manager.store_cache(
+                template_id, f"v-{name}", archive, commit_hash=commit
+            )
+        first_keys = [
+            manager._generate_cache_key(template_id, "v-a", "a" * 40, "tar.gz"),
+            manager._generate_cache_key(template_id, "v-a", format="tar.gz"),
+        ]
+        assert await manager.redis.exists(*first_keys) == 2
+
+        # Eviction deletes the recorded keys; it never scans the keyspace
+        scanned = AssertionError("scanned")
+        with patch.object(manager.redis, "scan_iter", side_effect=scanned):
+            await self._store(manager, temp_cache_dir, "c", 1000)
+
+        assert await manager.redis.exists(*first_keys) == 0
+        first_path = manager._generate_cache_path(
+            template_id, "v-a", "tar.gz", "a" * 40
+        )
+        assert not await manager.redis.exists(manager._archive_keys_key(first_path))
+        assert await manager.check_cache(template_id, "v-b", "b" * 40) is not None
@@ -0,0 +1,215 @@
+"""
+Unit tests for bare-mirror template downloads.
+
+Covers GitManager mirrors (ref resolution, incremental fetch, git archive,
+sweeping) and the commit-keyed archive entries in CacheManager.
+"""
+
+import asyncio
+import hashlib
+import os
+import tarfile
+import time
+import zipfile
+from pathlib import Path
+from uuid import uuid4
+
+import git
+import pytest
+
+from template_service.cache_manager import CacheManager
+from template_service.git_manager import (
+    GitArchiveError,
+    GitManager,
+    GitRefNotFoundError,
+    SingleFlight,
+)
+
+
+@pytest.fixture
+def temp_git_dir(tmp_path):
+    """Git operations directory"""
+    git_dir = tmp_path / "git_ops"
+    git_dir.mkdir(parents=True, exist_ok=True)
+    return git_dir
+
+
+@pytest.fixture
+def temp_cache_dir(tmp_path):
+    """Cache directory"""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+@pytest.fixture
+def origin_repo(tmp_path):
+    """Local repository with one commit on main and a v1.0.0 tag"""
+    repo_dir = tmp_path / "origin"
+    repo = git.Repo.init(repo_dir, initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test User")
+        config.set_value("user", "email", "test@example.com")
+    (repo_dir / "README.md").write_text("# Template v1")
+    repo.index.add(["README.md"])
+    repo.index.commit("Initial commit")
+    repo.create_tag("v1.0.0")
+    return repo
+
+
+def commit_file(repo, name, content):
+    """Add a commit to the origin repository"""
+    (Path(repo.working_tree_dir) / name).write_text(content)
+    repo.index.add([name])
+    return repo.index.commit(f"Update {name}").hexsha
+
+
+class TestGitManagerMirrors:
+    """Test bare mirrors, git archive and single-flight builds"""
+
+    @pytest.mark.asyncio
+    async def test_resolve_commit_creates_and_reuses_mirror(self, temp_git_dir, origin_repo):
+        """Test mirror is created once and refs resolve to commits"""
+        manager = GitManager(temp_dir=str(temp_git_dir), mirror_refresh_seconds=3600)
+        url = origin_repo.working_tree_dir
+        head = origin_repo.head.commit.hexsha
+
+        commit, _ = await manager.resolve_commit(url, "main")
+        assert commit == head
+        assert manager._mirror_path(url).exists()
+        assert (await manager.resolve_commit(url, "v1.0.0"))[0] == head
+        assert (await manager.resolve_commit(url, head))[0] == head
+
+        with pytest.raises(GitRefNotFoundError):
+            await manager.resolve_commit(url, "does-not-exist")
+        with pytest.raises(GitRefNotFoundError):
+            await manager.resolve_commit(url, "--upload-pack=evil")
+
+    @pytest.mark.asyncio
+    async def test_stale_mirror_fetches_new_commits(self, temp_git_dir, origin_repo):
+        """Test branches are refreshed by incremental fetch"""
+        manager = GitManager(temp_dir=str(temp_git_dir), mirror_refresh_seconds=3600)
+        url = origin_repo.working_tree_dir
+        await manager.resolve_commit(url, "main")
+
+        new_head = commit_file(origin_repo, "app.py", "print('v2')")
+        # Fresh mirror: branch lookups do not hit the remote
+        assert (await manager.resolve_commit(url, "main"))[0] != new_head
+        # Unknown commits force a fetch
+        assert (await manager.resolve_commit(url, new_head))[0] == new_head
+
+        manager.mirror_refresh_seconds = 0
+        newer_head = commit_file(origin_repo, "app.py", "print('v3')")
+        assert (await manager.resolve_commit(url, "main"))[0] == newer_head
+
+    @pytest.mark.asyncio
+    async def test_archive_commit_from_mirror(self, temp_git_dir, origin_repo):
+        """Test tar.gz and zip archives are produced by git archive"""
+        manager = GitManager(temp_dir=str(temp_git_dir))
+        url = origin_repo.working_tree_dir
+        commit, _ = await manager.resolve_commit(url, "main")
+
+        tar_path = temp_git_dir / "out" / f"{commit}.tar.gz"
+        size, checksum, _ = await manager.archive_commit(url, commit, tar_path, "tar.gz", prefix="tpl")
+        assert size == tar_path.stat().st_size
+        assert checksum == hashlib.sha256(tar_path.read_bytes()).hexdigest()
+        with tarfile.open(tar_path, "r:gz") as tar:
+            assert "tpl/README.md" in tar.getnames()
+
+        zip_path = temp_git_dir / "out" / f"{commit}.zip"
+        await manager.archive_commit(url, commit, zip_path, "zip", prefix="tpl")
+        with zipfile.ZipFile(zip_path) as zipf:
+            assert "tpl/README.md" in zipf.namelist()
+
+        with pytest.raises(GitArchiveError):
+            await manager.archive_commit(url, commit, temp_git_dir / "out" / "x.rar", "rar")
+
+    @pytest.mark.asyncio
+    async def test_archive_prefix_is_sanitised(self, temp_git_dir, origin_repo):
+        """Test template names cannot escape the archive's top-level directory"""
+        manager = GitManager(temp_dir=str(temp_git_dir))
+        url = origin_repo.working_tree_dir
+        commit, _ = await manager.resolve_commit(url, "main")
+
+        tar_path = manager.build_archive_path("tpl-id", commit, "tar.gz")
+        await manager.archive_commit(url, commit, tar_path, "tar.gz", prefix="../../etc/My Template")
+        with tarfile.open(tar_path, "r:gz") as tar:
+            assert "etc-My-Template/README.md" in tar.getnames()
+
+        assert GitManager.safe_path_component("..") == "template"
+        assert GitManager.safe_path_component("api/v2 service") == "api-v2-service"
+
+    @pytest.mark.asyncio
+    async def test_sweep_removes_stale_archives_and_idle_mirrors(self, temp_git_dir, origin_repo):
+        """Test leftover build archives and unused mirrors are deleted"""
+        manager = GitManager(temp_dir=str(temp_git_dir))
+        url = origin_repo.working_tree_dir
+        commit, _ = await manager.resolve_commit(url, "main")
+        mirror_path = manager._mirror_path(url)
+
+        old_archive = manager.build_archive_path("old", commit, "zip")
+        new_archive = manager.build_archive_path("new", commit, "zip")
+        old_archive.write_bytes(b"old")
+        new_archive.write_bytes(b"new")
+        hour_ago = time.time() - 7200
+        os.utime(old_archive, (hour_ago, hour_ago))
+
+        # Recently used mirror survives
+        assert await manager.sweep() == (1, 0)
+        assert not old_archive.exists() and new_archive.exists()
+        assert mirror_path.exists()
+
+        week_ago = time.time() - 8 * 24 * 3600
+        os.utime(mirror_path / GitManager.MIRROR_USED_MARKER, (week_ago, week_ago))
+        assert await manager.sweep() == (0, 1)
+        assert not mirror_path.exists()
+        assert [p for p in manager.mirror_dir.iterdir()] == []
+
+        # Next request re-clones the mirror
+        assert (await manager.resolve_commit(url, "main"))[0] == commit
+
+    @pytest.mark.asyncio
+    async def test_single_flight_coalesces_concurrent_builds(self):
+        """Test concurrent calls with one key share a single execution"""
+        flight = SingleFlight()
+        calls = []
+
+        async def build():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "archive"
+
+        results = await asyncio.gather(*[flight.run(("url", "abc", "zip"), build) for _ in range(5)])
+        assert results == ["archive"] * 5
+        assert len(calls) == 1
+        assert len(flight) == 0
+
+        async def fail():
+            raise GitArchiveError("boom")
+
+        with pytest.raises(GitArchiveError):
+            await flight.run("key", fail)
+        assert len(flight) == 0
+
+
+class TestCommitKeyedCache:
+    """Test cache entries keyed by resolved commit"""
+
+    @pytest.mark.asyncio
+    async def test_store_with_commit_serves_version_without_commit(self, temp_cache_dir):
+        """Test the version-only key falls back to the last build of a version"""
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        manager = CacheManager(fakeredis.aioredis.FakeRedis(), cache_dir=str(temp_cache_dir))
+        template_id = uuid4()
+        archive = temp_cache_dir / "build.zip"
+        archive.write_bytes(b"zip")
+
+        assert await manager.store_cache(template_id, "main", archive, "a" * 40, format="zip")
+        cached = await manager.check_cache(template_id, "main", "a" * 40, format="zip")
+        assert cached == temp_cache_dir / str(template_id) / f"{'a' * 40}.zip"
+        assert await manager.check_cache(template_id, "main", format="zip") == cached
+        assert await manager.check_cache(template_id, "main", format="tar.gz") is None
+
+        await manager.invalidate_cache(template_id, "main")
+        assert await manager.check_cache(template_id, "main", format="zip") is None